@@ -30,6 +30,8 @@ _REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
+from tool_dispatch import DEVICE, TRACK, Arg, ToolRegistry, register_controller_tools
+
 try:
     from ableton_controls import ableton  # module-level singleton (one listener on 11001)
     from ableton_controls.reliable_params import ReliableParameterController
@@ -91,20 +93,6 @@ reliable_params = ReliableParameterController(ableton)
 # Helper utilities (mirror jarvis_engine.py helpers, no Gemini dependency)
 # ---------------------------------------------------------------------------
 
-def _to_int(value):
-    """Coerce a value to int where possible (matches jarvis_engine.to_int)."""
-    if value is None:
-        return None
-    if isinstance(value, str):
-        try:
-            return int(float(value))
-        except ValueError:
-            return value
-    if isinstance(value, (int, float)):
-        return int(value)
-    return value
-
-
 def get_track_status_combined(track_index: int):
     """Get combined mute/solo/arm status for a track."""
     try:
@@ -233,55 +221,47 @@ def find_track_by_name(query: str):
 
 def delete_device_osc(track_index: int, device_index: int):
     """Delete a device from a track using JarvisDeviceLoader OSC endpoint."""
+    result = _send_device_delete(track_index, device_index)
+    cache = getattr(ableton, "device_metadata", None)
+    if result.get("success") and hasattr(cache, "on_device_deleted"):
+        # Devices after the deleted one shift down; drop their cached metadata slots
+        cache.on_device_deleted(track_index, device_index)
+    return result
+
+
+def _send_device_delete(track_index: int, device_index: int):
+    """Send /jarvis/device/delete and wait briefly for the loader's reply."""
     import socket
-    import struct
     import time
 
-    try:
-        address = "/jarvis/device/delete"
-        addr_bytes = address.encode("utf-8") + b"\x00"
-        addr_padded = addr_bytes + b"\x00" * ((4 - len(addr_bytes) % 4) % 4)
-        type_tag = ",ii"
-        type_bytes = type_tag.encode("utf-8") + b"\x00"
-        type_padded = type_bytes + b"\x00" * ((4 - len(type_bytes) % 4) % 4)
-        arg_data = struct.pack(">i", track_index) + struct.pack(">i", device_index)
-        message = addr_padded + type_padded + arg_data
-
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(3.0)
-        try:
-            sock.bind(("127.0.0.1", 11003))
-        except OSError:
-            sock.bind(("127.0.0.1", 0))
-
-        sock.sendto(message, ("127.0.0.1", 11002))
+    from ableton_controls.loader_channel import get_loader_channel
+    from ableton_controls.osc_codec import encode_message
 
-        try:
-            data, _addr = sock.recvfrom(65535)
-            sock.close()
-            response_str = data.decode("utf-8", errors="ignore")
-            return {"success": True,
-                    "message": f"Device {device_index} deleted from track {track_index + 1}",
-                    "response": response_str}
-        except socket.timeout:
-            sock.close()
+    try:
+        reply = get_loader_channel().request("/jarvis/device/delete",
+                                             [track_index, device_index], timeout=3.0)
+        if reply is None:
             return {"success": False,
                     "message": "Timeout: No response from JarvisDeviceLoader. Is it installed in Ableton?",
                     "response": None}
+        _address, args = reply
+        return {"success": True,
+                "message": f"Device {device_index} deleted from track {track_index + 1}",
+                "response": " ".join(str(a) for a in args)}
 
     except OSError as e:
-        if "10048" in str(e) or "Address already in use" in str(e):
-            try:
-                sock2 = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                sock2.sendto(message, ("127.0.0.1", 11002))
-                sock2.close()
-                time.sleep(0.5)
-                return {"success": True,
-                        "message": f"Device delete request sent for device {device_index} on track {track_index + 1}",
-                        "response": None}
-            except Exception as e2:
-                return {"success": False, "message": f"Socket error: {e2}", "response": None}
-        return {"success": False, "message": f"Socket error: {e}", "response": None}
+        # Reply port held by another process: send without waiting
+        try:
+            sock2 = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock2.sendto(encode_message("/jarvis/device/delete", [track_index, device_index]),
+                         ("127.0.0.1", 11002))
+            sock2.close()
+            time.sleep(0.5)
+            return {"success": True,
+                    "message": f"Device delete request sent for device {device_index} on track {track_index + 1}",
+                    "response": None}
+        except Exception as e2:
+            return {"success": False, "message": f"Socket error: {e2}", "response": None}
     except Exception as e:
         return {"success": False, "message": f"Failed to delete device: {e}"}
 
@@ -356,133 +336,28 @@ def _describe_functions():
 # Function dispatch table
 # ---------------------------------------------------------------------------
 
-def _build_dispatch(args: dict):
-    """Build and return the function dispatch table for a given args dict.
-
-    The returned dict maps function-name strings to zero-arg callables.
-    """
-    track_index = _to_int(args.get("track_index"))
-    verify = bool(args.get("verify", False))
-
-    return {
-        # -- Playback --
-        "play":                lambda: ableton.play(),
-        "stop":                lambda: ableton.stop(),
-        "continue_playback":   lambda: ableton.continue_playback(),
-        "start_recording":     lambda: ableton.start_recording(),
-        "stop_recording":      lambda: ableton.stop_recording(),
-        "toggle_metronome":    lambda: ableton.toggle_metronome(_to_int(args.get("state"))),
-
-        # -- Transport --
-        "set_tempo":           lambda: ableton.set_tempo(args.get("bpm")),
-        "set_position":        lambda: ableton.set_position(args.get("beat")),
-        "set_loop":            lambda: ableton.set_loop(_to_int(args.get("enabled"))),
-        "set_loop_start":      lambda: ableton.set_loop_start(args.get("beat")),
-        "set_loop_length":     lambda: ableton.set_loop_length(args.get("beats")),
-
-        # -- Track controls --
-        "mute_track":          lambda: ableton.mute_track(track_index, _to_int(args.get("muted")), verify=verify),
-        "solo_track":          lambda: ableton.solo_track(track_index, _to_int(args.get("soloed")), verify=verify),
-        "arm_track":           lambda: ableton.arm_track(track_index, _to_int(args.get("armed")), verify=verify),
-        "set_track_volume":    lambda: ableton.set_track_volume(track_index, args.get("volume"), verify=verify),
-        "set_track_pan":       lambda: ableton.set_track_pan(track_index, args.get("pan"), verify=verify),
-        "set_track_send":      lambda: ableton.set_track_send(
-            track_index, _to_int(args.get("send_index")), args.get("level"), verify=verify),
-
-        # -- Scene / clip --
-        "fire_scene":          lambda: ableton.fire_scene(_to_int(args.get("scene_index"))),
-        "fire_clip":           lambda: ableton.fire_clip(track_index, _to_int(args.get("clip_index"))),
-        "stop_clip":           lambda: ableton.stop_clip(track_index),
-
-        # -- Track management --
-        "create_audio_track":  lambda: ableton.create_audio_track(_to_int(args.get("index", -1))),
-        "create_midi_track":   lambda: ableton.create_midi_track(_to_int(args.get("index", -1))),
-        "create_return_track": lambda: ableton.create_return_track(),
-        "delete_track":        lambda: ableton.delete_track(track_index),
-        "delete_return_track": lambda: ableton.delete_return_track(track_index),
-        "duplicate_track":     lambda: ableton.duplicate_track(track_index),
-        "set_track_name":      lambda: ableton.set_track_name(track_index, args.get("name")),
-        "set_track_color":     lambda: ableton.set_track_color(track_index, _to_int(args.get("color_index"))),
-
-        # -- Track queries --
-        "get_track_list":      lambda: ableton.get_track_list(),
-        "get_track_mute":      lambda: ableton.get_track_mute(track_index),
-        "get_track_solo":      lambda: ableton.get_track_solo(track_index),
-        "get_track_arm":       lambda: ableton.get_track_arm(track_index),
-        "get_track_volume":    lambda: ableton.get_track_volume(track_index),
-        "get_track_pan":       lambda: ableton.get_track_pan(track_index),
-        "get_track_send":      lambda: ableton.get_track_send(track_index, _to_int(args.get("send_index"))),
-        "get_track_status":    lambda: get_track_status_combined(track_index),
-        "get_armed_tracks":    lambda: get_armed_tracks_list(),
-        "find_track_by_name":  lambda: find_track_by_name(args.get("query")),
-
-        # -- Device queries --
-        "get_num_devices":     lambda: ableton.get_num_devices_sync(track_index),
-        "get_track_devices":   lambda: ableton.get_track_devices_sync(track_index),
-        "get_device_name":     lambda: ableton.get_device_name(
-            track_index, _to_int(args.get("device_index"))),
-        "get_device_class_name": lambda: ableton.get_device_class_name(
-            track_index, _to_int(args.get("device_index"))),
-        "get_device_parameters": lambda: ableton.get_device_parameters_name_sync(
-            track_index, _to_int(args.get("device_index"))),
-        "get_device_parameter_value": lambda: ableton.get_device_parameter_value_sync(
-            track_index, _to_int(args.get("device_index")),
-            _to_int(args.get("param_index"))),
-
-        # -- Device control --
-        "set_device_parameter": lambda: reliable_params.set_parameter_verified(
-            track_index, _to_int(args.get("device_index")),
-            _to_int(args.get("param_index")), args.get("value")),
-        "set_device_parameter_by_name": lambda: reliable_params.set_parameter_by_name(
-            track_index, _to_int(args.get("device_index")),
-            args.get("param_name"), args.get("value")),
-        "set_device_parameters_by_name": lambda: reliable_params.set_parameters_by_name(
-            track_index, _to_int(args.get("device_index")),
-            args.get("params", {})),
-        "set_device_enabled":  lambda: ableton.set_device_enabled(
-            track_index, _to_int(args.get("device_index")),
-            _to_int(args.get("enabled"))),
-        "delete_device":       lambda: delete_device_osc(
-            track_index, _to_int(args.get("device_index"))),
-
-        # -- Plugin management --
-        "add_plugin_to_track": lambda: ableton.load_device(
-            track_index, args.get("plugin_name"), _to_int(args.get("position", -1))),
-        "get_available_plugins": lambda: ableton.get_available_plugins(args.get("category")),
-        "find_plugin":         lambda: ableton.find_plugin(
-            args.get("query"), args.get("category")),
-        "refresh_plugin_list": lambda: ableton.refresh_plugin_list(),
-
-        # -- Diagnostics --
-        "diag_osc":            lambda: ableton.diag_osc(float(args.get("timeout", 3.0))),
-
-        # -- Introspection --
-        "describe_functions":  lambda: _describe_functions(),
-    }
-
+# Controller tools come from the registry shared with jarvis_engine; the
+# module globals are looked up per call so tests can patch them.
+TOOLS = register_controller_tools(ToolRegistry(), lambda: ableton, lambda: reliable_params)
+TOOLS.register("get_track_status", lambda t: get_track_status_combined(t), TRACK, track=True)
+TOOLS.register("get_armed_tracks", lambda: get_armed_tracks_list())
+TOOLS.register("find_track_by_name", lambda query: find_track_by_name(query), Arg("query"))
+TOOLS.register("delete_device", lambda t, d: delete_device_osc(t, d), TRACK, DEVICE, track=True)
+TOOLS.register("diag_osc", lambda timeout: ableton.diag_osc(timeout), Arg("timeout", float, 3.0))
+TOOLS.register("describe_functions", lambda: _describe_functions())
 
 # Operations that require a track_index argument
-TRACK_OPERATIONS = {
-    "mute_track", "solo_track", "arm_track",
-    "set_track_volume", "set_track_pan", "set_track_send",
-    "fire_clip", "stop_clip",
-    "get_num_devices", "get_track_devices", "get_device_name",
-    "get_device_class_name", "get_device_parameters",
-    "get_device_parameter_value", "set_device_parameter",
-    "set_device_parameter_by_name", "set_device_parameters_by_name",
-    "set_device_enabled",
-    "add_plugin_to_track", "delete_device",
-    "delete_track", "delete_return_track", "duplicate_track",
-    "set_track_name", "set_track_color",
-    "get_track_mute", "get_track_solo", "get_track_arm",
-    "get_track_volume", "get_track_pan", "get_track_send",
-    "get_track_status",
-}
+TRACK_OPERATIONS = TOOLS.track_operations()
+
+
+def _build_dispatch(args: dict):
+    """Return {function name: zero-arg callable} bound to an args dict."""
+    return {name: (lambda name=name: TOOLS.call(name, args)) for name in TOOLS}
 
 
 def list_functions() -> list[str]:
     """Return sorted list of all available function names."""
-    return sorted(_build_dispatch({}).keys())
+    return TOOLS.names()
 
 
 # ---------------------------------------------------------------------------
@@ -544,17 +419,14 @@ def main():
         sys.exit(1)
 
     # Validate track_index for operations that require it
-    if func_name in TRACK_OPERATIONS and args.get("track_index") is None:
+    if TOOLS.missing_track_index(func_name, args):
         print(json.dumps({
             "success": False,
             "error": f"{func_name} requires 'track_index'. Specify which track (0-based).",
         }))
         sys.exit(1)
 
-    # Build dispatch and execute
-    dispatch = _build_dispatch(args)
-
-    if func_name not in dispatch:
+    if func_name not in TOOLS:
         print(json.dumps({
             "success": False,
             "error": f"Unknown function '{func_name}'. Use --list to see available functions.",
@@ -562,7 +434,7 @@ def main():
         sys.exit(1)
 
     try:
-        result = dispatch[func_name]()
+        result = TOOLS.call(func_name, args)
     except Exception as e:
         print(json.dumps({"success": False, "error": str(e)}))
         sys.exit(1)
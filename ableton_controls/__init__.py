@@ -5,7 +5,11 @@ This package provides reliable control of Ableton Live via OSC.
 """
 
 # Import from the controller module
-from .controller import AbletonController, ableton
+from .controller import AbletonController, DeviceStateSnapshot, ableton
+from .async_controller import AsyncAbletonController, call_controller
+from .response_mux import OSCResponseMux
+from .loader_channel import LoaderChannel, close_loader_channels, get_loader_channel
+from .device_metadata import DeviceMetadataCache
 
 # Export reliable params module
 from .reliable_params import ReliableParameterController, ParameterCache
@@ -16,6 +20,14 @@ from .process_manager import AbletonProcessManager, get_ableton_manager
 __all__ = [
     'AbletonController',
     'ableton',
+    'AsyncAbletonController',
+    'call_controller',
+    'DeviceStateSnapshot',
+    'OSCResponseMux',
+    'LoaderChannel',
+    'get_loader_channel',
+    'close_loader_channels',
+    'DeviceMetadataCache',
     'ReliableParameterController',
     'ParameterCache',
     'AbletonProcessManager',
@@ -0,0 +1,952 @@
+"""
+Asyncio OSC Transport for Ableton Live
+
+AsyncAbletonController owns the UDP socket that talks to AbletonOSC. Replies
+on response_port (11001) are received by an ``asyncio.DatagramProtocol`` and
+routed through the shared OSCResponseMux, so a query never blocks a thread:
+callers ``await`` a future that the mux resolves when the echoed reply lands.
+
+The synchronous AbletonController is a thin facade over this transport. It
+runs the transport on a private event loop in a daemon thread and its track,
+device query and parameter write methods submit the coroutines below to that
+loop, so both APIs share one implementation, one socket and one in-flight
+query table.
+
+Usage:
+    # From async code (e.g. the Gemini Live loop)
+    actrl = ableton.async_controller
+    result = await actrl.get_track_volume(0)
+    await actrl.set_track_volume(0, 0.8, verify=True)
+
+    # Any controller (real, mock, or without a bound listener)
+    result = await call_controller(ableton, "get_track_volume", 0)
+"""
+
+import asyncio
+import inspect
+import socket
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .device_metadata import CachedDeviceInfo, DeviceMetadataCache
+from .osc_codec import decode_packet, encode_message
+from .param_batch import (
+    ParamWriteFlowControl,
+    bundled_write_result,
+    find_dropped_writes,
+    param_write_bundles,
+)
+from .response_mux import OSCResponseMux, PendingQuery
+
+
+QueryRequest = Tuple[str, List[Any], Optional[List[str]]]
+QueryReply = Optional[Tuple[str, List[Any]]]
+
+
+# ==================== REPLY PARSING (shared with the sync facade) ====================
+
+def _strip_device_prefix(args: List[Any]) -> List[Any]:
+    """Strip optional leading [track_id, device_id] from a device query reply."""
+    if len(args) >= 2 and isinstance(args[0], int) and isinstance(args[1], int):
+        return args[2:]
+    return args
+
+
+def _last_number(args: Sequence[Any]) -> Optional[float]:
+    """Return the last numeric argument (the value after any echoed ids)."""
+    for arg in reversed(args):
+        if isinstance(arg, (int, float)) and not isinstance(arg, bool):
+            return arg
+    return None
+
+
+def _default_value_compare(actual, expected) -> bool:
+    if isinstance(expected, float) or isinstance(actual, float):
+        return abs(float(actual) - float(expected)) < 0.02
+    return actual == expected
+
+
+def _clamp_param_value(value: float, minmax: Dict[str, Any],
+                       param_index: int) -> Dict[str, Any]:
+    """
+    Clamp a parameter value to its reported range.
+
+    Returns:
+        dict: {"value", "clamped", "min", "max"} or {"error": str}
+    """
+    v = float(value)
+    clamped = False
+    pmin = None
+    pmax = None
+    if minmax.get("success"):
+        mins: List[float] = minmax["mins"]
+        maxs: List[float] = minmax["maxs"]
+        if param_index < 0 or param_index >= min(len(mins), len(maxs)):
+            return {"error": f"Param index {param_index} out of range (have {min(len(mins), len(maxs))})"}
+        pmin = mins[param_index]
+        pmax = maxs[param_index]
+
+        # Percent-to-normalized heuristic (common for Dry/Wet when some devices report 0..1)
+        if pmin >= 0.0 and pmax <= 1.0 and v > 1.0:
+            if v <= 100.0:
+                v = v / 100.0
+            else:
+                v = 1.0
+            clamped = True
+
+        # Clamp to range
+        if v < pmin:
+            v = pmin
+            clamped = True
+        if v > pmax:
+            v = pmax
+            clamped = True
+    else:
+        # If we don't know the range, avoid obviously dangerous values for normalized params
+        if v > 1.0 and v <= 100.0:
+            # conservative: many params are 0..1; try scaling
+            v = v / 100.0
+            clamped = True
+    return {"value": v, "clamped": clamped, "min": pmin, "max": pmax}
+
+
+
+def _clamp_param_writes(params: Dict[int, float], minmax: Dict[str, Any]
+                        ) -> Tuple[Dict[int, float], Dict[int, Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Clamp a batch of writes with _clamp_param_value.
+
+    Returns:
+        (param_index -> value to send, param_index -> clamp info, rejected entries)
+    """
+    sendable: Dict[int, float] = {}
+    clamps: Dict[int, Dict[str, Any]] = {}
+    rejected: List[Dict[str, Any]] = []
+    for param_index, value in params.items():
+        clamp = _clamp_param_value(value, minmax, int(param_index))
+        if "error" in clamp:
+            rejected.append({"param_index": int(param_index), "value": float(value),
+                             "error": clamp["error"]})
+            continue
+        sendable[int(param_index)] = clamp["value"]
+        clamps[int(param_index)] = clamp
+    return sendable, clamps, rejected
+
+
+def _merge_clamped_writes(result: Dict[str, Any], device_index: int,
+                          params: Dict[int, float], clamps: Dict[int, Dict[str, Any]],
+                          rejected: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Report a bundled write in terms of the caller's (unclamped) values."""
+    originals = {int(i): float(v) for i, v in params.items()}
+    for entry in result["applied"] + result["failed"]:
+        index = entry["param_index"]
+        entry["sent_value"] = entry["value"]
+        entry["value"] = originals[index]
+        entry["clamped"] = clamps[index]["clamped"]
+    result["failed"] = result["failed"] + rejected
+    result["success"] = result["success"] and not rejected
+    total = len(result["applied"]) + len(result["failed"])
+    result["message"] = (f"Set {len(result['applied'])}/{total} parameters on device "
+                         f"{device_index + 1} in {result.get('bundles', 0)} bundle(s)")
+    return result
+
+
+@dataclass
+class DeviceStateSnapshot:
+    """
+    Complete parameter state of one device, read in a single round trip.
+
+    mins/maxs/values are ``array('d')`` aligned with ``names`` (index i is
+    parameter i). ``values`` is empty when values were not requested.
+    """
+    track_index: int
+    device_index: int
+    success: bool
+    device_name: str = ""
+    class_name: str = ""
+    names: List[str] = field(default_factory=list)
+    mins: array = field(default_factory=lambda: array('d'))
+    maxs: array = field(default_factory=lambda: array('d'))
+    values: array = field(default_factory=lambda: array('d'))
+    elapsed_ms: float = 0.0
+    message: str = ""
+
+    @property
+    def param_count(self) -> int:
+        return len(self.names)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": self.success,
+            "track_index": self.track_index,
+            "device_index": self.device_index,
+            "device_name": self.device_name,
+            "class_name": self.class_name,
+            "names": list(self.names),
+            "mins": list(self.mins),
+            "maxs": list(self.maxs),
+            "values": list(self.values),
+            "param_count": self.param_count,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "message": self.message,
+        }
+
+
+def _snapshot_requests(track_index: int, device_index: int,
+                       include_values: bool) -> List[QueryRequest]:
+    prefix = [track_index, device_index]
+    requests: List[QueryRequest] = [
+        ("/live/device/get/name", prefix, None),
+        ("/live/device/get/parameters/name", prefix, None),
+        ("/live/device/get/parameters/min", prefix, None),
+        ("/live/device/get/parameters/max", prefix, None),
+    ]
+    if include_values:
+        requests.append(("/live/device/get/parameters/value", prefix, None))
+    # Class name + parameter names identify the device type (DeviceMetadataCache)
+    requests.append(("/live/device/get/class_name", prefix, None))
+    return requests
+
+
+def _identity_requests(track_index: int, device_index: int) -> List[QueryRequest]:
+    """Cheap probe for DeviceMetadataCache.bind_probe(): class, name, parameter count."""
+    prefix = [track_index, device_index]
+    return [
+        ("/live/device/get/class_name", prefix, None),
+        ("/live/device/get/name", prefix, None),
+        ("/live/device/get/num_parameters", prefix, None),
+    ]
+
+
+def _parse_identity(replies: List[QueryReply]) -> Optional[Tuple[str, str, int]]:
+    """(class_name, device_name, param_count) from _identity_requests() replies."""
+    resp_class, resp_name, resp_count = replies
+    if not resp_class or not resp_name or not resp_count:
+        return None
+    count = _last_number(resp_count[1])
+    class_names = [a for a in resp_class[1] if isinstance(a, str)]
+    names = [a for a in resp_name[1] if isinstance(a, str)]
+    if count is None or not class_names:
+        return None
+    return class_names[-1], names[-1] if names else "", int(count)
+
+
+def _remember_snapshot(cache: DeviceMetadataCache, snap: "DeviceStateSnapshot") -> None:
+    """Store a successful snapshot's metadata in the shared cache."""
+    if snap.success and snap.mins and snap.maxs:
+        cache.set(
+            snap.track_index, snap.device_index,
+            device_name=snap.device_name or "Unknown",
+            param_names=list(snap.names),
+            param_mins=list(snap.mins),
+            param_maxs=list(snap.maxs),
+            class_name=snap.class_name,
+        )
+
+
+def _build_snapshot(track_index: int, device_index: int, replies: List[QueryReply],
+                    include_values: bool, start: float) -> DeviceStateSnapshot:
+    """Assemble a DeviceStateSnapshot from the replies of _snapshot_requests()."""
+    resp_name, resp_names, resp_min, resp_max = replies[:4]
+    resp_values = replies[4] if include_values else None
+    resp_class = replies[-1]
+
+    snap = DeviceStateSnapshot(track_index=track_index, device_index=device_index, success=False)
+    snap.elapsed_ms = (time.time() - start) * 1000
+
+    if not resp_names:
+        snap.message = "No response for parameter names"
+        return snap
+
+    snap.names = [a for a in _strip_device_prefix(resp_names[1]) if isinstance(a, str)]
+    if not snap.names:
+        snap.message = f"Unexpected parameter name response: {resp_names[1]}"
+        return snap
+
+    if resp_name:
+        strs = [a for a in resp_name[1] if isinstance(a, str)]
+        snap.device_name = strs[-1] if strs else ""
+    if resp_class:
+        strs = [a for a in resp_class[1] if isinstance(a, str)]
+        snap.class_name = strs[-1] if strs else ""
+
+    def _floats(resp) -> array:
+        if not resp:
+            return array('d')
+        return array('d', (float(x) for x in _strip_device_prefix(resp[1])
+                           if isinstance(x, (int, float))))
+
+    snap.mins = _floats(resp_min)
+    snap.maxs = _floats(resp_max)
+    snap.values = _floats(resp_values)
+
+    missing = [label for label, resp in (("name", resp_name), ("min", resp_min),
+                                         ("max", resp_max), ("value", resp_values))
+               if resp is None and (label != "value" or include_values)]
+
+    snap.success = True
+    snap.message = f"Read {snap.param_count} params in {snap.elapsed_ms:.0f} ms"
+    if missing:
+        snap.message += f" (missing: {', '.join(missing)})"
+    return snap
+
+
+# ==================== DATAGRAM PROTOCOL ====================
+
+class _OSCDatagramProtocol(asyncio.DatagramProtocol):
+    """Decode AbletonOSC replies and hand them to the response mux."""
+
+    def __init__(self, owner: "AsyncAbletonController"):
+        self.owner = owner
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            messages = decode_packet(data)
+        except Exception:
+            return
+        for address, args in messages:
+            self.owner._on_reply(address, args)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP port-unreachable etc. when AbletonOSC is not running
+        self.owner.errors += 1
+
+
+class AsyncAbletonController:
+    """asyncio-native OSC transport and query API for AbletonOSC."""
+
+    def __init__(self, ip: str = "127.0.0.1", port: int = 11000, response_port: int = 11001,
+                 mux: Optional[OSCResponseMux] = None,
+                 last_response: Optional[Dict[str, Tuple[float, List[Any]]]] = None,
+                 response_cv: Optional[threading.Condition] = None,
+                 device_metadata: Optional[DeviceMetadataCache] = None,
+                 param_flow: Optional[ParamWriteFlowControl] = None):
+        """
+        Args:
+            ip: IP address of OSC bridge
+            port: Port number of OSC bridge
+            response_port: Port AbletonOSC sends responses to
+            mux: Shared in-flight query table (a new one if None)
+            last_response: Shared address -> (timestamp, args) diagnostics map
+            response_cv: Condition notified on every reply (sync facade diagnostics)
+            device_metadata: Shared parameter names/ranges cache
+            param_flow: Shared flow control for bundled parameter writes
+        """
+        self.ip = ip
+        self.port = port
+        self.response_port = response_port
+        self.mux = mux if mux is not None else OSCResponseMux()
+        self.last_response = last_response if last_response is not None else {}
+        self.response_cv = response_cv or threading.Condition()
+        self.device_metadata = device_metadata if device_metadata is not None else DeviceMetadataCache()
+        self.param_flow = param_flow or ParamWriteFlowControl()
+
+        self.sock: Optional[socket.socket] = None
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+        self._owns_loop = False
+        self.errors = 0
+        # Cleared if AbletonOSC does not answer parameters/is_quantized
+        self.quantization_supported = True
+
+    # ==================== LIFECYCLE ====================
+
+    def open_socket(self) -> socket.socket:
+        """Bind the reply socket (raises OSError if response_port is taken)."""
+        if self.sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind((self.ip, self.response_port))
+            except OSError:
+                sock.close()
+                raise
+            sock.setblocking(False)
+            self.sock = sock
+        return self.sock
+
+    async def connect(self) -> "AsyncAbletonController":
+        """Attach the datagram endpoint to the running event loop."""
+        if self.transport is not None:
+            return self
+        sock = self.open_socket()
+        self.loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self.transport, _protocol = await self.loop.create_datagram_endpoint(
+            lambda: _OSCDatagramProtocol(self), sock=sock
+        )
+        return self
+
+    def start_in_thread(self, timeout: float = 2.0) -> "AsyncAbletonController":
+        """Run the transport on a private event loop in a daemon thread."""
+        self.open_socket()
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _run():
+            asyncio.set_event_loop(loop)
+            ready.set()
+            loop.run_forever()
+            loop.close()
+
+        self._owns_loop = True
+        self.thread = threading.Thread(target=_run, name="ableton-osc", daemon=True)
+        self.thread.start()
+        ready.wait(timeout)
+        asyncio.run_coroutine_threadsafe(self.connect(), loop).result(timeout)
+        return self
+
+    def stop(self) -> None:
+        """Close the transport and stop the private loop (best-effort)."""
+        loop = self.loop
+        transport = self.transport
+        self.transport = None
+        if loop is not None and not loop.is_closed():
+            if transport is not None:
+                try:
+                    loop.call_soon_threadsafe(transport.close)
+                except RuntimeError:
+                    pass
+            if self._owns_loop:
+                try:
+                    loop.call_soon_threadsafe(loop.stop)
+                except RuntimeError:
+                    pass
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except Exception:
+                pass
+        self.sock = None
+
+    @property
+    def connected(self) -> bool:
+        return self.transport is not None
+
+    @property
+    def loop_thread_id(self) -> Optional[int]:
+        """Ident of the thread running the transport's event loop."""
+        return self._loop_thread_id
+
+    def _on_reply(self, address: str, args: List[Any]) -> None:
+        with self.response_cv:
+            self.last_response[address] = (time.time(), args)
+            self.response_cv.notify_all()
+        # Wake the caller (thread or coroutine) waiting for exactly this reply
+        self.mux.dispatch(address, args)
+
+    # ==================== SEND ====================
+
+    def send_raw(self, msg: bytes) -> bool:
+        """Send a pre-built OSC message from the reply socket (any thread)."""
+        transport = self.transport
+        if transport is None:
+            return False
+        try:
+            if threading.get_ident() == self._loop_thread_id:
+                transport.sendto(msg, (self.ip, self.port))
+            else:
+                # UDP sendto on the bound socket is atomic; no need to hop threads
+                try:
+                    self.sock.sendto(msg, (self.ip, self.port))
+                except BlockingIOError:
+                    self.loop.call_soon_threadsafe(transport.sendto, msg, (self.ip, self.port))
+            return True
+        except Exception:
+            return False
+
+    def send(self, address: str, args: List[Any]) -> bool:
+        """Fire-and-forget OSC message."""
+        return self.send_raw(encode_message(address, args))
+
+    # ==================== QUERY ====================
+
+    async def query(self, address: str, args: List[Any], timeout: float = 2.0,
+                    accept_addresses: Optional[List[str]] = None) -> QueryReply:
+        """Send one query and await its echoed reply (None on timeout)."""
+        results = await self.query_many([(address, args, accept_addresses)], timeout=timeout)
+        return results[0]
+
+    async def query_many(self, requests: Sequence[QueryRequest],
+                         timeout: float = 2.0) -> List[QueryReply]:
+        """
+        Pipeline several queries and await every reply against one deadline.
+
+        Args:
+            requests: List of (address, args, accept_addresses or None)
+            timeout: Overall deadline for all replies
+
+        Returns:
+            List of (address, args) or None per request, in request order
+        """
+        if self.transport is None:
+            return [None] * len(requests)
+
+        caller_loop = asyncio.get_running_loop()
+        entries: List[Tuple[Optional[PendingQuery], Optional[asyncio.Future]]] = []
+        for address, args, accept_addresses in requests:
+            accept = accept_addresses or [address, f"{address}/response"]
+            future = caller_loop.create_future()
+            # Register BEFORE sending so a fast reply can't slip past us
+            pending = self.mux.register(accept, args, callback=self._resolver(caller_loop, future))
+            if not self.send(address, args):
+                self.mux.cancel(pending)
+                future.cancel()
+                entries.append((None, None))
+                continue
+            entries.append((pending, future))
+
+        futures = [f for _p, f in entries if f is not None]
+        if futures:
+            await asyncio.wait(futures, timeout=timeout)
+
+        results: List[QueryReply] = []
+        for pending, future in entries:
+            if pending is None:
+                results.append(None)
+            elif future.done() and not future.cancelled():
+                results.append(future.result())
+            elif not self.mux.expire(pending):
+                # Reply landed after the deadline but before expire()
+                results.append(pending.response)
+            else:
+                future.cancel()
+                results.append(None)
+        return results
+
+    @staticmethod
+    def _resolver(loop: asyncio.AbstractEventLoop, future: asyncio.Future) -> Callable:
+        def _set(response):
+            if not future.done():
+                future.set_result(response)
+
+        def _callback(response):
+            try:
+                loop.call_soon_threadsafe(_set, response)
+            except RuntimeError:
+                # Caller's loop already closed
+                pass
+        return _callback
+
+    async def verified_set(self,
+                           set_address, set_args,
+                           get_address, get_args,
+                           expected_value, value_key,
+                           value_compare=None,
+                           retries=3, base_delay=0.1, max_delay=2.0, timeout=2.0) -> Dict[str, Any]:
+        """
+        SET→GET→compare verification loop with exponential backoff.
+
+        Sends a SET command, waits, reads back with GET, and compares.
+        Mirrors the pattern from reliable_params._retry_with_backoff.
+
+        Args:
+            set_address: OSC address for the SET command
+            set_args: Arguments for the SET command
+            get_address: OSC address for the GET readback
+            get_args: Arguments for the GET command
+            expected_value: The value we expect to read back
+            value_key: Result key the readback is also reported under
+                (e.g. "muted", "volume"), as the matching getter does
+            value_compare: Optional callable(actual, expected) -> bool.
+                           Defaults: int uses ==, float uses abs diff < 0.02
+            retries: Maximum number of attempts (default 3)
+            base_delay: Initial delay in seconds before first readback
+            max_delay: Maximum delay between retries
+            timeout: Timeout for each GET readback
+
+        Returns:
+            dict: {"success": bool, "verified": bool, "attempts": int,
+                   "expected": value, "actual": value|None, value_key: value|None,
+                   "message": str}
+        """
+        compare = value_compare or _default_value_compare
+        last_actual = None
+
+        for attempt in range(1, retries + 1):
+            try:
+                self.send(set_address, set_args)
+                await asyncio.sleep(min(base_delay * (2 ** (attempt - 1)), max_delay))
+
+                resp = await self.query(get_address, get_args, timeout=timeout)
+                if resp:
+                    actual = _last_number(resp[1])
+                    last_actual = actual
+                    if actual is not None and compare(actual, expected_value):
+                        return {
+                            "success": True,
+                            "verified": True,
+                            "attempts": attempt,
+                            "expected": expected_value,
+                            "actual": actual,
+                            value_key: actual,
+                            "message": f"Verified after {attempt} attempt(s)"
+                        }
+            except Exception:
+                pass
+
+        # All retries exhausted — SET almost certainly went through, but
+        # we couldn't confirm the readback matched.
+        return {
+            "success": True,
+            "verified": False,
+            "attempts": retries,
+            "expected": expected_value,
+            "actual": last_actual,
+            value_key: last_actual,
+            "message": f"Unverified after {retries} attempt(s)"
+        }
+
+    # ==================== TRACK CONTROLS ====================
+
+    async def _set_track_property(self, prop: str, track_index: int, value, verify: bool,
+                                  value_key: str, message: str, extra_args: Sequence[Any] = ()):
+        set_args = [track_index, *extra_args, value]
+        if verify:
+            return await self.verified_set(
+                f"/live/track/set/{prop}", set_args,
+                f"/live/track/get/{prop}", [track_index, *extra_args],
+                value, value_key)
+        if not self.send(f"/live/track/set/{prop}", set_args):
+            return {"success": False, "message": "OSC transport not connected"}
+        return {"success": True, "message": message}
+
+    async def mute_track(self, track_index, muted, verify=False):
+        return await self._set_track_property(
+            "mute", track_index, muted, verify, "muted",
+            f"Track {track_index + 1} {'muted' if muted == 1 else 'unmuted'}")
+
+    async def solo_track(self, track_index, soloed, verify=False):
+        return await self._set_track_property(
+            "solo", track_index, soloed, verify, "soloed",
+            f"Track {track_index + 1} {'soloed' if soloed == 1 else 'unsoloed'}")
+
+    async def arm_track(self, track_index, armed, verify=False):
+        return await self._set_track_property(
+            "arm", track_index, armed, verify, "armed",
+            f"Track {track_index + 1} {'armed' if armed == 1 else 'disarmed'}")
+
+    async def set_track_volume(self, track_index, volume, verify=False):
+        if not 0.0 <= volume <= 1.0:
+            return {"success": False, "message": "Volume must be between 0.0 and 1.0"}
+        return await self._set_track_property(
+            "volume", track_index, float(volume), verify, "volume",
+            f"Track {track_index + 1} volume set to {volume:.2f}")
+
+    async def set_track_pan(self, track_index, pan, verify=False):
+        if not -1.0 <= pan <= 1.0:
+            return {"success": False, "message": "Pan must be between -1.0 and 1.0"}
+        return await self._set_track_property(
+            "panning", track_index, float(pan), verify, "pan",
+            f"Track {track_index + 1} pan set to {pan:.2f}")
+
+    async def set_track_send(self, track_index, send_index, level, verify=False):
+        if not 0.0 <= level <= 1.0:
+            return {"success": False, "message": "Send level must be between 0.0 and 1.0"}
+        return await self._set_track_property(
+            "send", track_index, float(level), verify, "level",
+            f"Track {track_index + 1} send {send_index + 1} set to {level:.2f}",
+            extra_args=[send_index])
+
+    async def _get_track_value(self, prop: str, args: List[Any], key: str, describe: Callable,
+                               as_bool: bool = False, timeout: float = 2.0) -> Dict[str, Any]:
+        try:
+            response = await self.query(f"/live/track/get/{prop}", args, timeout=timeout)
+            if not response:
+                return {"success": False, key: None, "message": "No response from Ableton (timeout)"}
+            value = _last_number(response[1])
+            if value is None:
+                return {"success": False, key: None, "message": "Empty response from Ableton"}
+            value = bool(value) if as_bool else float(value)
+            return {"success": True, key: value, "message": describe(value)}
+        except Exception as e:
+            return {"success": False, key: None, "message": f"Failed to query track {prop}: {e}"}
+
+    async def get_track_mute(self, track_index):
+        return await self._get_track_value(
+            "mute", [track_index], "muted",
+            lambda v: f"Track {track_index + 1} is {'muted' if v else 'unmuted'}", as_bool=True)
+
+    async def get_track_solo(self, track_index):
+        return await self._get_track_value(
+            "solo", [track_index], "soloed",
+            lambda v: f"Track {track_index + 1} is {'soloed' if v else 'not soloed'}", as_bool=True)
+
+    async def get_track_arm(self, track_index):
+        return await self._get_track_value(
+            "arm", [track_index], "armed",
+            lambda v: f"Track {track_index + 1} is {'armed' if v else 'not armed'}", as_bool=True)
+
+    async def get_track_volume(self, track_index):
+        return await self._get_track_value(
+            "volume", [track_index], "volume",
+            lambda v: f"Track {track_index + 1} volume is {v:.2f}")
+
+    async def get_track_pan(self, track_index):
+        return await self._get_track_value(
+            "panning", [track_index], "pan",
+            lambda v: f"Track {track_index + 1} pan is {v:.2f}")
+
+    async def get_track_send(self, track_index, send_index):
+        return await self._get_track_value(
+            "send", [track_index, send_index], "level",
+            lambda v: f"Track {track_index + 1} send {send_index + 1} level is {v:.2f}")
+
+    async def get_track_names(self):
+        try:
+            response = await self.query("/live/song/get/track_names", [], timeout=2.0)
+            if not response:
+                return {"success": False, "track_names": [], "message": "No response from Ableton (timeout)"}
+            args = response[1]
+            if not args:
+                return {"success": False, "track_names": [], "message": "Empty response from Ableton"}
+            track_names = args[0] if isinstance(args[0], list) else args
+            return {"success": True, "track_names": track_names,
+                    "message": f"Found {len(track_names)} tracks"}
+        except Exception as e:
+            return {"success": False, "track_names": [], "message": f"Failed to query track names: {e}"}
+
+    async def get_track_list(self):
+        result = await self.get_track_names()
+        if not result["success"]:
+            return {"success": False, "tracks": [], "message": result.get("message", "Failed to get tracks")}
+        tracks = [{"index": i, "display_index": i + 1, "name": name}
+                  for i, name in enumerate(result["track_names"])]
+        return {"success": True, "tracks": tracks, "message": f"Found {len(tracks)} tracks"}
+
+    # ==================== DEVICE QUERIES ====================
+
+    async def get_num_devices_sync(self, track_index: int, timeout: float = 2.0) -> Dict[str, Any]:
+        resp = await self.query("/live/track/get/num_devices", [track_index], timeout=timeout)
+        if not resp:
+            return {"success": False, "count": 0, "message": "No response (is AbletonOSC sending replies to port 11001?)"}
+        args = resp[1]
+        count = None
+        if len(args) >= 2 and isinstance(args[0], int) and args[0] == track_index and isinstance(args[1], int):
+            count = args[1]
+        elif len(args) >= 1 and isinstance(args[0], int):
+            count = args[0]
+        if count is None:
+            return {"success": False, "count": 0, "message": f"Unexpected response args: {args}"}
+        return {"success": True, "count": int(count), "message": f"Track {track_index + 1} has {count} devices"}
+
+    async def get_track_devices_sync(self, track_index: int, timeout: float = 2.0) -> Dict[str, Any]:
+        resp = await self.query("/live/track/get/devices/name", [track_index], timeout=timeout)
+        if not resp:
+            return {"success": False, "devices": [], "message": "No response"}
+        args = resp[1]
+        if len(args) >= 1 and isinstance(args[0], int) and args[0] == track_index:
+            args = args[1:]
+        names = [a for a in args if isinstance(a, str)]
+        return {"success": True, "devices": names, "count": len(names), "message": f"Found {len(names)} devices"}
+
+    async def get_device_name_sync(self, track_index: int, device_index: int,
+                                   timeout: float = 2.0) -> Dict[str, Any]:
+        resp = await self.query("/live/device/get/name", [track_index, device_index], timeout=timeout)
+        if not resp:
+            return {"success": False, "name": "", "message": "No response"}
+        strs = [a for a in resp[1] if isinstance(a, str)]
+        if not strs:
+            return {"success": False, "name": "", "message": f"Unexpected response: {resp[1]}"}
+        return {"success": True, "name": strs[-1], "message": f"Device name: {strs[-1]}"}
+
+    async def get_device_parameters_name_sync(self, track_index: int, device_index: int,
+                                              timeout: float = 3.0) -> Dict[str, Any]:
+        resp = await self.query("/live/device/get/parameters/name", [track_index, device_index], timeout=timeout)
+        if not resp:
+            return {"success": False, "names": [], "message": "No response"}
+        names = [a for a in _strip_device_prefix(resp[1]) if isinstance(a, str)]
+        return {"success": True, "names": names, "count": len(names), "message": f"Found {len(names)} parameters"}
+
+    async def get_device_parameter_value_sync(self, track_index: int, device_index: int,
+                                              param_index: int, timeout: float = 2.0) -> Dict[str, Any]:
+        resp = await self.query("/live/device/get/parameter/value",
+                                [track_index, device_index, param_index], timeout=timeout)
+        if not resp:
+            return {"success": False, "value": None, "message": "No response"}
+        value = _last_number(resp[1])
+        if value is None:
+            return {"success": False, "value": None, "message": f"Unexpected response: {resp[1]}"}
+        return {"success": True, "value": float(value), "message": "ok"}
+
+    async def get_device_parameters_minmax_sync(self, track_index: int, device_index: int,
+                                                timeout: float = 3.0) -> Dict[str, Any]:
+        info = await self.get_device_metadata(track_index, device_index, timeout=timeout)
+        if info is None:
+            return {"success": False, "mins": [], "maxs": [], "message": "No response for min/max"}
+        if not info.param_mins or not info.param_maxs:
+            return {"success": False, "mins": [], "maxs": [], "message": "Device reported no min/max"}
+        return {"success": True, "mins": info.param_mins, "maxs": info.param_maxs,
+                "message": f"Min/max for {min(len(info.param_mins), len(info.param_maxs))} params"}
+
+    async def bind_device_metadata(self, track_index: int, device_index: int,
+                                   timeout: float = 2.0) -> Optional[CachedDeviceInfo]:
+        """Re-bind a slot to a cached device type via a cheap class/name/count probe."""
+        if not self.device_metadata.known_device_types():
+            return None
+        replies = await self.query_many(_identity_requests(track_index, device_index), timeout=timeout)
+        identity = _parse_identity(replies)
+        if identity is None:
+            return None
+        return self.device_metadata.bind_probe(track_index, device_index, *identity)
+
+    async def get_device_metadata(self, track_index: int, device_index: int,
+                                  timeout: float = 3.0,
+                                  refresh: bool = False) -> Optional[CachedDeviceInfo]:
+        """Parameter names and ranges for a slot, from cache, probe, or a fresh snapshot."""
+        if not refresh:
+            info = self.device_metadata.get(track_index, device_index)
+            if info is None:
+                info = await self.bind_device_metadata(track_index, device_index)
+            if info is not None:
+                return info
+        await self.get_device_state_snapshot(track_index, device_index, timeout=timeout,
+                                             include_values=False)
+        return self.device_metadata.get(track_index, device_index)
+
+    async def get_device_state_snapshot(self, track_index: int, device_index: int,
+                                        timeout: float = 3.0,
+                                        include_values: bool = True) -> DeviceStateSnapshot:
+        """Read a device's names, min, max and (optionally) values in one round trip."""
+        start = time.time()
+        replies = await self.query_many(
+            _snapshot_requests(track_index, device_index, include_values), timeout=timeout)
+        snap = _build_snapshot(track_index, device_index, replies, include_values, start)
+        _remember_snapshot(self.device_metadata, snap)
+        if (snap.success and self.quantization_supported
+                and self.device_metadata.needs_quantization(snap.class_name, snap.device_name)):
+            await self._learn_quantization(track_index, device_index)
+        return snap
+
+    async def _learn_quantization(self, track_index: int, device_index: int,
+                                  timeout: float = 0.5) -> bool:
+        """One-time read of is_quantized flags for a newly recorded device schema."""
+        reply = await self.query("/live/device/get/parameters/is_quantized",
+                                 [track_index, device_index], timeout=timeout)
+        if reply is None:
+            # Older AbletonOSC builds lack this endpoint; stop asking this session
+            self.quantization_supported = False
+            return False
+        return self.device_metadata.record_quantization(track_index, device_index,
+                                                        list(reply[1][2:]))
+
+    # ==================== DEVICE WRITES ====================
+
+    async def set_device_parameter(self, track_index, device_index, param_index, value):
+        if not self.send("/live/device/set/parameter/value",
+                         [track_index, device_index, param_index, float(value)]):
+            return {"success": False, "message": "Failed to set device parameter: OSC transport not connected"}
+        return {"success": True, "message": f"Set parameter {param_index} on device {device_index + 1} to {value}"}
+
+    async def safe_set_device_parameter(self, track_index: int, device_index: int,
+                                        param_index: int, value: float,
+                                        timeout: float = 3.0) -> Dict[str, Any]:
+        minmax = await self.get_device_parameters_minmax_sync(track_index, device_index, timeout=timeout)
+        clamp = _clamp_param_value(value, minmax, param_index)
+        if "error" in clamp:
+            return {"success": False, "message": clamp["error"]}
+        result = await self.set_device_parameter(track_index, device_index, param_index, clamp["value"])
+        result.setdefault("original_value", float(value))
+        result.setdefault("sent_value", clamp["value"])
+        result.setdefault("clamped", clamp["clamped"])
+        if clamp["min"] is not None and clamp["max"] is not None:
+            result.setdefault("min", clamp["min"])
+            result.setdefault("max", clamp["max"])
+        return result
+
+    async def write_device_parameters_bundled(self, track_index: int, device_index: int,
+                                              values: Dict[int, float],
+                                              verify: bool = True,
+                                              tolerance: float = 0.01,
+                                              skip_verify: Sequence[int] = (),
+                                              max_rounds: int = 3,
+                                              timeout: float = 2.0) -> Dict[str, Any]:
+        """Write raw values in OSC bundles and confirm with one readback per round."""
+        values = {int(i): float(v) for i, v in values.items()}
+        pending = dict(values)
+        readback: Dict[int, float] = {}
+        verified = False
+        bundles = 0
+        rounds = 0
+
+        while pending and rounds < max_rounds:
+            rounds += 1
+            bundle_size, gap = self.param_flow.plan()
+            for n, packet in enumerate(param_write_bundles(track_index, device_index, pending, bundle_size)):
+                if n and gap:
+                    await asyncio.sleep(gap)
+                if not self.send_raw(packet):
+                    return {"success": False, "applied": [], "failed": [], "verified": False,
+                            "readback": {}, "bundles": bundles, "rounds": rounds,
+                            "message": "Failed to send parameter bundle: OSC transport not connected"}
+                bundles += 1
+            if not verify:
+                pending = {}
+                break
+
+            resp = await self.query("/live/device/get/parameters/value",
+                                    [track_index, device_index], timeout=timeout)
+            if not resp:
+                verified = False
+                pending = {}
+                break
+            current = [float(x) for x in _strip_device_prefix(resp[1]) if isinstance(x, (int, float))]
+            readback.update({i: current[i] for i in values if i < len(current)})
+            dropped = find_dropped_writes(pending, current, tolerance, skip_verify)
+            self.param_flow.record(len(pending), len(dropped))
+            verified = True
+            pending = {i: pending[i] for i in dropped}
+
+        return bundled_write_result(device_index, values, pending, readback,
+                                    verified, bundles, rounds)
+
+    async def set_device_parameters_batch(self, track_index: int, device_index: int,
+                                          params: Dict[int, float],
+                                          inter_delay: float = 0.03,
+                                          bundled: bool = True) -> Dict[str, Any]:
+        if bundled:
+            minmax = await self.get_device_parameters_minmax_sync(track_index, device_index)
+            sendable, clamps, rejected = _clamp_param_writes(params, minmax)
+            result = await self.write_device_parameters_bundled(track_index, device_index, sendable)
+            return _merge_clamped_writes(result, device_index, params, clamps, rejected)
+
+        applied = []
+        failed = []
+        for param_index, value in params.items():
+            result = await self.safe_set_device_parameter(track_index, device_index,
+                                                          int(param_index), float(value))
+            entry = {"param_index": int(param_index), "value": float(value)}
+            if result.get("success"):
+                applied.append(entry)
+            else:
+                entry["error"] = result.get("message", "unknown")
+                failed.append(entry)
+            await asyncio.sleep(inter_delay)
+        return {
+            "success": len(failed) == 0,
+            "applied": applied,
+            "failed": failed,
+            "message": f"Set {len(applied)}/{len(applied)+len(failed)} parameters on device {device_index + 1}"
+        }
+
+
+async def call_controller(controller: Any, method: str, *args, **kwargs) -> Any:
+    """
+    Await a controller call without blocking the event loop.
+
+    Uses the controller's asyncio transport when it implements ``method``
+    natively; otherwise runs the synchronous method in a worker thread.
+    """
+    actrl = getattr(controller, "async_controller", None)
+    if isinstance(actrl, AsyncAbletonController) and actrl.connected:
+        native = getattr(actrl, method, None)
+        if native is not None and inspect.iscoroutinefunction(native):
+            return await native(*args, **kwargs)
+    return await asyncio.to_thread(getattr(controller, method), *args, **kwargs)
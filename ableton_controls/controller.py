@@ -13,18 +13,32 @@ Example:
 """
 
 from pythonosc.udp_client import SimpleUDPClient
+import asyncio
+import concurrent.futures
 import json
 import os
 import socket
-import struct
 import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .async_controller import AsyncAbletonController, DeviceStateSnapshot
+from .device_metadata import CachedDeviceInfo, DeviceMetadataCache
+from .osc_codec import decode_message, encode_message
+from .param_batch import ParamWriteFlowControl
+from .loader_channel import get_loader_channel
+from .response_mux import OSCResponseMux
+
 
 class AbletonController:
     """Main controller for Ableton Live via OSC"""
+
+    # Upper bound on one sync facade call. Every call carries its own,
+    # shorter OSC timeouts; this only stops a stuck coroutine hanging
+    # the caller forever.
+    FACADE_TIMEOUT = 60.0
     
-    def __init__(self, ip="127.0.0.1", port=11000, response_port=11001):
+    def __init__(self, ip="127.0.0.1", port=11000, response_port=11001, schema_store=None):
         """
         Initialize OSC client for Ableton communication
         
@@ -32,6 +46,8 @@ class AbletonController:
             ip: IP address of OSC bridge (default: 127.0.0.1)
             port: Port number of OSC bridge (default: 11000)
             response_port: Port AbletonOSC sends responses to (default: 11001)
+            schema_store: Persistent DeviceParameterCache for learned device
+                layouts (default: None, in-memory only)
         """
         self.ip = ip
         self.port = port
@@ -48,10 +64,17 @@ class AbletonController:
         self._resp_running = False
         self._resp_lock = threading.Lock()
         self._resp_cv = threading.Condition(self._resp_lock)
-        # address -> (timestamp, args)
+        # address -> (timestamp, args) — most recent reply per address (diagnostics)
         self._last_response: Dict[str, Tuple[float, List[Any]]] = {}
-        # (track, device) -> (mins, maxs, timestamp)
-        self._param_range_cache: Dict[Tuple[int, int], Tuple[List[float], List[float], float]] = {}
+        # In-flight queries, matched by address + echoed argument prefix
+        self._mux = OSCResponseMux()
+        # Parameter names/ranges keyed by device type; slots are invalidated
+        # by device load/delete events (see device_metadata.py)
+        self.device_metadata = DeviceMetadataCache(schema_store=schema_store)
+        # Adaptive bundle size / gap for bundled parameter writes
+        self._param_flow = ParamWriteFlowControl()
+        # asyncio transport that owns the reply socket (see async_controller.py)
+        self._osc: Optional[AsyncAbletonController] = None
 
         self._start_response_listener()
     
@@ -82,266 +105,193 @@ class AbletonController:
     # ==================== OSC REQUEST/RESPONSE (AbletonOSC replies on 11001) ====================
 
     def _start_response_listener(self):
-        """Start UDP listener for AbletonOSC responses (best-effort)."""
+        """Start the asyncio reply transport on a background loop (best-effort)."""
+        osc = AsyncAbletonController(
+            self.ip, self.port, self.response_port,
+            mux=self._mux,
+            last_response=self._last_response,
+            response_cv=self._resp_cv,
+            device_metadata=self.device_metadata,
+            param_flow=self._param_flow,
+        )
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            sock.bind((self.ip, self.response_port))
-            sock.settimeout(0.5)
-            self._resp_sock = sock
-            self._diag_listener_ok = True
-            self._diag_listener_addr = (self.ip, self.response_port)
+            osc.start_in_thread()
         except Exception as exc:
             # If we can't bind, queries will be fire-and-forget.
+            osc.stop()
             self._resp_sock = None
             self._diag_listener_ok = False
             self._diag_listener_error = str(exc)
             return
 
+        self._osc = osc
+        self._resp_sock = osc.sock
+        self._resp_thread = osc.thread
         self._resp_running = True
-        self._resp_thread = threading.Thread(target=self._response_loop, daemon=True)
-        self._resp_thread.start()
+        self._diag_listener_ok = True
+        self._diag_listener_addr = (self.ip, self.response_port)
+
+    @property
+    def async_controller(self) -> Optional[AsyncAbletonController]:
+        """The asyncio transport (None if the reply port could not be bound)."""
+        return getattr(self, "_osc", None)
 
     def shutdown(self):
         """Stop the response listener (best-effort)."""
         self._resp_running = False
-        try:
-            if self._resp_sock:
-                self._resp_sock.close()
-        except Exception:
-            pass
+        osc = getattr(self, "_osc", None)
+        if osc is not None:
+            osc.stop()
+        self._osc = None
         self._resp_sock = None
 
-    def _response_loop(self):
-        """Receive and store AbletonOSC responses."""
-        if self._resp_sock is None:
-            return
-        while self._resp_running:
-            try:
-                data, _addr = self._resp_sock.recvfrom(65536)
-            except socket.timeout:
-                continue
-            except Exception:
-                continue
-
-            try:
-                address, args = self._parse_osc_message(data)
-            except Exception:
-                continue
-
-            with self._resp_cv:
-                self._last_response[address] = (time.time(), args)
-                self._resp_cv.notify_all()
-
     def _build_osc_message(self, address: str, args: List[Any]) -> bytes:
         """Build a minimal OSC message (address + typetags + args)."""
-        addr_bytes = address.encode("utf-8") + b"\x00"
-        addr_padded = addr_bytes + b"\x00" * ((4 - len(addr_bytes) % 4) % 4)
-
-        type_tag = ","
-        arg_data = b""
-
-        for arg in args:
-            if isinstance(arg, bool):
-                type_tag += "i"
-                arg_data += struct.pack(">i", 1 if arg else 0)
-            elif isinstance(arg, int):
-                type_tag += "i"
-                arg_data += struct.pack(">i", arg)
-            elif isinstance(arg, float):
-                type_tag += "f"
-                arg_data += struct.pack(">f", arg)
-            else:
-                type_tag += "s"
-                s = str(arg)
-                s_bytes = s.encode("utf-8") + b"\x00"
-                s_padded = s_bytes + b"\x00" * ((4 - len(s_bytes) % 4) % 4)
-                arg_data += s_padded
-
-        type_bytes = type_tag.encode("utf-8") + b"\x00"
-        type_padded = type_bytes + b"\x00" * ((4 - len(type_bytes) % 4) % 4)
-
-        return addr_padded + type_padded + arg_data
+        return encode_message(address, args)
 
     def _parse_osc_message(self, data: bytes) -> Tuple[str, List[Any]]:
         """Parse a minimal OSC message (address + typetags + args)."""
-        null_idx = data.index(b"\x00")
-        address = data[:null_idx].decode("utf-8")
-        addr_size = (null_idx + 4) & ~3
-        if len(data) <= addr_size:
-            return address, []
-
-        type_start = addr_size
-        if data[type_start:type_start + 1] != b",":
-            return address, []
-        type_null = data.index(b"\x00", type_start)
-        type_tag = data[type_start + 1:type_null].decode("utf-8")
-        type_size = ((type_null - type_start) + 4) & ~3
-
-        args: List[Any] = []
-        offset = type_start + type_size
-        for tag in type_tag:
-            if tag == "i":
-                args.append(struct.unpack(">i", data[offset:offset + 4])[0])
-                offset += 4
-            elif tag == "f":
-                args.append(struct.unpack(">f", data[offset:offset + 4])[0])
-                offset += 4
-            elif tag == "s":
-                s_null = data.index(b"\x00", offset)
-                args.append(data[offset:s_null].decode("utf-8"))
-                offset = ((s_null + 1) + 3) & ~3
-
-        return address, args
-
-    def _send_and_wait(self,
-                       address: str,
-                       args: List[Any],
-                       timeout: float = 2.0,
-                       accept_addresses: Optional[List[str]] = None) -> Optional[Tuple[str, List[Any]]]:
-        """
-        Send an OSC message and wait for a matching response on response_port.
-
-        AbletonOSC response address patterns can vary; we accept a small set
-        of likely options: [address, address + '/response'].
-        """
-        if self._resp_sock is None:
-            return None
-
-        accept = accept_addresses or [address, f"{address}/response"]
-        start_time = time.time()
+        return decode_message(data)
 
+    def _send_raw(self, msg: bytes) -> bool:
+        """Send a pre-built OSC message, preferring the listener socket."""
+        # Send from the LISTENER socket so AbletonOSC replies to response_port.
+        osc = getattr(self, "_osc", None)
+        if osc is not None and osc.send_raw(msg):
+            return True
         try:
-            msg = self._build_osc_message(address, args)
-            # Send from the LISTENER socket so AbletonOSC replies to response_port.
-            # Previous approach created a throwaway socket (random ephemeral port)
-            # which was closed before the reply arrived.
             self._resp_sock.sendto(msg, (self.ip, self.port))
+            return True
         except Exception:
             # Fallback: try a separate socket (fire-and-forget send).
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 sock.sendto(msg, (self.ip, self.port))
                 sock.close()
+                return True
             except Exception:
-                return None
-
-        with self._resp_cv:
-            while time.time() - start_time < timeout:
-                # Return most recent acceptable response after we sent.
-                best_addr = None
-                best_args = None
-                best_ts = 0.0
-                for a in accept:
-                    if a in self._last_response:
-                        ts, rargs = self._last_response[a]
-                        if ts >= start_time and ts > best_ts:
-                            best_ts = ts
-                            best_addr = a
-                            best_args = rargs
-                if best_addr is not None and best_args is not None:
-                    return best_addr, best_args
-
-                # Also check for ANY response (address mismatch detection).
-                # Stored for diagnostics but not returned here.
-                for resp_addr, (ts, _) in list(self._last_response.items()):
-                    if ts >= start_time and resp_addr not in accept:
-                        if not hasattr(self, '_diag_unmatched'):
-                            self._diag_unmatched = []
-                        self._diag_unmatched.append(resp_addr)
-
-                remaining = timeout - (time.time() - start_time)
-                if remaining <= 0:
-                    break
-                self._resp_cv.wait(timeout=min(0.2, remaining))
+                return False
 
-        return None
+    def _send_and_wait(self,
+                       address: str,
+                       args: List[Any],
+                       timeout: float = 2.0,
+                       accept_addresses: Optional[List[str]] = None) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Send an OSC message and wait for a matching response on response_port.
 
-    # ==================== VERIFIED SET (track-level) ====================
+        AbletonOSC response address patterns can vary; we accept a small set
+        of likely options: [address, address + '/response']. The reply must
+        also echo ``args`` as its prefix (e.g. track/device/param), so
+        concurrent queries on the same address never steal each other's
+        answers. The caller is woken directly by the listener thread.
+        """
+        results = self._send_many_and_wait(
+            [(address, args, accept_addresses)], timeout=timeout
+        )
+        return results[0]
 
-    def _verified_set(self,
-                      set_address, set_args,
-                      get_address, get_args,
-                      expected_value, value_key,
-                      value_compare=None,
-                      retries=3, base_delay=0.1, max_delay=2.0, timeout=2.0):
+    def _send_many_and_wait(self,
+                            requests: Sequence[Tuple[str, List[Any], Optional[List[str]]]],
+                            timeout: float = 2.0) -> List[Optional[Tuple[str, List[Any]]]]:
         """
-        SET→GET→compare verification loop with exponential backoff.
+        Pipeline several queries: send them all, then collect every reply.
 
-        Sends a SET command, waits, reads back with GET, and compares.
-        Mirrors the pattern from reliable_params._retry_with_backoff.
+        All requests are in flight at once on the listener socket, so the total
+        wait is roughly one round trip instead of one per request.
 
         Args:
-            set_address: OSC address for the SET command
-            set_args: Arguments for the SET command
-            get_address: OSC address for the GET readback
-            get_args: Arguments for the GET command
-            expected_value: The value we expect to read back
-            value_key: Dict key for the readback value (e.g. "muted", "volume")
-            value_compare: Optional callable(actual, expected) -> bool.
-                           Defaults: int uses ==, float uses abs diff < 0.02
-            retries: Maximum number of attempts (default 3)
-            base_delay: Initial delay in seconds before first readback
-            max_delay: Maximum delay between retries
-            timeout: Timeout for each GET readback
-
-        Returns:
-            dict: {"success": bool, "verified": bool, "attempts": int,
-                   "expected": value, "actual": value|None, "message": str}
-        """
-        if value_compare is None:
-            def value_compare(actual, expected):
-                if isinstance(expected, float) or isinstance(actual, float):
-                    return abs(float(actual) - float(expected)) < 0.02
-                return actual == expected
-
-        last_actual = None
-
-        for attempt in range(1, retries + 1):
-            try:
-                # 1. Fire-and-forget SET
-                self.client.send_message(set_address, set_args)
-
-                # 2. Exponential backoff delay
-                delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
-                time.sleep(delay)
-
-                # 3. Synchronous GET readback
-                resp = self._send_and_wait(get_address, get_args, timeout=timeout)
-                if resp:
-                    _addr, args = resp
-                    # Extract the value — last numeric arg is the value
-                    actual = None
-                    if args:
-                        for a in reversed(args):
-                            if isinstance(a, (int, float)):
-                                actual = a
-                                break
-                    last_actual = actual
-
-                    # 4. Compare
-                    if actual is not None and value_compare(actual, expected_value):
-                        return {
-                            "success": True,
-                            "verified": True,
-                            "attempts": attempt,
-                            "expected": expected_value,
-                            "actual": actual,
-                            "message": f"Verified after {attempt} attempt(s)"
-                        }
-            except Exception:
-                pass
+            requests: List of (address, args, accept_addresses or None)
+            timeout: Overall deadline for all replies
 
-        # All retries exhausted — SET almost certainly went through, but
-        # we couldn't confirm the readback matched.
-        return {
-            "success": True,
-            "verified": False,
-            "attempts": retries,
-            "expected": expected_value,
-            "actual": last_actual,
-            "message": f"Unverified after {retries} attempt(s)"
-        }
+        Returns:
+            List of (address, args) or None per request, in request order
+        """
+        if self._resp_sock is None:
+            return [None] * len(requests)
+
+        pendings = []
+        for address, args, accept_addresses in requests:
+            accept = accept_addresses or [address, f"{address}/response"]
+            # Register BEFORE sending so a fast reply can't slip past us
+            pending = self._mux.register(accept, args)
+            msg = self._build_osc_message(address, args)
+            if not self._send_raw(msg):
+                self._mux.cancel(pending)
+                pending = None
+            pendings.append(pending)
+
+        deadline = time.time() + timeout
+        results: List[Optional[Tuple[str, List[Any]]]] = []
+        for pending in pendings:
+            if pending is None:
+                results.append(None)
+                continue
+            remaining = max(0.0, deadline - time.time())
+            results.append(self._mux.wait(pending, remaining))
+        return results
+
+    # ==================== ASYNC FACADE ====================
+
+    def _run_async(self, method: str, *args, **kwargs) -> Any:
+        """
+        Run an AsyncAbletonController method to completion from sync code.
+
+        The coroutine runs on the transport's loop thread. If the reply port
+        could not be bound, it runs on a throwaway loop with a transport on
+        an ephemeral port instead, so writes still go out and queries time
+        out the way they would without a listener. When the calling thread
+        already runs an event loop, that throwaway loop runs on a worker
+        thread. Either way the call gives up after FACADE_TIMEOUT.
+        """
+        osc = self.async_controller
+        if osc is not None and osc.connected:
+            if threading.get_ident() == osc.loop_thread_id:
+                raise RuntimeError(f"AbletonController.{method} would block the OSC loop; "
+                                   f"await async_controller.{method} instead")
+            coro = getattr(osc, method)(*args, **kwargs)
+            future = asyncio.run_coroutine_threadsafe(coro, osc.loop)
+            try:
+                return future.result(self.FACADE_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise TimeoutError(f"AbletonController.{method} did not finish "
+                                   f"in {self.FACADE_TIMEOUT:.0f}s") from None
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._run_offline(method, args, kwargs))
+        # asyncio.run() refuses to nest inside a running loop
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="osc-offline")
+        try:
+            return pool.submit(asyncio.run, self._run_offline(method, args, kwargs)).result()
+        finally:
+            pool.shutdown(wait=False)
+
+    async def _run_offline(self, method: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+        try:
+            return await asyncio.wait_for(self._call_offline(method, args, kwargs),
+                                          self.FACADE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"AbletonController.{method} did not finish "
+                               f"in {self.FACADE_TIMEOUT:.0f}s") from None
+
+    async def _call_offline(self, method: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+        osc = AsyncAbletonController(
+            self.ip, self.port, 0,
+            mux=self._mux,
+            device_metadata=self.device_metadata,
+            param_flow=self._param_flow,
+        )
+        try:
+            await osc.connect()
+        except OSError:
+            pass  # No socket at all: sends report "not connected"
+        try:
+            return await getattr(osc, method)(*args, **kwargs)
+        finally:
+            osc.stop()
 
     # ==================== PLAYBACK CONTROLS ====================
     
@@ -533,18 +483,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str, ...}
         """
-        try:
-            if verify:
-                return self._verified_set(
-                    "/live/track/set/mute", [track_index, muted],
-                    "/live/track/get/mute", [track_index],
-                    muted, "muted")
-            # CORRECT FORMAT: /live/track/set/mute [track_id, mute_value]
-            self.client.send_message("/live/track/set/mute", [track_index, muted])
-            state_str = "muted" if muted == 1 else "unmuted"
-            return {"success": True, "message": f"Track {track_index + 1} {state_str}"}
-        except Exception as e:
-            return {"success": False, "message": f"Failed to mute track: {e}"}
+        return self._run_async("mute_track", track_index, muted, verify=verify)
     
     def solo_track(self, track_index, soloed, verify=False):
         """
@@ -558,18 +497,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str, ...}
         """
-        try:
-            if verify:
-                return self._verified_set(
-                    "/live/track/set/solo", [track_index, soloed],
-                    "/live/track/get/solo", [track_index],
-                    soloed, "soloed")
-            # CORRECT FORMAT: /live/track/set/solo [track_id, solo_value]
-            self.client.send_message("/live/track/set/solo", [track_index, soloed])
-            state_str = "soloed" if soloed == 1 else "unsoloed"
-            return {"success": True, "message": f"Track {track_index + 1} {state_str}"}
-        except Exception as e:
-            return {"success": False, "message": f"Failed to solo track: {e}"}
+        return self._run_async("solo_track", track_index, soloed, verify=verify)
     
     def arm_track(self, track_index, armed, verify=False):
         """
@@ -583,18 +511,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str, ...}
         """
-        try:
-            if verify:
-                return self._verified_set(
-                    "/live/track/set/arm", [track_index, armed],
-                    "/live/track/get/arm", [track_index],
-                    armed, "armed")
-            # CORRECT FORMAT: /live/track/set/arm [track_id, arm_value]
-            self.client.send_message("/live/track/set/arm", [track_index, armed])
-            state_str = "armed" if armed == 1 else "disarmed"
-            return {"success": True, "message": f"Track {track_index + 1} {state_str}"}
-        except Exception as e:
-            return {"success": False, "message": f"Failed to arm track: {e}"}
+        return self._run_async("arm_track", track_index, armed, verify=verify)
 
     def get_track_mute(self, track_index):
         """
@@ -606,24 +523,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "muted": bool (or None), "message": str}
         """
-        try:
-            response = self._send_and_wait("/live/track/get/mute", [track_index], timeout=2.0)
-
-            if response:
-                address, args = response
-                if args and len(args) > 0:
-                    muted = bool(args[0])
-                    return {
-                        "success": True,
-                        "muted": muted,
-                        "message": f"Track {track_index + 1} is {'muted' if muted else 'unmuted'}"
-                    }
-                else:
-                    return {"success": False, "muted": None, "message": "Empty response from Ableton"}
-            else:
-                return {"success": False, "muted": None, "message": "No response from Ableton (timeout)"}
-        except Exception as e:
-            return {"success": False, "muted": None, "message": f"Failed to query track mute: {e}"}
+        return self._run_async("get_track_mute", track_index)
 
     def get_track_solo(self, track_index):
         """
@@ -635,24 +535,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "soloed": bool (or None), "message": str}
         """
-        try:
-            response = self._send_and_wait("/live/track/get/solo", [track_index], timeout=2.0)
-
-            if response:
-                address, args = response
-                if args and len(args) > 0:
-                    soloed = bool(args[0])
-                    return {
-                        "success": True,
-                        "soloed": soloed,
-                        "message": f"Track {track_index + 1} is {'soloed' if soloed else 'not soloed'}"
-                    }
-                else:
-                    return {"success": False, "soloed": None, "message": "Empty response from Ableton"}
-            else:
-                return {"success": False, "soloed": None, "message": "No response from Ableton (timeout)"}
-        except Exception as e:
-            return {"success": False, "soloed": None, "message": f"Failed to query track solo: {e}"}
+        return self._run_async("get_track_solo", track_index)
 
     def get_track_arm(self, track_index):
         """
@@ -664,24 +547,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "armed": bool (or None), "message": str}
         """
-        try:
-            response = self._send_and_wait("/live/track/get/arm", [track_index], timeout=2.0)
-
-            if response:
-                address, args = response
-                if args and len(args) > 0:
-                    armed = bool(args[0])
-                    return {
-                        "success": True,
-                        "armed": armed,
-                        "message": f"Track {track_index + 1} is {'armed' if armed else 'not armed'}"
-                    }
-                else:
-                    return {"success": False, "armed": None, "message": "Empty response from Ableton"}
-            else:
-                return {"success": False, "armed": None, "message": "No response from Ableton (timeout)"}
-        except Exception as e:
-            return {"success": False, "armed": None, "message": f"Failed to query track arm: {e}"}
+        return self._run_async("get_track_arm", track_index)
 
     def set_track_volume(self, track_index, volume, verify=False):
         """
@@ -695,20 +561,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str, ...}
         """
-        try:
-            if not 0.0 <= volume <= 1.0:
-                return {"success": False, "message": "Volume must be between 0.0 and 1.0"}
-
-            if verify:
-                return self._verified_set(
-                    "/live/track/set/volume", [track_index, float(volume)],
-                    "/live/track/get/volume", [track_index],
-                    float(volume), "volume")
-            # CORRECT FORMAT: /live/track/set/volume [track_id, volume_value]
-            self.client.send_message("/live/track/set/volume", [track_index, float(volume)])
-            return {"success": True, "message": f"Track {track_index + 1} volume set to {volume:.2f}"}
-        except Exception as e:
-            return {"success": False, "message": f"Failed to set track volume: {e}"}
+        return self._run_async("set_track_volume", track_index, volume, verify=verify)
 
     def get_track_volume(self, track_index):
         """
@@ -720,25 +573,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "volume": float|None, "message": str}
         """
-        try:
-            response = self._send_and_wait("/live/track/get/volume", [track_index], timeout=2.0)
-
-            if response:
-                address, args = response
-                if args and len(args) > 0:
-                    # Response may be [track_id, volume] or [volume]
-                    value = float(args[-1]) if isinstance(args[-1], (int, float)) else None
-                    if value is not None:
-                        return {
-                            "success": True,
-                            "volume": value,
-                            "message": f"Track {track_index + 1} volume is {value:.2f}"
-                        }
-                return {"success": False, "volume": None, "message": "Empty response from Ableton"}
-            else:
-                return {"success": False, "volume": None, "message": "No response from Ableton (timeout)"}
-        except Exception as e:
-            return {"success": False, "volume": None, "message": f"Failed to query track volume: {e}"}
+        return self._run_async("get_track_volume", track_index)
 
     def set_track_pan(self, track_index, pan, verify=False):
         """
@@ -752,20 +587,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str, ...}
         """
-        try:
-            if not -1.0 <= pan <= 1.0:
-                return {"success": False, "message": "Pan must be between -1.0 and 1.0"}
-
-            if verify:
-                return self._verified_set(
-                    "/live/track/set/panning", [track_index, float(pan)],
-                    "/live/track/get/panning", [track_index],
-                    float(pan), "pan")
-            # CORRECT FORMAT: /live/track/set/panning [track_id, pan_value]
-            self.client.send_message("/live/track/set/panning", [track_index, float(pan)])
-            return {"success": True, "message": f"Track {track_index + 1} pan set to {pan:.2f}"}
-        except Exception as e:
-            return {"success": False, "message": f"Failed to set track pan: {e}"}
+        return self._run_async("set_track_pan", track_index, pan, verify=verify)
 
     def get_track_pan(self, track_index):
         """
@@ -777,24 +599,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "pan": float|None, "message": str}
         """
-        try:
-            response = self._send_and_wait("/live/track/get/panning", [track_index], timeout=2.0)
-
-            if response:
-                address, args = response
-                if args and len(args) > 0:
-                    value = float(args[-1]) if isinstance(args[-1], (int, float)) else None
-                    if value is not None:
-                        return {
-                            "success": True,
-                            "pan": value,
-                            "message": f"Track {track_index + 1} pan is {value:.2f}"
-                        }
-                return {"success": False, "pan": None, "message": "Empty response from Ableton"}
-            else:
-                return {"success": False, "pan": None, "message": "No response from Ableton (timeout)"}
-        except Exception as e:
-            return {"success": False, "pan": None, "message": f"Failed to query track pan: {e}"}
+        return self._run_async("get_track_pan", track_index)
 
     def set_track_send(self, track_index, send_index, level, verify=False):
         """
@@ -809,20 +614,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str, ...}
         """
-        try:
-            if not 0.0 <= level <= 1.0:
-                return {"success": False, "message": "Send level must be between 0.0 and 1.0"}
-
-            if verify:
-                return self._verified_set(
-                    "/live/track/set/send", [track_index, send_index, float(level)],
-                    "/live/track/get/send", [track_index, send_index],
-                    float(level), "level")
-            # CORRECT FORMAT: /live/track/set/send [track_id, send_id, value]
-            self.client.send_message("/live/track/set/send", [track_index, send_index, float(level)])
-            return {"success": True, "message": f"Track {track_index + 1} send {send_index + 1} set to {level:.2f}"}
-        except Exception as e:
-            return {"success": False, "message": f"Failed to set track send: {e}"}
+        return self._run_async("set_track_send", track_index, send_index, level, verify=verify)
 
     def get_track_send(self, track_index, send_index):
         """
@@ -835,24 +627,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "level": float|None, "message": str}
         """
-        try:
-            response = self._send_and_wait("/live/track/get/send", [track_index, send_index], timeout=2.0)
-
-            if response:
-                address, args = response
-                if args and len(args) > 0:
-                    value = float(args[-1]) if isinstance(args[-1], (int, float)) else None
-                    if value is not None:
-                        return {
-                            "success": True,
-                            "level": value,
-                            "message": f"Track {track_index + 1} send {send_index + 1} level is {value:.2f}"
-                        }
-                return {"success": False, "level": None, "message": "Empty response from Ableton"}
-            else:
-                return {"success": False, "level": None, "message": "No response from Ableton (timeout)"}
-        except Exception as e:
-            return {"success": False, "level": None, "message": f"Failed to query track send: {e}"}
+        return self._run_async("get_track_send", track_index, send_index)
 
     # ==================== SCENE CONTROLS ====================
     
@@ -950,24 +725,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "count": int, "message": str}
         """
-        resp = self._send_and_wait("/live/track/get/num_devices", [track_index], timeout=timeout)
-        if not resp:
-            return {"success": False, "count": 0, "message": "No response (is AbletonOSC sending replies to port 11001?)"}
-
-        _addr, args = resp
-        # Common formats:
-        # - [track_id, num_devices]
-        # - [num_devices]
-        count = None
-        if len(args) >= 2 and isinstance(args[0], int) and args[0] == track_index and isinstance(args[1], int):
-            count = args[1]
-        elif len(args) >= 1 and isinstance(args[0], int):
-            count = args[0]
-
-        if count is None:
-            return {"success": False, "count": 0, "message": f"Unexpected response args: {args}"}
-
-        return {"success": True, "count": int(count), "message": f"Track {track_index + 1} has {count} devices"}
+        return self._run_async("get_num_devices_sync", track_index, timeout=timeout)
     
     def get_track_devices(self, track_index):
         """
@@ -992,20 +750,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "devices": list[str], "message": str}
         """
-        resp = self._send_and_wait("/live/track/get/devices/name", [track_index], timeout=timeout)
-        if not resp:
-            return {"success": False, "devices": [], "message": "No response"}
-
-        _addr, args = resp
-        # Common formats:
-        # - [track_id, "Dev1", "Dev2", ...]
-        # - ["Dev1", "Dev2", ...]
-        if len(args) >= 1 and isinstance(args[0], int) and args[0] == track_index:
-            names = [a for a in args[1:] if isinstance(a, str)]
-        else:
-            names = [a for a in args if isinstance(a, str)]
-
-        return {"success": True, "devices": names, "count": len(names), "message": f"Found {len(names)} devices"}
+        return self._run_async("get_track_devices_sync", track_index, timeout=timeout)
     
     def get_device_name(self, track_index, device_index):
         """
@@ -1031,24 +776,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "name": str, "message": str}
         """
-        resp = self._send_and_wait(
-            "/live/device/get/name", [track_index, device_index], timeout=timeout
-        )
-        if not resp:
-            return {"success": False, "name": "", "message": "No response"}
-
-        _addr, args = resp
-        # Response format: [track_id, device_id, name] or [name]
-        name = ""
-        if len(args) >= 3 and isinstance(args[2], str):
-            name = args[2]
-        elif len(args) >= 1 and isinstance(args[-1], str):
-            name = args[-1]
-
-        if not name:
-            return {"success": False, "name": "", "message": f"Unexpected response: {args}"}
-
-        return {"success": True, "name": name, "message": f"Device name: {name}"}
+        return self._run_async("get_device_name_sync", track_index, device_index, timeout=timeout)
 
     def select_device(self, track_index: int, device_index: int) -> Dict[str, Any]:
         """
@@ -1063,35 +791,14 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str}
         """
-        import socket
-        import struct
-
         try:
-            address = "/jarvis/device/select"
-
-            addr_bytes = address.encode('utf-8') + b'\x00'
-            addr_padded = addr_bytes + b'\x00' * ((4 - len(addr_bytes) % 4) % 4)
-
-            type_tag = ',ii'
-            type_bytes = type_tag.encode('utf-8') + b'\x00'
-            type_padded = type_bytes + b'\x00' * ((4 - len(type_bytes) % 4) % 4)
-
-            arg_data = struct.pack('>i', track_index) + struct.pack('>i', device_index)
-
-            message = addr_padded + type_padded + arg_data
-
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(5.0)
-            sock.bind(('127.0.0.1', 11003))
-            sock.sendto(message, ('127.0.0.1', 11002))
-
-            data, addr = sock.recvfrom(65535)
-            sock.close()
+            reply = get_loader_channel().request("/jarvis/device/select",
+                                                 [track_index, device_index], timeout=5.0)
+            if reply is None:
+                return {"success": False, "message": "Timeout: JarvisDeviceLoader not responding"}
 
             return {"success": True, "message": f"Device {device_index} on track {track_index} selected in Detail View"}
 
-        except socket.timeout:
-            return {"success": False, "message": "Timeout: JarvisDeviceLoader not responding"}
         except Exception as e:
             return {"success": False, "message": f"OSC error: {e}"}
 
@@ -1153,19 +860,8 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "names": list[str], "message": str}
         """
-        resp = self._send_and_wait("/live/device/get/parameters/name", [track_index, device_index], timeout=timeout)
-        if not resp:
-            return {"success": False, "names": [], "message": "No response"}
-
-        _addr, args = resp
-        # Common formats:
-        # - [track_id, device_id, "Param1", "Param2", ...]
-        # - ["Param1", "Param2", ...]
-        start = 0
-        if len(args) >= 2 and isinstance(args[0], int) and isinstance(args[1], int):
-            start = 2
-        names = [a for a in args[start:] if isinstance(a, str)]
-        return {"success": True, "names": names, "count": len(names), "message": f"Found {len(names)} parameters"}
+        return self._run_async("get_device_parameters_name_sync", track_index, device_index,
+                               timeout=timeout)
     
     def get_device_parameter_value(self, track_index, device_index, param_index):
         """
@@ -1198,19 +894,8 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "value": float|None, "message": str}
         """
-        resp = self._send_and_wait(
-            "/live/device/get/parameter/value",
-            [track_index, device_index, param_index],
-            timeout=timeout,
-        )
-        if not resp:
-            return {"success": False, "value": None, "message": "No response"}
-
-        _addr, args = resp
-        for arg in reversed(args):
-            if isinstance(arg, (int, float)):
-                return {"success": True, "value": float(arg), "message": "ok"}
-        return {"success": False, "value": None, "message": f"Unexpected response: {args}"}
+        return self._run_async("get_device_parameter_value_sync", track_index, device_index,
+                               param_index, timeout=timeout)
 
     def get_device_parameter_value_string_sync(
         self,
@@ -1315,47 +1000,76 @@ class AbletonController:
     def get_device_parameters_minmax_sync(self,
                                           track_index: int,
                                           device_index: int,
-                                          timeout: float = 3.0,
-                                          cache_ttl_s: float = 30.0) -> Dict[str, Any]:
+                                          timeout: float = 3.0) -> Dict[str, Any]:
         """
-        Get min/max arrays for all parameters (request/response) and cache them.
+        Get min/max arrays for all parameters, from the shared metadata cache.
+
+        Cached ranges stay valid until a device load/delete invalidates the slot.
 
         Returns:
             dict: {"success": bool, "mins": list[float], "maxs": list[float], "message": str}
         """
-        cache_key = (track_index, device_index)
-        now = time.time()
-        if cache_key in self._param_range_cache:
-            mins, maxs, ts = self._param_range_cache[cache_key]
-            if now - ts <= cache_ttl_s and mins and maxs:
-                return {"success": True, "mins": mins, "maxs": maxs, "message": "Using cached min/max"}
+        return self._run_async("get_device_parameters_minmax_sync", track_index, device_index,
+                               timeout=timeout)
+
+    def bind_device_metadata(self, track_index: int, device_index: int,
+                             timeout: float = 2.0) -> Optional[CachedDeviceInfo]:
+        """
+        Re-bind a slot to an already cached device type.
+
+        Asks only for class name, device name and parameter count (one round
+        trip, no per-parameter enumeration in Live).
+
+        Returns:
+            CachedDeviceInfo, or None if this device type has not been fetched yet
+        """
+        return self._run_async("bind_device_metadata", track_index, device_index, timeout=timeout)
 
-        resp_min = self._send_and_wait("/live/device/get/parameters/min", [track_index, device_index], timeout=timeout)
-        resp_max = self._send_and_wait("/live/device/get/parameters/max", [track_index, device_index], timeout=timeout)
-        if not resp_min or not resp_max:
-            return {"success": False, "mins": [], "maxs": [], "message": "No response for min/max"}
+    def get_device_metadata(self, track_index: int, device_index: int,
+                            timeout: float = 3.0,
+                            refresh: bool = False) -> Optional[CachedDeviceInfo]:
+        """
+        Parameter names and min/max for a device slot.
 
-        _addr_min, args_min = resp_min
-        _addr_max, args_max = resp_max
+        Served from the cache when the slot is bound, by re-binding to a known
+        device type, or by a fresh snapshot (which fills the cache).
 
-        # Strip optional leading track/device ids
-        def _strip_prefix(args: List[Any]) -> List[Any]:
-            if len(args) >= 2 and isinstance(args[0], int) and isinstance(args[1], int):
-                return args[2:]
-            return args
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            timeout: Query timeout
+            refresh: Skip the cache and re-read from Live
 
-        raw_mins = _strip_prefix(args_min)
-        raw_maxs = _strip_prefix(args_max)
+        Returns:
+            CachedDeviceInfo or None if the device did not answer
+        """
+        return self._run_async("get_device_metadata", track_index, device_index,
+                               timeout=timeout, refresh=refresh)
 
-        mins = [float(x) for x in raw_mins if isinstance(x, (int, float))]
-        maxs = [float(x) for x in raw_maxs if isinstance(x, (int, float))]
+    def get_device_state_snapshot(self,
+                                  track_index: int,
+                                  device_index: int,
+                                  timeout: float = 3.0,
+                                  include_values: bool = True) -> DeviceStateSnapshot:
+        """
+        Read a device's names, min, max and (optionally) values in one round trip.
 
-        if not mins or not maxs:
-            return {"success": False, "mins": [], "maxs": [], "message": f"Unexpected min/max response: {args_min} / {args_max}"}
+        Sends /live/device/get/name|class_name and
+        /live/device/get/parameters/name|min|max|value together and collects
+        all replies concurrently, instead of one blocking query after another.
+        Names and ranges are stored in the shared device metadata cache.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            timeout: Deadline for all replies
+            include_values: Also read current parameter values
 
-        # Cache
-        self._param_range_cache[cache_key] = (mins, maxs, now)
-        return {"success": True, "mins": mins, "maxs": maxs, "message": f"Fetched min/max for {min(len(mins), len(maxs))} params"}
+        Returns:
+            DeviceStateSnapshot (success=False if parameter names were not received)
+        """
+        return self._run_async("get_device_state_snapshot", track_index, device_index,
+                               timeout=timeout, include_values=include_values)
 
     def safe_set_device_parameter(self,
                                   track_index: int,
@@ -1368,52 +1082,8 @@ class AbletonController:
 
         This prevents AbletonOSC RuntimeError: Invalid value (which can destabilize the session).
         """
-        # Best-effort: fetch min/max; if unavailable, apply heuristic scaling.
-        minmax = self.get_device_parameters_minmax_sync(track_index, device_index, timeout=timeout)
-
-        original_v = float(value)
-        v = original_v
-        clamped = False
-        pmin = None
-        pmax = None
-        if minmax.get("success"):
-            mins: List[float] = minmax["mins"]
-            maxs: List[float] = minmax["maxs"]
-            if param_index < 0 or param_index >= min(len(mins), len(maxs)):
-                return {"success": False, "message": f"Param index {param_index} out of range (have {min(len(mins), len(maxs))})"}
-            pmin = mins[param_index]
-            pmax = maxs[param_index]
-
-            # Percent-to-normalized heuristic (common for Dry/Wet when some devices report 0..1)
-            if pmin >= 0.0 and pmax <= 1.0 and v > 1.0:
-                if v <= 100.0:
-                    v = v / 100.0
-                else:
-                    v = 1.0
-                clamped = True
-
-            # Clamp to range
-            if v < pmin:
-                v = pmin
-                clamped = True
-            if v > pmax:
-                v = pmax
-                clamped = True
-        else:
-            # If we don't know the range, avoid obviously dangerous values for normalized params
-            if v > 1.0 and v <= 100.0:
-                # conservative: many params are 0..1; try scaling
-                v = v / 100.0
-                clamped = True
-        result = self.set_device_parameter(track_index, device_index, param_index, v)
-        # Enrich for debugging
-        result.setdefault("original_value", original_v)
-        result.setdefault("sent_value", v)
-        result.setdefault("clamped", clamped)
-        if pmin is not None and pmax is not None:
-            result.setdefault("min", pmin)
-            result.setdefault("max", pmax)
-        return result
+        return self._run_async("safe_set_device_parameter", track_index, device_index,
+                               param_index, value, timeout=timeout)
     
     def set_device_parameter(self, track_index, device_index, param_index, value):
         """
@@ -1428,12 +1098,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "message": str}
         """
-        try:
-            self.client.send_message("/live/device/set/parameter/value", 
-                                     [track_index, device_index, param_index, float(value)])
-            return {"success": True, "message": f"Set parameter {param_index} on device {device_index + 1} to {value}"}
-        except Exception as e:
-            return {"success": False, "message": f"Failed to set device parameter: {e}"}
+        return self._run_async("set_device_parameter", track_index, device_index, param_index, value)
     
     def set_device_parameters_bulk(self, track_index, device_index, values):
         """
@@ -1455,46 +1120,66 @@ class AbletonController:
         except Exception as e:
             return {"success": False, "message": f"Failed to set device parameters: {e}"}
     
+    def write_device_parameters_bundled(self, track_index: int, device_index: int,
+                                        values: Dict[int, float],
+                                        verify: bool = True,
+                                        tolerance: float = 0.01,
+                                        skip_verify: Sequence[int] = (),
+                                        max_rounds: int = 3,
+                                        timeout: float = 2.0) -> Dict[str, Any]:
+        """
+        Write raw parameter values in OSC bundles, then confirm with one readback.
+
+        Values are sent as-is (no clamping or normalization). Writes the
+        /live/device/get/parameters/value readback does not confirm are resent
+        in smaller bundles, up to max_rounds; bundle size and the gap between
+        bundles come from the shared ParamWriteFlowControl.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            values: Dict mapping param_index -> value to send
+            verify: Read all values back after each round
+            tolerance: Readback tolerance (see find_dropped_writes)
+            skip_verify: Param indices whose readback is unreliable (never resent)
+            max_rounds: Maximum send rounds including the first
+            timeout: Readback timeout per round
+
+        Returns:
+            dict with applied/failed lists, verified, readback, bundles and rounds
+        """
+        return self._run_async("write_device_parameters_bundled", track_index, device_index, values,
+                               verify=verify, tolerance=tolerance, skip_verify=skip_verify,
+                               max_rounds=max_rounds, timeout=timeout)
+
     def set_device_parameters_batch(self, track_index: int, device_index: int,
                                      params: Dict[int, float],
-                                     inter_delay: float = 0.03) -> Dict[str, Any]:
+                                     inter_delay: float = 0.03,
+                                     bundled: bool = True) -> Dict[str, Any]:
         """
-        Set multiple device parameters individually with small delays between sends.
+        Set multiple device parameters, clamped to their min/max range.
 
-        Unlike set_device_parameters_bulk (which sends all values in one OSC message),
-        this method sends each parameter as a separate safe_set_device_parameter call
-        with a configurable delay to avoid overwhelming the OSC bridge.
+        By default the writes go out as OSC bundles with one verifying
+        readback (see write_device_parameters_bundled). With bundled=False
+        each parameter is sent as a separate safe_set_device_parameter call
+        followed by inter_delay seconds, as older bridges require.
 
         Args:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
             params: Dict mapping param_index -> value
-            inter_delay: Seconds to wait between parameter sends
+            inter_delay: Seconds to wait between sends (bundled=False only)
+            bundled: Send as OSC bundles with adaptive flow control
 
         Returns:
             dict with applied/failed lists
         """
-        import time as _time
-        applied = []
-        failed = []
+        return self._run_async("set_device_parameters_batch", track_index, device_index, params,
+                               inter_delay=inter_delay, bundled=bundled)
 
-        for param_index, value in params.items():
-            result = self.safe_set_device_parameter(track_index, device_index,
-                                                     int(param_index), float(value))
-            entry = {"param_index": int(param_index), "value": float(value)}
-            if result.get("success"):
-                applied.append(entry)
-            else:
-                entry["error"] = result.get("message", "unknown")
-                failed.append(entry)
-            _time.sleep(inter_delay)
-
-        return {
-            "success": len(failed) == 0,
-            "applied": applied,
-            "failed": failed,
-            "message": f"Set {len(applied)}/{len(applied)+len(failed)} parameters on device {device_index + 1}"
-        }
+    def get_param_write_stats(self) -> Dict[str, Any]:
+        """Bundled-write flow control counters (writes, dropped, backoffs, bundle_size, gap_s)."""
+        return self._param_flow.get_stats()
 
     def set_device_enabled(self, track_index, device_index, enabled):
         """
@@ -1666,31 +1351,7 @@ class AbletonController:
         Returns:
             dict: {"success": bool, "track_names": List[str], "message": str}
         """
-        try:
-            # Send request and wait for response
-            response = self._send_and_wait("/live/song/get/track_names", [], timeout=2.0)
-
-            if response:
-                address, args = response
-                # args should be a list of track names
-                if args and len(args) > 0:
-                    # First arg might be the list, or each arg is a track name
-                    if isinstance(args[0], list):
-                        track_names = args[0]
-                    else:
-                        track_names = args
-
-                    return {
-                        "success": True,
-                        "track_names": track_names,
-                        "message": f"Found {len(track_names)} tracks"
-                    }
-                else:
-                    return {"success": False, "track_names": [], "message": "Empty response from Ableton"}
-            else:
-                return {"success": False, "track_names": [], "message": "No response from Ableton (timeout)"}
-        except Exception as e:
-            return {"success": False, "track_names": [], "message": f"Failed to query track names: {e}"}
+        return self._run_async("get_track_names")
     
     def get_num_tracks(self):
         """Query number of tracks"""
@@ -1719,25 +1380,7 @@ class AbletonController:
                 "message": str
             }
         """
-        try:
-            result = self.get_track_names()
-            if result["success"] and "track_names" in result:
-                tracks = []
-                for i, name in enumerate(result["track_names"]):
-                    tracks.append({
-                        "index": i,  # 0-based index for code
-                        "display_index": i + 1,  # 1-based for user display
-                        "name": name
-                    })
-                return {
-                    "success": True,
-                    "tracks": tracks,
-                    "message": f"Found {len(tracks)} tracks"
-                }
-            else:
-                return {"success": False, "tracks": [], "message": result.get("message", "Failed to get tracks")}
-        except Exception as e:
-            return {"success": False, "tracks": [], "message": f"Failed to get track list: {e}"}
+        return self._run_async("get_track_list")
     
     # ==================== DEVICE LOADING (via JarvisDeviceLoader) ====================
     # These methods communicate with the JarvisDeviceLoader Remote Script on port 11002
@@ -1770,49 +1413,42 @@ class AbletonController:
     
     def _load_device_osc(self, track_index, device_name, position=-1):
         """Direct OSC call to load a device (via JarvisDeviceLoader)"""
-        import socket
-        import struct
-        
         try:
-            # Build OSC message for JarvisDeviceLoader
-            address = "/jarvis/device/load"
-            
-            # Address (null-terminated, padded to 4 bytes)
-            addr_bytes = address.encode('utf-8') + b'\x00'
-            addr_padded = addr_bytes + b'\x00' * ((4 - len(addr_bytes) % 4) % 4)
-            
-            # Type tag: int, string, int
-            type_tag = ',isi'
-            type_bytes = type_tag.encode('utf-8') + b'\x00'
-            type_padded = type_bytes + b'\x00' * ((4 - len(type_bytes) % 4) % 4)
-            
-            # Arguments
-            arg_data = struct.pack('>i', track_index)
-            str_bytes = device_name.encode('utf-8') + b'\x00'
-            str_padded = str_bytes + b'\x00' * ((4 - len(str_bytes) % 4) % 4)
-            arg_data += str_padded
-            arg_data += struct.pack('>i', position)
-            
-            message = addr_padded + type_padded + arg_data
-            
-            # Send to JarvisDeviceLoader port (11002)
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(10.0)
-            sock.bind(('127.0.0.1', 11003))  # Bind to response port
-            sock.sendto(message, ('127.0.0.1', 11002))
-            
-            # Wait for response
-            data, addr = sock.recvfrom(65535)
-            sock.close()
+            reply = get_loader_channel().request("/jarvis/device/load",
+                                                 [track_index, device_name, position], timeout=10.0)
+            if reply is None:
+                return {"success": False, "message": "Timeout: JarvisDeviceLoader not responding"}
             
             # Parse response (simplified)
             return {"success": True, "message": f"Device load request sent: {device_name}"}
             
-        except socket.timeout:
-            return {"success": False, "message": "Timeout: JarvisDeviceLoader not responding"}
         except Exception as e:
             return {"success": False, "message": f"OSC error: {e}"}
     
+    def delete_device(self, track_index, device_index):
+        """
+        Delete a device from a track (via JarvisDeviceLoader)
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            dict: {"success": bool, "message": str}
+        """
+        try:
+            message = encode_message("/jarvis/device/delete", [track_index, device_index])
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.sendto(message, ('127.0.0.1', 11002))
+            finally:
+                sock.close()
+            # Later devices shift down one slot
+            self.device_metadata.on_device_deleted(track_index, device_index)
+            return {"success": True, "message": f"Device {device_index + 1} delete request sent for track {track_index + 1}"}
+        except Exception as e:
+            return {"success": False, "message": f"Failed to delete device: {e}"}
+
     def load_device_with_preset(self, track_index, device_name, preset_path):
         """
         Load a device with a specific preset
@@ -2092,11 +1728,10 @@ class AbletonController:
             # Try sending from listener socket (preferred)
             sent_from = "none"
             if self._resp_sock is not None:
-                try:
-                    self._resp_sock.sendto(msg, (self.ip, self.port))
+                if self._send_raw(msg):
                     sent_from = f"listener ({self.ip}:{self.response_port})"
-                except Exception as exc:
-                    sent_from = f"listener_error: {exc}"
+                else:
+                    sent_from = "listener_error: send failed"
             else:
                 # Fallback: send from new socket
                 try:
@@ -2182,7 +1817,8 @@ class AbletonController:
         diag["total_received"] = len(received)
 
         # --- 5. Check for unmatched addresses ---
-        diag["unmatched_addresses"] = getattr(self, "_diag_unmatched", [])
+        diag["unmatched_addresses"] = list(self._mux.unmatched)
+        diag["query_stats"] = self._mux.get_stats()
 
         # --- 6. Verdict ---
         if not diag["listener_bound"]:
@@ -2208,5 +1844,14 @@ class AbletonController:
         return diag
 
 
+def _default_schema_store():
+    """The persistent device schema store, if the top-level module is importable."""
+    try:
+        from device_parameter_cache import device_cache
+        return device_cache
+    except ImportError:
+        return None
+
+
 # Singleton instance for easy import
-ableton = AbletonController()
+ableton = AbletonController(schema_store=_default_schema_store())
@@ -0,0 +1,430 @@
+"""
+Device Parameter Metadata Cache
+
+One cache for parameter names and min/max ranges, shared by
+AbletonController, AsyncAbletonController and ReliableParameterController.
+
+Entries are keyed by device IDENTITY, meaning the Live class name plus a
+signature of the parameter names, not by slot. A (track, device) slot is
+only a binding to an identity, so:
+
+- every EQ Eight in the set shares one entry, fetched once per session;
+- entries never expire by wall-clock time. Memory is bounded by LRU
+  eviction of identities;
+- bindings are dropped by explicit events: on_device_loaded(),
+  on_device_deleted() and on_track_cleared(). These are called from
+  load_device_verified, delete_device_osc and the pipeline's
+  _clear_track_devices, because indices after the change shift.
+
+A slot whose binding was dropped can be re-bound cheaply. The controller
+asks for class name, device name and parameter count, and bind_probe()
+reuses the cached identity when that probe key is known. This avoids
+enumerating every parameter's name/min/max again.
+
+Changes made directly in Live's UI are not observed; callers that suspect
+this can refetch with use_cache=False / refresh=True.
+
+With a schema store attached (device_parameter_cache.DeviceParameterCache),
+every newly fetched layout is persisted and the cache starts pre-seeded
+with all device types met in earlier sessions. A freshly loaded device can
+then be bound by name (bind_device_name) without any OSC query.
+
+Usage:
+    cache = DeviceMetadataCache()
+    cache.set(0, 1, "EQ Eight", names, mins, maxs, class_name="Eq8")
+    info = cache.get(0, 1)            # CachedDeviceInfo or None
+    cache.on_device_deleted(0, 0)     # slot (0, 1) shifted -> unbound
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+DeviceKey = Tuple[str, int, str]
+ProbeKey = Tuple[str, str, int]
+
+# Inaccessible devices (e.g. VSTs still initializing) are retried after this
+INACCESSIBLE_TTL_S = 10.0
+
+
+class ParamNameIndex:
+    """
+    Case-insensitive parameter-name lookup, built once per device type.
+
+    Gives the same answer as scanning the names in order (exact match, then
+    first name containing the query, then first name contained in the
+    query), but without touching every name:
+
+    - exact: a dict of lowered names;
+    - contains: a trigram index narrows the names that can contain the query;
+    - contained-in: the query's substrings are looked up in the exact dict.
+
+    Results are memoized per query, and ``resolved`` is free for callers to
+    memoize higher-level resolutions (aliases, semantic mappings) against
+    this device type.
+    """
+
+    NGRAM = 3
+
+    def __init__(self, param_names: List[str]):
+        self.lowered = [name.lower() for name in param_names]
+        self.exact: Dict[str, int] = {}
+        self.ngrams: Dict[str, List[int]] = {}
+        for i, name in enumerate(self.lowered):
+            self.exact.setdefault(name, i)
+            for gram in {name[j:j + self.NGRAM] for j in range(len(name) - self.NGRAM + 1)}:
+                self.ngrams.setdefault(gram, []).append(i)
+        self._memo: Dict[str, Optional[int]] = {}
+        self.resolved: Dict[Any, Optional[int]] = {}
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Parameter index for a name, or None."""
+        try:
+            return self._memo[name]
+        except KeyError:
+            pass
+        query = name.lower()
+        index = self.exact.get(query)
+        if index is None:
+            index = self._first_containing(query)
+        if index is None:
+            index = self._first_contained_in(query)
+        self._memo[name] = index
+        return index
+
+    def _first_containing(self, query: str) -> Optional[int]:
+        if len(query) < self.NGRAM:
+            return next((i for i, n in enumerate(self.lowered) if query in n), None)
+        candidates: Optional[set] = None
+        for j in range(len(query) - self.NGRAM + 1):
+            postings = self.ngrams.get(query[j:j + self.NGRAM])
+            if not postings:
+                return None
+            candidates = set(postings) if candidates is None else candidates & set(postings)
+            if not candidates:
+                return None
+        matches = [i for i in candidates if query in self.lowered[i]]
+        return min(matches) if matches else None
+
+    def _first_contained_in(self, query: str) -> Optional[int]:
+        found = [self.exact[sub] for sub in
+                 {query[a:b] for a in range(len(query)) for b in range(a, len(query) + 1)}
+                 if sub in self.exact]
+        return min(found) if found else None
+
+
+@dataclass
+class CachedDeviceInfo:
+    """Cached information about a device's parameters"""
+    device_name: str
+    param_names: List[str]
+    param_mins: List[float]
+    param_maxs: List[float]
+    timestamp: float
+    ttl: Optional[float] = None  # None = valid until invalidated by a device event
+    accessible: bool = True
+    is_vst: bool = False
+    class_name: str = ""
+    param_quantized: Optional[List[bool]] = None
+    _name_index: Optional[ParamNameIndex] = field(default=None, init=False, repr=False,
+                                                  compare=False)
+
+    def is_expired(self) -> bool:
+        """Check if cache entry is expired"""
+        return self.ttl is not None and time.time() - self.timestamp > self.ttl
+
+    @property
+    def param_count(self) -> int:
+        return len(self.param_names)
+
+    @property
+    def name_index(self) -> ParamNameIndex:
+        """Name index over param_names (built on first use, shared by all slots)."""
+        index = self._name_index
+        if index is None or len(index.lowered) != len(self.param_names):
+            index = self._name_index = ParamNameIndex(self.param_names)
+        return index
+
+    def get_param_index(self, name: str) -> Optional[int]:
+        """Find parameter index by name (case-insensitive, exact then partial)"""
+        return self.name_index.lookup(name)
+
+
+def device_key(class_name: str, param_names: List[str]) -> DeviceKey:
+    """Identity of a device type: class name + parameter-name signature."""
+    digest = hashlib.sha1("\x1f".join(param_names).encode("utf-8")).hexdigest()[:16]
+    return (class_name or "", len(param_names), digest)
+
+
+class DeviceMetadataCache:
+    """
+    Thread-safe, identity-keyed LRU cache of device parameter metadata.
+
+    Keeps the get/set/invalidate/invalidate_track/clear/stats API of the
+    former per-slot ParameterCache.
+    """
+
+    def __init__(self, max_entries: int = 256, default_ttl: Optional[float] = None,
+                 schema_store=None):
+        """
+        Args:
+            max_entries: Device identities kept before LRU eviction
+            default_ttl: Optional wall-clock TTL for accessible entries
+                (None = event-invalidated only)
+            schema_store: Optional persistent DeviceParameterCache to seed
+                from and record new layouts into
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[DeviceKey, CachedDeviceInfo]" = OrderedDict()
+        self._slots: Dict[Tuple[int, int], DeviceKey] = {}
+        self._probes: Dict[ProbeKey, DeviceKey] = {}
+        self._names: Dict[str, DeviceKey] = {}
+        self._stats = {"hits": 0, "misses": 0, "probe_hits": 0, "name_hits": 0,
+                       "evictions": 0, "invalidations": 0}
+        self._schema_store = None
+        if schema_store is not None:
+            self.attach_schema_store(schema_store)
+
+    # ==================== SCHEMA STORE ====================
+
+    def attach_schema_store(self, store) -> int:
+        """
+        Seed from a persistent schema store and record future layouts into it.
+
+        Returns:
+            Number of device types seeded
+        """
+        self._schema_store = store
+        seeded = 0
+        with self._lock:
+            for schema in store.list_schemas():
+                info = CachedDeviceInfo(
+                    device_name=schema.device_name,
+                    param_names=list(schema.names),
+                    param_mins=list(schema.mins),
+                    param_maxs=list(schema.maxs),
+                    timestamp=time.time(),
+                    ttl=self.default_ttl,
+                    class_name=schema.class_name,
+                    param_quantized=schema.quantized,
+                )
+                self._remember_locked(device_key(schema.class_name, info.param_names), info)
+                seeded += 1
+        return seeded
+
+    def needs_quantization(self, class_name: str, device_name: str) -> bool:
+        """True if the schema store has this layout but not its is_quantized flags."""
+        if self._schema_store is None or not class_name:
+            return False
+        schema = self._schema_store.get_schema(class_name, device_name)
+        return schema is not None and schema.quantized is None
+
+    def record_quantization(self, track_index: int, device_index: int,
+                            quantized: List[bool]) -> bool:
+        """Attach is_quantized flags to the layout bound at a slot (and persist them)."""
+        info = self.get(track_index, device_index)
+        if info is None or len(quantized) != info.param_count:
+            return False
+        info.param_quantized = [bool(q) for q in quantized]
+        if self._schema_store is not None and info.class_name:
+            self._schema_store.record_schema(info.class_name, info.device_name, info.param_names,
+                                             info.param_mins, info.param_maxs,
+                                             quantized=info.param_quantized)
+        return True
+
+    # ==================== LOOKUP ====================
+
+    def get(self, track_index: int, device_index: int) -> Optional[CachedDeviceInfo]:
+        """Metadata bound to a slot, or None if unbound (or expired)."""
+        slot = (track_index, device_index)
+        with self._lock:
+            key = self._slots.get(slot)
+            info = self._entries.get(key) if key is not None else None
+            if info is None or info.is_expired():
+                if key is not None:
+                    del self._slots[slot]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return info
+
+    def get_ranges(self, track_index: int,
+                   device_index: int) -> Optional[Tuple[List[float], List[float]]]:
+        """(mins, maxs) for a bound slot, or None."""
+        info = self.get(track_index, device_index)
+        if info is None or not info.param_mins or not info.param_maxs:
+            return None
+        return info.param_mins, info.param_maxs
+
+    def known_device_types(self) -> int:
+        """Number of device types a probe could be bound to."""
+        with self._lock:
+            return len(self._probes)
+
+    def find_device_name(self, device_name: str) -> Optional[CachedDeviceInfo]:
+        """Metadata of a known device type by device name, without binding a slot."""
+        with self._lock:
+            key = self._names.get((device_name or "").lower())
+            info = self._entries.get(key) if key is not None else None
+            if info is None or info.is_expired():
+                return None
+            return info
+
+    def bind_device_name(self, track_index: int, device_index: int,
+                         device_name: str) -> Optional[CachedDeviceInfo]:
+        """
+        Bind a slot by the name of the device just loaded into it (no OSC query).
+
+        Returns:
+            The shared CachedDeviceInfo, or None if no device of that name is known
+        """
+        with self._lock:
+            key = self._names.get((device_name or "").lower())
+            info = self._entries.get(key) if key is not None else None
+            if info is None or info.is_expired():
+                return None
+            self._slots[(track_index, device_index)] = key
+            self._entries.move_to_end(key)
+            self._stats["name_hits"] += 1
+            return info
+
+    def bind_probe(self, track_index: int, device_index: int, class_name: str,
+                   device_name: str, param_count: int) -> Optional[CachedDeviceInfo]:
+        """
+        Bind a slot to a known identity from a cheap (class, name, count) probe.
+
+        Returns:
+            The shared CachedDeviceInfo, or None if this device type is unknown
+        """
+        with self._lock:
+            key = self._probes.get((class_name or "", device_name or "", int(param_count)))
+            info = self._entries.get(key) if key is not None else None
+            if info is None or info.is_expired():
+                return None
+            self._slots[(track_index, device_index)] = key
+            self._entries.move_to_end(key)
+            self._stats["probe_hits"] += 1
+            return info
+
+    # ==================== STORE ====================
+
+    def set(self, track_index: int, device_index: int,
+            device_name: str, param_names: List[str],
+            param_mins: List[float], param_maxs: List[float],
+            accessible: bool = True, is_vst: bool = False,
+            class_name: str = "") -> CachedDeviceInfo:
+        """Store metadata for its identity and bind the slot to it."""
+        info = CachedDeviceInfo(
+            device_name=device_name,
+            param_names=param_names,
+            param_mins=param_mins,
+            param_maxs=param_maxs,
+            timestamp=time.time(),
+            ttl=self.default_ttl if accessible else INACCESSIBLE_TTL_S,
+            accessible=accessible,
+            is_vst=is_vst,
+            class_name=class_name,
+        )
+        if accessible:
+            key = device_key(class_name, param_names)
+        else:
+            # Nothing identifies an inaccessible device; keep it slot-private
+            key = ("<inaccessible>", track_index, str(device_index))
+        with self._lock:
+            if accessible:
+                previous = self._entries.get(key)
+                if previous is not None and previous.param_quantized is not None:
+                    info.param_quantized = previous.param_quantized
+                self._remember_locked(key, info)
+            else:
+                self._entries[key] = info
+                self._entries.move_to_end(key)
+            self._slots[(track_index, device_index)] = key
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest_locked()
+        if accessible and self._schema_store is not None and isinstance(class_name, str):
+            self._schema_store.record_schema(class_name, device_name, param_names,
+                                             param_mins, param_maxs)
+        return info
+
+    def _remember_locked(self, key: DeviceKey, info: CachedDeviceInfo) -> None:
+        info.name_index  # build once here rather than on the first lookup
+        self._entries[key] = info
+        self._entries.move_to_end(key)
+        self._probes[(info.class_name or "", info.device_name or "", info.param_count)] = key
+        if info.device_name:
+            self._names[info.device_name.lower()] = key
+        while len(self._entries) > self.max_entries:
+            self._evict_oldest_locked()
+
+    def _evict_oldest_locked(self) -> None:
+        key, _info = self._entries.popitem(last=False)
+        self._slots = {slot: k for slot, k in self._slots.items() if k != key}
+        self._probes = {probe: k for probe, k in self._probes.items() if k != key}
+        self._names = {name: k for name, k in self._names.items() if k != key}
+        self._stats["evictions"] += 1
+
+    # ==================== INVALIDATION ====================
+
+    def _unbind_locked(self, predicate) -> int:
+        slots = [slot for slot in self._slots if predicate(slot)]
+        for slot in slots:
+            del self._slots[slot]
+        self._stats["invalidations"] += len(slots)
+        return len(slots)
+
+    def invalidate(self, track_index: int, device_index: int) -> bool:
+        """Unbind one slot (the device-type entry stays cached)."""
+        with self._lock:
+            return self._unbind_locked(lambda slot: slot == (track_index, device_index)) > 0
+
+    def invalidate_track(self, track_index: int) -> int:
+        """Unbind every slot on a track."""
+        with self._lock:
+            return self._unbind_locked(lambda slot: slot[0] == track_index)
+
+    def on_device_loaded(self, track_index: int, device_index: Optional[int] = None) -> int:
+        """A device was inserted at device_index: that slot and all after it shift."""
+        if device_index is None or device_index < 0:
+            return self.invalidate_track(track_index)
+        with self._lock:
+            return self._unbind_locked(
+                lambda slot: slot[0] == track_index and slot[1] >= device_index)
+
+    def on_device_deleted(self, track_index: int, device_index: int) -> int:
+        """A device was removed: its slot and all after it shift."""
+        return self.on_device_loaded(track_index, device_index)
+
+    def on_track_cleared(self, track_index: int) -> int:
+        """All devices on a track were removed."""
+        return self.invalidate_track(track_index)
+
+    def clear(self) -> int:
+        """Clear all cache entries"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._slots.clear()
+            self._probes.clear()
+            self._names.clear()
+            return count
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            expired = sum(1 for info in self._entries.values() if info.is_expired())
+            stats = dict(self._stats)
+            stats.update({
+                "total_entries": len(self._entries),
+                "expired_entries": expired,
+                "active_entries": len(self._entries) - expired,
+                "bound_slots": len(self._slots),
+                "max_entries": self.max_entries,
+            })
+            return stats
@@ -0,0 +1,286 @@
+"""
+JarvisDeviceLoader Request Channel
+
+The JarvisDeviceLoader Remote Script listens on UDP 11002 and always answers
+on 11003. Binding 11003 per request means concurrent callers (plugin
+discovery, device loads, track-type checks, deletes) race for the port and
+fail with "address already in use". This module owns that port once: a
+single socket, bound for the life of the process, sends every request and a
+listener thread routes replies through an OSCResponseMux.
+
+Requests carry an id when the Remote Script supports it:
+
+    /jarvis/req [id, address, *args]  ->  /jarvis/reply [id, reply_address, *args]
+
+so a late reply to a timed-out request can never be handed to the next
+caller. Older Remote Scripts (no "req" capability in their /jarvis/test
+reply) get plain messages, matched oldest-first per reply address. The
+capability check runs once per bound socket; if the Remote Script does not
+answer it, plain messages are used and the check is retried only after
+NEGOTIATE_BACKOFF_S, so a silent Live does not cost every request a probe.
+
+Usage:
+    channel = get_loader_channel()
+    reply = channel.request("/jarvis/track/type", [0], timeout=3.0)
+    if reply:
+        address, args = reply
+
+    # Unsolicited notifications: register BEFORE triggering them
+    events = channel.expect(["/jarvis/device/loaded"], [track_index, load_id])
+    channel.request("/jarvis/device/load", [track_index, "EQ Eight", -1, load_id])
+    loaded = channel.wait(events, timeout=10.0)
+"""
+
+import atexit
+import itertools
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .osc_codec import OSCCodecError, decode_message, encode_message
+from .response_mux import OSCResponseMux, PendingQuery
+
+LOADER_HOST = "127.0.0.1"
+LOADER_SEND_PORT = 11002
+LOADER_RECV_PORT = 11003
+MAX_IN_FLIGHT = 4  # concurrent requests; the Remote Script handles them in order
+NEGOTIATE_TIMEOUT = 0.5  # longest a request waits on the /jarvis/test probe
+NEGOTIATE_BACKOFF_S = 30.0  # after an unanswered probe, before probing again
+
+
+class LoaderChannel:
+    """
+    One long-lived request/reply channel to JarvisDeviceLoader.
+
+    Thread-safe: any number of threads may call request() at once; at most
+    ``max_in_flight`` of them have a request outstanding.
+    """
+
+    def __init__(self, host: str = LOADER_HOST, send_port: int = LOADER_SEND_PORT,
+                 recv_port: int = LOADER_RECV_PORT, max_in_flight: int = MAX_IN_FLIGHT):
+        self.host = host
+        self.send_port = send_port
+        self.recv_port = recv_port
+        self.max_in_flight = max_in_flight
+        self._mux = OSCResponseMux()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._listener: Optional[threading.Thread] = None
+        self._running = False
+        # None until a /jarvis/test reply says whether /jarvis/req is understood
+        self._ids_supported: Optional[bool] = None
+        self._negotiate_lock = threading.Lock()
+        self._negotiate_after = 0.0  # monotonic time the next probe is allowed
+        self.stats = {"requests": 0, "timeouts": 0, "saturated": 0, "negotiations": 0}
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> None:
+        """
+        Bind the reply port and start the listener (idempotent).
+
+        Raises:
+            OSError: If the reply port is held by another process
+        """
+        with self._lock:
+            if self._running:
+                return
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.bind((self.host, self.recv_port))
+            except OSError as e:
+                sock.close()
+                raise OSError(
+                    f"Response port {self.recv_port} is already in use. "
+                    "Jarvis needs exclusive access to receive JarvisDeviceLoader replies."
+                ) from e
+            sock.settimeout(0.5)
+            self._sock = sock
+            # A new connection may face a different Remote Script: ask again
+            self._ids_supported = None
+            self._negotiate_after = 0.0
+            self._running = True
+            self._listener = threading.Thread(target=self._listen, daemon=True,
+                                              name=f"loader-channel-{self.recv_port}")
+            self._listener.start()
+
+    def close(self) -> None:
+        """Stop the listener and release the reply port."""
+        with self._lock:
+            self._running = False
+            sock, self._sock = self._sock, None
+        if self._listener is not None:
+            self._listener.join(timeout=1.0)
+            self._listener = None
+        if sock is not None:
+            sock.close()
+
+    def _listen(self) -> None:
+        while self._running:
+            sock = self._sock
+            if sock is None:
+                break
+            try:
+                data, _addr = sock.recvfrom(65535)
+            except socket.timeout:
+                continue
+            except ConnectionResetError:
+                continue  # ICMP port unreachable from an earlier send (Windows)
+            except OSError:
+                break
+            try:
+                address, args = decode_message(data)
+            except OSCCodecError:
+                continue
+            self._mux.dispatch(address, args)
+
+    # ==================== REQUESTS ====================
+
+    def send(self, address: str, args: Sequence[Any] = ()) -> None:
+        """Fire-and-forget message to the Remote Script."""
+        self.start()
+        self._sock.sendto(encode_message(address, list(args)), (self.host, self.send_port))
+
+    def request(self, address: str, args: Sequence[Any] = (), timeout: float = 5.0,
+                reply_address: Optional[str] = None) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Send a request and wait for its reply.
+
+        Args:
+            address: Request address, e.g. "/jarvis/track/type"
+            args: Request arguments
+            timeout: Seconds to wait in total (for a free in-flight slot, the
+                capability check and the reply)
+            reply_address: Reply address (default: address + "/response")
+
+        Returns:
+            (reply_address, args), or None on timeout
+
+        Raises:
+            OSError: If the reply port cannot be bound
+        """
+        self.start()
+        deadline = time.monotonic() + timeout
+        reply_address = reply_address or address + "/response"
+        if not self._slots.acquire(timeout=timeout):
+            self.stats["saturated"] += 1
+            return None
+        try:
+            self.stats["requests"] += 1
+            if address != "/jarvis/test":
+                self._ensure_negotiated(deadline)
+            if self._ids_supported:
+                return self._request_with_id(address, args, _remaining(deadline))
+            pending = self._mux.register([reply_address])
+            self._sock.sendto(encode_message(address, list(args)), (self.host, self.send_port))
+            reply = self._mux.wait(pending, _remaining(deadline))
+            if reply is None:
+                self.stats["timeouts"] += 1
+            elif address == "/jarvis/test":
+                self._note_capabilities(reply[1])
+            return reply
+        finally:
+            self._slots.release()
+
+    def _request_with_id(self, address: str, args: Sequence[Any],
+                         timeout: float) -> Optional[Tuple[str, List[Any]]]:
+        request_id = next(self._ids)
+        pending = self._mux.register(["/jarvis/reply"], [request_id])
+        self._sock.sendto(encode_message("/jarvis/req", [request_id, address] + list(args)),
+                          (self.host, self.send_port))
+        reply = self._mux.wait(pending, timeout)
+        if reply is None:
+            self.stats["timeouts"] += 1
+            return None
+        _, reply_args = reply
+        return str(reply_args[1]), list(reply_args[2:])
+
+    def _ensure_negotiated(self, deadline: float) -> None:
+        """
+        Probe the Remote Script's capabilities unless they are known or an
+        unanswered probe is still backing off. One caller probes at a time;
+        the others wait for its answer, within their own deadline.
+        """
+        if self._ids_supported is not None or time.monotonic() < self._negotiate_after:
+            return
+        if not self._negotiate_lock.acquire(timeout=_remaining(deadline)):
+            return
+        try:
+            if self._ids_supported is None and time.monotonic() >= self._negotiate_after:
+                self._negotiate(min(_remaining(deadline), NEGOTIATE_TIMEOUT))
+        finally:
+            self._negotiate_lock.release()
+
+    def _negotiate(self, timeout: float) -> None:
+        """Ask the Remote Script for its capabilities (left unknown if silent)."""
+        self.stats["negotiations"] += 1
+        pending = self._mux.register(["/jarvis/test/response"])
+        self._sock.sendto(encode_message("/jarvis/test", []), (self.host, self.send_port))
+        reply = self._mux.wait(pending, timeout)
+        if reply is not None:
+            self._note_capabilities(reply[1])
+        else:
+            self._negotiate_after = time.monotonic() + NEGOTIATE_BACKOFF_S
+
+    def _note_capabilities(self, args: Sequence[Any]) -> None:
+        self._ids_supported = "req" in args[1:]
+
+    # ==================== NOTIFICATIONS ====================
+
+    def expect(self, addresses: Sequence[str], prefix: Sequence[Any] = ()) -> PendingQuery:
+        """
+        Register for an unsolicited message (e.g. /jarvis/device/loaded)
+        whose arguments start with ``prefix``. Call before triggering it.
+        """
+        self.start()
+        return self._mux.register(addresses, prefix)
+
+    def wait(self, pending: PendingQuery, timeout: float) -> Optional[Tuple[str, List[Any]]]:
+        """Wait for a message registered with expect(); None on timeout."""
+        return self._mux.wait(pending, timeout)
+
+    def cancel(self, pending: PendingQuery) -> None:
+        """Drop an expect() registration that is no longer needed."""
+        self._mux.cancel(pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request counters plus the reply table's matching stats."""
+        stats = dict(self.stats)
+        stats["ids_supported"] = self._ids_supported
+        stats["mux"] = self._mux.get_stats()
+        return stats
+
+
+def _remaining(deadline: float) -> float:
+    return max(0.0, deadline - time.monotonic())
+
+
+_channels: Dict[Tuple[str, int, int], LoaderChannel] = {}
+_channels_lock = threading.Lock()
+
+
+def get_loader_channel(host: str = LOADER_HOST, send_port: int = LOADER_SEND_PORT,
+                       recv_port: int = LOADER_RECV_PORT,
+                       max_in_flight: int = MAX_IN_FLIGHT) -> LoaderChannel:
+    """Get the process-wide channel for a loader address (created unstarted)."""
+    key = (host, send_port, recv_port)
+    with _channels_lock:
+        channel = _channels.get(key)
+        if channel is None:
+            channel = LoaderChannel(host, send_port, recv_port, max_in_flight)
+            _channels[key] = channel
+        return channel
+
+
+def close_loader_channels() -> None:
+    """Release every channel's reply port (they rebind on next use)."""
+    with _channels_lock:
+        channels = list(_channels.values())
+    for channel in channels:
+        channel.close()
+
+
+atexit.register(close_loader_channels)
@@ -0,0 +1,142 @@
+"""
+Bundled Parameter Writes
+
+Setting a preset used to cost one ``/live/device/set/parameter/value``
+datagram per parameter plus a fixed sleep after each, so a 30-parameter
+device spent over a second in sleeps before verification even started.
+
+Here many writes are packed into OSC bundles (AbletonOSC's server parses
+every datagram with python-osc's ``OscPacket`` and dispatches each bundled
+message exactly like a standalone one), followed by ONE
+``/live/device/get/parameters/value`` readback. Writes the readback does not
+confirm are resent, so the cost scales with the number of bundles rather
+than the number of parameters.
+
+ParamWriteFlowControl adapts the bundle size and the gap between bundles
+(additive increase, multiplicative decrease), and it only backs off when a
+readback actually shows dropped writes.
+
+Usage:
+    flow = ParamWriteFlowControl()
+    size, gap = flow.plan()
+    for packet in param_write_bundles(track, device, {3: 0.5, 4: 0.25}, size):
+        sock.sendto(packet, addr)
+        time.sleep(gap)
+    dropped = find_dropped_writes({3: 0.5, 4: 0.25}, readback_values)
+    flow.record(sent=2, dropped=len(dropped))
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .osc_codec import encode_bundle
+
+SET_PARAM_ADDRESS = "/live/device/set/parameter/value"
+
+
+class ParamWriteFlowControl:
+    """
+    Adaptive bundle size / inter-bundle gap for parameter writes.
+
+    Clean readbacks grow the bundle by ``increase`` messages and halve the
+    gap; a readback with dropped writes halves the bundle and doubles the
+    gap (starting from ``backoff_gap_s``). Thread-safe, so one instance can
+    be shared by the sync facade and the asyncio transport.
+    """
+
+    def __init__(self, bundle_size: int = 32, min_bundle: int = 1, max_bundle: int = 64,
+                 max_gap_s: float = 0.1, backoff_gap_s: float = 0.005, increase: int = 8):
+        self.min_bundle = min_bundle
+        self.max_bundle = max_bundle
+        self.max_gap_s = max_gap_s
+        self.backoff_gap_s = backoff_gap_s
+        self.increase = increase
+        self.bundle_size = max(min_bundle, min(bundle_size, max_bundle))
+        self.gap_s = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"writes": 0, "dropped": 0, "backoffs": 0, "clean_rounds": 0}
+
+    def plan(self) -> Tuple[int, float]:
+        """Current (bundle_size, gap_s) to use for the next round."""
+        with self._lock:
+            return self.bundle_size, self.gap_s
+
+    def record(self, sent: int, dropped: int) -> None:
+        """Feed back the outcome of one verified round of writes."""
+        with self._lock:
+            self.stats["writes"] += sent
+            self.stats["dropped"] += dropped
+            if dropped:
+                self.stats["backoffs"] += 1
+                self.bundle_size = max(self.min_bundle, self.bundle_size // 2)
+                self.gap_s = min(self.max_gap_s, max(self.backoff_gap_s, self.gap_s * 2))
+            else:
+                self.stats["clean_rounds"] += 1
+                self.bundle_size = min(self.max_bundle, self.bundle_size + self.increase)
+                self.gap_s = self.gap_s / 2 if self.gap_s > self.backoff_gap_s / 4 else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of counters plus the current bundle size and gap."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["bundle_size"] = self.bundle_size
+            stats["gap_s"] = self.gap_s
+        return stats
+
+
+def param_write_bundles(track_index: int, device_index: int,
+                        values: Dict[int, float], bundle_size: int) -> List[bytes]:
+    """Encode ``param_index -> value`` writes as OSC bundles of ``bundle_size`` messages."""
+    messages = [(SET_PARAM_ADDRESS, [track_index, device_index, int(i), float(v)])
+                for i, v in values.items()]
+    step = max(1, bundle_size)
+    return [encode_bundle(messages[i:i + step]) for i in range(0, len(messages), step)]
+
+
+def find_dropped_writes(expected: Dict[int, float], readback: Sequence[float],
+                        tolerance: float = 0.01, skip: Iterable[int] = ()) -> List[int]:
+    """
+    Parameter indices whose readback does not match the written value.
+
+    ``tolerance`` is absolute for values within [-1, 1] and relative to the
+    magnitude of larger values. Indices in ``skip`` (parameters whose
+    readback is known to be unreliable) and indices past the end of the
+    readback are never reported.
+    """
+    skip = set(skip)
+    dropped = []
+    for index, value in expected.items():
+        if index in skip or index >= len(readback):
+            continue
+        if abs(readback[index] - value) > tolerance * max(1.0, abs(value)):
+            dropped.append(index)
+    return dropped
+
+
+def bundled_write_result(device_index: int, values: Dict[int, float], unconfirmed: Iterable[int],
+                         readback: Dict[int, float], verified: bool,
+                         bundles: int, rounds: int) -> Dict[str, Any]:
+    """Result dict shared by the sync and asyncio write_device_parameters_bundled()."""
+    unconfirmed = set(unconfirmed)
+    applied = []
+    failed = []
+    for index, value in values.items():
+        entry = {"param_index": index, "value": value}
+        if index in readback:
+            entry["actual_value"] = readback[index]
+        if index in unconfirmed:
+            entry["error"] = "Write not confirmed by readback"
+            failed.append(entry)
+        else:
+            applied.append(entry)
+    return {
+        "success": not failed,
+        "applied": applied,
+        "failed": failed,
+        "verified": verified,
+        "readback": readback,
+        "bundles": bundles,
+        "rounds": rounds,
+        "message": (f"Set {len(applied)}/{len(values)} parameters on device {device_index + 1} "
+                    f"in {bundles} bundle(s)"),
+    }
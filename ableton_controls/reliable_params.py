@@ -25,11 +25,11 @@ Usage:
 """
 
 import time
-import threading
 import math
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+
+from .device_metadata import CachedDeviceInfo, DeviceMetadataCache
 
 
 # ============================================================================
@@ -344,129 +344,8 @@ def smart_normalize_parameter(param_name: str, value: float, device_name: str =
     return (max(0.0, min(1.0, value)), "passthrough")
 
 
-@dataclass
-class CachedDeviceInfo:
-    """Cached information about a device's parameters"""
-    device_name: str
-    param_names: List[str]
-    param_mins: List[float]
-    param_maxs: List[float]
-    timestamp: float
-    ttl: float = 300.0  # 5 minutes default
-    accessible: bool = True
-    is_vst: bool = False
-    
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired"""
-        return time.time() - self.timestamp > self.ttl
-    
-    @property
-    def param_count(self) -> int:
-        return len(self.param_names)
-
-    def get_param_index(self, name: str) -> Optional[int]:
-        """Find parameter index by name (case-insensitive)"""
-        name_lower = name.lower()
-        
-        # Exact match first
-        for i, param_name in enumerate(self.param_names):
-            if param_name.lower() == name_lower:
-                return i
-        
-        # Partial match (name contains search term)
-        for i, param_name in enumerate(self.param_names):
-            if name_lower in param_name.lower():
-                return i
-        
-        # Reverse partial match (search term contains param name)
-        for i, param_name in enumerate(self.param_names):
-            if param_name.lower() in name_lower:
-                return i
-        
-        return None
-
-
-class ParameterCache:
-    """
-    Thread-safe cache for device parameter information.
-    
-    Caches parameter names, min/max values to avoid repeated OSC queries.
-    Automatically expires entries after TTL.
-    """
-    
-    def __init__(self, default_ttl: float = 300.0):
-        self._cache: Dict[Tuple[int, int], CachedDeviceInfo] = {}
-        self._lock = threading.Lock()
-        self.default_ttl = default_ttl
-    
-    def get(self, track_index: int, device_index: int) -> Optional[CachedDeviceInfo]:
-        """Get cached device info, returns None if not cached or expired"""
-        key = (track_index, device_index)
-        with self._lock:
-            if key in self._cache:
-                info = self._cache[key]
-                if not info.is_expired():
-                    return info
-                else:
-                    # Remove expired entry
-                    del self._cache[key]
-        return None
-    
-    def set(self, track_index: int, device_index: int, 
-            device_name: str, param_names: List[str],
-            param_mins: List[float], param_maxs: List[float],
-            accessible: bool = True, is_vst: bool = False) -> CachedDeviceInfo:
-        """Cache device parameter information"""
-        key = (track_index, device_index)
-        info = CachedDeviceInfo(
-            device_name=device_name,
-            param_names=param_names,
-            param_mins=param_mins,
-            param_maxs=param_maxs,
-            timestamp=time.time(),
-            ttl=self.default_ttl,
-            accessible=accessible,
-            is_vst=is_vst
-        )
-        with self._lock:
-            self._cache[key] = info
-        return info
-    
-    def invalidate(self, track_index: int, device_index: int) -> bool:
-        """Invalidate a specific cache entry"""
-        key = (track_index, device_index)
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-        return False
-    
-    def invalidate_track(self, track_index: int) -> int:
-        """Invalidate all cache entries for a track"""
-        count = 0
-        with self._lock:
-            keys_to_remove = [k for k in self._cache if k[0] == track_index]
-            for key in keys_to_remove:
-                del self._cache[key]
-                count += 1
-        return count
-    
-    def clear(self) -> int:
-        """Clear all cache entries"""
-        with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            return count
-    
-    def stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
-        with self._lock:
-            expired = sum(1 for info in self._cache.values() if info.is_expired())
-            return {
-                "total_entries": len(self._cache),
-                "expired_entries": expired,
-                "active_entries": len(self._cache) - expired
-            }
+# The per-slot ParameterCache is now the shared, device-type keyed cache
+ParameterCache = DeviceMetadataCache
 
 
 class ReliableParameterController:
@@ -490,7 +369,10 @@ class ReliableParameterController:
             verbose: Enable verbose logging for debugging
         """
         self.ableton = ableton_controller
-        self.cache = ParameterCache()
+        # Share the controller's metadata cache so both layers see one copy
+        shared = getattr(ableton_controller, "device_metadata", None)
+        self._shared_metadata = isinstance(shared, DeviceMetadataCache)
+        self.cache = shared if self._shared_metadata else DeviceMetadataCache()
         self.verbose = verbose
         
         # Configuration - INCREASED DELAYS for state synchronization reliability
@@ -500,6 +382,10 @@ class ReliableParameterController:
         self.poll_interval = 0.15         # 150ms between polls (increased from 100ms)
         self.value_tolerance = 0.01       # tolerance for value verification
         self.device_load_delay = 0.5      # 500ms minimum delay after device load
+
+        # Slots the Remote Script reported as loaded (/jarvis/device/loaded),
+        # consumed by the next wait_for_device_ready on that slot
+        self._loaded_events: Dict[Tuple[int, int], int] = {}
     
     def _log(self, msg: str, level: str = "DEBUG"):
         """Log message if verbose mode is enabled"""
@@ -521,7 +407,9 @@ class ReliableParameterController:
         """
         Wait for a device to be ready (parameters accessible).
         
-        Polls the device until parameters can be fetched or timeout.
+        Returns at once if load_device_verified just received the Remote
+        Script's load notification for this slot; otherwise polls the device
+        until parameters can be fetched or timeout.
         
         Args:
             track_index: Track index (0-based)
@@ -532,6 +420,12 @@ class ReliableParameterController:
             True if device is ready, False if timeout
         """
         timeout = timeout or self.default_ready_timeout
+        num_parameters = self._loaded_events.pop((track_index, device_index), 0)
+        if num_parameters > 0:
+            self._log(f"wait_for_device_ready: track={track_index}, device={device_index} "
+                     f"reported loaded with {num_parameters} parameters", "SUCCESS")
+            return True
+
         start_time = time.time()
         attempts = 0
         
@@ -579,12 +473,12 @@ class ReliableParameterController:
             CachedDeviceInfo or None if failed
         """
         try:
-            # Fetch parameter names
-            names_result = self.ableton.get_device_parameters_name_sync(
-                track_index, device_index, timeout=timeout
+            # Names, min/max and device name in a single pipelined round trip
+            snapshot = self.ableton.get_device_state_snapshot(
+                track_index, device_index, timeout=timeout, include_values=False
             )
-            
-            if not names_result.get("success") or not names_result.get("names"):
+
+            if not snapshot.success or not snapshot.names:
                 # Device might be a VST with locked parameters
                 self._log(f"_fetch_device_info: Could not fetch params for "
                          f"track={track_index}, device={device_index}", "WARN")
@@ -600,26 +494,10 @@ class ReliableParameterController:
                     is_vst=True
                 )
             
-            param_names = names_result["names"]
-            
-            # Fetch min/max values
-            minmax_result = self.ableton.get_device_parameters_minmax_sync(
-                track_index, device_index, timeout=timeout
-            )
-            
-            mins = minmax_result.get("mins", [0.0] * len(param_names))
-            maxs = minmax_result.get("maxs", [1.0] * len(param_names))
-            
-            # Try to get device name
-            device_name = "Unknown"
-            try:
-                devices_result = self.ableton.get_track_devices_sync(track_index)
-                if devices_result.get("success") and devices_result.get("devices"):
-                    devices = devices_result["devices"]
-                    if device_index < len(devices):
-                        device_name = devices[device_index]
-            except Exception:
-                pass
+            param_names = list(snapshot.names)
+            mins = list(snapshot.mins) or [0.0] * len(param_names)
+            maxs = list(snapshot.maxs) or [1.0] * len(param_names)
+            device_name = snapshot.device_name or "Unknown"
             
             # Cache the info
             info = self.cache.set(
@@ -629,7 +507,8 @@ class ReliableParameterController:
                 param_mins=mins,
                 param_maxs=maxs,
                 accessible=True,
-                is_vst=False
+                is_vst=False,
+                class_name=getattr(snapshot, "class_name", ""),
             )
             
             self._log(f"_fetch_device_info: Cached {len(param_names)} params for "
@@ -660,6 +539,13 @@ class ReliableParameterController:
                 self._log(f"get_device_info: Using cached info for "
                          f"track={track_index}, device={device_index}")
                 return cached
+            if self._shared_metadata:
+                # Same device type seen before: re-bind without re-enumerating
+                cached = self.ableton.bind_device_metadata(track_index, device_index)
+                if cached:
+                    self._log(f"get_device_info: Re-bound cached '{cached.device_name}' to "
+                             f"track={track_index}, device={device_index}")
+                    return cached
         
         return self._fetch_device_info(track_index, device_index)
     
@@ -855,36 +741,83 @@ class ReliableParameterController:
             self._log(f"find_parameter_index: Device params not accessible", "WARN")
             return None
 
-        # First, try semantic name mapping for known devices
-        device_name = info.device_name
-        if device_name in self.SEMANTIC_PARAM_MAPPINGS:
-            device_mapping = self.SEMANTIC_PARAM_MAPPINGS[device_name]
-            param_key = param_name.lower().replace(" ", "_").replace("-", "_")
-            if param_key in device_mapping:
-                ableton_name, fallback_index = device_mapping[param_key]
-                self._log(f"find_parameter_index: semantic mapping '{param_name}' -> '{ableton_name}' (fallback idx: {fallback_index})")
-                # Try to find by the mapped Ableton name first
-                index = info.get_param_index(ableton_name)
-                if index is not None:
-                    self._log(f"find_parameter_index: found via semantic mapping at index {index}", "SUCCESS")
-                    return index
-                # Fall back to hardcoded index
-                if fallback_index < info.param_count:
-                    self._log(f"find_parameter_index: using fallback index {fallback_index}", "SUCCESS")
-                    return fallback_index
-
-        # Standard lookup
-        index = info.get_param_index(param_name)
+        return self._match_parameter_index(info, param_name)
 
-        if index is not None:
-            actual_name = info.param_names[index] if index < len(info.param_names) else "?"
-            self._log(f"find_parameter_index: found '{param_name}' at index {index} "
-                     f"(actual name: '{actual_name}')", "SUCCESS")
-        else:
-            self._log(f"find_parameter_index: '{param_name}' NOT FOUND", "WARN")
-            self._log(f"  Available params: {info.param_names[:10]}...", "DEBUG")
-        
+    def lookup_parameter_index(self, device_name: str, param_name: str) -> Optional[int]:
+        """
+        Resolve a parameter index from cached/persisted metadata only.
+
+        No OSC query is made, so this works before the device is even loaded
+        (e.g. to validate a plan), but only for device types met before.
+
+        Args:
+            device_name: Device name as shown in Live (e.g. "EQ Eight")
+            param_name: Parameter name to search for
+
+        Returns:
+            Parameter index, or None if the device type or parameter is unknown
+        """
+        info = self.cache.find_device_name(device_name)
+        if info is None or not info.accessible:
+            return None
+        return self._match_parameter_index(info, param_name)
+
+    def _match_parameter_index(self, info: CachedDeviceInfo, param_name: str) -> Optional[int]:
+        """
+        Semantic mapping (direct or via an adaptive_layer alias), then name
+        matching against a device's parameters.
+
+        Results are memoized on the device type's name index, so repeated
+        lookups (set, then verify) and other slots of the same type are O(1).
+        """
+        resolved = info.name_index.resolved
+        if param_name in resolved:
+            return resolved[param_name]
+
+        index = self._semantic_parameter_index(info, param_name)
+        if index is None:
+            # Standard lookup
+            index = info.get_param_index(param_name)
+            if index is not None:
+                actual_name = info.param_names[index] if index < len(info.param_names) else "?"
+                self._log(f"find_parameter_index: found '{param_name}' at index {index} "
+                         f"(actual name: '{actual_name}')", "SUCCESS")
+            else:
+                self._log(f"find_parameter_index: '{param_name}' NOT FOUND", "WARN")
+                self._log(f"  Available params: {info.param_names[:10]}...", "DEBUG")
+
+        resolved[param_name] = index
         return index
+
+    def _semantic_parameter_index(self, info: CachedDeviceInfo,
+                                  param_name: str) -> Optional[int]:
+        """Index from SEMANTIC_PARAM_MAPPINGS, expanding friendly aliases first."""
+        device_name = info.device_name
+        device_mapping = self.SEMANTIC_PARAM_MAPPINGS.get(device_name)
+        if not device_mapping:
+            return None
+        param_key = param_name.lower().replace(" ", "_").replace("-", "_")
+        if param_key not in device_mapping:
+            try:
+                from adaptive_layer import resolve_alias
+            except ImportError:
+                return None
+            # e.g. "air" on EQ Eight -> "band4_gain_db"
+            param_key, _default = resolve_alias(device_name, param_name)
+            if param_key not in device_mapping:
+                return None
+        ableton_name, fallback_index = device_mapping[param_key]
+        self._log(f"find_parameter_index: semantic mapping '{param_name}' -> '{ableton_name}' (fallback idx: {fallback_index})")
+        # Try to find by the mapped Ableton name first
+        index = info.get_param_index(ableton_name)
+        if index is not None:
+            self._log(f"find_parameter_index: found via semantic mapping at index {index}", "SUCCESS")
+            return index
+        # Fall back to hardcoded index
+        if fallback_index < info.param_count:
+            self._log(f"find_parameter_index: using fallback index {fallback_index}", "SUCCESS")
+            return fallback_index
+        return None
     
     def get_all_parameter_names(self, track_index: int, device_index: int,
                                 use_cache: bool = True) -> List[str]:
@@ -946,6 +879,35 @@ class ReliableParameterController:
             self._log(f"get_parameter_value_sync: Error: {e}", "ERROR")
             return None
     
+    def get_all_parameter_values(self, track_index: int, device_index: int,
+                                 timeout: float = 3.0) -> Optional[List[float]]:
+        """
+        Read every parameter value of a device in one round trip.
+
+        Also refreshes the cached names/min/max from the same snapshot.
+
+        Returns:
+            List of current values (index = parameter index) or None if failed
+        """
+        try:
+            snapshot = self.ableton.get_device_state_snapshot(
+                track_index, device_index, timeout=timeout, include_values=True
+            )
+            if not snapshot.success or not snapshot.values:
+                return None
+            self.cache.set(
+                track_index, device_index,
+                device_name=snapshot.device_name or "Unknown",
+                param_names=list(snapshot.names),
+                param_mins=list(snapshot.mins) or [0.0] * snapshot.param_count,
+                param_maxs=list(snapshot.maxs) or [1.0] * snapshot.param_count,
+                class_name=snapshot.class_name,
+            )
+            return list(snapshot.values)
+        except Exception as e:
+            self._log(f"get_all_parameter_values: Error: {e}", "ERROR")
+            return None
+    
     def get_parameter_range(self, track_index: int, device_index: int,
                             param_index: int) -> Tuple[float, float]:
         """
@@ -1012,63 +974,22 @@ class ReliableParameterController:
     
     # ==================== VERIFIED PARAMETER SETTING ====================
     
-    def set_parameter_verified(self, track_index: int, device_index: int,
-                               param_index: int, value: float,
-                               max_retries: int = None,
-                               verify_delay: float = None,
-                               tolerance: float = None) -> Dict[str, Any]:
+    def _prepare_parameter_write(self, track_index: int, device_index: int,
+                                 param_index: int, value: float,
+                                 tolerance: float) -> Dict[str, Any]:
         """
-        Set a parameter and verify it was actually set.
-        
-        Automatically normalizes human-readable values (e.g., 100 Hz, 4:1 ratio)
-        to Ableton's 0.0-1.0 range before sending, and denormalizes readbacks
-        for accurate verification.
-        
-        Retries if verification fails.
-        
-        Args:
-            track_index: Track index
-            device_index: Device index
-            param_index: Parameter index
-            value: Value to set (in human-readable units, e.g., Hz, dB, ms)
-            max_retries: Maximum retry attempts (default: 3)
-            verify_delay: Delay before verification (default: 0.2s)
-            tolerance: Value tolerance for verification (default: 0.01)
-            
+        Work out what to send for a human-readable value, without sending it.
+
+        Applies the percentage heuristics, smart normalization and clamping
+        used by set_parameter_verified().
+
         Returns:
-            Dict with:
-            - success: bool
-            - requested_value: float (original human value)
-            - actual_value: float or None (in human units)
-            - attempts: int
-            - message: str
-            - verified: bool
-            - normalized_sent: float (what was actually sent to Ableton)
+            Dict with min, max, param_name, device_name, clamped_value, clamped,
+            normalized_value, conversion_method, effective_tolerance and
+            negative_only (readback is unreliable for the parameter)
         """
-        max_retries = max_retries or self.default_max_retries
-        verify_delay = verify_delay or self.default_verify_delay
-        tolerance = tolerance or self.value_tolerance
-        
-        self._log(f"set_parameter_verified: track={track_index}, device={device_index}, "
-                 f"param={param_index}, value={value}")
-        
-        result = {
-            "success": False,
-            "requested_value": value,
-            "actual_value": None,
-            "attempts": 0,
-            "message": "",
-            "verified": False,
-            "clamped": False,
-            "min": None,
-            "max": None,
-            "normalized_sent": None
-        }
-        
         # Get parameter range for normalization
         pmin, pmax = self.get_parameter_range(track_index, device_index, param_index)
-        result["min"] = pmin
-        result["max"] = pmax
 
         # Check if parameter is already in normalized range (0.0-1.0)
         is_normalized_param = (pmin == 0.0 and pmax == 1.0)
@@ -1084,6 +1005,7 @@ class ReliableParameterController:
         
         # Prepare the target value in human units
         target_value = value
+        clamped = False
         
         # INTELLIGENT auto-percentage conversion:
         # Only convert if it's a NORMALIZED parameter (0-1) AND looks like a percentage
@@ -1106,14 +1028,14 @@ class ReliableParameterController:
             # Only convert if it looks like a percentage param and doesn't look like something else
             if is_percentage and not is_not_percentage:
                 target_value = value / 100.0
-                result["clamped"] = True
+                clamped = True
                 self._log(f"  Auto-converted percentage: {value}% -> {target_value}", "INFO")
             elif not is_percentage and not is_not_percentage:
                 # Ambiguous - if value is very close to 0-1 range already, don't convert
                 # Otherwise convert as percentage (safer default for 0-1 params)
                 if value > 10.0:  # Definitely meant as percentage
                     target_value = value / 100.0
-                    result["clamped"] = True
+                    clamped = True
                     self._log(f"  Auto-converted percentage: {value}% -> {target_value}", "INFO")
         
         # NORMALIZATION-FIRST STRATEGY:
@@ -1154,11 +1076,11 @@ class ReliableParameterController:
             clamped_value = target_value
             if target_value < pmin:
                 clamped_value = pmin
-                result["clamped"] = True
+                clamped = True
                 self._log(f"  Clamped {target_value} to min {pmin}", "INFO")
             elif target_value > pmax:
                 clamped_value = pmax
-                result["clamped"] = True
+                clamped = True
                 self._log(f"  Clamped {target_value} to max {pmax}", "INFO")
         
         # Calculate appropriate tolerance based on parameter range
@@ -1178,18 +1100,99 @@ class ReliableParameterController:
         # Readback always returns 0.0 regardless of the value set.
         # For these parameters, we skip verification and trust the write succeeded.
         is_negative_only_range = (pmax <= 0.0 and pmin < 0.0)
+
+        if pre_normalized:
+            normalized_value, conversion_method = probe_normalized, probe_method
+        else:
+            normalized_value, conversion_method = smart_normalize_parameter(
+                param_name, clamped_value, device_name, pmin, pmax
+            )
+
+        return {
+            "min": pmin,
+            "max": pmax,
+            "param_name": param_name,
+            "device_name": device_name,
+            "clamped_value": clamped_value,
+            "clamped": clamped,
+            "normalized_value": normalized_value,
+            "conversion_method": conversion_method,
+            "effective_tolerance": effective_tolerance,
+            "negative_only": is_negative_only_range,
+        }
+
+    def set_parameter_verified(self, track_index: int, device_index: int,
+                               param_index: int, value: float,
+                               max_retries: int = None,
+                               verify_delay: float = None,
+                               tolerance: float = None) -> Dict[str, Any]:
+        """
+        Set a parameter and verify it was actually set.
+        
+        Automatically normalizes human-readable values (e.g., 100 Hz, 4:1 ratio)
+        to Ableton's 0.0-1.0 range before sending, and denormalizes readbacks
+        for accurate verification.
+        
+        Retries if verification fails.
+        
+        Args:
+            track_index: Track index
+            device_index: Device index
+            param_index: Parameter index
+            value: Value to set (in human-readable units, e.g., Hz, dB, ms)
+            max_retries: Maximum retry attempts (default: 3)
+            verify_delay: Delay before verification (default: 0.2s)
+            tolerance: Value tolerance for verification (default: 0.01)
+            
+        Returns:
+            Dict with:
+            - success: bool
+            - requested_value: float (original human value)
+            - actual_value: float or None (in human units)
+            - attempts: int
+            - message: str
+            - verified: bool
+            - normalized_sent: float (what was actually sent to Ableton)
+        """
+        max_retries = max_retries or self.default_max_retries
+        verify_delay = verify_delay or self.default_verify_delay
+        tolerance = tolerance or self.value_tolerance
+        
+        self._log(f"set_parameter_verified: track={track_index}, device={device_index}, "
+                 f"param={param_index}, value={value}")
+        
+        result = {
+            "success": False,
+            "requested_value": value,
+            "actual_value": None,
+            "attempts": 0,
+            "message": "",
+            "verified": False,
+            "clamped": False,
+            "min": None,
+            "max": None,
+            "normalized_sent": None
+        }
+        
+        plan = self._prepare_parameter_write(
+            track_index, device_index, param_index, value, tolerance
+        )
+        pmin, pmax = plan["min"], plan["max"]
+        result["min"] = pmin
+        result["max"] = pmax
+        result["clamped"] = plan["clamped"]
+        param_name = plan["param_name"]
+        clamped_value = plan["clamped_value"]
+        effective_tolerance = plan["effective_tolerance"]
+        is_negative_only_range = plan["negative_only"]
         
         if is_negative_only_range:
             self._log(f"  Negative-only range [{pmin}, {pmax}] - skipping verification "
                      f"(OSC readback unreliable for these parameters)", "INFO")
             
             # Normalize and send the value (using smart normalization)
-            if pre_normalized:
-                normalized_value, conversion_method = probe_normalized, probe_method
-            else:
-                normalized_value, conversion_method = smart_normalize_parameter(
-                    param_name, clamped_value, device_name, pmin, pmax
-                )
+            normalized_value = plan["normalized_value"]
+            conversion_method = plan["conversion_method"]
             result["normalized_sent"] = normalized_value
             result["conversion_method"] = conversion_method
             result["attempts"] = 1
@@ -1223,12 +1226,8 @@ class ReliableParameterController:
             
             try:
                 # === NORMALIZE the value using smart parameter-specific conversion ===
-                if pre_normalized:
-                    normalized_value, conversion_method = probe_normalized, probe_method
-                else:
-                    normalized_value, conversion_method = smart_normalize_parameter(
-                        param_name, clamped_value, device_name, pmin, pmax
-                    )
+                normalized_value = plan["normalized_value"]
+                conversion_method = plan["conversion_method"]
                 result["normalized_sent"] = normalized_value
                 result["conversion_method"] = conversion_method
 
@@ -1413,7 +1412,9 @@ class ReliableParameterController:
             device_name: Name of device to load
             position: Position in chain (-1 = end)
             timeout: Timeout for verification (default: 8s, increased for reliability)
-            min_delay: Minimum delay after load (default: 500ms - Ableton needs time)
+            min_delay: Minimum delay after load before polling the device count
+                (default: 500ms). Skipped when the loader reports the new
+                device's slot via its load notification.
             
         Returns:
             Dict with:
@@ -1456,6 +1457,16 @@ class ReliableParameterController:
                     "WARN",
                 )
 
+            # The Remote Script reports where the device landed once Live has
+            # inserted it; no settle delay or count polling needed
+            device_index = load_result.get("device_index")
+            if load_result.get("success") and isinstance(device_index, int):
+                self._on_device_loaded(track_index, device_index, device_name, load_result)
+                result["success"] = True
+                result["device_index"] = device_index
+                result["message"] = f"Device loaded at index {device_index}"
+                return result
+
             # Wait minimum delay
             time.sleep(min_delay)
             
@@ -1471,12 +1482,7 @@ class ReliableParameterController:
                     result["success"] = True
                     result["device_index"] = device_index
                     result["message"] = f"Device loaded at index {device_index}"
-                    
-                    # Invalidate cache for this position since device is new
-                    self.cache.invalidate(track_index, device_index)
-                    
-                    self._log(f"load_device_verified: SUCCESS - '{device_name}' "
-                             f"loaded at index {device_index}", "SUCCESS")
+                    self._on_device_loaded(track_index, device_index, device_name)
                     return result
                 
                 time.sleep(self.poll_interval)
@@ -1490,6 +1496,33 @@ class ReliableParameterController:
             self._log(f"load_device_verified: ERROR: {e}", "ERROR")
             return result
     
+    def _on_device_loaded(self, track_index: int, device_index: int, device_name: str,
+                          event: Optional[Dict[str, Any]] = None):
+        """Update the metadata cache for a device that just landed in a slot.
+
+        Args:
+            event: The loader's /jarvis/device/loaded details (class_name,
+                device_name, num_parameters), when the load was event-driven
+        """
+        # The new device and everything after it moved slots
+        self.cache.on_device_loaded(track_index, device_index)
+        # A device type met before (this or an earlier session) needs
+        # no parameter enumeration at all
+        if self.cache.bind_device_name(track_index, device_index, device_name):
+            self._log(f"load_device_verified: bound known parameter layout "
+                     f"for '{device_name}'")
+        elif event and self.cache.bind_probe(track_index, device_index,
+                                             event.get("class_name", ""),
+                                             event.get("device_name", device_name),
+                                             event.get("num_parameters", 0)):
+            self._log(f"load_device_verified: bound known parameter layout "
+                     f"for '{device_name}' from load notification")
+        if event:
+            self._loaded_events[(track_index, device_index)] = int(event.get("num_parameters", 0))
+
+        self._log(f"load_device_verified: SUCCESS - '{device_name}' "
+                 f"loaded at index {device_index}", "SUCCESS")
+
     # ==================== BATCH OPERATIONS ====================
     
     def set_multiple_parameters(self, track_index: int, device_index: int,
@@ -1586,6 +1619,78 @@ class ReliableParameterController:
                              f"({results['not_found']} not found)")
         return results
     
+    def set_parameters_bundled(self, track_index: int, device_index: int,
+                               params: Dict[int, float]) -> Dict[int, Dict[str, Any]]:
+        """
+        Set several parameters with bundled OSC writes and one shared readback.
+
+        Values are normalized exactly as in set_parameter_verified(), sent in
+        OSC bundles (see AbletonController.write_device_parameters_bundled)
+        and verified together. Parameters the bundled readback cannot confirm
+        fall back to set_parameter_verified() with its retries and fallbacks.
+
+        Args:
+            track_index: Track index
+            device_index: Device index
+            params: Dict of {param_index: value in human units}
+
+        Returns:
+            Dict of {param_index: result} (same shape as set_parameter_verified)
+        """
+        requested = {int(index): value for index, value in params.items()}
+        plans = {
+            index: self._prepare_parameter_write(
+                track_index, device_index, index, value, self.value_tolerance
+            )
+            for index, value in requested.items()
+        }
+        writes = {index: plan["normalized_value"] for index, plan in plans.items()}
+        unverifiable = [index for index, plan in plans.items() if plan["negative_only"]]
+
+        batch = self.ableton.write_device_parameters_bundled(
+            track_index, device_index, writes, skip_verify=unverifiable
+        )
+        failed = {entry["param_index"] for entry in batch.get("failed", [])}
+        # No per-parameter outcome at all means the bundles never went out
+        send_failed = not batch.get("success") and not failed
+        readback = batch.get("readback", {})
+        self._log(f"set_parameters_bundled: {batch.get('message')} "
+                  f"({batch.get('rounds', 0)} round(s), {len(failed)} unconfirmed)")
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for index, plan in plans.items():
+            value = requested[index]
+            if send_failed or index in failed:
+                results[index] = self.set_parameter_verified(
+                    track_index, device_index, index, value
+                )
+                continue
+
+            result = {
+                "success": True,
+                "requested_value": value,
+                "actual_value": plan["clamped_value"],
+                "attempts": batch.get("rounds", 1),
+                "message": "Parameter set (bundled)",
+                "verified": False,
+                "clamped": plan["clamped"],
+                "min": plan["min"],
+                "max": plan["max"],
+                "normalized_sent": plan["normalized_value"],
+                "conversion_method": plan["conversion_method"],
+            }
+            if plan["negative_only"]:
+                result["message"] = "Set without verification (negative-only range OSC limitation)"
+            elif batch.get("verified") and index in readback:
+                actual = readback[index]
+                if plan["conversion_method"] not in {"enum_raw", "eq_gain_raw"}:
+                    actual = self.denormalize_value(actual, plan["min"], plan["max"])
+                result["actual_value"] = actual
+                result["verified"] = True
+                result["message"] = "Parameter set and verified (bundled)"
+            results[index] = result
+        return results
+
     # ==================== RETRY WITH EXPONENTIAL BACKOFF ====================
 
     def _retry_with_backoff(self, operation, max_retries: int = 3,
@@ -0,0 +1,204 @@
+"""
+OSC Response Multiplexer
+
+AbletonOSC answers every "get/*" query on a single UDP port (11001), and the
+reply echoes the query arguments before the value:
+
+    /live/device/get/parameter/value [track, device, param]
+      -> /live/device/get/parameter/value [track, device, param, value]
+
+Matching replies by address alone lets two concurrent queries for different
+parameters pick up each other's answers. This module keeps a table of
+in-flight queries and routes each reply to the caller whose address AND
+echoed argument prefix match, waking that caller directly from the listener
+thread. Many queries can be outstanding at once on the one listener socket.
+
+Usage:
+    mux = OSCResponseMux()
+    pending = mux.register(["/live/track/get/volume"], [0])
+    sock.sendto(msg, addr)
+    reply = mux.wait(pending, timeout=2.0)   # (address, args) or None
+
+    # From the listener thread:
+    mux.dispatch(address, args)
+
+Waiters may also pass a ``callback`` that is invoked with the reply, which is
+how the asyncio transport resolves futures on the caller's event loop.
+"""
+
+import itertools
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+
+class PendingQuery:
+    """A single in-flight query waiting for its reply."""
+
+    __slots__ = ("query_id", "accept", "prefix", "event", "response", "callback")
+
+    def __init__(self, query_id: int, accept: Sequence[str], prefix: Sequence[Any],
+                 callback: Optional[Callable[[Tuple[str, List[Any]]], None]] = None):
+        self.query_id = query_id
+        self.accept = tuple(accept)
+        self.prefix = tuple(prefix)
+        self.event = threading.Event()
+        self.response: Optional[Tuple[str, List[Any]]] = None
+        self.callback = callback
+
+    def matches_prefix(self, args: Sequence[Any]) -> bool:
+        """True if the reply echoes this query's arguments as its prefix."""
+        n = len(self.prefix)
+        if n == 0:
+            return True
+        if len(args) < n:
+            return False
+        for expected, actual in zip(self.prefix, args):
+            if isinstance(expected, str) != isinstance(actual, str):
+                return False
+            if expected != actual:
+                return False
+        return True
+
+
+class OSCResponseMux:
+    """
+    Thread-safe table of in-flight OSC queries.
+
+    Replies are matched per address, oldest-first, preferring a waiter whose
+    arguments are echoed as the reply prefix. Replies that do not echo any
+    prefix (e.g. a bare ``[value]``) fall back to the oldest waiter on that
+    address so older bridge versions keep working.
+    """
+
+    def __init__(self, unmatched_history: int = 50):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        # address -> FIFO of waiters accepting that address
+        self._by_address: Dict[str, Deque[PendingQuery]] = {}
+        # Recent reply addresses no caller was waiting for (diagnostics)
+        self.unmatched: Deque[str] = deque(maxlen=unmatched_history)
+        self.stats = {"registered": 0, "matched": 0, "fallback_matched": 0,
+                      "unmatched": 0, "timeouts": 0}
+
+    def register(self, accept_addresses: Sequence[str],
+                 prefix: Sequence[Any] = (),
+                 callback: Optional[Callable[[Tuple[str, List[Any]]], None]] = None) -> PendingQuery:
+        """
+        Register interest in a reply BEFORE sending the query.
+
+        Args:
+            accept_addresses: Reply addresses that satisfy this query
+            prefix: Query arguments the reply is expected to echo
+            callback: Optional callable(response) run when the reply arrives
+
+        Returns:
+            PendingQuery handle to pass to wait()/cancel()
+        """
+        pending = PendingQuery(next(self._ids), accept_addresses, prefix, callback)
+        with self._lock:
+            for address in pending.accept:
+                self._by_address.setdefault(address, deque()).append(pending)
+            self.stats["registered"] += 1
+        return pending
+
+    def cancel(self, pending: PendingQuery) -> None:
+        """Remove a query from the table (no-op if already resolved)."""
+        with self._lock:
+            self._remove_locked(pending)
+
+    def _remove_locked(self, pending: PendingQuery) -> None:
+        for address in pending.accept:
+            waiters = self._by_address.get(address)
+            if not waiters:
+                continue
+            try:
+                waiters.remove(pending)
+            except ValueError:
+                pass
+            if not waiters:
+                del self._by_address[address]
+
+    def dispatch(self, address: str, args: List[Any]) -> bool:
+        """
+        Route a received reply to its waiting caller.
+
+        Returns:
+            True if a waiter was woken, False if nobody was waiting for it
+        """
+        with self._lock:
+            waiters = self._by_address.get(address)
+            target = None
+            fallback = False
+            if waiters:
+                for pending in waiters:
+                    if pending.matches_prefix(args):
+                        target = pending
+                        break
+                if target is None and not any(
+                        self._echoes_any_prefix(p, args) for p in waiters):
+                    # Reply carries no recognizable prefix: oldest waiter wins
+                    target = waiters[0]
+                    fallback = True
+
+            if target is None:
+                self.unmatched.append(address)
+                self.stats["unmatched"] += 1
+                return False
+
+            self._remove_locked(target)
+            self.stats["fallback_matched" if fallback else "matched"] += 1
+            # Delivered under the lock so expire() cannot count it as a timeout
+            target.response = (address, args)
+            target.event.set()
+
+        if target.callback is not None:
+            try:
+                target.callback(target.response)
+            except Exception:
+                pass
+        return True
+
+    @staticmethod
+    def _echoes_any_prefix(pending: PendingQuery, args: Sequence[Any]) -> bool:
+        """True if args look like an echo of SOME query (same shape, different values)."""
+        n = len(pending.prefix)
+        if n == 0 or len(args) <= n:
+            return False
+        return all(isinstance(p, str) == isinstance(a, str)
+                   for p, a in zip(pending.prefix, args))
+
+    def wait(self, pending: PendingQuery, timeout: float) -> Optional[Tuple[str, List[Any]]]:
+        """Block until the reply for ``pending`` arrives or ``timeout`` elapses."""
+        if not pending.event.wait(timeout) and self.expire(pending):
+            return None
+        return pending.response
+
+    def expire(self, pending: PendingQuery) -> bool:
+        """
+        Give up on a query after its deadline.
+
+        Returns:
+            True if it really timed out, False if the reply landed meanwhile
+        """
+        with self._lock:
+            self._remove_locked(pending)
+            if pending.event.is_set():
+                return False
+            self.stats["timeouts"] += 1
+            return True
+
+    def in_flight(self) -> int:
+        """Number of distinct queries currently awaiting a reply."""
+        with self._lock:
+            seen = set()
+            for waiters in self._by_address.values():
+                seen.update(p.query_id for p in waiters)
+            return len(seen)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of matching counters."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["in_flight"] = self.in_flight()
+        return stats
@@ -18,10 +18,15 @@ Usage:
 
 from __future__ import with_statement
 import Live
+import hashlib
+import json
+import re
 import threading
 import socket
-import struct
 import time
+from collections import deque
+
+from .osc_codec import decode_message, encode_message
 
 # Import Ableton Framework components
 try:
@@ -33,6 +38,16 @@ except ImportError:
     Task = None
 
 
+class _RequestReply(object):
+    """Reply target for an enveloped /jarvis/req request"""
+
+    __slots__ = ('addr', 'request_id')
+
+    def __init__(self, addr, request_id):
+        self.addr = addr
+        self.request_id = request_id
+
+
 class JarvisDeviceLoader(ControlSurface):
     """
     Main control surface class for Jarvis Device Loader
@@ -52,19 +67,44 @@ class JarvisDeviceLoader(ControlSurface):
         self._socket = None
         self._listener_thread = None
         
-        # Cache for available plugins
-        self._plugin_cache = None
-        self._plugin_cache_time = 0
-        self._cache_ttl = 300  # 5 minutes
+        # Loads waiting for their device to appear, per track index, and the
+        # devices listener attached to each of those tracks
+        self._pending_loads = {}
+        self._device_listeners = {}
+        self._load_timeout_ticks = 150  # ~15s at Live's ~100ms tick
+
+        # Browser index: name/URI -> browser item, built in time slices on the
+        # main thread (see BROWSER INDEX below)
+        self._index_state = "empty"
+        self._index_generation = 0
+        self._index_started = 0
+        self._index_queue = deque()
+        self._index_by_name = {}
+        self._index_by_uri = {}
+        self._index_entries = []
+        self._index_slice_seconds = 0.02
+        self._index_max_depth = 5
+
+        # Plugin inventory, produced by the same walk (see PLUGIN DISCOVERY)
+        self._inventory = []
+        self._inventory_hash = ""
+        self._inventory_type_hashes = {}
+        self._inventory_waiters = []
+        self._inventory_lock = threading.Lock()
         
         # Start OSC listener
         self._start_osc_listener()
+
+        # Index the browser once Live has finished setting up the surface
+        if hasattr(self, 'schedule_message'):
+            self.schedule_message(10, self._start_browser_index)
         
         self.log_message("JarvisDeviceLoader initialized on port {}".format(self._osc_port))
     
     def disconnect(self):
         """Clean up when the script is unloaded"""
         self._running = False
+        self._remove_device_listeners()
         if self._socket:
             try:
                 self._socket.close()
@@ -127,6 +167,13 @@ class JarvisDeviceLoader(ControlSurface):
             address, args = self._parse_osc(data)
             
             self.log_message("Received OSC: {} {}".format(address, args))
+
+            # /jarvis/req [id, address, *args]: the reply goes out as
+            # /jarvis/reply [id, reply_address, *args] (see _send_response)
+            if address == "/jarvis/req" and len(args) >= 2:
+                addr = _RequestReply(addr, args[0])
+                address = str(args[1])
+                args = list(args[2:])
             
             # Route to appropriate handler
             if address == "/jarvis/device/load":
@@ -135,6 +182,8 @@ class JarvisDeviceLoader(ControlSurface):
                 self._handle_load_device_by_uri(args, addr)
             elif address == "/jarvis/plugins/get":
                 self._handle_get_plugins(args, addr)
+            elif address == "/jarvis/plugins/hash":
+                self._handle_plugins_hash(args, addr)
             elif address == "/jarvis/plugins/refresh":
                 self._handle_refresh_plugins(args, addr)
             elif address == "/jarvis/device/delete":
@@ -143,10 +192,13 @@ class JarvisDeviceLoader(ControlSurface):
                 self._handle_get_track_type(args, addr)
             elif address == "/jarvis/device/select":
                 self._handle_select_device(args, addr)
+            elif address == "/jarvis/browser/index":
+                self._handle_browser_index_status(args, addr)
             elif address == "/jarvis/debug/browser":
                 self._handle_debug_browser(args, addr)
             elif address == "/jarvis/test":
-                self._send_response(addr, "/jarvis/test/response", ["ok"])
+                # Trailing values advertise protocol features to clients
+                self._send_response(addr, "/jarvis/test/response", ["ok", "req"])
             else:
                 self.log_message("Unknown OSC address: {}".format(address))
                 
@@ -155,78 +207,18 @@ class JarvisDeviceLoader(ControlSurface):
     
     def _parse_osc(self, data):
         """Parse OSC message into address and arguments"""
-        # OSC address is null-terminated, padded to 4-byte boundary
-        null_idx = data.index(b'\x00')
-        address = data[:null_idx].decode('utf-8')
-        
-        # Calculate padding
-        addr_size = (null_idx + 4) & ~3
-        
-        # Type tag starts after address
-        if len(data) <= addr_size:
-            return address, []
-        
-        # Find type tag string
-        type_start = addr_size
-        if data[type_start:type_start+1] != b',':
-            return address, []
-        
-        type_null = data.index(b'\x00', type_start)
-        type_tag = data[type_start+1:type_null].decode('utf-8')
-        type_size = ((type_null - type_start) + 4) & ~3
-        
-        # Parse arguments based on type tags
-        args = []
-        offset = type_start + type_size
-        
-        for tag in type_tag:
-            if tag == 'i':
-                val = struct.unpack('>i', data[offset:offset+4])[0]
-                args.append(val)
-                offset += 4
-            elif tag == 'f':
-                val = struct.unpack('>f', data[offset:offset+4])[0]
-                args.append(val)
-                offset += 4
-            elif tag == 's':
-                str_null = data.index(b'\x00', offset)
-                val = data[offset:str_null].decode('utf-8')
-                args.append(val)
-                offset = ((str_null + 1) + 3) & ~3
-        
-        return address, args
-    
+        return decode_message(data)
+
     def _build_osc_message(self, address, args):
         """Build an OSC message from address and arguments"""
-        # Address (null-terminated, padded)
-        addr_bytes = address.encode('utf-8') + b'\x00'
-        addr_padded = addr_bytes + b'\x00' * ((4 - len(addr_bytes) % 4) % 4)
-        
-        # Type tag
-        type_tag = ','
-        arg_data = b''
-        
-        for arg in args:
-            if isinstance(arg, int):
-                type_tag += 'i'
-                arg_data += struct.pack('>i', arg)
-            elif isinstance(arg, float):
-                type_tag += 'f'
-                arg_data += struct.pack('>f', arg)
-            elif isinstance(arg, str):
-                type_tag += 's'
-                str_bytes = arg.encode('utf-8') + b'\x00'
-                str_padded = str_bytes + b'\x00' * ((4 - len(str_bytes) % 4) % 4)
-                arg_data += str_padded
-        
-        type_bytes = type_tag.encode('utf-8') + b'\x00'
-        type_padded = type_bytes + b'\x00' * ((4 - len(type_bytes) % 4) % 4)
-        
-        return addr_padded + type_padded + arg_data
-    
+        return encode_message(address, args)
+
     def _send_response(self, addr, response_address, args):
         """Send OSC response back to client"""
         try:
+            if isinstance(addr, _RequestReply):
+                args = [addr.request_id, response_address] + list(args)
+                response_address = "/jarvis/reply"
             response = self._build_osc_message(response_address, args)
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             # Send to response port on localhost
@@ -252,11 +244,15 @@ class JarvisDeviceLoader(ControlSurface):
         track_index = int(args[0])
         device_name = str(args[1])
         position = int(args[2]) if len(args) > 2 else -1
+        # Echoed in the load notifications; older clients send none
+        load_id = str(args[3]) if len(args) > 3 else device_name
 
         def do_load_on_main_thread():
             try:
-                result = self._load_device_on_track(track_index, device_name, position)
+                result = self._load_device_on_track(track_index, device_name, position, load_id)
                 self._send_response(addr, "/jarvis/device/load/response", result)
+                # Stock devices are usually in the chain already
+                self._check_pending_loads(track_index)
             except Exception as e:
                 self.log_message("Load device error: {}".format(str(e)))
                 self._send_response(addr, "/jarvis/device/load/response",
@@ -280,11 +276,13 @@ class JarvisDeviceLoader(ControlSurface):
         track_index = int(args[0])
         browser_uri = str(args[1])
         position = int(args[2]) if len(args) > 2 else -1
+        load_id = str(args[3]) if len(args) > 3 else browser_uri
 
         def do_load_uri_on_main_thread():
             try:
-                result = self._load_device_by_uri(track_index, browser_uri, position)
+                result = self._load_device_by_uri(track_index, browser_uri, position, load_id)
                 self._send_response(addr, "/jarvis/device/load_by_uri/response", result)
+                self._check_pending_loads(track_index)
             except Exception as e:
                 self.log_message("Load device by URI error: {}".format(str(e)))
                 self._send_response(addr, "/jarvis/device/load_by_uri/response",
@@ -295,7 +293,7 @@ class JarvisDeviceLoader(ControlSurface):
         else:
             do_load_uri_on_main_thread()
     
-    def _load_device_on_track(self, track_index, device_name, position=-1):
+    def _load_device_on_track(self, track_index, device_name, position=-1, load_id=None):
         """Load a device onto a track by name"""
         self.log_message("Loading device '{}' on track {} at position {}".format(device_name, track_index, position))
 
@@ -334,10 +332,7 @@ class JarvisDeviceLoader(ControlSurface):
             return [0, "error", error_msg]
 
         self.log_message("Found device, loading...")
-
-        # Count devices before loading
-        devices_before = len(list(track.devices))
-        self.log_message("Devices on track before load: {}".format(devices_before))
+        devices_before = list(track.devices)
 
         # Load the device — we are now on the main thread (via schedule_message)
         # so this is safe and won't cause Audio queue timeout
@@ -346,41 +341,17 @@ class JarvisDeviceLoader(ControlSurface):
         except Exception as e:
             error_msg = "Failed to load device: {}".format(str(e))
             self.log_message("ERROR: " + error_msg)
+            # The indexed item may be stale (plugins rescanned since)
+            self._invalidate_browser_index()
             return [0, "error", error_msg]
 
-        # Verify the device was actually loaded.
-        # We're on the main thread already (via schedule_message), so we avoid
-        # blocking with time.sleep. Instead, check a few times with short waits.
-        # Ableton typically loads stock devices within 200-500ms.
-        max_retries = 5
-        for attempt in range(max_retries):
-            # Yield to Ableton briefly — 200ms per check, 1s total max
-            # This is acceptable on the main thread for a device load operation
-            import time
-            time.sleep(0.2)
-
-            try:
-                devices_after = len(list(track.devices))
-            except Exception:
-                continue
+        # Don't wait here: the devices listener reports the new device as soon
+        # as Live inserts it (see LOAD NOTIFICATIONS below).
+        self._begin_pending_load(track, track_index, device_name, position, devices_before,
+                                 load_id)
+        return [1, "loading", "Loading device: {}".format(device_name)]
 
-            if devices_after > devices_before:
-                # Success! Device was added
-                try:
-                    new_device = list(track.devices)[-1]
-                    new_device_name = new_device.name if hasattr(new_device, 'name') else 'Unknown'
-                except Exception:
-                    new_device_name = device_name
-                success_msg = "Loaded '{}' on track {} (verified: {} -> {} devices, attempt {})".format(
-                    new_device_name, track_index + 1, devices_before, devices_after, attempt + 1)
-                self.log_message(success_msg)
-                return [1, "success", "Device loaded: {}".format(new_device_name)]
-
-        # If we get here, device count didn't increase
-        self.log_message("WARNING: Device count did not increase after load_item(). May have failed silently.")
-        return [0, "error", "Device load may have failed - device count unchanged"]
-    
-    def _load_device_by_uri(self, track_index, uri, position=-1):
+    def _load_device_by_uri(self, track_index, uri, position=-1, load_id=None):
         """Load a device by its browser URI"""
         song = self._get_song()
         browser = self._get_browser()
@@ -400,18 +371,161 @@ class JarvisDeviceLoader(ControlSurface):
             # Find and load the item
             item = self._find_browser_item_by_uri(browser, uri)
             if item:
+                devices_before = list(track.devices)
                 browser.load_item(item)
-                return [1, "success", "Device loaded from URI"]
+                self._begin_pending_load(track, track_index, uri, position, devices_before,
+                                         load_id)
+                return [1, "loading", "Loading device from URI"]
             else:
                 return [0, "error", "URI not found in browser"]
         except Exception as e:
             return [0, "error", str(e)]
     
+    # ==================== LOAD NOTIFICATIONS ====================
+    # browser.load_item() returns before the device is in the chain. Rather
+    # than sleeping on the main thread, each load is parked here and a
+    # devices listener on the track pushes /jarvis/device/loaded
+    # [track_index, load_id, device_index, device_name, class_name,
+    # num_parameters] the moment Live inserts it, or /jarvis/device/load/failed
+    # [track_index, load_id, device_name, message] once the timeout passes.
+    # load_id is the id the client sent with the load (the requested name or
+    # URI if it sent none), so a late event cannot answer a newer load.
+
+    def _device_identity(self, device):
+        """Stable identity of a Live device across wrapper objects, or None"""
+        return getattr(device, '_live_ptr', None)
+
+    def _begin_pending_load(self, track, track_index, device_name, position, devices_before,
+                            load_id=None):
+        """Park a load until the track's device list grows past devices_before"""
+        entry = {
+            "name": device_name,
+            "load_id": device_name if load_id is None else load_id,
+            "position": position,
+            "before": len(devices_before),
+            "before_ids": set(self._device_identity(d) for d in devices_before),
+        }
+        self._pending_loads.setdefault(track_index, []).append(entry)
+        self._watch_track_devices(track_index, track)
+
+        if hasattr(self, 'schedule_message'):
+            self.schedule_message(self._load_timeout_ticks,
+                                  lambda: self._expire_pending_load(track_index, entry))
+
+    def _watch_track_devices(self, track_index, track):
+        """Attach one devices listener per track (kept until disconnect)"""
+        current = self._device_listeners.get(track_index)
+        if current is not None:
+            if current[0] == track:
+                return
+            self._remove_device_listener(current[0], current[1])
+
+        def on_devices_changed():
+            self._check_pending_loads(track_index)
+
+        try:
+            track.add_devices_listener(on_devices_changed)
+            self._device_listeners[track_index] = (track, on_devices_changed)
+        except Exception as e:
+            self.log_message("Could not watch devices on track {}: {}".format(track_index, str(e)))
+
+    def _remove_device_listener(self, track, callback):
+        try:
+            if track.devices_has_listener(callback):
+                track.remove_devices_listener(callback)
+        except Exception:
+            pass
+
+    def _remove_device_listeners(self):
+        for track, callback in list(self._device_listeners.values()):
+            self._remove_device_listener(track, callback)
+        self._device_listeners = {}
+        self._pending_loads = {}
+
+    def _check_pending_loads(self, track_index):
+        """Resolve parked loads whose device has appeared on the track"""
+        pending = self._pending_loads.get(track_index)
+        if not pending:
+            return
+        watched = self._device_listeners.get(track_index)
+        if watched is None:
+            return
+        try:
+            devices = list(watched[0].devices)
+        except Exception:
+            return
+
+        # Loads parked together share "before", so each added device
+        # resolves one entry and each entry claims a different device
+        resolved = 0
+        claimed = set()
+        while pending and len(devices) > pending[0]["before"] + resolved:
+            device_index = self._new_device_index(devices, pending[0], claimed)
+            if device_index is None:
+                break  # no unclaimed new device yet
+            entry = pending.pop(0)
+            identity = self._device_identity(devices[device_index])
+            if identity is not None:
+                claimed.add(identity)
+                # Loads still parked must not take this device on a later pass
+                for other in pending:
+                    other["before_ids"].add(identity)
+            resolved += 1
+            self._notify_device_loaded(track_index, entry["load_id"], device_index,
+                                       devices[device_index])
+
+    def _new_device_index(self, devices, entry, claimed=()):
+        """Index of the device a parked load added, or None if it is not in yet"""
+        if None not in entry["before_ids"]:
+            for index, device in enumerate(devices):
+                identity = self._device_identity(device)
+                if (identity is not None and identity not in entry["before_ids"]
+                        and identity not in claimed):
+                    return index
+            return None
+        position = entry["position"]
+        if position < 0 or position >= len(devices):
+            return len(devices) - 1
+        return position
+
+    def _notify_device_loaded(self, track_index, load_id, device_index, device):
+        name = getattr(device, 'name', '') or ''
+        class_name = getattr(device, 'class_name', '') or ''
+        try:
+            num_parameters = len(list(device.parameters))
+        except Exception:
+            num_parameters = 0
+        self.log_message("Loaded '{}' on track {} at index {} ({} parameters)".format(
+            name, track_index + 1, device_index, num_parameters))
+        self._send_response(None, "/jarvis/device/loaded",
+                            [track_index, load_id, device_index, str(name), str(class_name),
+                             num_parameters])
+
+    def _expire_pending_load(self, track_index, entry):
+        pending = self._pending_loads.get(track_index) or []
+        if entry not in pending:
+            return
+        pending.remove(entry)
+        message = "Device load may have failed - device count unchanged"
+        self.log_message("WARNING: {} ({})".format(message, entry["name"]))
+        self._send_response(None, "/jarvis/device/load/failed",
+                            [track_index, entry["load_id"], entry["name"], message])
+
     def _find_device_uri(self, browser, device_name):
         """
         Find a device in the browser by name using robust strategies.
         Handles ghost folders, iterator consumption, and native device quirks.
         """
+        with self._inventory_lock:
+            item = self._index_by_name.get(self._browser_key(device_name))
+            ready = self._index_state == "ready"
+        if item is not None:
+            return item
+        if ready:
+            # The finished index covers everything the crawl below would find
+            self.log_message("Device not in browser index: {}".format(device_name))
+            return None
+
         device_name_lower = device_name.lower().strip()
         self.log_message("Searching for device: '{}' (robust mode)".format(device_name))
         
@@ -530,65 +644,318 @@ class JarvisDeviceLoader(ControlSurface):
     
     def _find_browser_item_by_uri(self, browser, uri):
         """Find a browser item by its URI"""
+        with self._inventory_lock:
+            item = self._index_by_uri.get(uri)
+            ready = self._index_state == "ready"
+        if item is not None or ready:
+            return item
+
+        # Index still building: crawl like _deep_search, matching on URI
+        for _, root in self._browser_roots(browser):
+            result = self._deep_search_uri(root, uri)
+            if result:
+                return result
         return None
-    
+
+    def _deep_search_uri(self, parent, uri, depth=0):
+        """Recursive search for an item with the given URI"""
+        if depth > 5: return None
+
+        for child in self._get_children_safe(parent):
+            if getattr(child, 'uri', None) == uri:
+                return child
+            result = self._deep_search_uri(child, uri, depth + 1)
+            if result: return result
+
+        return None
+
+    # ==================== BROWSER INDEX ====================
+    # Crawling the browser for every load is slow enough on large plugin
+    # libraries to trip Live's audio-queue timeout. Instead the browser is
+    # walked once, breadth-first, a slice of at most _index_slice_seconds per
+    # main-thread tick (via schedule_message), into name and URI lookup
+    # tables. Until the walk finishes, lookups fall back to the crawl.
+    # The walk runs on the main thread only; _inventory_lock guards the index
+    # tables and generation against the OSC socket thread, which reads them
+    # for status replies and marks the index stale on refresh requests.
+
+    def _browser_roots(self, browser):
+        """(root name, browser item) pairs, in the crawl's search order"""
+        roots = []
+        for attr in ("audio_effects", "midi_effects", "instruments",
+                     "plugins", "drums", "max_for_live"):
+            try:
+                root = getattr(browser, attr, None)
+            except Exception:
+                root = None
+            if root:
+                roots.append((attr, root))
+        return roots
+
+    def _browser_key(self, name):
+        """Lookup key matching _is_match: case- and space-insensitive"""
+        return name.lower().strip().replace(' ', '')
+
+    def _start_browser_index(self):
+        """(Re)build the browser index; superseded builds stop at their next slice"""
+        browser = self._get_browser()
+        if not browser:
+            self._publish_inventory([], "empty")
+            return False
+
+        with self._inventory_lock:
+            self._index_generation += 1
+            generation = self._index_generation
+            self._index_by_name = {}
+            self._index_by_uri = {}
+            self._index_entries = []
+            self._index_queue = deque()
+            for root_name, root in self._browser_roots(browser):
+                self._index_queue.append((root, root_name, getattr(root, 'name', root_name), 0))
+            self._index_state = "building"
+            self._index_started = time.time()
+        self._browser_index_step(generation)
+        return True
+
+    def _browser_index_step(self, generation):
+        """Index browser nodes for one time slice, then yield to Live"""
+        deadline = time.time() + self._index_slice_seconds
+        with self._inventory_lock:
+            if generation != self._index_generation:
+                return
+            while self._index_queue:
+                parent, root_name, path, depth = self._index_queue.popleft()
+                for child in self._get_children_safe(parent):
+                    name = getattr(child, 'name', '') or ''
+                    is_device = getattr(child, 'is_device', False)
+                    if getattr(child, 'is_loadable', False):
+                        self._index_browser_item(child, name, is_device)
+                        if is_device and root_name in self._INVENTORY_TYPES:
+                            self._index_entries.append(
+                                self._inventory_entry(child, name, root_name, path))
+                    # Devices' children are presets; don't descend into them
+                    if not is_device and depth < self._index_max_depth:
+                        self._index_queue.append((child, root_name, path + "/" + name, depth + 1))
+                if time.time() >= deadline:
+                    break
+            # Invalidated during the slice: a newer walk owns the tables now
+            if generation != self._index_generation:
+                return
+            more = bool(self._index_queue)
+            entries = self._index_entries
+
+        if more:
+            if hasattr(self, 'schedule_message'):
+                self.schedule_message(1, lambda: self._browser_index_step(generation))
+            else:
+                self._browser_index_step(generation)
+            return
+
+        self.log_message("Browser index ready: {} names, {} URIs ({:.1f}s)".format(
+            len(self._index_by_name), len(self._index_by_uri),
+            time.time() - self._index_started))
+        self._publish_inventory(entries, "ready", generation)
+
+    def _index_browser_item(self, item, name, is_device):
+        """Add a loadable item; the first device seen for a name wins, as in the crawl
+        (_inventory_lock held)"""
+        key = self._browser_key(name)
+        current = self._index_by_name.get(key)
+        if current is None or (is_device and not getattr(current, 'is_device', False)):
+            self._index_by_name[key] = item
+        uri = getattr(item, 'uri', None)
+        if uri:
+            self._index_by_uri.setdefault(uri, item)
+
+    def _invalidate_browser_index(self):
+        """Drop a stale index (e.g. after a plugin rescan) and rebuild it (main thread)"""
+        with self._inventory_lock:
+            self._index_state = "building"
+            self._index_generation += 1
+            self._index_by_name = {}
+            self._index_by_uri = {}
+        if hasattr(self, 'schedule_message'):
+            self.schedule_message(1, self._start_browser_index)
+        else:
+            self._start_browser_index()
+
+    def _request_browser_reindex(self):
+        """Invalidate from the OSC socket thread: mark the index stale now, so
+        a running walk stops and inventory requests wait for the new one, and
+        leave dropping and rebuilding the index to the main thread"""
+        with self._inventory_lock:
+            self._index_state = "building"
+            self._index_generation += 1
+        if hasattr(self, 'schedule_message'):
+            self.schedule_message(1, self._invalidate_browser_index)
+        else:
+            self._invalidate_browser_index()
+
+    def _handle_browser_index_status(self, args, addr):
+        """Report [1, state, names, uris]; pass 1 to force a rebuild"""
+        if len(args) >= 1 and int(args[0]) == 1:
+            self._request_browser_reindex()
+        with self._inventory_lock:
+            response = [1, self._index_state, len(self._index_by_name),
+                        len(self._index_by_uri)]
+        self._send_response(addr, "/jarvis/browser/index/response", response)
+
     # ==================== PLUGIN DISCOVERY ====================
-    
+    # The inventory is every device under the roots in _INVENTORY_TYPES,
+    # collected by the browser index walk. It is served in pages of
+    # [1, "success", total, offset, limit, json, hash], where hash covers the
+    # whole filtered listing; /jarvis/plugins/hash returns the overall hash and
+    # one per plugin type so clients re-download only the types that changed.
+    # Requests that arrive mid-walk are answered when it finishes.
+
+    _INVENTORY_TYPES = {
+        "plugins": "plugin",
+        "audio_effects": "audio_effect",
+        "instruments": "instrument",
+        "max_for_live": "max_for_live",
+    }
+
+    # (category, word prefixes, name substrings); the first match wins
+    _CATEGORY_RULES = (
+        ("eq", ("eq", "equali"), ("pro-q",)),
+        ("limiter", ("limit", "maximi"), ("pro-l",)),
+        ("compressor", ("compress", "comp", "glue", "1176", "la-2a"), ("pro-c",)),
+        ("dynamics", ("gate", "dynamic", "transient", "expander", "deess", "de-ess"), ("pro-g", "pro-ds")),
+        ("reverb", ("reverb", "verb", "hall", "plate"), ("pro-r",)),
+        ("delay", ("delay", "echo"), ()),
+        ("distortion", ("distort", "satur", "overdrive", "drive", "tape", "amp"), ("saturn",)),
+        ("modulation", ("chorus", "flanger", "phaser", "tremolo", "autopan", "ensemble"), ()),
+        ("filter", ("filter",), ()),
+        ("utility", ("utility", "tuner", "spectrum", "meter"), ()),
+    )
+
+    def _categorize(self, name, path):
+        """Coarse effect category (eq, compressor, ...) from name, then folder"""
+        for text in (name, path):
+            lower = text.lower()
+            words = re.split(r"[^a-z0-9]+", lower)
+            for category, prefixes, substrings in self._CATEGORY_RULES:
+                for sub in substrings:
+                    if sub in lower:
+                        return category
+                for word in words:
+                    if word and word.startswith(prefixes):
+                        return category
+        return "unknown"
+
+    def _inventory_entry(self, item, name, root_name, path):
+        plugin_type = self._INVENTORY_TYPES[root_name]
+        category = self._categorize(name, path)
+        if category == "unknown" and plugin_type == "instrument":
+            category = "instrument"
+        return {
+            "name": name,
+            "type": plugin_type,
+            "category": category,
+            "path": path + "/" + name,
+            "uri": getattr(item, 'uri', None) or "",
+        }
+
+    def _inventory_digest(self, entries):
+        payload = json.dumps(entries, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _publish_inventory(self, entries, state, generation=None):
+        """Install a finished walk's inventory and index state, then answer
+        requests parked during the walk. A walk's result is dropped if the
+        index was invalidated after it finished (generation is stale)"""
+        entries = sorted(entries, key=lambda e: (e["type"], e["name"].lower(), e["path"]))
+        type_hashes = {}
+        for plugin_type in sorted(set(e["type"] for e in entries)):
+            type_hashes[plugin_type] = self._inventory_digest(
+                [e for e in entries if e["type"] == plugin_type])
+
+        with self._inventory_lock:
+            if generation is not None and generation != self._index_generation:
+                return
+            self._inventory = entries
+            self._inventory_hash = self._inventory_digest(entries)
+            self._inventory_type_hashes = type_hashes
+            self._index_state = state
+            waiters, self._inventory_waiters = self._inventory_waiters, []
+
+        self.log_message("Plugin inventory: {} devices (hash {})".format(
+            len(entries), self._inventory_hash))
+        for waiter in waiters:
+            waiter()
+
+    def _when_inventory_ready(self, callback):
+        """Run callback now if the inventory is current, else after the walk"""
+        with self._inventory_lock:
+            if self._index_state != "ready":
+                self._inventory_waiters.append(callback)
+                start = self._index_state == "empty"
+            else:
+                start = None
+        if start is None:
+            callback()
+        elif start:
+            if hasattr(self, 'schedule_message'):
+                self.schedule_message(1, self._start_browser_index)
+            else:
+                self._start_browser_index()
+
     def _handle_get_plugins(self, args, addr):
         """Handle request for available plugins list"""
         # Backwards-compatible args:
         # - [] -> return first page
-        # - [category] -> return first page filtered
+        # - [category] -> return first page filtered (plugin type or category)
         # - [category, offset, limit] -> return page
         category_filter = str(args[0]) if len(args) >= 1 and args[0] not in (None, "") else None
         offset = int(args[1]) if len(args) >= 2 else 0
         limit = int(args[2]) if len(args) >= 3 else 200
         if limit <= 0:
             limit = 200
-        
-        try:
-            plugins = self._get_available_plugins(category_filter)
-            total = len(plugins)
-            # Page the response to avoid oversized UDP datagrams (WinError 10040)
-            page = plugins[offset:offset + limit]
-
-            # Send response with total count + paging info + JSON chunk
-            response = [1, "success", total, offset, limit]
-            import json
-            plugins_json = json.dumps(page)
-            response.append(plugins_json)
-            self._send_response(addr, "/jarvis/plugins/get/response", response)
-        except Exception as e:
-            self._send_response(addr, "/jarvis/plugins/get/response",
-                              [0, "error", str(e)])
-    
+
+        def respond():
+            try:
+                plugins = self._get_available_plugins(category_filter)
+                total = len(plugins)
+                # Page the response to avoid oversized UDP datagrams (WinError 10040)
+                page = plugins[offset:offset + limit]
+
+                # Send response with total count + paging info + JSON chunk + hash
+                response = [1, "success", total, offset, limit, json.dumps(page),
+                            self._inventory_digest(plugins)]
+                self._send_response(addr, "/jarvis/plugins/get/response", response)
+            except Exception as e:
+                self._send_response(addr, "/jarvis/plugins/get/response",
+                                  [0, "error", str(e)])
+
+        self._when_inventory_ready(respond)
+
+    def _handle_plugins_hash(self, args, addr):
+        """Report [1, "success", inventory_hash, total, type_hashes_json]"""
+        def respond():
+            with self._inventory_lock:
+                response = [1, "success", self._inventory_hash, len(self._inventory),
+                            json.dumps(self._inventory_type_hashes)]
+            self._send_response(addr, "/jarvis/plugins/hash/response", response)
+
+        self._when_inventory_ready(respond)
+
     def _handle_refresh_plugins(self, args, addr):
-        """Force refresh the plugin cache"""
-        self._plugin_cache = None
-        self._plugin_cache_time = 0
-        
-        try:
-            plugins = self._get_available_plugins()
-            self._send_response(addr, "/jarvis/plugins/refresh/response",
-                              [1, "success", len(plugins)])
-        except Exception as e:
+        """Force a rescan of the browser; answers once the new inventory is in"""
+        self._request_browser_reindex()
+
+        def respond():
             self._send_response(addr, "/jarvis/plugins/refresh/response",
-                              [0, "error", str(e)])
-    
+                              [1, "success", len(self._inventory), self._inventory_hash])
+
+        self._when_inventory_ready(respond)
+
     def _get_available_plugins(self, category_filter=None):
-        """Get list of all available plugins from Ableton's browser"""
-        current_time = time.time()
-        
-        if (self._plugin_cache is not None and 
-            current_time - self._plugin_cache_time < self._cache_ttl):
-            plugins = self._plugin_cache
-        else:
-            # We use the deep search logic to populate this
-            plugins = [] 
-            # (Simplified for now - can re-implement full scan if needed)
-            self._plugin_cache = plugins
-            self._plugin_cache_time = current_time
-        
+        """Get the inventory, optionally filtered by plugin type or category"""
+        with self._inventory_lock:
+            plugins = self._inventory
+        if category_filter:
+            wanted = category_filter.lower()
+            plugins = [p for p in plugins if p["type"] == wanted or p["category"] == wanted]
         return plugins
 
     def _handle_delete_device(self, args, addr):
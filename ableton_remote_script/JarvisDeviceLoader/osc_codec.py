@@ -0,0 +1,560 @@
+"""
+OSC Codec
+
+Single OSC 1.0 encoder/decoder shared by the controller, the asyncio
+transport, VST discovery and (as a vendored copy) the JarvisDeviceLoader
+remote script.
+
+Each message is packed with ONE struct call whose format covers the padded
+address, type tags and every argument (``Ns`` fields zero-pad strings for
+free), instead of one ``bytes +=`` and ``struct.pack`` per field. Formats for
+numeric-only messages are cached per (address, argument types), so hot paths
+like parameter writes skip format building entirely. OSCEncoder packs
+messages and bundles into a reusable preallocated ``bytearray`` with
+``pack_into``. Decoding walks the datagram in place with ``unpack_from``
+following a plan cached per type tag string: a message whose arguments are
+all fixed-size is unpacked with one Struct call; any other type tag string is
+compiled once into a straight-line decode function (one Struct call per run
+of fixed-size arguments, one find() per string, and a single split for a
+trailing run of strings such as parameter name lists).
+
+Supported argument types:
+    i int32   h int64   f float32   d float64   s/S string   b blob
+    t timetag T/F True/False   N None   I infinity   c char   r rgba   m midi
+
+Python -> OSC mapping when encoding:
+    bool -> i (0/1, what AbletonOSC expects), int -> i (h if it needs 64 bits),
+    float -> f, Double -> d, Int64 -> h, bytes/bytearray/memoryview -> b,
+    None -> N, anything else -> s (via str())
+
+Bundles (``#bundle``) are supported in both directions; decode_packet()
+flattens nested bundles into a list of (address, args).
+
+This file must stay importable by Ableton's embedded Python, so it uses no
+annotations or f-strings. The remote script ships an identical copy
+(ableton_remote_script/JarvisDeviceLoader/osc_codec.py).
+
+Usage:
+    data = encode_message("/live/track/set/volume", [0, 0.8])
+    address, args = decode_message(data)
+
+    bundle = encode_bundle([("/live/device/set/parameter/value", [0, 1, 2, 0.5]),
+                            ("/live/device/set/parameter/value", [0, 1, 3, 0.7])])
+    for address, args in decode_packet(bundle):
+        ...
+"""
+
+import struct
+import threading
+
+_pack = struct.pack
+_pack_into = struct.pack_into
+
+_I32 = struct.Struct(">i")
+_U32 = struct.Struct(">I")
+_I64 = struct.Struct(">q")
+_U64 = struct.Struct(">Q")
+_F32 = struct.Struct(">f")
+_F64 = struct.Struct(">d")
+
+BUNDLE_TAG = b"#bundle\x00"
+# OSC timetag meaning "process immediately"
+IMMEDIATELY = 1
+
+_BUFFER_SIZE = 8192
+_FORMAT_CACHE_SIZE = 512
+
+
+class Double(float):
+    """Float that is encoded as OSC float64 ('d') instead of float32."""
+    __slots__ = ()
+
+
+class Int64(int):
+    """Int that is always encoded as OSC int64 ('h')."""
+    __slots__ = ()
+
+
+class OSCCodecError(ValueError):
+    """Raised when a packet is not valid OSC."""
+
+
+def _pad4(n):
+    return (n + 3) & ~3
+
+
+# struct field for a null-terminated string of n bytes, padded to 4
+_STR_FIELDS = ["%ds" % ((n + 4) & ~3) for n in range(256)]
+
+
+def _str_field(n):
+    if n < 256:
+        return _STR_FIELDS[n]
+    return "%ds" % ((n + 4) & ~3)
+
+
+# ==================== ENCODING ====================
+
+# Exact Python type -> (OSC tag, struct code); "s"/"b" codes are sized per call
+_EXACT = {int: ("i", "i"), bool: ("i", "i"), float: ("f", "f"),
+          str: ("s", "s"), bytes: ("b", "b"), type(None): ("N", "")}
+# (address, arg types) -> template; numeric-only templates carry a full format
+_FORMATS = {}
+_GENERAL = ("general",)
+
+
+def _template(key):
+    """
+    Build the cached (format, address bytes, typetag bytes, codes) for
+    key = (address, arg types).
+
+    format is the complete struct format when every argument is numeric,
+    otherwise only the address/typetag prefix and codes says how to size
+    each argument per call. Returns _GENERAL for types that need
+    isinstance dispatch (subclasses such as Double/Int64).
+    """
+    address, types = key
+    if len(_FORMATS) >= _FORMAT_CACHE_SIZE:
+        _FORMATS.clear()
+    specs = [_EXACT.get(t) for t in types]
+    if None in specs:
+        hit = _GENERAL
+    else:
+        raw_address = address.encode("utf-8")
+        typetag = ("," + "".join(spec[0] for spec in specs)).encode("ascii")
+        prefix = ">" + _str_field(len(raw_address)) + _str_field(len(typetag))
+        codes = "".join(spec[1] or "-" for spec in specs)
+        numeric = all(c in "if" for c in codes)
+        hit = (prefix + codes if numeric else prefix, raw_address, typetag,
+               None if numeric else codes)
+    _FORMATS[key] = hit
+    return hit
+
+
+def _templated_format(hit, args):
+    """Size the string/blob fields of a non-numeric template for these args."""
+    fmt = [hit[0]]
+    values = [hit[1], hit[2]]
+    for code, arg in zip(hit[3], args):
+        if code == "s":
+            raw = arg.encode("utf-8")
+            fmt.append(_str_field(len(raw)))
+            values.append(raw)
+        elif code == "b":
+            fmt.append("i%ds" % _pad4(len(arg)))
+            values.append(len(arg))
+            values.append(arg)
+        elif code != "-":
+            fmt.append(code)
+            values.append(arg)
+    return "".join(fmt), values
+
+
+def _general_format(address, args):
+    """Build (format, values) for any supported argument types."""
+    tags = [","]
+    codes = []
+    values = []
+    for arg in args:
+        if isinstance(arg, bool):
+            tags.append("i")
+            codes.append("i")
+            values.append(1 if arg else 0)
+        elif isinstance(arg, int):
+            if isinstance(arg, Int64) or not -0x80000000 <= arg <= 0x7FFFFFFF:
+                tags.append("h")
+                codes.append("q")
+            else:
+                tags.append("i")
+                codes.append("i")
+            values.append(int(arg))
+        elif isinstance(arg, float):
+            if isinstance(arg, Double):
+                tags.append("d")
+                codes.append("d")
+            else:
+                tags.append("f")
+                codes.append("f")
+            values.append(float(arg))
+        elif isinstance(arg, (bytes, bytearray, memoryview)):
+            blob = bytes(arg)
+            tags.append("b")
+            codes.append("i%ds" % _pad4(len(blob)))
+            values.append(len(blob))
+            values.append(blob)
+        elif arg is None:
+            tags.append("N")
+        else:
+            raw = str(arg).encode("utf-8")
+            tags.append("s")
+            codes.append(_str_field(len(raw)))
+            values.append(raw)
+    raw_address = address.encode("utf-8")
+    typetag = "".join(tags).encode("ascii")
+    fmt = ">" + _str_field(len(raw_address)) + _str_field(len(typetag)) + "".join(codes)
+    return fmt, [raw_address, typetag] + values
+
+
+def _message_format(address, args):
+    """(format, values) packing one message with a single struct call."""
+    key = (address, tuple(map(type, args)))
+    hit = _FORMATS.get(key) or _template(key)
+    if hit is _GENERAL:
+        return _general_format(address, args)
+    if hit[3] is None:
+        return hit[0], (hit[1], hit[2]) + tuple(args)
+    return _templated_format(hit, args)
+
+
+def encode_message(address, args=()):
+    """Build an OSC message (address + typetags + args) as bytes."""
+    fmt, values = _message_format(address, args)
+    try:
+        return _pack(fmt, *values)
+    except struct.error:
+        # int outside int32: the general path switches it to int64
+        fmt, values = _general_format(address, args)
+        return _pack(fmt, *values)
+
+
+class Bundle(object):
+    """Nested bundle element for encode_bundle()."""
+    __slots__ = ("elements", "timetag")
+
+    def __init__(self, elements, timetag=IMMEDIATELY):
+        self.elements = list(elements)
+        self.timetag = timetag
+
+
+class OSCEncoder(object):
+    """
+    Packs messages and bundles into one preallocated, growable bytearray.
+
+    Not thread-safe: use one encoder per thread (encode_bundle() keeps a
+    thread-local instance).
+    """
+
+    def __init__(self, capacity=_BUFFER_SIZE):
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+
+    def _ensure(self, size):
+        if size > len(self._buf):
+            new_size = len(self._buf)
+            while new_size < size:
+                new_size *= 2
+            # Fresh buffer: views handed out by encode_view() stay valid
+            grown = bytearray(new_size)
+            grown[:len(self._buf)] = self._buf
+            self._buf = grown
+            self._view = memoryview(grown)
+
+    def _write_message(self, offset, address, args):
+        fmt, values = _message_format(address, args)
+        size = struct.calcsize(fmt)
+        self._ensure(offset + size)
+        try:
+            _pack_into(fmt, self._buf, offset, *values)
+        except struct.error:
+            fmt, values = _general_format(address, args)
+            size = struct.calcsize(fmt)
+            self._ensure(offset + size)
+            _pack_into(fmt, self._buf, offset, *values)
+        return offset + size
+
+    def _write_bundle(self, offset, elements, timetag):
+        self._ensure(offset + 16)
+        self._buf[offset:offset + 8] = BUNDLE_TAG
+        _U64.pack_into(self._buf, offset + 8, timetag)
+        offset += 16
+        for element in elements:
+            size_at = offset
+            self._ensure(offset + 4)
+            offset += 4
+            if isinstance(element, (bytes, bytearray)):
+                # Pre-encoded message or bundle
+                self._ensure(offset + len(element))
+                self._buf[offset:offset + len(element)] = element
+                offset += len(element)
+            elif isinstance(element, Bundle):
+                offset = self._write_bundle(offset, element.elements, element.timetag)
+            else:
+                address, args = element
+                offset = self._write_message(offset, address, args)
+            # Back-patch the element size now that it is known
+            _I32.pack_into(self._buf, size_at, offset - size_at - 4)
+        return offset
+
+    def encode_view(self, address, args=()):
+        """Encode into the internal buffer; the view is valid until the next call."""
+        n = self._write_message(0, address, args)
+        return self._view[:n]
+
+    def encode_bundle_view(self, elements, timetag=IMMEDIATELY):
+        """Encode a bundle into the internal buffer (valid until the next call)."""
+        n = self._write_bundle(0, elements, timetag)
+        return self._view[:n]
+
+    def encode_bundle(self, elements, timetag=IMMEDIATELY):
+        """
+        Encode a bundle.
+
+        Args:
+            elements: Iterable of (address, args), Bundle, or pre-encoded bytes
+            timetag: OSC NTP timetag (default: immediately)
+        """
+        return bytes(self.encode_bundle_view(elements, timetag))
+
+
+_local = threading.local()
+
+
+def _encoder():
+    encoder = getattr(_local, "encoder", None)
+    if encoder is None:
+        encoder = _local.encoder = OSCEncoder()
+    return encoder
+
+
+def encode_bundle(elements, timetag=IMMEDIATELY):
+    """Build an OSC bundle from (address, args) pairs, Bundles or encoded bytes."""
+    return _encoder().encode_bundle(elements, timetag)
+
+
+# ==================== DECODING ====================
+
+# Fixed-size OSC tag -> struct code
+_FIXED = {"i": "i", "f": "f", "d": "d", "h": "q", "t": "Q", "r": "I"}
+# Constant-valued tags (no payload bytes)
+_CONSTANT = {"T": "True", "F": "False", "N": "None", "I": "_INF"}
+# A trailing run of at least this many strings is split in one pass
+_SPLIT_MIN = 4
+# typetag bytes -> a Struct when every argument is fixed-size (unpacked in
+# one call), else a decode function(data, offset, end) compiled for that
+# type tag string, so decoding a message runs no per-argument dispatch
+_PLANS = {}
+# Address bytes -> str: replies use a small set of addresses
+_ADDRESSES = {}
+_Struct = struct.Struct
+_INF = float("inf")
+
+
+def _truncated():
+    return OSCCodecError("truncated OSC message")
+
+
+def _unterminated(offset):
+    return OSCCodecError("unterminated OSC string at offset {}".format(offset))
+
+
+def _split_strings(data, offset, end, count):
+    """
+    Decode the last ``count`` arguments of a message, all strings, at once.
+
+    Splitting the tail on NUL yields each string followed by one empty
+    piece per extra padding byte, so a string of length n spans
+    4 - n % 4 pieces. Non-ASCII tails (byte and character offsets
+    differ) fall back to one find() per string.
+    """
+    tail = data[offset:end]
+    if tail.isascii():
+        pieces = tail.decode("ascii").split("\x00")
+        out = []
+        index = 0
+        last = len(pieces) - 1
+        for _ in range(count):
+            if index >= last:
+                raise _unterminated(offset)
+            piece = pieces[index]
+            out.append(piece)
+            index += 4 - (len(piece) & 3)
+        return out
+    out = []
+    find = data.find
+    for _ in range(count):
+        null = find(b"\x00", offset, end)
+        if null < 0:
+            raise _unterminated(offset)
+        out.append(data[offset:null].decode("utf-8"))
+        offset = (null + 4) & ~3
+    return out
+
+
+def _compile_decoder(tags):
+    """
+    Generate the decode function for a type tag string with strings or blobs.
+
+    Offsets known at compile time (after a fixed-size run) are folded into
+    the next expression instead of being added to ``offset`` step by step.
+    """
+    lines = ["def decode(data, offset, end):"]
+    names = []
+    env = {"_truncated": _truncated, "_unterminated": _unterminated,
+           "_split_strings": _split_strings, "_I32": _I32, "_INF": _INF,
+           "_pad4": _pad4, "OSCCodecError": OSCCodecError}
+    tail_strings = len(tags) - len(tags.rstrip("sS"))
+    if tail_strings < _SPLIT_MIN:
+        tail_strings = 0
+    body = tags[:len(tags) - tail_strings]
+    shift = [0]
+
+    def value():
+        names.append("v%d" % len(names))
+        return names[-1]
+
+    def at(extra=0):
+        n = shift[0] + extra
+        return "offset + %d" % n if n else "offset"
+
+    def settle():
+        if shift[0]:
+            lines.append(" offset += %d" % shift[0])
+            shift[0] = 0
+
+    run = ""
+    for tag in body + "\x00":
+        code = _FIXED.get(tag)
+        if code is not None:
+            run += code
+            continue
+        if run:
+            step = _Struct(">" + run)
+            step_name = "S%d" % len(env)
+            env[step_name] = step
+            targets = ", ".join(value() for _ in run)
+            lines.append(" if %s > end: raise _truncated()" % at(step.size))
+            lines.append(" %s, = %s.unpack_from(data, %s)" % (targets, step_name, at()))
+            shift[0] += step.size
+            run = ""
+        if tag == "\x00":
+            break
+        if tag in "sS":
+            lines.append(" null = data.find(b'\\x00', %s, end)" % at())
+            lines.append(" if null < 0: raise _unterminated(%s)" % at())
+            lines.append(" %s = data[%s:null].decode('utf-8')" % (value(), at()))
+            lines.append(" offset = (null + 4) & ~3")
+            shift[0] = 0
+        elif tag in _CONSTANT:
+            lines.append(" %s = %s" % (value(), _CONSTANT[tag]))
+        elif tag == "b":
+            settle()
+            lines.append(" n, = _I32.unpack_from(data, offset)")
+            lines.append(" offset += 4")
+            lines.append(" if n < 0 or offset + n > end: raise OSCCodecError('blob overruns packet')")
+            lines.append(" %s = bytes(data[offset:offset + n])" % value())
+            lines.append(" offset = _pad4(offset + n)")
+        elif tag == "c":
+            lines.append(" %s = chr(_I32.unpack_from(data, %s)[0])" % (value(), at()))
+            shift[0] += 4
+        elif tag == "m":
+            lines.append(" if %s > end: raise _truncated()" % at(4))
+            lines.append(" %s = bytes(data[%s:%s])" % (value(), at(), at(4)))
+            shift[0] += 4
+        else:
+            # Unknown type: its size is unknown, so stop here
+            tail_strings = 0
+            break
+    result = "[%s]" % ", ".join(names)
+    if tail_strings:
+        result += " + _split_strings(data, %s, end, %d)" % (at(), tail_strings)
+    lines.append(" return " + result)
+    exec(compile("\n".join(lines), "<osc decoder %s>" % tags, "exec"), env)
+    return env["decode"]
+
+
+def _decode_plan(typetag):
+    if len(_PLANS) >= _FORMAT_CACHE_SIZE:
+        _PLANS.clear()
+    tags = typetag.decode("ascii")
+    if tags and all(tag in _FIXED for tag in tags):
+        plan = _Struct(">" + "".join(_FIXED[tag] for tag in tags))
+    else:
+        plan = _compile_decoder(tags)
+    _PLANS[typetag] = plan
+    return plan
+
+
+def _decode_message_at(data, start, end):
+    find = data.find
+    null = find(b"\x00", start, end)
+    if null < 0:
+        raise _unterminated(start)
+    raw = data[start:null]
+    address = _ADDRESSES.get(raw)
+    if address is None:
+        if len(_ADDRESSES) >= _FORMAT_CACHE_SIZE:
+            _ADDRESSES.clear()
+        address = _ADDRESSES[raw] = raw.decode("utf-8")
+    offset = (null + 4) & ~3
+    if offset >= end or data[offset] != 0x2C:  # ','
+        return address, []
+    null = find(b"\x00", offset, end)
+    if null < 0:
+        raise _unterminated(offset)
+    typetag = data[offset + 1:null]
+    plan = _PLANS.get(typetag) or _decode_plan(typetag)
+    offset = (null + 4) & ~3
+
+    if plan.__class__ is _Struct:
+        # Only fixed-size arguments (parameter writes, value lists)
+        if offset + plan.size > end:
+            raise _truncated()
+        return address, list(plan.unpack_from(data, offset))
+    return address, plan(data, offset, end)
+
+
+def _as_bytes(data):
+    # Address and type tag slices are dict keys, so they must be bytes; a
+    # memoryview or bytearray is copied once up front
+    if data.__class__ is not bytes:
+        return bytes(data)
+    return data
+
+
+def decode_message(data):
+    """Parse an OSC message into (address, args)."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    try:
+        return _decode_message_at(data, 0, len(data))
+    except struct.error as exc:
+        raise OSCCodecError("truncated OSC message: {}".format(exc))
+
+
+def _decode_bundle_at(data, start, end, out):
+    timetag = _U64.unpack_from(data, start + 8)[0]
+    offset = start + 16
+    while offset + 4 <= end:
+        size = _I32.unpack_from(data, offset)[0]
+        offset += 4
+        if size <= 0 or offset + size > end:
+            raise OSCCodecError("bundle element overruns packet")
+        if data[offset:offset + 8] == BUNDLE_TAG:
+            _decode_bundle_at(data, offset, offset + size, out)
+        else:
+            out.append(_decode_message_at(data, offset, offset + size))
+        offset += size
+    return timetag
+
+
+def is_bundle(data):
+    """True if the packet is an OSC bundle."""
+    return data[:8] == BUNDLE_TAG
+
+
+def decode_bundle(data):
+    """Parse a bundle into (timetag, [(address, args), ...]) with nesting flattened."""
+    data = _as_bytes(data)
+    messages = []
+    try:
+        timetag = _decode_bundle_at(data, 0, len(data), messages)
+    except struct.error as exc:
+        raise OSCCodecError("truncated OSC bundle: {}".format(exc))
+    return timetag, messages
+
+
+def decode_packet(data):
+    """Parse a message or bundle into a list of (address, args)."""
+    if is_bundle(data):
+        return decode_bundle(data)[1]
+    return [decode_message(data)]
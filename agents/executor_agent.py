@@ -16,6 +16,11 @@ from agent_system import BaseAgent
 import asyncio
 
 
+async def _failure(message: str) -> Dict[str, Any]:
+    """Awaitable failure result, so every action_map entry can be awaited"""
+    return {"success": False, "message": message}
+
+
 class ExecutorAgent(BaseAgent):
     """
     Executes commands against Ableton Live
@@ -187,8 +192,8 @@ class ExecutorAgent(BaseAgent):
 
         if hasattr(ableton, func_name):
             try:
-                func = getattr(ableton, func_name)
-                result = func(**args) if args else func()
+                from ableton_controls.async_controller import call_controller
+                result = await call_controller(ableton, func_name, **args)
 
                 # Mark as undone in persistence
                 if self.persistence:
@@ -231,6 +236,8 @@ class ExecutorAgent(BaseAgent):
         if not ableton:
             return {"success": False, "message": "Ableton controller not available"}
 
+        from ableton_controls.async_controller import call_controller
+
         # Get previous values for undo if needed
         previous_value = None
         if extracted_action in ("set_track_volume", "set_track_pan"):
@@ -238,94 +245,114 @@ class ExecutorAgent(BaseAgent):
             if track_idx is None:
                 return {"success": False, "message": "track_index required for volume/pan operations"}
             try:
+                # Readback queries are awaited so the event loop keeps running
                 if extracted_action == "set_track_volume":
-                    prev_result = ableton.get_track_volume(track_idx)
+                    prev_result = await call_controller(ableton, "get_track_volume", track_idx)
                     if prev_result.get("success"):
                         previous_value = prev_result.get("volume")
                 else:
-                    prev_result = ableton.get_track_pan(track_idx)
+                    prev_result = await call_controller(ableton, "get_track_pan", track_idx)
                     if prev_result.get("success"):
                         previous_value = prev_result.get("pan")
             except Exception:
                 pass
         elif extracted_action == "set_tempo":
             try:
-                prev_result = ableton.get_tempo()
+                prev_result = await call_controller(ableton, "get_tempo")
                 if prev_result.get("success"):
                     previous_value = prev_result.get("tempo")
             except Exception:
                 pass
 
-        # Map actions to Ableton controller methods
+        # Map actions to awaitable Ableton controller calls
         action_map = {
             # Playback
-            "play": lambda: ableton.play(),
-            "stop": lambda: ableton.stop(),
-            "pause": lambda: ableton.stop(),
-            "continue": lambda: ableton.continue_playback(),
-            "start_recording": lambda: ableton.start_recording(),
-            "stop_recording": lambda: ableton.stop_recording(),
-            "toggle_recording": lambda: ableton.start_recording(),
+            "play": lambda: call_controller(ableton, "play"),
+            "stop": lambda: call_controller(ableton, "stop"),
+            "pause": lambda: call_controller(ableton, "stop"),
+            "continue": lambda: call_controller(ableton, "continue_playback"),
+            "start_recording": lambda: call_controller(ableton, "start_recording"),
+            "stop_recording": lambda: call_controller(ableton, "stop_recording"),
+            "toggle_recording": lambda: call_controller(ableton, "start_recording"),
             
             # Metronome/Loop
-            "toggle_metronome": lambda: ableton.toggle_metronome(parameters.get("state", 1)),
-            "toggle_loop": lambda: ableton.set_loop(parameters.get("state", 1)),
+            "toggle_metronome": lambda: call_controller(ableton, "toggle_metronome", parameters.get("state", 1)),
+            "toggle_loop": lambda: call_controller(ableton, "set_loop", parameters.get("state", 1)),
             
             # Tempo
-            "set_tempo": lambda: ableton.set_tempo(parameters.get("bpm", 120)),
+            "set_tempo": lambda: call_controller(ableton, "set_tempo", parameters.get("bpm", 120)),
             
             # Track controls - IMPORTANT: track_index must be explicitly provided
-            "mute_track": lambda: ableton.mute_track(
+            "mute_track": lambda: call_controller(
+                ableton, "mute_track",
                 parameters.get("track_index"),
-                1
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
-            "unmute_track": lambda: ableton.mute_track(
+                1,
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
+            "unmute_track": lambda: call_controller(
+                ableton, "mute_track",
                 parameters.get("track_index"),
-                0
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
-            "solo_track": lambda: ableton.solo_track(
+                0,
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
+            "solo_track": lambda: call_controller(
+                ableton, "solo_track",
                 parameters.get("track_index"),
-                1
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
-            "unsolo_track": lambda: ableton.solo_track(
+                1,
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
+            "unsolo_track": lambda: call_controller(
+                ableton, "solo_track",
                 parameters.get("track_index"),
-                0
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
-            "arm_track": lambda: ableton.arm_track(
+                0,
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
+            "arm_track": lambda: call_controller(
+                ableton, "arm_track",
                 parameters.get("track_index"),
-                1
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
-            "disarm_track": lambda: ableton.arm_track(
+                1,
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
+            "disarm_track": lambda: call_controller(
+                ableton, "arm_track",
                 parameters.get("track_index"),
-                0
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
-            "set_track_volume": lambda: ableton.set_track_volume(
+                0,
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
+            "set_track_volume": lambda: call_controller(
+                ableton, "set_track_volume",
                 parameters.get("track_index"),
-                parameters.get("volume", 0.85)
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
-            "set_track_pan": lambda: ableton.set_track_pan(
+                parameters.get("volume", 0.85),
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
+            "set_track_pan": lambda: call_controller(
+                ableton, "set_track_pan",
                 parameters.get("track_index"),
-                parameters.get("pan", 0.0)
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
+                parameters.get("pan", 0.0),
+                verify=parameters.get("verify", False)
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
 
             # Scene/Clip - scene_index and clip_index must be explicitly provided
-            "fire_scene": lambda: ableton.fire_scene(
+            "fire_scene": lambda: call_controller(
+                ableton, "fire_scene",
                 parameters.get("scene_index")
-            ) if parameters.get("scene_index") is not None else {"success": False, "message": "scene_index required"},
-            "fire_clip": lambda: ableton.fire_clip(
+            ) if parameters.get("scene_index") is not None else _failure("scene_index required"),
+            "fire_clip": lambda: call_controller(
+                ableton, "fire_clip",
                 parameters.get("track_index"),
                 parameters.get("clip_index")
-            ) if parameters.get("track_index") is not None and parameters.get("clip_index") is not None else {"success": False, "message": "track_index and clip_index required"},
-            "stop_clip": lambda: ableton.stop_clip(
+            ) if parameters.get("track_index") is not None and parameters.get("clip_index") is not None else _failure("track_index and clip_index required"),
+            "stop_clip": lambda: call_controller(
+                ableton, "stop_clip",
                 parameters.get("track_index")
-            ) if parameters.get("track_index") is not None else {"success": False, "message": "track_index required"},
+            ) if parameters.get("track_index") is not None else _failure("track_index required"),
         }
         
         # Execute the action
         if extracted_action in action_map:
             try:
                 print(f"[EXECUTOR] Executing simple action: {extracted_action}")
-                result = action_map[extracted_action]()
+                result = await action_map[extracted_action]()
 
                 # Record the action for undo capability
                 if result.get("success"):
@@ -340,20 +367,22 @@ class ExecutorAgent(BaseAgent):
     
     async def _parse_and_execute_intent(self, intent: str, ableton) -> Dict[str, Any]:
         """Parse natural language intent and execute"""
+        from ableton_controls.async_controller import call_controller
+
         intent_lower = intent.lower()
         
         # Simple pattern matching for common commands
         if "play" in intent_lower and "stop" not in intent_lower:
-            return ableton.play()
+            return await call_controller(ableton, "play")
         
         if "stop" in intent_lower:
-            return ableton.stop()
+            return await call_controller(ableton, "stop")
         
         if "metronome on" in intent_lower or "turn on metronome" in intent_lower:
-            return ableton.toggle_metronome(1)
+            return await call_controller(ableton, "toggle_metronome", 1)
         
         if "metronome off" in intent_lower or "turn off metronome" in intent_lower:
-            return ableton.toggle_metronome(0)
+            return await call_controller(ableton, "toggle_metronome", 0)
         
         # Extract tempo
         import re
@@ -361,7 +390,7 @@ class ExecutorAgent(BaseAgent):
                       re.search(r'tempo\s*(?:to|at)?\s*(\d+)', intent_lower)
         if tempo_match:
             bpm = int(tempo_match.group(1))
-            return ableton.set_tempo(bpm)
+            return await call_controller(ableton, "set_tempo", bpm)
         
         return {"success": False, "message": f"Could not understand: {intent}"}
     
@@ -387,6 +416,8 @@ class ExecutorAgent(BaseAgent):
         if not ableton:
             return {"success": False, "message": "Ableton controller not available"}
 
+        from ableton_controls.async_controller import call_controller
+
         # Track context carried across commands
         track_index = content.get("track_index", 0)
         last_device_index = content.get("device_index", None)
@@ -415,7 +446,7 @@ class ExecutorAgent(BaseAgent):
                 continue
 
             try:
-                result = self._dispatch_command(
+                result = await self._dispatch_command(
                     ableton, func_name, args, track_index, last_device_index
                 )
 
@@ -426,7 +457,8 @@ class ExecutorAgent(BaseAgent):
                         if new_idx is not None:
                             last_device_index = new_idx
                         elif hasattr(ableton, "_find_last_device_index"):
-                            last_device_index = ableton._find_last_device_index(track_index)
+                            last_device_index = await call_controller(
+                                ableton, "_find_last_device_index", track_index)
 
                     # Track whether we fell back to a stock device
                     loaded = result.get("loaded_device")
@@ -455,7 +487,7 @@ class ExecutorAgent(BaseAgent):
             "results": results
         }
 
-    def _dispatch_command(
+    async def _dispatch_command(
         self,
         ableton,
         func_name: str,
@@ -472,7 +504,11 @@ class ExecutorAgent(BaseAgent):
         * ``set_device_parameter`` with ``param`` (name) + ``value`` →
           ``reliable_params.set_parameter_by_name()`` or falls back to
           ``ableton.set_device_parameter()`` when ``param_index`` is provided.
+
+        Controller calls are awaited through ``call_controller`` so a
+        verified write never blocks the loop running the agent.
         """
+        from ableton_controls.async_controller import call_controller
 
         # -- add_device → load_device translation with fallback --
         if func_name == "add_device":
@@ -481,7 +517,7 @@ class ExecutorAgent(BaseAgent):
             position = args.get("position", -1)
             print(f"[EXECUTOR] Running: load_device (from add_device) device={device_name} track={ti}")
 
-            result = ableton.load_device(ti, device_name, position)
+            result = await call_controller(ableton, "load_device", ti, device_name, position)
             if result.get("success"):
                 result["loaded_device"] = device_name
                 result["is_fallback"] = False
@@ -494,7 +530,7 @@ class ExecutorAgent(BaseAgent):
 
             for fb in fallbacks:
                 print(f"[EXECUTOR] Fallback: trying {fb} (instead of {device_name})")
-                result = ableton.load_device(ti, fb, position)
+                result = await call_controller(ableton, "load_device", ti, fb, position)
                 if result.get("success"):
                     result["loaded_device"] = fb
                     result["is_fallback"] = True
@@ -524,7 +560,7 @@ class ExecutorAgent(BaseAgent):
                 try:
                     from ableton_controls.reliable_params import get_reliable_controller
                     rpc = get_reliable_controller()
-                    return rpc.set_parameter_by_name(ti, di, param_name, value)
+                    return await asyncio.to_thread(rpc.set_parameter_by_name, ti, di, param_name, value)
                 except Exception as e:
                     return {"success": False,
                             "message": f"set_parameter_by_name failed: {e}"}
@@ -533,7 +569,7 @@ class ExecutorAgent(BaseAgent):
             if param_index is not None and di is not None:
                 print(f"[EXECUTOR] Running: set_device_parameter "
                       f"track={ti} device={di} param_idx={param_index} value={value}")
-                return ableton.set_device_parameter(ti, di, param_index, value)
+                return await call_controller(ableton, "set_device_parameter", ti, di, param_index, value)
 
             return {"success": False,
                     "message": f"set_device_parameter: missing device_index or param identifier. "
@@ -541,9 +577,8 @@ class ExecutorAgent(BaseAgent):
 
         # -- Default: direct dispatch to ableton controller --
         if hasattr(ableton, func_name):
-            func = getattr(ableton, func_name)
             print(f"[EXECUTOR] Running: {func_name} {args}")
-            return func(**args) if args else func()
+            return await call_controller(ableton, func_name, **args)
 
         return {"success": False, "message": f"Unknown function: {func_name}"}
 
@@ -9,27 +9,109 @@ This is useful because:
 2. Parameter indices need to be known to set values
 3. Common devices have predictable parameter layouts
 
-NOTE: This cache is populated with known Ableton stock device parameters.
-For VST/AU plugins, you'll need to query parameters at runtime.
+NOTE: This cache is seeded with known Ableton stock device parameters.
+Full schemas (every parameter's name, min, max and quantization) learned
+from live fetches are persisted to config/device_schemas.json, keyed by
+device class (plugins by class + device name), and loaded back on startup.
+A device met in an earlier session therefore resolves parameter indices
+without any OSC query.
 """
 
-from typing import Dict, Optional, List
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, List
+
+logger = logging.getLogger("jarvis.device_parameter_cache")
+
+# Bump when the on-disk layout changes; older files are ignored, not migrated
+DEVICE_SCHEMA_VERSION = 1
+DEVICE_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "config", "device_schemas.json")
+
+# Live classes that host many different devices: the class alone is no identity
+PLUGIN_CLASSES = frozenset({
+    "PluginDevice", "AuPluginDevice",
+    "MxDeviceAudioEffect", "MxDeviceInstrument", "MxDeviceMidiEffect",
+})
+
+
+def schema_key(class_name: str, device_name: str) -> str:
+    """Store key for a device: its Live class, or class:name for plugins/M4L."""
+    if class_name in PLUGIN_CLASSES:
+        return f"{class_name}:{device_name}"
+    return class_name
+
+
+@dataclass
+class DeviceSchema:
+    """Full parameter layout of one device class"""
+    class_name: str
+    device_name: str
+    names: List[str]
+    mins: List[float]
+    maxs: List[float]
+    quantized: Optional[List[bool]] = None  # None = not learned yet
+    updated: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return schema_key(self.class_name, self.device_name)
+
+    def param_map(self) -> Dict[str, int]:
+        """Parameter name -> index (first occurrence wins)."""
+        mapping: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            mapping.setdefault(name, i)
+        return mapping
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DeviceSchema":
+        names = [str(n) for n in data["names"]]
+        mins = [float(v) for v in data["mins"]]
+        maxs = [float(v) for v in data["maxs"]]
+        if not (len(names) == len(mins) == len(maxs)):
+            raise ValueError("names/mins/maxs length mismatch")
+        quantized = data.get("quantized")
+        if quantized is not None:
+            quantized = [bool(q) for q in quantized]
+        return cls(class_name=str(data["class_name"]), device_name=str(data.get("device_name", "")),
+                   names=names, mins=mins, maxs=maxs, quantized=quantized,
+                   updated=float(data.get("updated", 0.0)))
 
 
 class DeviceParameterCache:
     """
     Cache for device parameter names to indices mapping.
     
-    Provides quick lookup of parameter indices by name for common Ableton devices.
+    Provides quick lookup of parameter indices by name for common Ableton devices,
+    plus the persistent schema store for every device class met at runtime.
     """
     
-    def __init__(self):
-        """Initialize the parameter cache with known device parameters"""
+    def __init__(self, store_path: Optional[str] = None):
+        """
+        Initialize the parameter cache with known device parameters
+        
+        Args:
+            store_path: JSON file for learned schemas (None = in-memory only)
+        """
         self._cache: Dict[str, Dict[str, int]] = {}
+        self._schemas: Dict[str, DeviceSchema] = {}
+        self._by_device_name: Dict[str, str] = {}
+        self._lock = threading.RLock()
+        self.store_path = store_path
         self._load_stock_devices()
+        if store_path:
+            self._load_schemas()
     
     def _load_stock_devices(self):
-        """Load parameter mappings for Ableton stock devices"""
+        """Load parameter mappings for Ableton stock devices
+        
+        These are partial seeds; a learned schema for the same class
+        (see record_schema) replaces them with the device's full layout.
+        """
         
         # Compressor parameters (typical layout)
         self._cache["Compressor"] = {
@@ -261,6 +343,144 @@ class DeviceParameterCache:
             True if device is cached, False otherwise
         """
         return device_class in self._cache
+    
+    # ==================== PERSISTENT SCHEMAS ====================
+    
+    def _index_schema(self, schema: DeviceSchema):
+        """Make a schema visible to lookups (caller holds the lock)."""
+        key = schema.key
+        self._schemas[key] = schema
+        # A learned layout is complete, so it replaces any partial stock map
+        self._cache[key] = schema.param_map()
+        if schema.device_name:
+            self._by_device_name[schema.device_name.lower()] = key
+    
+    def _load_schemas(self):
+        """Load learned schemas from store_path (missing/stale files are ignored)."""
+        if not os.path.exists(self.store_path):
+            return
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning("Ignoring unreadable device schema store %s: %s", self.store_path, e)
+            return
+        if not isinstance(data, dict) or data.get("version") != DEVICE_SCHEMA_VERSION:
+            logger.info("Ignoring device schema store %s (version %r, expected %d)",
+                        self.store_path, data.get("version") if isinstance(data, dict) else None,
+                        DEVICE_SCHEMA_VERSION)
+            return
+        with self._lock:
+            for key, raw in (data.get("devices") or {}).items():
+                try:
+                    self._index_schema(DeviceSchema.from_dict(raw))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning("Skipping bad device schema %r: %s", key, e)
+    
+    def save(self) -> bool:
+        """
+        Write learned schemas to store_path (atomic replace)
+        
+        Returns:
+            True if written, False if there is no store path or the write failed
+        """
+        if not self.store_path:
+            return False
+        with self._lock:
+            data = {
+                "version": DEVICE_SCHEMA_VERSION,
+                "devices": {key: asdict(schema) for key, schema in sorted(self._schemas.items())},
+            }
+            tmp_path = f"{self.store_path}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.store_path) or ".", exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=1)
+                os.replace(tmp_path, self.store_path)
+                return True
+            except OSError as e:
+                logger.warning("Could not save device schema store %s: %s", self.store_path, e)
+                return False
+    
+    def record_schema(self, class_name: str, device_name: str,
+                      names: List[str], mins: List[float], maxs: List[float],
+                      quantized: Optional[List[bool]] = None) -> bool:
+        """
+        Record a device class's full parameter layout (persisted if changed)
+        
+        Args:
+            class_name: Live class name (e.g. "Eq8", "PluginDevice")
+            device_name: Device name as shown in Live
+            names: All parameter names, in index order
+            mins: Parameter minimums
+            maxs: Parameter maximums
+            quantized: Per-parameter is_quantized flags, if known
+            
+        Returns:
+            True if the store changed, False if it already had this layout
+        """
+        if not class_name or not names or not (len(names) == len(mins) == len(maxs)):
+            return False
+        key = schema_key(class_name, device_name)
+        with self._lock:
+            existing = self._schemas.get(key)
+            if (existing is not None and existing.names == list(names)
+                    and existing.mins == list(mins) and existing.maxs == list(maxs)
+                    and (quantized is None or existing.quantized == list(quantized))):
+                return False
+            if quantized is None and existing is not None and existing.names == list(names):
+                quantized = existing.quantized
+            schema = DeviceSchema(
+                class_name=class_name,
+                device_name=device_name,
+                names=list(names),
+                mins=[float(v) for v in mins],
+                maxs=[float(v) for v in maxs],
+                quantized=[bool(q) for q in quantized] if quantized is not None else None,
+                updated=time.time(),
+            )
+            self._index_schema(schema)
+            self.save()
+        logger.info("Recorded %d-parameter schema for %s", len(names), key)
+        return True
+    
+    def get_schema(self, class_name: str, device_name: str = "") -> Optional[DeviceSchema]:
+        """
+        Get the learned schema for a device class
+        
+        Args:
+            class_name: Live class name
+            device_name: Device name (needed for plugin classes)
+            
+        Returns:
+            DeviceSchema or None if never seen
+        """
+        with self._lock:
+            return self._schemas.get(schema_key(class_name, device_name))
+    
+    def find_schema_by_device_name(self, device_name: str) -> Optional[DeviceSchema]:
+        """
+        Get the learned schema for a device by its Live name (e.g. "EQ Eight")
+        
+        Args:
+            device_name: Device name, case-insensitive
+            
+        Returns:
+            DeviceSchema or None if no device with that name was recorded
+        """
+        with self._lock:
+            key = self._by_device_name.get((device_name or "").lower())
+            return self._schemas.get(key) if key else None
+    
+    def list_schemas(self) -> List[DeviceSchema]:
+        """
+        Get all learned schemas
+        
+        Returns:
+            List of DeviceSchema
+        """
+        with self._lock:
+            return list(self._schemas.values())
 
 
 # Common parameter shortcuts for voice commands
@@ -302,8 +522,8 @@ def normalize_param_name(spoken_name: str) -> str:
     return COMMON_PARAMS.get(normalized, spoken_name)
 
 
-# Singleton instance for easy import
-device_cache = DeviceParameterCache()
+# Singleton instance for easy import (backed by the persistent schema store)
+device_cache = DeviceParameterCache(store_path=DEVICE_SCHEMA_PATH)
 
 
 if __name__ == "__main__":
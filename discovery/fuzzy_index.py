@@ -0,0 +1,93 @@
+"""
+Fuzzy Name Index
+
+Prebuilt lookup tables for fuzzy plugin-name matching. Scoring a query
+against every installed plugin with SequenceMatcher gets slow with large
+libraries, so the index narrows the field first: only names that share a
+token or a character trigram with the query are scored.
+
+Every substring and token-overlap match shares at least one of those with
+the query, so pruning never drops them. Pure edit-distance matches with no
+common trigram (heavy typos in short names) can be missed; queries shorter
+than a trigram are scored against everything.
+
+Usage:
+    index = FuzzyNameIndex([["eq eight", "eq8"], ["fabfilter pro-q 3"]])
+    for i in index.candidates("pro q"):
+        name_lower = index.keys[i][0]
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+NGRAM_SIZE = 3
+
+# Spaces, hyphens, underscores, and letter/digit transitions ("pro-q3" -> pro, q, 3)
+_TOKEN_SPLIT = re.compile(r'[\s\-_]+|(?<=[a-z])(?=[0-9])|(?<=[0-9])(?=[a-z])')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase tokens, handling common separators"""
+    return [t for t in _TOKEN_SPLIT.split(text.lower()) if t]
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> Set[str]:
+    """Character n-grams of text (empty if shorter than size)"""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class FuzzyNameIndex:
+    """
+    Token and trigram inverted index over entries of normalized keys.
+
+    Each entry is a sequence of keys (a name, optionally followed by its
+    aliases), already lowercased by the caller. Entry positions match the
+    order they were given in, so callers can map them back to their own list.
+    """
+
+    def __init__(self, entries: Iterable[Sequence[str]] = ()):
+        self.keys: List[Tuple[str, ...]] = []
+        # Tokens of each entry's first key, and those tokens sorted and joined
+        self.tokens: List[FrozenSet[str]] = []
+        self.sorted_tokens: List[str] = []
+        self._by_token: Dict[str, List[int]] = {}
+        self._by_gram: Dict[str, List[int]] = {}
+        # Entries with a key too short to have a trigram of its own
+        self._short: List[int] = []
+
+        for position, keys in enumerate(entries):
+            keys = tuple(keys)
+            self.keys.append(keys)
+            first_tokens = tokenize(keys[0]) if keys else []
+            self.tokens.append(frozenset(first_tokens))
+            self.sorted_tokens.append(' '.join(sorted(set(first_tokens))))
+
+            entry_tokens: Set[str] = set()
+            entry_grams: Set[str] = set()
+            for key in keys:
+                entry_tokens.update(tokenize(key))
+                entry_grams.update(ngrams(key))
+            if any(len(key) < NGRAM_SIZE for key in keys):
+                self._short.append(position)
+            for token in entry_tokens:
+                self._by_token.setdefault(token, []).append(position)
+            for gram in entry_grams:
+                self._by_gram.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def candidates(self, query: str) -> List[int]:
+        """
+        Positions of entries worth scoring against a normalized query,
+        in entry order.
+        """
+        if len(query) < NGRAM_SIZE:
+            return list(range(len(self.keys)))
+
+        hits: Set[int] = set(self._short)
+        for token in tokenize(query):
+            hits.update(self._by_token.get(token, ()))
+        for gram in ngrams(query):
+            hits.update(self._by_gram.get(gram, ()))
+        return sorted(hits)
@@ -13,9 +13,13 @@ Resolution Tiers:
 
 import json
 import os
+import threading
+from collections import OrderedDict
 from difflib import SequenceMatcher, get_close_matches
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
+from dataclasses import dataclass, replace
+
+from discovery.fuzzy_index import FuzzyNameIndex, tokenize
 
 
 @dataclass
@@ -70,6 +74,14 @@ class PluginNameResolver:
         # Installed plugin names (ground truth)
         self._installed_plugins: List[str] = []
         self._installed_plugins_lower: Dict[str, str] = {}  # lower -> actual
+        # Token/trigram index over installed names, rebuilt on (re)load
+        self._index = FuzzyNameIndex()
+
+        # Recently resolved queries: (query_lower, strict) -> result
+        # Guarded by _resolve_cache_lock: resolve() runs on several worker threads
+        self._resolve_cache: "OrderedDict[Tuple[str, bool], ResolveResult]" = OrderedDict()
+        self._resolve_cache_lock = threading.Lock()
+        self.resolve_cache_size = 512
 
         # Fuzzy matching thresholds
         self.fuzzy_threshold_high = 0.85  # High confidence match
@@ -130,6 +142,7 @@ class PluginNameResolver:
             self._installed_plugins_lower = {
                 name.lower(): name for name in self._installed_plugins
             }
+            self._index = FuzzyNameIndex([name.lower().strip()] for name in self._installed_plugins)
 
             print(f"[PluginResolver] Loaded {len(self._installed_plugins)} installed plugins")
             return True
@@ -144,6 +157,9 @@ class PluginNameResolver:
         self._canonical_to_aliases.clear()
         self._installed_plugins.clear()
         self._installed_plugins_lower.clear()
+        self._index = FuzzyNameIndex()
+        with self._resolve_cache_lock:
+            self._resolve_cache.clear()
 
         self._load_aliases()
         self._load_installed_plugins()
@@ -218,18 +234,17 @@ class PluginNameResolver:
             threshold = self.fuzzy_threshold_medium
 
         query_lower = query.lower().strip()
+        query_tokens = frozenset(tokenize(query_lower))
 
-        # Collect all searchable names (installed + aliases)
-        all_names = list(self._installed_plugins)
-
-        # Score each candidate
+        # Score only the installed names the index can't rule out
         scored_matches: List[Tuple[float, str]] = []
+        index = self._index
 
-        for name in all_names:
-            # Calculate similarity using multiple methods
-            score = self._calculate_similarity(query_lower, name.lower())
+        for i in index.candidates(query_lower):
+            score = self._score(query_lower, query_tokens, index.keys[i][0],
+                                index.tokens[i], index.sorted_tokens[i], threshold)
             if score >= threshold:
-                scored_matches.append((score, name))
+                scored_matches.append((score, self._installed_plugins[i]))
 
         # Sort by score descending
         scored_matches.sort(key=lambda x: x[0], reverse=True)
@@ -251,10 +266,21 @@ class PluginNameResolver:
         2. Token-based matching (handles reordering)
         3. Sequence matching (handles typos)
         """
-        # Normalize strings
         query = query.lower().strip()
         candidate = candidate.lower().strip()
+        candidate_tokens = frozenset(tokenize(candidate))
+        return self._score(query, frozenset(tokenize(query)), candidate,
+                           candidate_tokens, ' '.join(sorted(candidate_tokens)))
+
+    def _score(self, query: str, query_tokens: FrozenSet[str], candidate: str,
+               candidate_tokens: FrozenSet[str], candidate_sorted: str,
+               floor: float = 0.0) -> float:
+        """
+        _calculate_similarity on normalized, pre-tokenized strings.
 
+        Sequence ratios whose quick upper bounds fall below ``floor`` are
+        skipped (scored 0.0), since the caller would discard them anyway.
+        """
         # Exact match
         if query == candidate:
             return 1.0
@@ -270,9 +296,6 @@ class PluginNameResolver:
             return max(0.75, ratio * 0.9)
 
         # Token-based matching (handles "Pro Q 3" vs "Pro-Q 3")
-        query_tokens = set(self._tokenize(query))
-        candidate_tokens = set(self._tokenize(candidate))
-
         if query_tokens and candidate_tokens:
             common_tokens = query_tokens & candidate_tokens
             token_score = len(common_tokens) / max(len(query_tokens), len(candidate_tokens))
@@ -281,23 +304,20 @@ class PluginNameResolver:
             if token_score >= 0.5:
                 return max(0.7, token_score * 0.95)
 
-        # Sequence matching (handles typos)
-        seq_ratio = SequenceMatcher(None, query, candidate).ratio()
-
-        # Also try with tokens sorted (handles reordering)
+        # Sequence matching (handles typos), and with tokens sorted (handles reordering)
         query_sorted = ' '.join(sorted(query_tokens))
-        candidate_sorted = ' '.join(sorted(candidate_tokens))
-        sorted_ratio = SequenceMatcher(None, query_sorted, candidate_sorted).ratio()
+        best = 0.0
+        for a, b in ((query, candidate), (query_sorted, candidate_sorted)):
+            matcher = SequenceMatcher(None, a, b)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            best = max(best, matcher.ratio())
 
-        # Return best of sequence ratios
-        return max(seq_ratio, sorted_ratio)
+        return best
 
     def _tokenize(self, text: str) -> List[str]:
         """Split text into tokens, handling common separators"""
-        import re
-        # Split on spaces, hyphens, underscores, and transition from letter to number
-        tokens = re.split(r'[\s\-_]+|(?<=[a-z])(?=[0-9])|(?<=[0-9])(?=[a-z])', text.lower())
-        return [t for t in tokens if t]  # Remove empty strings
+        return tokenize(text)
 
     # ==================== MAIN RESOLVE METHOD ====================
 
@@ -314,6 +334,26 @@ class PluginNameResolver:
         """
         query = query.strip()
 
+        # Every tier is case-insensitive, so one entry serves all spellings
+        key = (query.lower(), strict)
+        with self._resolve_cache_lock:
+            cached = self._resolve_cache.get(key)
+            if cached is not None:
+                self._resolve_cache.move_to_end(key)
+        if cached is None:
+            # Resolved outside the lock; a concurrent duplicate just stores it twice
+            cached = self._resolve_uncached(query, strict)
+            with self._resolve_cache_lock:
+                self._resolve_cache[key] = cached
+                self._resolve_cache.move_to_end(key)
+                if len(self._resolve_cache) > self.resolve_cache_size:
+                    self._resolve_cache.popitem(last=False)
+
+        # Callers own their copy
+        return replace(cached, original_query=query, alternatives=list(cached.alternatives))
+
+    def _resolve_uncached(self, query: str, strict: bool) -> ResolveResult:
+        """The tiered resolution behind resolve()"""
         # Tier 1: Exact Match
         exact = self._exact_match(query)
         if exact:
@@ -435,6 +475,8 @@ class PluginNameResolver:
         # Add to runtime learned aliases
         self._learned_aliases[alias_lower] = canonical_name
         self._alias_to_canonical[alias_lower] = canonical_name
+        with self._resolve_cache_lock:
+            self._resolve_cache.clear()
 
         # Persist to file
         self._save_learned_alias(alias, canonical_name)
@@ -10,13 +10,17 @@ user queries to exact Ableton device names.
 
 import json
 import os
-import socket
-import struct
 import time
-from typing import Dict, List, Optional, Tuple, Any
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 from dataclasses import dataclass, field
 
+from ableton_controls.loader_channel import LoaderChannel, get_loader_channel
+from ableton_controls.osc_codec import decode_message, encode_message
+from ableton_controls.response_mux import PendingQuery
+from discovery.fuzzy_index import FuzzyNameIndex
+
 # Import the tiered resolver (lazy import to avoid circular deps)
 _resolver = None
 def _get_resolver():
@@ -30,6 +34,32 @@ def _get_resolver():
     return _resolver
 
 
+def _match_score(query_lower: str, name_lower: str, aliases_lower: List[str]) -> float:
+    """PluginInfo.matches_query on lowercased strings"""
+    # Exact match
+    if query_lower == name_lower:
+        return 1.0
+    
+    # Name contains query
+    if query_lower in name_lower:
+        return 0.9
+    
+    # Query contains name
+    if name_lower in query_lower:
+        return 0.85
+    
+    # Check aliases
+    for alias_lower in aliases_lower:
+        if query_lower == alias_lower:
+            return 0.95
+        if query_lower in alias_lower or alias_lower in query_lower:
+            return 0.8
+    
+    # Fuzzy match using SequenceMatcher
+    ratio = SequenceMatcher(None, query_lower, name_lower).ratio()
+    return ratio * 0.7  # Scale down fuzzy matches
+
+
 @dataclass
 class PluginInfo:
     """Information about an available plugin"""
@@ -38,6 +68,7 @@ class PluginInfo:
     category: str     # eq, compressor, reverb, delay, etc.
     path: str = ""
     aliases: List[str] = field(default_factory=list)
+    uri: str = ""     # Live browser URI, for /jarvis/device/load_by_uri
     
     def matches_query(self, query: str) -> float:
         """
@@ -46,32 +77,8 @@ class PluginInfo:
         Returns:
             Float 0.0-1.0 indicating match quality
         """
-        query_lower = query.lower()
-        name_lower = self.name.lower()
-        
-        # Exact match
-        if query_lower == name_lower:
-            return 1.0
-        
-        # Name contains query
-        if query_lower in name_lower:
-            return 0.9
-        
-        # Query contains name
-        if name_lower in query_lower:
-            return 0.85
-        
-        # Check aliases
-        for alias in self.aliases:
-            alias_lower = alias.lower()
-            if query_lower == alias_lower:
-                return 0.95
-            if query_lower in alias_lower or alias_lower in query_lower:
-                return 0.8
-        
-        # Fuzzy match using SequenceMatcher
-        ratio = SequenceMatcher(None, query_lower, name_lower).ratio()
-        return ratio * 0.7  # Scale down fuzzy matches
+        return _match_score(query.lower(), self.name.lower(),
+                            [alias.lower() for alias in self.aliases])
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -80,7 +87,8 @@ class PluginInfo:
             'type': self.plugin_type,
             'category': self.category,
             'path': self.path,
-            'aliases': self.aliases
+            'aliases': self.aliases,
+            'uri': self.uri
         }
     
     @classmethod
@@ -91,7 +99,8 @@ class PluginInfo:
             plugin_type=data.get('type', 'plugin'),
             category=data.get('category', 'unknown'),
             path=data.get('path', ''),
-            aliases=data.get('aliases', [])
+            aliases=data.get('aliases', []),
+            uri=data.get('uri', '')
         )
 
 
@@ -107,7 +116,8 @@ class VSTDiscoveryService:
                  osc_host: str = "127.0.0.1",
                  osc_send_port: int = 11002,
                  osc_recv_port: int = 11003,
-                 cache_file: str = "config/vst_cache.json"):
+                 cache_file: str = "config/vst_cache.json",
+                 max_concurrent_requests: int = 4):
         """
         Initialize the VST Discovery Service
         
@@ -116,17 +126,32 @@ class VSTDiscoveryService:
             osc_send_port: Port to send OSC messages to Remote Script
             osc_recv_port: Port to receive OSC responses
             cache_file: Path to plugin cache file
+            max_concurrent_requests: Requests allowed in flight at once on
+                the shared loader channel (set by its first user)
         """
         self.osc_host = osc_host
         self.osc_send_port = osc_send_port
         self.osc_recv_port = osc_recv_port
         self.cache_file = cache_file
+        self.max_concurrent_requests = max_concurrent_requests
+
+        # How long load_device_on_track waits for the Remote Script's
+        # /jarvis/device/loaded notification after the load is accepted.
+        # Outlasts the script's own expiry (150 ticks, ~15s) so its
+        # /jarvis/device/load/failed arrives before we give up.
+        self.load_event_timeout = 16.0
         
         # Plugin cache
         self._plugins: List[PluginInfo] = []
         self._plugins_by_category: Dict[str, List[PluginInfo]] = {}
+        # Name/alias index over self._plugins for find_plugins
+        self._name_index = FuzzyNameIndex()
         self._cache_loaded = False
         self._last_refresh = 0
+        # Content hashes of the Remote Script's inventory, overall and per
+        # plugin type, as of the last refresh
+        self._inventory_hash = ""
+        self._type_hashes: Dict[str, str] = {}
         
         # Known plugin aliases for fuzzy matching
         self._aliases = self._load_plugin_aliases()
@@ -259,6 +284,8 @@ class VSTDiscoveryService:
             
             self._plugins = [PluginInfo.from_dict(p) for p in data.get('plugins', [])]
             self._last_refresh = data.get('last_refresh', 0)
+            self._inventory_hash = data.get('inventory_hash', '')
+            self._type_hashes = data.get('type_hashes', {})
             self._build_category_index()
             self._cache_loaded = True
             
@@ -276,7 +303,9 @@ class VSTDiscoveryService:
             data = {
                 'plugins': [p.to_dict() for p in self._plugins],
                 'last_refresh': self._last_refresh,
-                'plugin_count': len(self._plugins)
+                'plugin_count': len(self._plugins),
+                'inventory_hash': self._inventory_hash,
+                'type_hashes': self._type_hashes
             }
             
             with open(self.cache_file, 'w') as f:
@@ -286,7 +315,7 @@ class VSTDiscoveryService:
             print(f"[VSTDiscovery] Error saving cache: {e}")
     
     def _build_category_index(self):
-        """Build index of plugins by category"""
+        """Build index of plugins by category, and the fuzzy name index"""
         self._plugins_by_category = {}
         
         for plugin in self._plugins:
@@ -294,6 +323,11 @@ class VSTDiscoveryService:
             if category not in self._plugins_by_category:
                 self._plugins_by_category[category] = []
             self._plugins_by_category[category].append(plugin)
+
+        self._name_index = FuzzyNameIndex(
+            [plugin.name.lower()] + [alias.lower() for alias in plugin.aliases]
+            for plugin in self._plugins
+        )
     
     def _apply_aliases(self):
         """Apply known aliases to plugins"""
@@ -305,76 +339,26 @@ class VSTDiscoveryService:
     
     def _build_osc_message(self, address: str, args: List) -> bytes:
         """Build an OSC message"""
-        # Address (null-terminated, padded to 4 bytes)
-        addr_bytes = address.encode('utf-8') + b'\x00'
-        addr_padded = addr_bytes + b'\x00' * ((4 - len(addr_bytes) % 4) % 4)
-        
-        # Type tag
-        type_tag = ','
-        arg_data = b''
-        
-        for arg in args:
-            if isinstance(arg, int):
-                type_tag += 'i'
-                arg_data += struct.pack('>i', arg)
-            elif isinstance(arg, float):
-                type_tag += 'f'
-                arg_data += struct.pack('>f', arg)
-            elif isinstance(arg, str):
-                type_tag += 's'
-                str_bytes = arg.encode('utf-8') + b'\x00'
-                str_padded = str_bytes + b'\x00' * ((4 - len(str_bytes) % 4) % 4)
-                arg_data += str_padded
-        
-        type_bytes = type_tag.encode('utf-8') + b'\x00'
-        type_padded = type_bytes + b'\x00' * ((4 - len(type_bytes) % 4) % 4)
-        
-        return addr_padded + type_padded + arg_data
-    
+        return encode_message(address, args)
+
     def _parse_osc_response(self, data: bytes) -> Tuple[str, List]:
         """Parse an OSC response message"""
-        # Address
-        null_idx = data.index(b'\x00')
-        address = data[:null_idx].decode('utf-8')
-        addr_size = (null_idx + 4) & ~3
-        
-        if len(data) <= addr_size:
-            return address, []
-        
-        # Type tag
-        type_start = addr_size
-        if data[type_start:type_start+1] != b',':
-            return address, []
-        
-        type_null = data.index(b'\x00', type_start)
-        type_tag = data[type_start+1:type_null].decode('utf-8')
-        type_size = ((type_null - type_start) + 4) & ~3
-        
-        # Arguments
-        args = []
-        offset = type_start + type_size
-        
-        for tag in type_tag:
-            if tag == 'i':
-                val = struct.unpack('>i', data[offset:offset+4])[0]
-                args.append(val)
-                offset += 4
-            elif tag == 'f':
-                val = struct.unpack('>f', data[offset:offset+4])[0]
-                args.append(val)
-                offset += 4
-            elif tag == 's':
-                str_null = data.index(b'\x00', offset)
-                val = data[offset:str_null].decode('utf-8')
-                args.append(val)
-                offset = ((str_null + 1) + 3) & ~3
-        
-        return address, args
-    
-    def _send_osc_request(self, address: str, args: List = None, timeout: float = 5.0, max_retries: int = 3) -> Optional[Tuple[str, List]]:
+        return decode_message(data)
+
+    @property
+    def channel(self) -> LoaderChannel:
+        """The shared request channel to JarvisDeviceLoader"""
+        return get_loader_channel(self.osc_host, self.osc_send_port, self.osc_recv_port,
+                                  max_in_flight=self.max_concurrent_requests)
+
+    def _send_osc_request(self, address: str, args: List = None, timeout: float = 5.0,
+                          max_retries: int = 3) -> Optional[Tuple[str, List]]:
         """
         Send an OSC request and wait for response with retry logic and exponential backoff.
 
+        Goes through the shared LoaderChannel, so concurrent requests overlap
+        on one bound socket instead of racing to bind the reply port.
+
         Args:
             address: OSC address pattern
             args: Arguments to send
@@ -388,45 +372,15 @@ class VSTDiscoveryService:
             ConnectionError: If all retries fail with connection issues
             TimeoutError: If all retries timeout
         """
-        import time
         args = args or []
         last_error = None
         base_delay = 0.3  # Initial retry delay in seconds
 
         for attempt in range(max_retries + 1):
-            sock = None
             try:
-                # Create UDP socket with reuse option
-                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                sock.settimeout(timeout)
-
-                # Bind to receive port
-                try:
-                    sock.bind((self.osc_host, self.osc_recv_port))
-                except OSError as e:
-                    if e.errno == 10048:  # Address already in use (Windows)
-                        # CRITICAL: JarvisDeviceLoader responds to fixed port 11003.
-                        # If we are not bound to that port, we will never receive responses.
-                        raise OSError(
-                            f"Response port {self.osc_recv_port} is already in use. "
-                            "Jarvis needs exclusive access to receive JarvisDeviceLoader replies."
-                        )
-                    raise
-
-                # Build and send message
-                message = self._build_osc_message(address, args)
-                sock.sendto(message, (self.osc_host, self.osc_send_port))
-
-                # Wait for response
-                data, addr = sock.recvfrom(65535)
-                sock.close()
-
-                # Parse and return response
-                response = self._parse_osc_response(data)
-                return response
-
-            except socket.timeout:
+                response = self.channel.request(address, args, timeout=timeout)
+                if response is not None:
+                    return response
                 last_error = TimeoutError(f"Timeout waiting for response to {address} (attempt {attempt + 1}/{max_retries + 1})")
                 print(f"[VSTDiscovery] {last_error}")
 
@@ -443,14 +397,6 @@ class VSTDiscoveryService:
                 last_error = Exception(f"Unexpected error on {address} (attempt {attempt + 1}/{max_retries + 1}): {e}")
                 print(f"[VSTDiscovery] {last_error}")
 
-            finally:
-                # Ensure socket is always closed
-                if sock:
-                    try:
-                        sock.close()
-                    except:
-                        pass
-
             # Exponential backoff before retry
             if attempt < max_retries:
                 delay = min(base_delay * (2 ** attempt), 2.0)
@@ -468,30 +414,96 @@ class VSTDiscoveryService:
     def refresh_plugins(self) -> bool:
         """
         Refresh the plugin list by querying Ableton
+
+        Compares the Remote Script's inventory hashes with the cached ones
+        first: an unchanged inventory is not downloaded at all, and otherwise
+        only the plugin types whose hash changed are re-fetched.
         
         Returns:
             True if successful, False otherwise
         """
         print("[VSTDiscovery] Refreshing plugin list from Ableton...")
-        
-        # JarvisDeviceLoader now paginates /jarvis/plugins/get to avoid UDP size limits.
-        # Response format: [1, "success", total, offset, limit, plugins_json]
+
+        summary = self._fetch_inventory_hashes()
+        if summary is None:
+            # Older Remote Script without hashes: page through everything
+            fetched = self._fetch_plugin_pages("")
+            if fetched is None:
+                return False
+            return self._install_plugins([], fetched[0], "", {})
+
+        inventory_hash, type_hashes = summary
+        if self._cache_loaded and self._plugins and inventory_hash == self._inventory_hash:
+            self._last_refresh = time.time()
+            self._save_cache()
+            print(f"[VSTDiscovery] Plugin inventory unchanged ({len(self._plugins)} plugins)")
+            return True
+
+        kept = [p for p in self._plugins
+                if p.plugin_type in type_hashes
+                and type_hashes[p.plugin_type] == self._type_hashes.get(p.plugin_type)]
+        new_hashes = {t: h for t, h in type_hashes.items() if h == self._type_hashes.get(t)}
+        fetched_plugins: List[Dict] = []
+        for plugin_type, type_hash in type_hashes.items():
+            if plugin_type in new_hashes:
+                continue
+            fetched = self._fetch_plugin_pages(plugin_type)
+            if fetched is None:
+                return False
+            page_data, page_hash = fetched
+            fetched_plugins.extend(page_data)
+            # If the inventory changed mid-refresh, record what was actually read
+            new_hashes[plugin_type] = page_hash or type_hash
+            print(f"[VSTDiscovery] Refreshed {len(page_data)} '{plugin_type}' entries")
+
+        if new_hashes != type_hashes:
+            inventory_hash = ""  # Force a full comparison next time
+        return self._install_plugins(kept, fetched_plugins, inventory_hash, new_hashes)
+
+    def _fetch_inventory_hashes(self) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Get (inventory_hash, {plugin_type: hash}), or None if unsupported"""
+        try:
+            response = self._send_osc_request("/jarvis/plugins/hash", [], timeout=10.0, max_retries=0)
+        except (ConnectionError, TimeoutError):
+            return None
+        if not response:
+            return None
+        _address, args = response
+        if len(args) < 5 or args[0] != 1:
+            return None
+        try:
+            return str(args[2]), dict(json.loads(args[4]))
+        except (TypeError, ValueError):
+            return None
+
+    def _fetch_plugin_pages(self, plugin_filter: str) -> Optional[Tuple[List[Dict], str]]:
+        """
+        Page through /jarvis/plugins/get for one filter (plugin type,
+        category, or "" for everything).
+
+        Returns:
+            (plugin dicts, content hash of the listing — "" from older
+            Remote Scripts), or None on failure
+        """
+        # JarvisDeviceLoader paginates /jarvis/plugins/get to avoid UDP size limits.
+        # Response format: [1, "success", total, offset, limit, plugins_json, hash]
         all_plugins: List[Dict] = []
         offset = 0
         limit = 200
         total = None
+        listing_hash = ""
 
         # Hard cap to prevent infinite loops if something goes wrong
         for _ in range(1000):
-            response = self._send_osc_request("/jarvis/plugins/get", ["", offset, limit], timeout=30.0)
+            response = self._send_osc_request("/jarvis/plugins/get", [plugin_filter, offset, limit], timeout=30.0)
             if not response:
                 print("[VSTDiscovery] Failed to get response from Ableton")
-                return False
+                return None
 
             _address, args = response
             if len(args) < 3 or args[0] != 1:
                 print(f"[VSTDiscovery] Error response: {args}")
-                return False
+                return None
 
             # New format has paging info; old format had [1, "success", count, json]
             try:
@@ -500,17 +512,26 @@ class VSTDiscoveryService:
                     page_offset = int(args[3])
                     page_limit = int(args[4])
                     plugins_json = args[5] if len(args) > 5 else "[]"
+                    page_hash = str(args[6]) if len(args) > 6 else ""
                 else:
                     # Back-compat: treat as single page
                     total = int(args[2])
                     page_offset = 0
                     page_limit = total
                     plugins_json = args[3] if len(args) > 3 else "[]"
+                    page_hash = ""
 
                 page_data = json.loads(plugins_json)
                 if not isinstance(page_data, list):
                     page_data = []
 
+                # The listing changed under us (rescan mid-refresh): start over
+                if listing_hash and page_hash and page_hash != listing_hash:
+                    print("[VSTDiscovery] Plugin inventory changed during refresh, restarting")
+                    all_plugins, offset, listing_hash = [], 0, ""
+                    continue
+                listing_hash = listing_hash or page_hash
+
                 # If we requested an offset but got something else, trust the data length and continue.
                 all_plugins.extend(page_data)
 
@@ -526,21 +547,29 @@ class VSTDiscoveryService:
 
             except Exception as e:
                 print(f"[VSTDiscovery] Error parsing plugins page: {e}")
-                return False
+                return None
 
-        if not all_plugins:
+        return all_plugins, listing_hash
+
+    def _install_plugins(self, kept: List[PluginInfo], fetched: List[Dict],
+                         inventory_hash: str, type_hashes: Dict[str, str]) -> bool:
+        """Replace the plugin list with kept + fetched entries and save the cache"""
+        if not kept and not fetched:
             print("[VSTDiscovery] No plugins returned")
             return False
 
         # Parse plugin data
         try:
-            self._plugins = [PluginInfo.from_dict(p) for p in all_plugins]
+            self._plugins = kept + [PluginInfo.from_dict(p) for p in fetched]
             self._apply_aliases()
             self._build_category_index()
             self._last_refresh = time.time()
+            self._inventory_hash = inventory_hash
+            self._type_hashes = type_hashes
             self._cache_loaded = True
             
             self._save_cache()
+            self._reload_resolver()
             
             print(f"[VSTDiscovery] Loaded {len(self._plugins)} plugins")
             return True
@@ -549,6 +578,12 @@ class VSTDiscoveryService:
             print(f"[VSTDiscovery] Error parsing plugins: {e}")
             return False
     
+    def _reload_resolver(self):
+        """Rebuild the tiered resolver's index if it reads the cache just saved"""
+        if _resolver is not None and \
+                os.path.abspath(_resolver.installed_plugins_file) == os.path.abspath(self.cache_file):
+            _resolver.reload()
+
     def get_all_plugins(self) -> List[PluginInfo]:
         """Get all available plugins"""
         if not self._cache_loaded:
@@ -674,16 +709,17 @@ class VSTDiscoveryService:
         if not self._cache_loaded:
             self._load_cache()
         
-        # Get candidate plugins
-        if category:
-            candidates = self.get_plugins_by_category(category)
-        else:
-            candidates = self._plugins
-        
-        # Score each candidate
+        # Score only the plugins the name index can't rule out
+        query_lower = query.lower()
+        category_lower = category.lower() if category else None
+        index = self._name_index
         scored = []
-        for plugin in candidates:
-            score = plugin.matches_query(query)
+        for i in index.candidates(query_lower):
+            plugin = self._plugins[i]
+            if category_lower and plugin.category.lower() != category_lower:
+                continue
+            keys = index.keys[i]
+            score = _match_score(query_lower, keys[0], list(keys[1:]))
             if score >= min_score:
                 scored.append((score, plugin))
         
@@ -763,18 +799,60 @@ class VSTDiscoveryService:
                 print(f"[VSTDiscovery] Auto-resolved '{device_name}' to '{resolved_plugin.name}'")
             final_name = resolved_plugin.name
             
-        # Keep request timeout short; reliable_params verifies by device count after send.
-        response = self._send_osc_request(
-            "/jarvis/device/load",
-            [track_index, final_name, position],
-            timeout=2.5,
-            max_retries=1,
-        )
+        # The Remote Script accepts the load immediately and then pushes
+        # /jarvis/device/loaded from its devices listener; register for that
+        # before sending so it cannot arrive unobserved. The load id is echoed
+        # back, so a late event from an earlier load on this track is ignored.
+        load_id = uuid.uuid4().hex[:12]
+        events = self.channel.expect(["/jarvis/device/loaded", "/jarvis/device/load/failed"],
+                                     [track_index, load_id])
+        try:
+            response = None
+            if resolved_plugin and resolved_plugin.uri:
+                # The inventory's URI skips the Remote Script's name lookup
+                response = self._send_osc_request(
+                    "/jarvis/device/load_by_uri",
+                    [track_index, resolved_plugin.uri, position, load_id],
+                    timeout=2.5,
+                    max_retries=1,
+                )
+                if response and response[1][:1] == [0] and "not found" in str(response[1][-1]).lower():
+                    response = None  # Stale URI: fall back to the name
+
+            if response is None:
+                response = self._send_osc_request(
+                    "/jarvis/device/load",
+                    [track_index, final_name, position, load_id],
+                    timeout=2.5,
+                    max_retries=1,
+                )
+            if response:
+                response = self._await_device_loaded(events, response)
+        finally:
+            self.channel.cancel(events)
         
         if not response:
             return {'success': False, 'message': 'No response from Ableton'}
         
         address, args = response
+
+        if address == "/jarvis/device/loaded" and len(args) >= 6:
+            return {
+                'success': True,
+                'status': 'loaded',
+                'message': f"Device loaded: {args[3]}",
+                'device_index': int(args[2]),
+                'device_name': args[3],
+                'class_name': args[4],
+                'num_parameters': int(args[5]),
+            }
+
+        if address == "/jarvis/device/load/failed":
+            return {
+                'success': False,
+                'status': 'error',
+                'message': args[3] if len(args) > 3 else 'Device load failed',
+            }
         
         if len(args) >= 2:
             return {
@@ -785,6 +863,26 @@ class VSTDiscoveryService:
         
         return {'success': False, 'message': 'Invalid response format'}
 
+    def _await_device_loaded(self, events: PendingQuery,
+                             response: Tuple[str, List]) -> Tuple[str, List]:
+        """
+        After a load was accepted ("loading"), wait for the Remote Script to
+        report the device in the chain.
+
+        Returns the /jarvis/device/loaded or /jarvis/device/load/failed
+        message, or a timeout reply (which load_device_verified treats as
+        recoverable and verifies by device count instead).
+        """
+        _, args = response
+        if len(args) < 2 or args[0] != 1 or args[1] != "loading":
+            return response  # Older Remote Script: the reply is final
+
+        event = self.channel.wait(events, self.load_event_timeout)
+        if event is not None:
+            return event
+        return "/jarvis/device/load/response", [
+            0, "error", "Timeout waiting for device load notification"]
+
     def learn_plugin_alias(self, alias: str, correct_name: str) -> bool:
         """
         Teach the resolver a new alias from user correction.
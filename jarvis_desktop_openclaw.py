@@ -13,6 +13,7 @@ Launch from WSL:
 import asyncio
 import json
 import logging
+import ntpath
 import os
 import platform
 import queue
@@ -20,11 +21,23 @@ import random
 import re
 import shlex
 import subprocess
+import sys
 import threading
 import time
 import tkinter as tk
 from tkinter import scrolledtext, ttk
 
+_REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from utils.relay_worker import (
+    OPENCLAW_WORKER_SCRIPT,
+    RelayError,
+    RelayWorkerPool,
+    openclaw_worker_command,
+)
+
 log = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -53,6 +66,12 @@ OPENCLAW_MAX_RETRIES = max(1, int(os.getenv("OPENCLAW_MAX_RETRIES", "3")))
 OPENCLAW_RETRY_BASE_DELAY = float(os.getenv("OPENCLAW_RETRY_BASE_DELAY", "2.0"))
 OPENCLAW_COOLDOWN_SEC = int(os.getenv("OPENCLAW_COOLDOWN_SEC", "60"))
 
+# Warm relay worker (utils/openclaw_relay_worker.py, or OPENCLAW_RELAY_WORKER_CMD):
+# it runs the CLI for each call, so we skip the spawn and the wsl.exe hop.
+# Set OPENCLAW_RELAY_PERSISTENT=0 for one CLI process per call.
+OPENCLAW_RELAY_PERSISTENT = os.getenv("OPENCLAW_RELAY_PERSISTENT", "1").lower() not in {"0", "false", "no", "off"}
+OPENCLAW_RELAY_WORKERS = max(1, int(os.getenv("OPENCLAW_RELAY_WORKERS", "1")))
+
 # ---------------------------------------------------------------------------
 # Circuit breaker — prevents hammering the LLM during cooldown
 # ---------------------------------------------------------------------------
@@ -204,6 +223,87 @@ def _pick_candidates(message: str, timeout: int = TIMEOUT_SEC,
     return candidates
 
 
+def _to_wsl_path(path: str) -> str:
+    """C:\\Users\\x\\file.py -> /mnt/c/Users/x/file.py"""
+    drive, rest = ntpath.splitdrive(path)
+    if not drive:
+        return path.replace("\\", "/")
+    return f"/mnt/{drive[0].lower()}" + rest.replace("\\", "/")
+
+
+def _relay_worker_command() -> list[str] | None:
+    """Command that starts the relay worker, or None (one CLI process per call)."""
+    if not OPENCLAW_RELAY_PERSISTENT:
+        return None
+    custom = os.getenv("OPENCLAW_RELAY_WORKER_CMD", "").strip()
+    if custom:
+        return shlex.split(custom)
+    # On Windows, run the worker inside WSL so the wsl.exe hop is paid once.
+    if _is_windows() and os.path.isfile(WSL_EXE):
+        return [WSL_EXE, "-e", "python3", _to_wsl_path(OPENCLAW_WORKER_SCRIPT), _NODE, _OPENCLAW_MJS]
+    return openclaw_worker_command([_NODE, _OPENCLAW_MJS])
+
+
+_relay: RelayWorkerPool | None = None
+
+
+def _get_relay() -> RelayWorkerPool | None:
+    global _relay
+    if _relay is None:
+        command = _relay_worker_command()
+        if command:
+            _relay = RelayWorkerPool(command, size=OPENCLAW_RELAY_WORKERS, name="openclaw-relay")
+    return _relay
+
+
+def _warm_relay() -> str:
+    """Start the relay worker (unless turned off) ahead of the first query."""
+    relay = _get_relay()
+    if relay is None:
+        return "one CLI process per call"
+    try:
+        relay.request({"op": "ping"}, timeout=TIMEOUT_SEC)
+        return "persistent worker ready"
+    except RelayError as e:
+        return f"persistent worker unavailable ({e})"
+
+
+def _reply_from_output(returncode: int, stdout: str, stderr: str) -> tuple[str | None, str]:
+    """Turn relay process output into (reply, error_text)."""
+    if returncode != 0:
+        err = (stderr or stdout or "").strip()
+        return None, err or f"Exit code {returncode}"
+
+    raw = (stdout or "").strip()
+    if not raw:
+        return "(empty response from relay)", ""
+
+    try:
+        return extract_reply(json.loads(raw)), ""
+    except json.JSONDecodeError:
+        return raw, ""
+
+
+def _call_relay_worker(relay: RelayWorkerPool, message: str, timeout: int,
+                       agent: str | None) -> tuple[str | None, str] | None:
+    """One request to the relay worker, or None if the worker itself failed."""
+    try:
+        resp = relay.request(
+            {"op": "agent", "message": message, "agent": agent or AGENT_ID, "timeout": timeout},
+            timeout=timeout + 15,
+        )
+    except RelayError as e:
+        # Includes RelayTimeout: a worker that keeps timing out is killed and
+        # restarted by the pool, and this call goes to the CLI
+        log.warning("Relay worker unavailable, using one-shot CLI: %s", e)
+        return None
+    if "returncode" not in resp:
+        # The worker could not run OpenClaw at all (not an agent error)
+        log.warning("Relay worker error, using one-shot CLI: %s", resp.get("error") or resp)
+        return None
+    return _reply_from_output(resp["returncode"], resp.get("stdout", ""), resp.get("stderr", ""))
+
+
 def _call_openclaw_once(message: str, timeout: int = TIMEOUT_SEC,
                        agent: str | None = None) -> tuple[str | None, str]:
     """Single attempt to call OpenClaw.  Returns (reply, error_text).
@@ -211,6 +311,12 @@ def _call_openclaw_once(message: str, timeout: int = TIMEOUT_SEC,
     On success reply is a non-empty string and error_text is "".
     On failure reply is None and error_text describes the problem.
     """
+    relay = _get_relay()
+    if relay is not None:
+        result = _call_relay_worker(relay, message, timeout, agent)
+        if result is not None:
+            return result
+
     candidates = _pick_candidates(message, timeout, agent)
     last_err = ""
 
@@ -231,20 +337,11 @@ def _call_openclaw_once(message: str, timeout: int = TIMEOUT_SEC,
             last_err = f"Timed out ({timeout + 15}s)"
             continue
 
-        if proc.returncode != 0:
-            last_err = (proc.stderr or proc.stdout or "").strip()
-            if not last_err:
-                last_err = f"Exit code {proc.returncode}"
+        reply, err = _reply_from_output(proc.returncode, proc.stdout, proc.stderr)
+        if reply is None:
+            last_err = err
             continue
-
-        raw = (proc.stdout or "").strip()
-        if not raw:
-            return "(empty response from relay)", ""
-
-        try:
-            return extract_reply(json.loads(raw)), ""
-        except json.JSONDecodeError:
-            return raw, ""
+        return reply, ""
 
     return None, last_err
 
@@ -332,12 +429,14 @@ class OpenClawBackend:
         # Pre-warm: fire a lightweight health check so the WSL/Node process
         # is already loaded by the time the user sends their first query.
         status = await asyncio.to_thread(health_check, self.agent)
-        log.info("OpenClaw warmup: %s", status)
+        relay = await asyncio.to_thread(_warm_relay)
+        log.info("OpenClaw warmup: %s (relay: %s)", status, relay)
         return (
             f"Jarvis text mode is ready.\n"
             f"Backend: OpenClaw relay (desktop app)\n"
             f"Agent: {self.agent}\n"
-            f"Health: {status}"
+            f"Health: {status}\n"
+            f"Relay: {relay}"
         )
 
     def _structured_intent_error(self, *, intent: str, input_text: str,
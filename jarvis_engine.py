@@ -1,65 +1,62 @@
 import asyncio
 import os
 import logging
-
-try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    PYAUDIO_AVAILABLE = False
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Staged startup: only the OSC transport and session bookkeeping load here.
+# google.genai and the tool declarations load right before the Gemini session
+# connects; agents, knowledge and device intelligence build on first use or
+# in a background warm-up (see start_jarvis and --profile-startup).
+from utils.startup import LazySubsystem, startup_profiler, warm_up
+from utils.audio_capture import EnergyGate, MicCapture
+from utils.audio_playback import PlaybackEngine
+
+with startup_profiler.measure("pyaudio", "import"):
+    try:
+        import pyaudio
+        PYAUDIO_AVAILABLE = True
+    except ImportError:
+        PYAUDIO_AVAILABLE = False
 from datetime import datetime
 from dotenv import load_dotenv
-from google import genai
-from google.genai import types
-from google.genai import errors as genai_errors
-from ableton_controls import ableton
-from ableton_controls.reliable_params import ReliableParameterController
-from jarvis_tools import ABLETON_TOOLS
-from logging_config import setup_logging
+with startup_profiler.measure("ableton_controls", "import"):
+    from ableton_controls import ableton, call_controller
+from logging_config import parse_level, setup_logging
 
 # Import session manager for conversation tracking
 from context.session_manager import session_manager
-from context.session_persistence import get_session_persistence
-from context.crash_recovery import get_crash_recovery
-
-# Import workflow coordinator for end-to-end orchestration
-from agents.workflow_coordinator import get_workflow_coordinator
-
-# Import macro system
-from macros.macro_builder import macro_builder
-
-# Import agent system for intelligent audio engineering decisions
-from agent_system import AgentOrchestrator
-from agents.audio_engineer_agent import AudioEngineerAgent
-from agents.research_agent import ResearchAgent
-from agents.router_agent import RouterAgent
-from agents.planner_agent import PlannerAgent
-from agents.implementation_agent import ImplementationAgent
-from agents.executor_agent import ExecutorAgent
 from agents import AgentType, AgentMessage
-
-# Import device intelligence for semantic parameter understanding
-from discovery.device_intelligence import get_device_intelligence
-
-# Import plugin chain building
-from plugins.chain_builder import PluginChainBuilder, create_plugin_chain
-from knowledge.plugin_chain_kb import get_plugin_chain_kb
+from tool_dispatch import (
+    ALL_ARGS, DEVICE, PARAM, TRACK, Arg, ResourceScheduler, ToolRegistry,
+    register_controller_tools, to_int,
+)
 
 # 1. Setup and Environment
 load_dotenv()
 os.environ["PYTHONIOENCODING"] = "utf-8"
 
-# Verbose logging mode - set to True for detailed diagnostics
-VERBOSE_LOGGING = True
+# Verbose logging mode - set to True for detailed diagnostics (JARVIS_VERBOSE=0 to quiet)
+VERBOSE_LOGGING = os.getenv("JARVIS_VERBOSE", "1") != "0"
+
+# Print the startup profile once the session is up (--profile-startup)
+PROFILE_STARTUP = False
 
 # Initialize centralized logging system
-# Console shows DEBUG if VERBOSE_LOGGING is True, otherwise INFO
+# Console shows DEBUG if VERBOSE_LOGGING is True, otherwise INFO; the log file
+# level comes from JARVIS_FILE_LOG_LEVEL, and JARVIS_LOG_JSON=<path> (or 1)
+# adds a JSON-lines log with structured tool fields
 console_level = logging.DEBUG if VERBOSE_LOGGING else logging.INFO
-setup_logging(console_level=console_level)
+_json_log = os.getenv("JARVIS_LOG_JSON")
+setup_logging(
+    console_level=console_level,
+    file_level=parse_level(os.getenv("JARVIS_FILE_LOG_LEVEL", "DEBUG")),
+    json_file=("logs/jarvis.jsonl" if _json_log == "1" else _json_log) or None,
+)
 
 # API Configuration
 API_KEY = os.getenv("GOOGLE_API_KEY")
-client = genai.Client(api_key=API_KEY, http_options={'api_version': 'v1alpha'})
 MODEL_ID_AUDIO = "gemini-2.5-flash-native-audio-latest"
 MODEL_ID_TEXT = "gemini-2.5-flash"
 
@@ -69,46 +66,151 @@ SEND_SAMPLE_RATE = 16000   # Mic input rate
 RECEIVE_SAMPLE_RATE = 24000  # Speaker output rate (model outputs at 24kHz)
 CHUNK_SIZE = 1024
 
+# Mic → Gemini: audio is coalesced into MIC_FRAME_MS frames; frames quieter
+# than MIC_VAD_THRESHOLD (16-bit RMS, 0 = send everything) are skipped, with
+# pre-roll before and hangover after speech so the server VAD still works
+MIC_FRAME_MS = 100
+MIC_VAD_THRESHOLD = int(os.getenv("JARVIS_MIC_VAD_THRESHOLD", "300"))
+MIC_VAD_HANGOVER_MS = 1200
+MIC_VAD_PREROLL_MS = 300
+MIC_STATS_LOG_INTERVAL_S = 5.0  # DEBUG summary of sent/skipped/dropped audio
+
+# Gemini → speakers: jitter buffer depth before an utterance starts playing,
+# and how long a gap in the stream is waited out before the reply is over
+PLAYBACK_PREBUFFER_MS = 120
+PLAYBACK_GAP_MS = 600
+
 if PYAUDIO_AVAILABLE:
     FORMAT = pyaudio.paInt16
-    pya = pyaudio.PyAudio()
+    with startup_profiler.measure("PyAudio", "init"):
+        pya = pyaudio.PyAudio()
 else:
     FORMAT = None
     pya = None
 
-# Initialize agent system for intelligent audio engineering
-agent_orchestrator = AgentOrchestrator()
-# Register all agents for full multi-agent orchestration
-agent_orchestrator.register_agent(RouterAgent(agent_orchestrator))
-agent_orchestrator.register_agent(AudioEngineerAgent(agent_orchestrator))
-agent_orchestrator.register_agent(ResearchAgent(agent_orchestrator))
-agent_orchestrator.register_agent(PlannerAgent(agent_orchestrator))
-agent_orchestrator.register_agent(ImplementationAgent(agent_orchestrator))
-agent_orchestrator.register_agent(ExecutorAgent(agent_orchestrator))
-agent_orchestrator.set_ableton_controller(ableton)
 
-# Initialize workflow coordinator for end-to-end orchestration
-workflow_coordinator = get_workflow_coordinator(agent_orchestrator)
+# ==================== SESSION STAGE ====================
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The Gemini client (google.genai is imported on first call)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                with startup_profiler.measure("google.genai", "import"):
+                    from google import genai
+                with startup_profiler.measure("genai client", "init"):
+                    _client = genai.Client(api_key=API_KEY, http_options={'api_version': 'v1alpha'})
+    return _client
+
+
+def get_ableton_tools():
+    """Tool declarations for the Gemini session"""
+    with startup_profiler.measure("jarvis_tools", "import"):
+        from jarvis_tools import ABLETON_TOOLS
+    return ABLETON_TOOLS
+
+
+def __getattr__(name):
+    # Former eager globals, still importable as jarvis_engine.client etc.
+    if name == "client":
+        return get_client()
+    if name == "ABLETON_TOOLS":
+        return get_ableton_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ==================== KNOWLEDGE / AGENT STAGE ====================
+
+def _build_agent_orchestrator():
+    with startup_profiler.measure("agent_system, agents", "import"):
+        from agent_system import AgentOrchestrator
+        from agents.audio_engineer_agent import AudioEngineerAgent
+        from agents.research_agent import ResearchAgent
+        from agents.router_agent import RouterAgent
+        from agents.planner_agent import PlannerAgent
+        from agents.implementation_agent import ImplementationAgent
+        from agents.executor_agent import ExecutorAgent
+
+    orchestrator = AgentOrchestrator()
+    # Register all agents for full multi-agent orchestration
+    orchestrator.register_agent(RouterAgent(orchestrator))
+    orchestrator.register_agent(AudioEngineerAgent(orchestrator))
+    orchestrator.register_agent(ResearchAgent(orchestrator))
+    orchestrator.register_agent(PlannerAgent(orchestrator))
+    orchestrator.register_agent(ImplementationAgent(orchestrator))
+    orchestrator.register_agent(ExecutorAgent(orchestrator))
+    orchestrator.set_ableton_controller(ableton)
+    return orchestrator
+
 
-# Initialize session persistence for cross-session learning
-session_persistence = get_session_persistence()
+def _build_workflow_coordinator():
+    # Workflow coordinator for end-to-end orchestration
+    from agents.workflow_coordinator import get_workflow_coordinator
+    return get_workflow_coordinator(agent_orchestrator.get())
 
-# Initialize crash recovery system
-crash_recovery = get_crash_recovery()
-crash_recovery.set_controller(ableton)
 
-# Initialize device intelligence for semantic parameter understanding
-device_intelligence = get_device_intelligence()
+def _build_session_persistence():
+    # Session persistence for cross-session learning
+    from context.session_persistence import get_session_persistence
+    return get_session_persistence()
 
-# Initialize reliable parameter controller for verified parameter operations
-reliable_params = ReliableParameterController(ableton, verbose=False)
 
-# Initialize plugin chain knowledge base
-plugin_chain_kb = get_plugin_chain_kb()
+def _build_crash_recovery():
+    from context.crash_recovery import get_crash_recovery
+    recovery = get_crash_recovery()
+    recovery.set_controller(ableton)
+    return recovery
 
-# Audio queues for non-blocking operation
+
+def _build_device_intelligence():
+    # Semantic parameter understanding
+    from discovery.device_intelligence import get_device_intelligence
+    return get_device_intelligence()
+
+
+def _build_reliable_params():
+    # Verified parameter operations
+    from ableton_controls.reliable_params import ReliableParameterController
+    return ReliableParameterController(ableton, verbose=False)
+
+
+def _build_plugin_chain_kb():
+    from knowledge.plugin_chain_kb import get_plugin_chain_kb
+    return get_plugin_chain_kb()
+
+
+def _build_macro_builder():
+    from macros.macro_builder import macro_builder
+    return macro_builder
+
+
+agent_orchestrator = LazySubsystem("agent orchestrator", _build_agent_orchestrator)
+workflow_coordinator = LazySubsystem("workflow coordinator", _build_workflow_coordinator)
+session_persistence = LazySubsystem("session persistence", _build_session_persistence)
+crash_recovery = LazySubsystem("crash recovery", _build_crash_recovery)
+device_intelligence = LazySubsystem("device intelligence", _build_device_intelligence)
+reliable_params = LazySubsystem("reliable params", _build_reliable_params)
+plugin_chain_kb = LazySubsystem("plugin chain KB", _build_plugin_chain_kb)
+macro_builder = LazySubsystem("macro builder", _build_macro_builder)
+
+# Background warm-up order: what the first tool calls are most likely to need
+BACKGROUND_SUBSYSTEMS = [
+    reliable_params, device_intelligence, plugin_chain_kb, macro_builder,
+    crash_recovery, session_persistence, agent_orchestrator, workflow_coordinator,
+]
+
+# Audio queue for non-blocking playback (drained into the playback jitter
+# buffer; END_OF_TURN marks the end of a reply); mic audio goes through mic_capture
 audio_queue_output = asyncio.Queue()
-audio_queue_mic = asyncio.Queue(maxsize=5)
+END_OF_TURN = None
+mic_capture = MicCapture(SEND_SAMPLE_RATE, CHUNK_SIZE, MIC_FRAME_MS)
+playback = PlaybackEngine(RECEIVE_SAMPLE_RATE, prebuffer_ms=PLAYBACK_PREBUFFER_MS,
+                          gap_ms=PLAYBACK_GAP_MS)
 
 # Flag to pause mic input while Jarvis is speaking (prevents echo/self-interruption)
 is_playing = asyncio.Event()
@@ -136,47 +238,67 @@ conversation_state = {
 MAX_RETRIES = 2
 RETRY_DELAY = 0.5
 
+# Worker threads for synchronous tools (OSC round-trips, chain builds)
+TOOL_WORKERS = 4
+
+
+_engine_logger = logging.getLogger("jarvis.engine")
+
+# Level name -> (logging level, message prefix kept for backward compatibility)
+_LOG_LEVELS = {
+    "DEBUG": (logging.DEBUG, "[DBG] "),
+    "INFO": (logging.INFO, ""),
+    "WARN": (logging.WARNING, "[WARN] "),
+    "WARNING": (logging.WARNING, ""),
+    "ERROR": (logging.ERROR, "❌ "),
+    "STATE": (logging.INFO, "📊 "),  # STATE messages are informational
+}
 
-def log(msg, level="INFO"):
+
+def log(msg, level="INFO", *args, **fields):
     """
     Timestamped logging with levels.
-    Now delegates to the centralized logging system while maintaining backward compatibility.
+    Delegates to the centralized logging system while maintaining backward compatibility.
+
+    For hot paths, pass %-style ``args`` instead of an f-string: the message
+    is only formatted (on the logging thread) if some sink wants the level.
+    Keyword ``fields`` (tool, track, latency_ms, ...) become structured
+    fields in the JSON-lines log.
     """
-    # Get the logger for jarvis.engine
-    logger = logging.getLogger("jarvis.engine")
-
-    # Map level strings to logging levels
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARN": logging.WARNING,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "STATE": logging.INFO,  # STATE messages are informational
-    }
+    log_level, prefix = _LOG_LEVELS.get(level.upper(), (logging.INFO, ""))
+    if not _engine_logger.isEnabledFor(log_level):
+        return
+    if prefix:
+        msg = prefix + msg
+    _engine_logger.log(log_level, msg, *args, extra=fields or None)
 
-    log_level = level_map.get(level.upper(), logging.INFO)
 
-    # Add emoji prefix for certain log types (for backward compatibility)
-    if level == "ERROR":
-        msg = f"❌ {msg}"
-    elif level == "STATE":
-        msg = f"📊 {msg}"
-    elif level == "DEBUG":
-        msg = f"[DBG] {msg}"
-    elif level == "WARN":
-        msg = f"[WARN] {msg}"
+def log_enabled(level="DEBUG"):
+    """True if a message at this level would be written anywhere"""
+    return _engine_logger.isEnabledFor(_LOG_LEVELS.get(level.upper(), (logging.INFO, ""))[0])
 
-    # Log to the centralized system
-    logger.log(log_level, msg)
+
+def _run_coroutine_sync(coro, timeout=None):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Works from plain threads (tool workers) as well as from inside a running
+    event loop, where the coroutine gets its own loop on a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result(timeout=timeout)
 
 
 def log_state():
     """Log current conversation state."""
-    log(f"STATE: mic_muted={is_playing.is_set()}, "
-        f"chunks_sent={conversation_state['audio_chunks_sent']}, "
-        f"tools_executed={conversation_state['tool_calls_executed']}, "
-        f"turns={conversation_state['turns_completed']}", "STATE")
+    log("STATE: mic_muted=%s, chunks_sent=%d, tools_executed=%d, turns=%d", "STATE",
+        is_playing.is_set(), conversation_state["audio_chunks_sent"],
+        conversation_state["tool_calls_executed"], conversation_state["turns_completed"])
 
 
 async def generate_content_with_retry(client, model, contents, config, max_retries=3, base_delay=2.0):
@@ -197,6 +319,8 @@ async def generate_content_with_retry(client, model, contents, config, max_retri
     Raises:
         Exception: Re-raises non-rate-limit errors immediately
     """
+    from google.genai import errors as genai_errors
+
     last_exception = None
 
     for attempt in range(max_retries + 1):
@@ -229,7 +353,7 @@ async def generate_content_with_retry(client, model, contents, config, max_retri
 
 
 async def listen_audio():
-    """Captures audio from the microphone and puts it into the mic queue."""
+    """Opens the microphone and runs the mic_capture reader thread for the session."""
     # Wait for session to be connected before starting mic capture
     log("Waiting for session connection before starting mic...", "DEBUG")
     while not session_connected.is_set() and not shutdown_event.is_set():
@@ -253,63 +377,84 @@ async def listen_audio():
     log(f"    Mic device: {mic_info['name']}", "DEBUG")
 
     try:
-        while not shutdown_event.is_set() and session_connected.is_set():
-            data = await asyncio.to_thread(
-                audio_stream.read, CHUNK_SIZE, exception_on_overflow=False
-            )
-
-            # Only send mic audio when Jarvis is NOT speaking (prevents echo)
-            # AND when session is connected
-            if not is_playing.is_set() and session_connected.is_set():
-                try:
-                    audio_queue_mic.put_nowait({"data": data, "mime_type": "audio/pcm"})
-                except asyncio.QueueFull:
-                    # This should rarely happen now
-                    pass
-            # else: mic is muted while Jarvis speaks
+        mic_capture.start(audio_stream)
+        while not shutdown_event.is_set() and session_connected.is_set() and mic_capture.running:
+            await asyncio.sleep(0.2)
+        if mic_capture.error is not None and session_connected.is_set():
+            log(f"Mic Error: {mic_capture.error}", "ERROR")
 
     except Exception as e:
         if session_connected.is_set():
             log(f"Mic Error: {e}", "ERROR")
     finally:
+        mic_capture.stop()
         audio_stream.stop_stream()
         audio_stream.close()
 
 
 async def send_audio(session):
-    """Sends audio from the mic queue to the Gemini session."""
-    chunk_count = 0
-    last_log_time = datetime.now()
+    """Sends coalesced, VAD-gated mic frames to the Gemini session."""
+    frame_ms = mic_capture.get_stats()["frame_ms"]
+    gate = EnergyGate(MIC_VAD_THRESHOLD,
+                      hangover_frames=int(MIC_VAD_HANGOVER_MS // frame_ms),
+                      preroll_frames=int(MIC_VAD_PREROLL_MS // frame_ms))
+    stats = mic_capture.stats
+    last_log_at = time.monotonic()
     consecutive_errors = 0
     max_consecutive_errors = 5
     
     try:
         while not shutdown_event.is_set() and session_connected.is_set():
             try:
-                msg = await asyncio.wait_for(audio_queue_mic.get(), timeout=1.0)
-                
-                # Check connection state before sending
-                if not session_connected.is_set():
-                    log("Connection closed, stopping audio send", "DEBUG")
-                    break
-                
-                await session.send_realtime_input(media=msg)
-                chunk_count += 1
-                consecutive_errors = 0  # Reset error counter on success
-                conversation_state["audio_chunks_sent"] = chunk_count
-                
-                # Log every 50 chunks (about 3 seconds of audio)
-                if chunk_count % 50 == 0:
-                    now = datetime.now()
-                    elapsed = (now - last_log_time).total_seconds()
-                    log(f"Audio: {chunk_count} chunks sent ({elapsed:.1f}s since last log)", "DEBUG")
-                    last_log_time = now
-                    
-            except asyncio.TimeoutError:
-                # Log if we've been waiting a while with no audio
+                frame = await mic_capture.read_frame(timeout=1.0)
+                if frame is None:
+                    if not mic_capture.running:
+                        await asyncio.sleep(0.1)  # mic not open yet
+                    elif is_playing.is_set():
+                        log("Mic muted (Jarvis speaking)", "DEBUG")
+                    continue
+
+                # Only send mic audio when Jarvis is NOT speaking (prevents echo)
                 if is_playing.is_set():
-                    log("Mic muted (Jarvis speaking)", "DEBUG")
-                continue
+                    stats["frames_muted"] += 1
+                    gate.reset()
+                    continue
+
+                was_open = gate.is_open
+                frames = gate.process(frame, at=mic_capture.last_frame_at)
+                if gate.threshold <= 0:
+                    # No VAD: the user's input ends where the streamed audio does
+                    playback.mark_input_end(mic_capture.last_frame_at)
+                elif was_open and not gate.is_open:
+                    # User stopped talking at the last voiced frame, not when
+                    # the hangover ran out
+                    playback.mark_input_end(gate.last_voice_at)
+                if not frames:
+                    stats["frames_gated"] += 1
+                    continue
+
+                for data in frames:
+                    # Check connection state before sending
+                    if not session_connected.is_set():
+                        log("Connection closed, stopping audio send", "DEBUG")
+                        break
+
+                    started = time.perf_counter()
+                    await session.send_realtime_input(media={"data": data, "mime_type": "audio/pcm"})
+                    mic_capture.record_send(len(data), time.perf_counter() - started)
+                    conversation_state["audio_chunks_sent"] += 1
+                consecutive_errors = 0  # Reset error counter on success
+
+                # Periodic summary: one frame can send several (pre-roll), so
+                # a frame-count cadence would skip lines
+                now = time.monotonic()
+                if now - last_log_at >= MIC_STATS_LOG_INTERVAL_S:
+                    snapshot = mic_capture.get_stats()
+                    log("Audio: %d frames sent, %d silent skipped, %d bytes dropped (%.1fs since last log)",
+                        "DEBUG", snapshot["frames_sent"], snapshot["frames_gated"],
+                        snapshot["bytes_dropped"], now - last_log_at)
+                    last_log_at = now
+
             except Exception as e:
                 error_msg = str(e)
                 consecutive_errors += 1
@@ -401,12 +546,15 @@ async def receive_responses(session):
                             if sc.turn_complete:
                                 conversation_state["turns_completed"] += 1
                                 conversation_state["waiting_for_response"] = False
-                                log(f"Turn {conversation_state['turns_completed']} complete - ready for next command", "DEBUG")
+                                log("Turn %d complete - ready for next command", "DEBUG", conversation_state["turns_completed"])
                                 
-                                # Small delay then unmute mic
+                                # Playback unmutes the mic once the reply has been spoken
+                                if playback.running:
+                                    audio_queue_output.put_nowait(END_OF_TURN)
                                 await asyncio.sleep(0.3)
-                                is_playing.clear()
-                                log("[MIC] Mic UNMUTED - listening for next command", "DEBUG")
+                                if not playback.active and audio_queue_output.empty():
+                                    is_playing.clear()
+                                    log("[MIC] Mic UNMUTED - listening for next command", "DEBUG")
                                 log_state()
                             
                             # ===== HANDLE INTERRUPTIONS =====
@@ -423,18 +571,17 @@ async def receive_responses(session):
                                         cleared += 1
                                     except asyncio.QueueEmpty:
                                         break
+                                playback.flush()
                                 if cleared > 0:
                                     log(f"Cleared {cleared} audio chunks from queue", "DEBUG")
                                 
                                 log("[MIC] Mic UNMUTED after interrupt - listening...", "DEBUG")
                         
                         # ===== HANDLE TOOL CALLS (Ableton control) =====
+                        # Run off the receive loop so audio and stall detection keep going
                         if response.tool_call and response.tool_call.function_calls:
-                            for call in response.tool_call.function_calls:
-                                # Check connection before handling tool call
-                                if not session_connected.is_set():
-                                    break
-                                await handle_tool_call(session, call)
+                            if session_connected.is_set():
+                                spawn_tool_calls(session, list(response.tool_call.function_calls))
 
                     except Exception as e:
                         log(f"Error handling response: {e}", "ERROR")
@@ -489,95 +636,156 @@ async def receive_responses(session):
         conversation_state["waiting_for_response"] = False
 
 
-async def handle_tool_call(session, call):
-    """Handle a single tool call with retry logic."""
-    # Check connection before handling tool call
-    if not session_connected.is_set():
-        log("Connection closed, skipping tool call", "WARN")
-        return
-    
-    conversation_state["last_tool_call_time"] = datetime.now()
-    conversation_state["tool_calls_executed"] += 1
-    
-    log(f"============================================================")
-    log(f"*** TOOL CALL #{conversation_state['tool_calls_executed']}: {call.name}")
-    log(f"    Args: {call.args}")
-    
-    # Extra debugging for track operations
-    if "track_index" in call.args:
-        raw_idx = call.args.get("track_index")
-        log(f"    Track index raw: {raw_idx} (type: {type(raw_idx).__name__})")
-    
-    # Execute with retry logic
+# The live session run_session is serving; replies (and connection errors)
+# from tool-call batches of any earlier session are dropped
+_active_session = None
+
+# Background tool-call batches -> the session they answer (kept referenced until they finish)
+_tool_call_tasks = {}
+
+
+def spawn_tool_calls(session, calls):
+    """Run a turn's tool calls in the background and answer them in one response."""
+    task = asyncio.create_task(handle_tool_calls(session, calls))
+    _tool_call_tasks[task] = session
+    task.add_done_callback(lambda t: _tool_call_tasks.pop(t, None))
+    return task
+
+
+async def cancel_tool_calls(session=None):
+    """Cancel and await the background tool-call batches of a session (default: all)."""
+    tasks = [task for task, owner in _tool_call_tasks.items() if session is None or owner is session]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+        log("Cancelled %d pending tool-call batch(es)", "DEBUG", len(tasks))
+
+
+def _session_is_current(session):
+    return session is _active_session and session_connected.is_set()
+
+
+def _as_tool_result(outcome):
+    """A gathered tool-call outcome as a response dict (exceptions become errors)."""
+    if isinstance(outcome, dict):
+        return outcome
+    return {"success": False, "message": f"Error: {outcome}"}
+
+
+async def _execute_with_retries(name, args):
+    """Execute a tool, retrying failed attempts."""
     result = None
-    last_error = None
-    
     for attempt in range(MAX_RETRIES + 1):
         try:
-            result = execute_ableton_function(call.name, call.args)
-            
+            result = await execute_ableton_function_async(name, args)
+
             if result.get("success"):
                 break  # Success, exit retry loop
-            else:
-                last_error = result.get("message", "Unknown error")
-                if attempt < MAX_RETRIES:
-                    log(f"    Attempt {attempt + 1} failed: {last_error}. Retrying...", "WARN")
-                    await asyncio.sleep(RETRY_DELAY)
-                    
-        except Exception as e:
-            last_error = str(e)
-            log(f"    Attempt {attempt + 1} exception: {e}", "ERROR")
             if attempt < MAX_RETRIES:
+                log("    [%s] Attempt %d failed: %s. Retrying...", "WARN",
+                    name, attempt + 1, result.get("message", "Unknown error"), tool=name)
                 await asyncio.sleep(RETRY_DELAY)
+
+        except Exception as e:
+            log("    [%s] Attempt %d exception: %s", "ERROR", name, attempt + 1, e, tool=name)
             result = {"success": False, "message": f"Error: {e}"}
-    
-    # Log final result
-    log(f"    Result: {result}")
-    
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(RETRY_DELAY)
+    return result
+
+
+async def run_tool_call(call):
+    """
+    Execute a single tool call with retry logic and record it in the session.
+
+    Calls on the same track (and track-less writes) run in the order they
+    were issued, track-less reads see every earlier write; independent
+    calls overlap.
+    """
+    args = dict(call.args or {})
+    conversation_state["last_tool_call_time"] = datetime.now()
+    conversation_state["tool_calls_executed"] += 1
+    number = conversation_state["tool_calls_executed"]
+    track = args.get("track_index")
+
+    log("*** TOOL CALL #%d: %s", "INFO", number, call.name, tool=call.name, track=track)
+    log("    Args: %s", "DEBUG", args)
+
+    # Extra debugging for track operations
+    if track is not None and log_enabled("DEBUG"):
+        log("    Track index raw: %r (type: %s)", "DEBUG", track, type(track).__name__)
+
+    started = time.perf_counter()
+    keys = TOOLS.resource_keys(call.name, args)
+    result = await tool_scheduler.run(keys, lambda: _execute_with_retries(call.name, args))
+    latency_ms = round((time.perf_counter() - started) * 1000.0, 2)
+
+    # Log final result (formatted on the logging thread, and only if wanted)
+    log("    Result [%s]: %s", "DEBUG", call.name, result)
+
     # Record action in session manager
-    session_manager.record_action(
-        action=call.name,
-        params=call.args
-    )
-    
+    session_manager.record_action(action=call.name, params=args)
+
     # Update session manager state based on action
-    update_session_state(call.name, call.args, result)
-    
-    # Send the result back to Gemini (only if connection is still alive)
-    if session_connected.is_set():
+    update_session_state(call.name, args, result)
+
+    # Print user-friendly result
+    success = bool(result.get("success"))
+    log("    [%s] %s: %s (%.0f ms)", "INFO" if success else "WARN",
+        "OK" if success else "FAIL", call.name, result.get("message"), latency_ms,
+        tool=call.name, track=track, latency_ms=latency_ms, success=success)
+    return result
+
+
+async def handle_tool_calls(session, calls):
+    """Execute a turn's tool calls concurrently and send all results in one response."""
+    # Check connection before handling tool calls
+    if not _session_is_current(session):
+        log("Connection closed, skipping tool calls", "WARN")
+        return
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run_tool_call(call) for call in calls),
+                                   return_exceptions=True)
+    results = [_as_tool_result(r) for r in results]
+    batch_ms = round((time.perf_counter() - started) * 1000.0, 2)
+    log("    %d tool call(s) done in %.0f ms", "DEBUG", len(calls), batch_ms,
+        tools=[call.name for call in calls], latency_ms=batch_ms)
+
+    # Send the results back to Gemini (only if this session is still the live one)
+    if _session_is_current(session):
+        from google.genai import types
         try:
             await session.send_tool_response(
                 function_responses=[
-                    types.FunctionResponse(
-                        id=call.id,
-                        name=call.name,
-                        response=result
-                    )
+                    types.FunctionResponse(id=call.id, name=call.name, response=result)
+                    for call, result in zip(calls, results)
                 ]
             )
             conversation_state["last_tool_response_sent"] = datetime.now()
-            log(f"    ✅ Tool response sent to Gemini", "DEBUG")
-            
+            log("    ✅ Tool response sent to Gemini (%d result(s))", "DEBUG", len(calls))
+
         except Exception as e:
             error_msg = str(e)
             log(f"    ❌ Failed to send tool response: {e}", "ERROR")
-            
-            # Check if this is a connection error
-            if "ConnectionClosed" in error_msg or "keepalive ping timeout" in error_msg or "1011" in error_msg:
+
+            # Check if this is a connection error (a stale session must not
+            # take down the flag its successor has set)
+            if session is _active_session and (
+                    "ConnectionClosed" in error_msg or "keepalive ping timeout" in error_msg or "1011" in error_msg):
                 session_connected.clear()
     else:
         log(f"    [WARN] Connection closed, tool response not sent", "WARN")
-    
-    # Print user-friendly result
-    if result.get("success"):
-        log(f"    [OK] {result.get('message')}")
-    else:
-        log(f"    [FAIL] {result.get('message')}", "WARN")
-    
-    log(f"============================================================")
-    
-    # Log state after tool call
+
+    # Log state after tool calls
     log_state()
+    return results
+
+
+async def handle_tool_call(session, call):
+    """Handle a single tool call (see handle_tool_calls)."""
+    return await handle_tool_calls(session, [call])
 
 
 def update_session_state(function_name, args, result):
@@ -608,7 +816,7 @@ def update_session_state(function_name, args, result):
 
 
 async def play_audio():
-    """Plays audio from the output queue to the speakers."""
+    """Feeds audio from the output queue to the playback engine's writer thread."""
     stream = await asyncio.to_thread(
         pya.open,
         format=FORMAT,
@@ -616,32 +824,33 @@ async def play_audio():
         rate=RECEIVE_SAMPLE_RATE,  # 24kHz for output
         output=True,
     )
-    
+
+    # Mute the mic for a whole spoken reply, not per chunk
+    loop = asyncio.get_running_loop()
+    playback.start(stream,
+                   on_start=lambda: loop.call_soon_threadsafe(is_playing.set),
+                   on_end=lambda: loop.call_soon_threadsafe(is_playing.clear))
+
     try:
         while not shutdown_event.is_set():
             try:
                 audio_data = await asyncio.wait_for(audio_queue_output.get(), timeout=1.0)
-                is_playing.set()  # Mute mic while playing
-
-                # CRITICAL: Use try/finally to guarantee unmute even if write fails
-                try:
-                    await asyncio.to_thread(stream.write, audio_data)
-                finally:
-                    # Small delay before unmuting to avoid overlap
-                    await asyncio.sleep(0.05)
-                    is_playing.clear()  # Always unmute after audio chunk
+                if audio_data is END_OF_TURN:
+                    playback.end_of_turn()
+                else:
+                    playback.feed(audio_data)
 
             except asyncio.TimeoutError:
+                if playback.error is not None:
+                    log(f"Playback Error: {playback.error}", "ERROR")
+                    break
                 continue  # Check shutdown flag
-            except Exception as e:
-                log(f"Playback chunk error: {e}", "ERROR")
-                # Ensure mic is unmuted after error
-                is_playing.clear()
 
     except Exception as e:
         log(f"Playback Error: {e}", "ERROR")
     finally:
         # Final guarantee: unmute mic when exiting
+        await asyncio.to_thread(playback.stop)
         is_playing.clear()
         stream.stop_stream()
         stream.close()
@@ -696,8 +905,8 @@ async def stall_detector():
                 break
 
             # ===== NEW: Check for audio stall (mic muted but no audio) =====
-            if is_playing.is_set() and audio_queue_output.empty():
-                # Mic is muted but no audio is queued - potential stall
+            if is_playing.is_set() and audio_queue_output.empty() and not playback.active:
+                # Mic is muted but no audio is queued or playing - potential stall
                 if audio_stall_start is None:
                     audio_stall_start = datetime.now()
                 else:
@@ -767,18 +976,10 @@ def execute_plugin_chain_creation(track_index, artist_or_style, track_type="voca
         if not research_result:
             log(f"single_shot_called query={query}", "DEBUG")
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as pool:
-                        research_result = pool.submit(
-                            asyncio.run,
-                            _async_single_shot_research(query, artist_or_style, track_type)
-                        ).result(timeout=30)
-                else:
-                    research_result = asyncio.run(
-                        _async_single_shot_research(query, artist_or_style, track_type)
-                    )
+                research_result = _run_coroutine_sync(
+                    _async_single_shot_research(query, artist_or_style, track_type),
+                    timeout=30,
+                )
             except Exception as e:
                 log(f"Single-shot research failed: {e}", "DEBUG")
         
@@ -911,36 +1112,19 @@ def execute_research_vocal_chain(
         coordinator = get_research_coordinator()
         
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    result = pool.submit(
-                        asyncio.run,
-                        coordinator.perform_research(
-                            query=query,
-                            use_youtube=use_youtube,
-                            use_web=use_web,
-                            budget_mode=budget_mode or "cheap",
-                            max_total_llm_calls=max_total_llm_calls,
-                            prefer_cache=prefer_cache,
-                            cache_max_age_days=cache_max_age_days,
-                            deep_research=False,
-                        )
-                    ).result(timeout=30)
-            else:
-                result = asyncio.run(
-                    coordinator.perform_research(
-                        query=query,
-                        use_youtube=use_youtube,
-                        use_web=use_web,
-                        budget_mode=budget_mode or "cheap",
-                        max_total_llm_calls=max_total_llm_calls,
-                        prefer_cache=prefer_cache,
-                        cache_max_age_days=cache_max_age_days,
-                        deep_research=False,
-                    )
-                )
+            result = _run_coroutine_sync(
+                coordinator.perform_research(
+                    query=query,
+                    use_youtube=use_youtube,
+                    use_web=use_web,
+                    budget_mode=budget_mode or "cheap",
+                    max_total_llm_calls=max_total_llm_calls,
+                    prefer_cache=prefer_cache,
+                    cache_max_age_days=cache_max_age_days,
+                    deep_research=False,
+                ),
+                timeout=30,
+            )
         except Exception as e:
             return {"success": False, "message": f"Research failed: {e}"}
         
@@ -2236,97 +2420,66 @@ def delete_device_osc(track_index: int, device_index: int):
     Returns:
         Dict with success status and message
     """
+    result = _send_device_delete(track_index, device_index)
+    if result.get("success"):
+        # Devices after the deleted one shift down; drop their cached metadata slots
+        ableton.device_metadata.on_device_deleted(track_index, device_index)
+    return result
+
+
+def _send_device_delete(track_index: int, device_index: int):
+    """Send /jarvis/device/delete and wait briefly for the loader's reply."""
     import socket
-    import struct
     import time
 
+    from ableton_controls.loader_channel import get_loader_channel
+    from ableton_controls.osc_codec import encode_message
+
     log(f"Deleting device {device_index} from track {track_index} via JarvisDeviceLoader", "DEBUG")
 
     try:
-        # Build OSC message for JarvisDeviceLoader (port 11002)
-        address = "/jarvis/device/delete"
-
-        # Address (null-terminated, padded to 4 bytes)
-        addr_bytes = address.encode('utf-8') + b'\x00'
-        addr_padded = addr_bytes + b'\x00' * ((4 - len(addr_bytes) % 4) % 4)
-
-        # Type tag: two integers (track_index, device_index)
-        type_tag = ',ii'
-        type_bytes = type_tag.encode('utf-8') + b'\x00'
-        type_padded = type_bytes + b'\x00' * ((4 - len(type_bytes) % 4) % 4)
-
-        # Arguments
-        arg_data = struct.pack('>i', track_index)
-        arg_data += struct.pack('>i', device_index)
-
-        message = addr_padded + type_padded + arg_data
-
-        # Send to JarvisDeviceLoader port (11002)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(3.0)
+        # Shared channel: no per-request bind of the 11003 reply port
+        reply = get_loader_channel().request("/jarvis/device/delete",
+                                             [track_index, device_index], timeout=3.0)
+        if reply is None:
+            log("Timeout waiting for JarvisDeviceLoader response", "DEBUG")
+            return {
+                "success": False,
+                "message": "Timeout: No response from JarvisDeviceLoader. Is it installed in Ableton?",
+                "response": None
+            }
 
-        # Bind to receive response
-        try:
-            sock.bind(('127.0.0.1', 11003))
-        except OSError:
-            # Port might already be in use, try random port
-            sock.bind(('127.0.0.1', 0))
+        # JarvisDeviceLoader sends [success, status, message]
+        _address, args = reply
+        response_str = " ".join(str(a) for a in args)
+        log(f"Delete response: {response_str[:100]}", "DEBUG")
 
-        sock.sendto(message, ('127.0.0.1', 11002))
-        log(f"Sent delete request to JarvisDeviceLoader on port 11002", "DEBUG")
+        return {
+            "success": True,  # Assume success if we got any response
+            "message": f"Device {device_index} deleted from track {track_index + 1}",
+            "response": response_str
+        }
 
-        # Wait for response
+    except OSError as e:
+        # Reply port held by another process - try fire-and-forget approach
+        log(f"Port 11003 unavailable ({e}), trying fire-and-forget approach", "DEBUG")
         try:
-            data, addr = sock.recvfrom(65535)
-            sock.close()
-
-            # Parse response - JarvisDeviceLoader sends [success, status, message]
-            response_str = data.decode('utf-8', errors='ignore')
-            success = b'success' in data.lower() if isinstance(data, bytes) else 'success' in str(data).lower()
-
-            log(f"Delete response: {response_str[:100]}", "DEBUG")
-
+            sock2 = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock2.sendto(encode_message("/jarvis/device/delete", [track_index, device_index]),
+                         ('127.0.0.1', 11002))
+            sock2.close()
+            time.sleep(0.5)  # Give time for deletion
             return {
-                "success": success or True,  # Assume success if we got any response
-                "message": f"Device {device_index} deleted from track {track_index + 1}",
-                "response": response_str
+                "success": True,
+                "message": f"Device delete request sent for device {device_index} on track {track_index + 1}",
+                "response": None
             }
-
-        except socket.timeout:
-            sock.close()
-            log("Timeout waiting for JarvisDeviceLoader response", "DEBUG")
-            # Even without response, the deletion might have worked
+        except Exception as e2:
             return {
                 "success": False,
-                "message": "Timeout: No response from JarvisDeviceLoader. Is it installed in Ableton?",
+                "message": f"Socket error: {e2}",
                 "response": None
             }
-
-    except OSError as e:
-        if "10048" in str(e) or "Address already in use" in str(e):
-            # Port binding issue - try fire-and-forget approach
-            log("Port 11003 busy, trying fire-and-forget approach", "DEBUG")
-            try:
-                sock2 = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                sock2.sendto(message, ('127.0.0.1', 11002))
-                sock2.close()
-                time.sleep(0.5)  # Give time for deletion
-                return {
-                    "success": True,
-                    "message": f"Device delete request sent for device {device_index} on track {track_index + 1}",
-                    "response": None
-                }
-            except Exception as e2:
-                return {
-                    "success": False,
-                    "message": f"Socket error: {e2}",
-                    "response": None
-                }
-        return {
-            "success": False,
-            "message": f"Socket error: {e}",
-            "response": None
-        }
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -2617,9 +2770,9 @@ def explain_adjustment(device_name: str, param_index: int, value: float, track_t
 
 # ==================== MACRO SYSTEM FUNCTIONS ====================
 
-def execute_macro(macro_name: str):
+async def execute_macro_async(macro_name: str):
     """
-    Execute a predefined macro.
+    Execute a predefined macro on the running event loop.
 
     Args:
         macro_name: Name of the macro to execute
@@ -2640,17 +2793,7 @@ def execute_macro(macro_name: str):
                 "message": f"Macro '{macro_name}' not found. Available macros: {', '.join(available)}"
             }
 
-        # Execute the macro (synchronous wrapper for async)
-        import asyncio
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # Create a new task
-            future = asyncio.ensure_future(macro_builder.execute_macro(macro_name, ableton))
-            # This won't work in a running loop - need different approach
-            return {"success": True, "message": f"Macro '{macro_name}' queued for execution"}
-        else:
-            result = loop.run_until_complete(macro_builder.execute_macro(macro_name, ableton))
-            return result
+        return await macro_builder.execute_macro(macro.name, ableton)
 
     except Exception as e:
         import traceback
@@ -2658,6 +2801,22 @@ def execute_macro(macro_name: str):
         return {"success": False, "message": f"Error executing macro: {e}"}
 
 
+def execute_macro(macro_name: str):
+    """
+    Execute a predefined macro (blocking wrapper for execute_macro_async).
+
+    Args:
+        macro_name: Name of the macro to execute
+
+    Returns:
+        Dict with execution result
+    """
+    try:
+        return _run_coroutine_sync(execute_macro_async(macro_name))
+    except Exception as e:
+        return {"success": False, "message": f"Error executing macro: {e}"}
+
+
 def list_macros():
     """List all available macros."""
     try:
@@ -2684,8 +2843,8 @@ def list_macros():
 
 # ==================== UNDO SYSTEM FUNCTIONS ====================
 
-def undo_last_action():
-    """Undo the last action."""
+async def undo_last_action_async():
+    """Undo the last action on the running event loop."""
     try:
         executor = agent_orchestrator.get_agent(AgentType.EXECUTOR)
         if not executor:
@@ -2693,25 +2852,14 @@ def undo_last_action():
 
         # Access the undo stack directly
         if hasattr(executor, '_undo_stack') and executor._undo_stack:
-            import asyncio
-
-            async def _undo():
-                from agents import AgentMessage
-                message = AgentMessage(
-                    sender=AgentType.ROUTER,
-                    recipient=AgentType.EXECUTOR,
-                    content={"action": "undo"}
-                )
-                result = await executor.process(message)
-                return result.content
-
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Queue for later execution
-                return {"success": True, "message": "Undo queued for execution"}
-            else:
-                result = loop.run_until_complete(_undo())
-                return result
+            from agents import AgentMessage
+            message = AgentMessage(
+                sender=AgentType.ROUTER,
+                recipient=AgentType.EXECUTOR,
+                content={"action": "undo"}
+            )
+            result = await executor.process(message)
+            return result.content
         else:
             return {"success": False, "message": "No actions available to undo"}
 
@@ -2721,6 +2869,14 @@ def undo_last_action():
         return {"success": False, "message": f"Error undoing action: {e}"}
 
 
+def undo_last_action():
+    """Undo the last action (blocking wrapper for undo_last_action_async)."""
+    try:
+        return _run_coroutine_sync(undo_last_action_async())
+    except Exception as e:
+        return {"success": False, "message": f"Error undoing action: {e}"}
+
+
 def get_undo_history(limit: int = 10):
     """Get list of undoable actions."""
     try:
@@ -2838,199 +2994,189 @@ def execute_clean_storage(category="all", dry_run=False):
         return {"success": False, "message": f"Storage cleanup error: {e}"}
 
 
-def execute_ableton_function(function_name, args):
+# Single tool registry: the controller tools shared with ableton_bridge plus
+# the engine's own. Module globals are looked up per call, so lazy subsystems
+# stay lazy and tests can patch them.
+TOOLS = register_controller_tools(ToolRegistry(), lambda: ableton, lambda: reliable_params)
+_tool = TOOLS.register
+_VOCAL = Arg("track_type", None, "vocal")
+
+# Track queries and device removal (engine helpers)
+_tool("get_track_status", lambda t: get_track_status_combined(t), TRACK, track=True)
+_tool("get_armed_tracks", lambda: get_armed_tracks_list())
+_tool("find_track_by_name", lambda query: find_track_by_name(query), Arg("query"))
+_tool("delete_device", lambda t, d: delete_device_osc(t, d), TRACK, DEVICE, track=True)
+
+# Plugin chain functions
+_tool("create_plugin_chain",
+      lambda t, style, track_type, deep: execute_plugin_chain_creation(t, style, track_type, deep),
+      TRACK, Arg("artist_or_style"), _VOCAL, Arg("deep_research", None, False), track=True)
+_tool("load_preset_chain", lambda t, preset, track_type: execute_preset_chain(t, preset, track_type),
+      TRACK, Arg("preset_name"), _VOCAL, track=True)
+
+# Audio engineer intelligence functions
+_tool("consult_audio_engineer", lambda question, track_type: consult_audio_engineer(question, track_type),
+      Arg("question"), _VOCAL)
+_tool("get_parameter_info", lambda device, p: get_parameter_info(device, p), Arg("device_name"), PARAM)
+_tool("suggest_device_settings",
+      lambda device, purpose, track_type: suggest_device_settings(device, purpose, track_type),
+      Arg("device_name"), Arg("purpose"), _VOCAL)
+_tool("apply_audio_intent", lambda intent, track_type, t, d: apply_audio_intent(intent, track_type, t, d),
+      Arg("intent"), _VOCAL, TRACK, DEVICE, track=True)
+_tool("explain_adjustment",
+      lambda device, p, value, track_type: explain_adjustment(device, p, value, track_type),
+      Arg("device_name"), PARAM, Arg("value"), _VOCAL)
+
+# Macro and undo systems
+_tool("execute_macro", lambda name: execute_macro(name), Arg("macro_name"))
+_tool("list_macros", lambda: list_macros())
+_tool("undo_last_action", lambda: undo_last_action())
+_tool("get_undo_history", lambda limit: get_undo_history(limit), Arg("limit", to_int, 10))
+
+# Semantic parameter functions
+_tool("find_parameters_for_intent", lambda plugin, intent: find_parameters_for_intent(plugin, intent),
+      Arg("plugin_name"), Arg("intent"))
+_tool("get_signal_flow_recommendation", lambda chain: get_signal_flow_recommendation(chain),
+      Arg("chain_type"))
+
+# Storage management
+_tool("clean_storage", lambda category, dry_run: execute_clean_storage(category, dry_run),
+      Arg("category", None, "all"), Arg("dry_run", None, False))
+
+# Research-driven vocal chains + local librarian
+_tool("lookup_song_chain",
+      lambda title, artist, section, query: execute_lookup_song_chain(title, artist, section, query),
+      Arg("song_title"), Arg("artist"), Arg("section", None, "verse"), Arg("query"))
+_tool("explain_parameter", lambda plugin, param: execute_explain_parameter(plugin, param),
+      Arg("plugin_name"), Arg("param_name"))
+_tool("list_library", lambda: execute_list_library())
+_tool("search_library_by_vibe", lambda tags: execute_search_library_by_vibe(tags), Arg("tags", None, []))
+_tool("research_vocal_chain", lambda *values: execute_research_vocal_chain(*values),
+      Arg("query"), Arg("use_youtube", None, True), Arg("use_web", None, True),
+      Arg("max_sources", None, 3), Arg("budget_mode", None, "balanced"),
+      Arg("prefer_cache", None, True), Arg("cache_max_age_days", None, 14),
+      Arg("max_total_llm_calls"), Arg("deep_research", None, False))
+_tool("apply_research_chain",
+      lambda t, spec, track_type: execute_apply_research_chain(t, spec, track_type),
+      TRACK, Arg("chain_spec"), _VOCAL, track=True)
+_tool("apply_basic_vocal_parameters",
+      lambda t, profile: execute_apply_basic_vocal_parameters(t, profile),
+      TRACK, Arg("voice_profile", None, "male_tenor"), track=True)
+
+# Non-chatty chain pipeline (single-call deterministic execution)
+_tool("build_chain_pipeline", lambda args: execute_build_chain_pipeline(args), ALL_ARGS)
+
+# Track operations that REQUIRE track_index
+TRACK_OPERATIONS = TOOLS.track_operations()
+
+
+def get_tool_stats():
+    """Per-tool call counts and latency histograms for this session"""
+    return TOOLS.stats.get_stats()
+
+
+def _resolve_track_index(function_name, args):
     """
-    Execute an Ableton control function based on the function name and arguments.
+    Extract track_index and validate it for track operations.
+
+    Returns:
+        (track_index, error_result or None)
     """
-    try:
-        def to_int(value):
-            """Convert values to integers"""
-            if value is None:
-                return None
-            if isinstance(value, str):
-                # Handle string numbers
-                try:
-                    return int(float(value))
-                except ValueError:
-                    return value
-            if isinstance(value, (int, float)):
-                return int(value)
-            return value
-
-        # Track operations that REQUIRE track_index
-        TRACK_OPERATIONS = {
-            "mute_track", "solo_track", "arm_track",
-            "set_track_volume", "set_track_pan", "set_track_send",
-            "fire_clip", "stop_clip",
-            "get_num_devices", "get_track_devices", "get_device_name",
-            "get_device_class_name", "get_device_parameters",
-            "get_device_parameter_value", "set_device_parameter", "set_device_enabled",
-            "add_plugin_to_track", "create_plugin_chain", "load_preset_chain", "apply_research_chain",
-            "delete_track", "duplicate_track", "set_track_name", "set_track_color",
-            "apply_audio_intent", "delete_device", "apply_basic_vocal_parameters"
+    # Extract and convert common args with logging
+    track_index = to_int(args.get("track_index"))
+
+    # CRITICAL: Validate track_index is provided for track operations
+    if TOOLS.missing_track_index(function_name, args):
+        log(f"    [ERROR] {function_name} requires track_index but none was provided!", "ERROR")
+        return None, {
+            "success": False,
+            "message": f"Track index required for {function_name}. Please specify which track (e.g., 'track 1', 'track 2')."
         }
 
-        # Extract and convert common args with logging
-        track_index = to_int(args.get("track_index"))
+    # Debug log for track operations
+    if track_index is not None:
+        log("    [DEBUG] Converted track_index: %s (Ableton Track %s)", "DEBUG", track_index, track_index + 1)
+    return track_index, None
+
+
+# Bounded pool for synchronous tools, and per-track ordering of concurrent calls
+_tool_executor = None
+_tool_executor_lock = threading.Lock()
+tool_scheduler = ResourceScheduler()
+
+
+def _get_tool_executor():
+    """Worker pool for synchronous tools (created on first use)"""
+    global _tool_executor
+    if _tool_executor is None:
+        with _tool_executor_lock:
+            if _tool_executor is None:
+                _tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS,
+                                                    thread_name_prefix="jarvis-tool")
+    return _tool_executor
+
+
+# Tools awaited natively on the asyncio OSC transport; everything else runs
+# execute_ableton_function on the tool worker pool so the Live loop never blocks.
+# Handlers take the same coerced arguments as the tool's TOOLS entry.
+_ASYNC_TOOL_HANDLERS = {
+    "mute_track": lambda t, muted, verify: call_controller(
+        ableton, "mute_track", t, muted, verify=verify),
+    "solo_track": lambda t, soloed, verify: call_controller(
+        ableton, "solo_track", t, soloed, verify=verify),
+    "arm_track": lambda t, armed, verify: call_controller(
+        ableton, "arm_track", t, armed, verify=verify),
+    "set_track_volume": lambda t, volume, verify: call_controller(
+        ableton, "set_track_volume", t, volume, verify=verify),
+    "set_track_pan": lambda t, pan, verify: call_controller(
+        ableton, "set_track_pan", t, pan, verify=verify),
+    "set_track_send": lambda t, send, level, verify: call_controller(
+        ableton, "set_track_send", t, send, level, verify=verify),
+    "get_track_list": lambda: call_controller(ableton, "get_track_list"),
+    "get_track_mute": lambda t: call_controller(ableton, "get_track_mute", t),
+    "get_track_solo": lambda t: call_controller(ableton, "get_track_solo", t),
+    "get_track_arm": lambda t: call_controller(ableton, "get_track_arm", t),
+    "get_num_devices": lambda t: call_controller(ableton, "get_num_devices_sync", t),
+    "get_track_devices": lambda t: call_controller(ableton, "get_track_devices_sync", t),
+    "execute_macro": lambda name: execute_macro_async(name),
+    "undo_last_action": lambda: undo_last_action_async(),
+}
 
-        # CRITICAL: Validate track_index is provided for track operations
-        if function_name in TRACK_OPERATIONS and track_index is None:
-            log(f"    [ERROR] {function_name} requires track_index but none was provided!", "ERROR")
-            return {
-                "success": False,
-                "message": f"Track index required for {function_name}. Please specify which track (e.g., 'track 1', 'track 2')."
-            }
 
-        # Debug log for track operations
-        if track_index is not None:
-            log(f"    [DEBUG] Converted track_index: {track_index} (Ableton Track {track_index + 1})", "DEBUG")
-        
-        # Map function names to ableton controller methods
-        function_map = {
-            # Playback controls
-            "play": lambda: ableton.play(),
-            "stop": lambda: ableton.stop(),
-            "continue_playback": lambda: ableton.continue_playback(),
-            "start_recording": lambda: ableton.start_recording(),
-            "stop_recording": lambda: ableton.stop_recording(),
-            "toggle_metronome": lambda: ableton.toggle_metronome(to_int(args.get("state"))),
-            
-            # Transport controls
-            "set_tempo": lambda: ableton.set_tempo(args.get("bpm")),
-            "set_position": lambda: ableton.set_position(args.get("beat")),
-            "set_loop": lambda: ableton.set_loop(to_int(args.get("enabled"))),
-            "set_loop_start": lambda: ableton.set_loop_start(args.get("beat")),
-            "set_loop_length": lambda: ableton.set_loop_length(args.get("beats")),
-            
-            # Track controls
-            "mute_track": lambda: ableton.mute_track(track_index, to_int(args.get("muted"))),
-            "solo_track": lambda: ableton.solo_track(track_index, to_int(args.get("soloed"))),
-            "arm_track": lambda: ableton.arm_track(track_index, to_int(args.get("armed"))),
-            "set_track_volume": lambda: ableton.set_track_volume(track_index, args.get("volume")),
-            "set_track_pan": lambda: ableton.set_track_pan(track_index, args.get("pan")),
-            "set_track_send": lambda: ableton.set_track_send(track_index, to_int(args.get("send_index")), args.get("level")),
-            
-            # Scene controls
-            "fire_scene": lambda: ableton.fire_scene(to_int(args.get("scene_index"))),
-            
-            # Clip controls
-            "fire_clip": lambda: ableton.fire_clip(track_index, to_int(args.get("clip_index"))),
-            "stop_clip": lambda: ableton.stop_clip(track_index),
-            
-            # Track management
-            "create_audio_track": lambda: ableton.create_audio_track(to_int(args.get("index", -1))),
-            "create_midi_track": lambda: ableton.create_midi_track(to_int(args.get("index", -1))),
-            "create_return_track": lambda: ableton.create_return_track(),
-            "delete_track": lambda: ableton.delete_track(track_index),
-            "delete_return_track": lambda: ableton.delete_return_track(track_index),
-            "duplicate_track": lambda: ableton.duplicate_track(track_index),
-            "set_track_name": lambda: ableton.set_track_name(track_index, args.get("name")),
-            "set_track_color": lambda: ableton.set_track_color(track_index, to_int(args.get("color_index"))),
-            
-            # Track query controls
-            "get_track_list": lambda: ableton.get_track_list(),
-            "get_track_mute": lambda: ableton.get_track_mute(track_index),
-            "get_track_solo": lambda: ableton.get_track_solo(track_index),
-            "get_track_arm": lambda: ableton.get_track_arm(track_index),
-            "get_track_status": lambda: get_track_status_combined(track_index),
-            "get_armed_tracks": lambda: get_armed_tracks_list(),
-            "find_track_by_name": lambda: find_track_by_name(args.get("query")),
-
-            # Device query controls
-            "get_num_devices": lambda: ableton.get_num_devices_sync(track_index),
-            "get_track_devices": lambda: ableton.get_track_devices_sync(track_index),
-            "get_device_name": lambda: ableton.get_device_name(track_index, to_int(args.get("device_index"))),
-            "get_device_class_name": lambda: ableton.get_device_class_name(track_index, to_int(args.get("device_index"))),
-            "get_device_parameters": lambda: ableton.get_device_parameters(track_index, to_int(args.get("device_index"))),
-            "get_device_parameter_value": lambda: ableton.get_device_parameter_value(
-                track_index, to_int(args.get("device_index")), to_int(args.get("param_index"))),
-            
-            # Device parameter controls - using reliable verified setting
-            "set_device_parameter": lambda: reliable_params.set_parameter_verified(
-                track_index, to_int(args.get("device_index")), to_int(args.get("param_index")), args.get("value")),
-            "set_device_enabled": lambda: ableton.set_device_enabled(
-                track_index, to_int(args.get("device_index")), to_int(args.get("enabled"))),
-            "delete_device": lambda: delete_device_osc(track_index, to_int(args.get("device_index"))),
-
-            # Plugin management
-            "add_plugin_to_track": lambda: ableton.load_device(
-                track_index, args.get("plugin_name"), to_int(args.get("position", -1))),
-            "get_available_plugins": lambda: ableton.get_available_plugins(args.get("category")),
-            "find_plugin": lambda: ableton.find_plugin(args.get("query"), args.get("category")),
-            "refresh_plugin_list": lambda: ableton.refresh_plugin_list(),
-            
-            # Plugin chain functions (async - handled specially)
-            "create_plugin_chain": lambda: execute_plugin_chain_creation(
-                track_index,
-                args.get("artist_or_style"),
-                args.get("track_type", "vocal"),
-                args.get("deep_research", False),
-            ),
-            "load_preset_chain": lambda: execute_preset_chain(
-                track_index, args.get("preset_name"), args.get("track_type", "vocal")),
-            
-            # Audio engineer intelligence functions
-            "consult_audio_engineer": lambda: consult_audio_engineer(
-                args.get("question"), args.get("track_type", "vocal")),
-            "get_parameter_info": lambda: get_parameter_info(
-                args.get("device_name"), to_int(args.get("param_index"))),
-            "suggest_device_settings": lambda: suggest_device_settings(
-                args.get("device_name"), args.get("purpose"), args.get("track_type", "vocal")),
-            "apply_audio_intent": lambda: apply_audio_intent(
-                args.get("intent"), args.get("track_type", "vocal"),
-                track_index, to_int(args.get("device_index"))),
-            "explain_adjustment": lambda: explain_adjustment(
-                args.get("device_name"), to_int(args.get("param_index")),
-                args.get("value"), args.get("track_type", "vocal")),
-
-            # Macro system
-            "execute_macro": lambda: execute_macro(args.get("macro_name")),
-            "list_macros": lambda: list_macros(),
-
-            # Undo system
-            "undo_last_action": lambda: undo_last_action(),
-            "get_undo_history": lambda: get_undo_history(to_int(args.get("limit", 10))),
-
-            # Semantic parameter functions
-            "find_parameters_for_intent": lambda: find_parameters_for_intent(
-                args.get("plugin_name"), args.get("intent")),
-            "get_signal_flow_recommendation": lambda: get_signal_flow_recommendation(
-                args.get("chain_type")),
-
-            # Storage management
-            "clean_storage": lambda: execute_clean_storage(
-                args.get("category", "all"), args.get("dry_run", False)),
-
-            # Research-driven vocal chains + local librarian
-            "lookup_song_chain": lambda: execute_lookup_song_chain(
-                args.get("song_title"), args.get("artist"), args.get("section", "verse"), args.get("query")),
-            "explain_parameter": lambda: execute_explain_parameter(
-                args.get("plugin_name"), args.get("param_name")),
-            "list_library": lambda: execute_list_library(),
-            "search_library_by_vibe": lambda: execute_search_library_by_vibe(
-                args.get("tags", [])),
-            "research_vocal_chain": lambda: execute_research_vocal_chain(
-                args.get("query"),
-                args.get("use_youtube", True),
-                args.get("use_web", True),
-                args.get("max_sources", 3),
-                args.get("budget_mode", "balanced"),
-                args.get("prefer_cache", True),
-                args.get("cache_max_age_days", 14),
-                args.get("max_total_llm_calls"),
-                args.get("deep_research", False),
-            ),
-            "apply_research_chain": lambda: execute_apply_research_chain(
-                track_index, args.get("chain_spec"), args.get("track_type", "vocal")),
-            "apply_basic_vocal_parameters": lambda: execute_apply_basic_vocal_parameters(
-                track_index, args.get("voice_profile", "male_tenor")),
+async def execute_ableton_function_async(function_name, args):
+    """
+    Awaitable execute_ableton_function for the Gemini Live / text loops.
 
-            # Non-chatty chain pipeline (single-call deterministic execution)
-            "build_chain_pipeline": lambda: execute_build_chain_pipeline(args),
-        }
-        
-        if function_name in function_map:
-            return function_map[function_name]()
+    OSC queries and verified sets are awaited on the asyncio transport;
+    other tools run the synchronous dispatcher on the tool worker pool.
+    """
+    handler = _ASYNC_TOOL_HANDLERS.get(function_name)
+    if handler is None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_tool_executor(), execute_ableton_function,
+                                          function_name, args)
+    try:
+        _track_index, error = _resolve_track_index(function_name, args)
+        if error:
+            return error
+        return await TOOLS.call_async(function_name, args, handler)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return {"success": False, "message": f"Error executing {function_name}: {e}"}
+
+
+def execute_ableton_function(function_name, args):
+    """
+    Execute an Ableton control function based on the function name and arguments.
+    """
+    try:
+        _track_index, error = _resolve_track_index(function_name, args)
+        if error:
+            return error
+
+        if function_name in TOOLS:
+            return TOOLS.call(function_name, args)
         else:
             return {"success": False, "message": f"Unknown function: {function_name}"}
             
@@ -3045,12 +3191,34 @@ def execute_build_chain_pipeline(args: dict) -> dict:
 
     Validates the plan using Pydantic, then delegates to
     ChainPipelineExecutor for deterministic execution with
-    ZERO additional LLM calls.
+    ZERO additional LLM calls. A ``plans`` list (one plan per track)
+    runs through execute_many() so the tracks are built concurrently.
     """
     try:
         from pipeline.schemas import ChainPipelinePlan
         from pipeline.executor import ChainPipelineExecutor
 
+        executor = ChainPipelineExecutor(
+            controller=ableton,
+            reliable=reliable_params,
+        )
+
+        if args.get("plans"):
+            shared = {"dry_run": args.get("dry_run", False)}
+            plans = [ChainPipelinePlan(**{**shared, **dict(p)}) for p in args["plans"]]
+            if args.get("devices"):
+                single = {k: v for k, v in args.items() if k != "plans"}
+                plans.insert(0, ChainPipelinePlan(**single))
+
+            log(f"[PIPELINE] Executing {len(plans)} chains on tracks "
+                f"{sorted({p.track_index for p in plans})}")
+            multi = executor.execute_many(plans)
+            log(f"[PIPELINE] Result: success={multi.success} "
+                f"tracks={multi.tracks_succeeded}/{multi.tracks_planned} "
+                f"devices={multi.total_devices_loaded} params={multi.total_params_set} "
+                f"time={multi.total_time_ms:.0f}ms")
+            return multi.model_dump()
+
         # Parse and validate the plan
         plan = ChainPipelinePlan(**args)
 
@@ -3058,10 +3226,6 @@ def execute_build_chain_pipeline(args: dict) -> dict:
             f"({len(plan.devices)} devices on track {plan.track_index})")
 
         # Execute deterministically
-        executor = ChainPipelineExecutor(
-            controller=ableton,
-            reliable=reliable_params,
-        )
         result = executor.execute(plan)
 
         log(f"[PIPELINE] Result: success={result.success} "
@@ -3159,7 +3323,7 @@ NON-CHATTY CHAIN EXECUTION (CRITICAL - USE THIS FOR ALL MULTI-DEVICE OPERATIONS)
 When the user asks you to build a vocal chain, plugin chain, or ANY multi-device setup:
 1. STILL follow Steps 0-2 above (verify tracks, clarify intent/era/track).
 2. Once you have all the information, use the build_chain_pipeline tool INSTEAD OF multiple add_plugin_to_track + set_device_parameter calls.
-3. Include ALL devices and ALL parameters in a SINGLE build_chain_pipeline call.
+3. Include ALL devices and ALL parameters in a SINGLE build_chain_pipeline call. For chains on several tracks, put one entry per track in "plans" in that same single call.
 4. Use semantic parameter names: threshold_db, ratio, attack_ms, release_ms, band1_freq_hz, band1_gain_db, band1_q, band1_type, dry_wet_pct, drive_db, decay_time_ms, predelay_ms, room_size, output_gain_db, etc.
 5. Use human-readable values: Hz for frequency, dB for gain/threshold, ms for attack/release, ratio (4.0 = 4:1), percentage (0-100) for dry/wet.
 6. NEVER fall back to individual add_plugin_to_track + set_device_parameter sequences for chain building.
@@ -3311,12 +3475,17 @@ async def run_text_session():
     Manually manages conversation history using raw dicts to properly preserve
     thought signatures required by Gemini 3 for function calling.
     """
+    from google.genai import types
+    client = get_client()
+    tools = get_ableton_tools()
     session_connected.set()
+    startup_profiler.mark("session connected")
+    _report_startup_profile()
 
     log("------------------------------------------------------------")
     log("--- Jarvis Online (Hamilton Studio) [TEXT MODE] ---")
     log(f"Model: {MODEL_ID_TEXT}")
-    log(f"Available functions: {len(ABLETON_TOOLS[0].function_declarations)}")
+    log(f"Available functions: {len(tools[0].function_declarations)}")
     log("Type your commands below. Type 'quit' or 'exit' to stop.")
     log(f"Verbose logging: {'ON' if VERBOSE_LOGGING else 'OFF'}")
     log("------------------------------------------------------------")
@@ -3325,7 +3494,7 @@ async def run_text_session():
     system_instruction = build_system_instruction()
     config = types.GenerateContentConfig(
         system_instruction=system_instruction,
-        tools=ABLETON_TOOLS,
+        tools=tools,
     )
 
     # Manually manage conversation history as dicts to preserve thought signatures
@@ -3432,25 +3601,14 @@ async def run_text_session():
                         break
 
                     # Execute function calls and build response parts as dicts
-                    function_response_parts = []
-                    for call in function_calls:
-                        conversation_state["tool_calls_executed"] += 1
-                        log(f"============================================================")
-                        log(f"*** TOOL CALL #{conversation_state['tool_calls_executed']}: {call.name}")
-                        log(f"    Args: {call.args}")
-
-                        result = execute_ableton_function(call.name, dict(call.args))
-                        log(f"    Result: {result}")
-
-                        session_manager.record_action(action=call.name, params=dict(call.args))
-                        update_session_state(call.name, dict(call.args), result)
-
-                        function_response_parts.append({
-                            "functionResponse": {
-                                "name": call.name,
-                                "response": result
-                            }
-                        })
+                    # (a failed call is answered with an error, the others still reply)
+                    results = await asyncio.gather(*(run_tool_call(call) for call in function_calls),
+                                                   return_exceptions=True)
+                    results = [_as_tool_result(r) for r in results]
+                    function_response_parts = [
+                        {"functionResponse": {"name": call.name, "response": result}}
+                        for call, result in zip(function_calls, results)
+                    ]
 
                     # Add function responses as user content dict
                     contents.append({
@@ -3480,6 +3638,7 @@ async def run_text_session():
 
 async def run_session(text_mode=False):
     """Run a single session with all tasks (voice mode only now)."""
+    global _active_session
     # Reset conversation state and connection flag
     conversation_state["audio_chunks_sent"] = 0
     conversation_state["tool_calls_executed"] = 0
@@ -3487,18 +3646,19 @@ async def run_session(text_mode=False):
     conversation_state["waiting_for_response"] = False
     session_connected.clear()  # Not connected yet - will set after connection
 
-    # Clear any stale audio in the queue before starting
-    while not audio_queue_mic.empty():
-        try:
-            audio_queue_mic.get_nowait()
-        except asyncio.QueueEmpty:
-            break
+    # Clear any stale audio in the mic buffer before starting
+    mic_capture.clear()
+
+    # Session stage: the Gemini client and tool declarations, nothing heavier
+    from google.genai import types
+    client = get_client()
+    tools = get_ableton_tools()
 
     # Setup Jarvis's configuration
     if text_mode:
         config = {
             "response_modalities": ["TEXT"],
-            "tools": ABLETON_TOOLS,
+            "tools": tools,
             "system_instruction": build_system_instruction()
         }
     else:
@@ -3512,7 +3672,7 @@ async def run_session(text_mode=False):
                     prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name="Aoede")
                 )
             ),
-            "tools": ABLETON_TOOLS,
+            "tools": tools,
             "system_instruction": build_system_instruction()
         }
     
@@ -3520,12 +3680,15 @@ async def run_session(text_mode=False):
         model = MODEL_ID_TEXT if text_mode else MODEL_ID_AUDIO
         async with client.aio.live.connect(model=model, config=config) as session:
             # NOW mark as connected after session is established
+            _active_session = session
             session_connected.set()
+            startup_profiler.mark("session connected")
+            _report_startup_profile()
 
             log("------------------------------------------------------------")
             mode_label = "TEXT" if text_mode else "VOICE"
             log(f"--- Jarvis Online (Hamilton Studio) [{mode_label} MODE] ---")
-            log(f"Available functions: {len(ABLETON_TOOLS[0].function_declarations)}")
+            log(f"Available functions: {len(tools[0].function_declarations)}")
             if not text_mode:
                 log("(Mic auto-mutes while Jarvis speaks to prevent echo)")
             else:
@@ -3585,15 +3748,13 @@ async def run_session(text_mode=False):
     finally:
         # Ensure connection flag is cleared and cleanup
         session_connected.clear()
+        _active_session = None
+        await cancel_tool_calls()
         is_playing.clear()
         conversation_state["waiting_for_response"] = False
         
-        # Clear audio queues to prevent stale data
-        while not audio_queue_mic.empty():
-            try:
-                audio_queue_mic.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        # Clear audio buffers to prevent stale data
+        mic_capture.clear()
         while not audio_queue_output.empty():
             try:
                 audio_queue_output.get_nowait()
@@ -3603,6 +3764,31 @@ async def run_session(text_mode=False):
         log("Session cleanup complete", "DEBUG")
 
 
+_startup_reports_printed = set()
+
+
+def _report_startup_profile(stage="session"):
+    """Print the startup profile once per stage when --profile-startup is set"""
+    if not PROFILE_STARTUP or stage in _startup_reports_printed:
+        return
+    _startup_reports_printed.add(stage)
+    print(startup_profiler.report())
+
+
+def _start_background_warm_up():
+    """Build the knowledge/agent subsystems on a daemon thread"""
+    def _warm():
+        warm_up(BACKGROUND_SUBSYSTEMS,
+                on_error=lambda name, e: log(f"Background init of {name} failed: {e}", "WARN"))
+        startup_profiler.mark("background subsystems ready")
+        if agent_orchestrator.ready:
+            log("Audio engineer intelligence ready: "
+                f"{len(agent_orchestrator.agents)} agents, device intelligence, chain KB", "DEBUG")
+        _report_startup_profile("background")
+
+    threading.Thread(target=_warm, daemon=True, name="jarvis-warm-up").start()
+
+
 async def start_jarvis(text_mode=False):
     """Main entry point with reconnection logic."""
     # Auto-cleanup if managed files exceed 100 MB
@@ -3630,11 +3816,12 @@ async def start_jarvis(text_mode=False):
         print("  Continuing anyway - Jarvis will report errors if commands fail.")
     print("============================================================")
     
+    # Knowledge, agents and device intelligence come up behind the session
+    _start_background_warm_up()
     print("============================================================")
-    print("--- Audio Engineer Intelligence Active ---")
-    print(f"[OK] Agent orchestrator initialized with {len(agent_orchestrator.agents)} agents")
-    print("[OK] Device intelligence ready for semantic parameter understanding")
-    print("[OK] Plugin chain knowledge base loaded")
+    print("--- Audio Engineer Intelligence Loading (background) ---")
+    print("[..] Agents, device intelligence and plugin chain knowledge base")
+    print("     are available on first use and finish loading in the background")
     print("============================================================")
     
     # Reconnection configuration
@@ -3704,7 +3891,10 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Jarvis - Ableton Live AI Assistant")
     parser.add_argument("--text", action="store_true", help="Run in text CLI mode (no microphone)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print per-module import and init times once the session connects")
     args = parser.parse_args()
+    PROFILE_STARTUP = args.profile_startup
 
     try:
         asyncio.run(start_jarvis(text_mode=args.text))
@@ -3718,6 +3908,16 @@ if __name__ == "__main__":
         print(f"  Tool calls executed: {conversation_state['tool_calls_executed']}")
         print(f"  Turns completed: {conversation_state['turns_completed']}")
         print(f"  Audio chunks sent: {conversation_state['audio_chunks_sent']}")
+        speech = playback.get_stats()
+        if speech["utterances"]:
+            print(f"  Playback: {speech['utterances']} replies, {speech['underruns']} underruns, "
+                  f"speech latency {speech['speech_latency_ms_mean']:.0f} ms mean / "
+                  f"{speech['speech_latency_ms_max']:.0f} ms max")
+        mic = mic_capture.get_stats()
+        if mic["chunks_captured"]:
+            print(f"  Mic: {mic['frames_gated']} silent frames skipped, "
+                  f"{mic['chunks_dropped']} chunks dropped, "
+                  f"send {mic['send_ms_mean']:.1f} ms mean / {mic['send_ms_max']:.1f} ms max")
         
         # Print action history
         recent = session_manager.get_recent_actions(10)
@@ -3725,7 +3925,11 @@ if __name__ == "__main__":
             print(f"\nRecent actions:")
             for a in recent:
                 print(f"  - {a['action']}: {a.get('params', {})}")
-        
+
+        if len(get_tool_stats()):
+            print(f"\nTool latency:")
+            print(TOOLS.stats.report())
+
         print("============================================================")
     finally:
         if pya is not None:
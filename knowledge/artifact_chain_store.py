@@ -6,6 +6,13 @@ Each artifact is a self-contained, deterministic chain specification produced
 by a single LLM research call. Subsequent requests for the same/similar chain
 load instantly from the filesystem with zero LLM calls.
 
+A manifest (knowledge/chains/_index.json) holds one summary row per artifact
+(query, tokens, artist, track_type, created_at, confidence, path). It is
+kept in memory with a token -> key inverted index and rewritten on
+save/delete, so fuzzy lookups and listings never open the artifact files;
+only the winning artifact is parsed. On first use the manifest is reconciled
+against the directory (files added, edited or removed by hand).
+
 Artifact directory: knowledge/chains/
 """
 
@@ -13,6 +20,7 @@ import json
 import os
 import re
 import hashlib
+import threading
 from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -23,6 +31,10 @@ _DEFAULT_CHAINS_DIR = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), "chains"
 )
 
+# Manifest file inside the chains directory.  Keys never start with "_"
+# (see _query_to_key), so it cannot collide with an artifact.
+INDEX_FILENAME = "_index.json"
+
 
 class ArtifactChainStore:
     """
@@ -36,10 +48,15 @@ class ArtifactChainStore:
     """
 
     SCHEMA_VERSION = 1
+    INDEX_VERSION = 1
 
     def __init__(self, chains_dir: str = _DEFAULT_CHAINS_DIR):
         self._chains_dir = chains_dir
         os.makedirs(self._chains_dir, exist_ok=True)
+        self._index_path = os.path.join(self._chains_dir, INDEX_FILENAME)
+        self._lock = threading.RLock()
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None  # key -> manifest row
+        self._by_token: Dict[str, set] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -66,8 +83,12 @@ class ArtifactChainStore:
         artifact_data.setdefault("chain", [])
 
         path = self._key_to_path(key)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(artifact_data, f, indent=2)
+        with self._lock:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(artifact_data, f, indent=2)
+            self._ensure_index()
+            self._index_put(key, self._manifest_row(key, artifact_data, path))
+            self._write_index()
 
         return key
 
@@ -91,27 +112,35 @@ class ArtifactChainStore:
         # 1) Exact key match
         exact = self._load_from_key(key)
         if exact is not None:
+            with self._lock:
+                if self._index is not None and key not in self._index:
+                    # Written behind our back (another process / by hand)
+                    self._index_put(key, self._manifest_row(key, exact, self._key_to_path(key)))
+                    self._write_index()
             exact["_cache_match"] = "exact"
             return exact
 
-        # 2) Fuzzy match across all stored artifacts
-        best_artifact = None
-        best_score = 0.0
-
-        for artifact_key in self._list_keys():
+        # 2) Fuzzy match over the in-memory manifest; parse only the winner
+        with self._lock:
+            self._ensure_index()
+            if key in self._index:
+                # Listed but gone from disk
+                self._index_remove(key)
+                self._write_index()
+            ranked = self._rank_candidates(query)
+
+        for score, artifact_key in ranked:
+            if score < similarity_threshold:
+                break
             stored = self._load_from_key(artifact_key)
             if stored is None:
+                with self._lock:
+                    self._index_remove(artifact_key)
+                    self._write_index()
                 continue
-            stored_query = stored.get("query", artifact_key)
-            score = self._query_similarity(query, stored_query)
-            if score > best_score:
-                best_score = score
-                best_artifact = stored
-
-        if best_artifact and best_score >= similarity_threshold:
-            best_artifact["_cache_match"] = "fuzzy"
-            best_artifact["_cache_similarity"] = round(best_score, 4)
-            return best_artifact
+            stored["_cache_match"] = "fuzzy"
+            stored["_cache_similarity"] = round(score, 4)
+            return stored
 
         return None
 
@@ -131,31 +160,35 @@ class ArtifactChainStore:
 
     def list_artifacts(self) -> List[Dict[str, Any]]:
         """Return a summary of every cached artifact (lightweight)."""
-        results = []
-        for key in self._list_keys():
-            artifact = self._load_from_key(key)
-            if artifact is None:
-                continue
-            results.append({
+        with self._lock:
+            self._ensure_index()
+            rows = sorted(self._index.items())
+        return [
+            {
                 "key": key,
-                "query": artifact.get("query", key),
-                "artist": artifact.get("artist", ""),
-                "track_type": artifact.get("track_type", "vocal"),
-                "confidence": artifact.get("confidence", 0.0),
-                "plugin_count": len(artifact.get("chain", [])),
-                "created_at": artifact.get("created_at", ""),
-                "source": artifact.get("source", ""),
-            })
-        return results
+                "query": row.get("query", key),
+                "artist": row.get("artist", ""),
+                "track_type": row.get("track_type", "vocal"),
+                "confidence": row.get("confidence", 0.0),
+                "plugin_count": row.get("plugin_count", 0),
+                "created_at": row.get("created_at", ""),
+                "source": row.get("source", ""),
+            }
+            for key, row in rows
+        ]
 
     def delete_artifact(self, query: str) -> bool:
         """Delete the artifact for a given query. Returns True if removed."""
         key = self._query_to_key(query)
         path = self._key_to_path(key)
-        if os.path.exists(path):
-            os.remove(path)
-            return True
-        return False
+        with self._lock:
+            self._ensure_index()
+            removed = os.path.exists(path)
+            if removed:
+                os.remove(path)
+            if self._index_remove(key) or removed:
+                self._write_index()
+        return removed
 
     def get_artifact_for_execution(
         self, query: str, max_age_days: int = 30
@@ -208,11 +241,109 @@ class ArtifactChainStore:
             return [
                 f[:-5]
                 for f in os.listdir(self._chains_dir)
-                if f.endswith(".json")
+                if f.endswith(".json") and not f.startswith("_")
             ]
         except OSError:
             return []
 
+    # ------------------------------------------------------------------
+    # Manifest index
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    def _manifest_row(self, key: str, artifact: Dict[str, Any], path: str) -> Dict[str, Any]:
+        query = artifact.get("query", key)
+        return {
+            "query": query,
+            "tokens": self._tokenize(query),
+            "artist": artifact.get("artist", ""),
+            "track_type": artifact.get("track_type", "vocal"),
+            "created_at": artifact.get("created_at", ""),
+            "confidence": artifact.get("confidence", 0.0),
+            "plugin_count": len(artifact.get("chain", [])),
+            "source": artifact.get("source", ""),
+            "path": os.path.basename(path),
+            "mtime": self._mtime(path),
+        }
+
+    def _ensure_index(self) -> None:
+        """Load the manifest and reconcile it with the directory (once, lock held)."""
+        if self._index is not None:
+            return
+        self._index = {}
+        self._by_token = {}
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.INDEX_VERSION:
+                rows = data.get("artifacts", {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            rows = {}
+
+        changed = False
+        for key in self._list_keys():
+            path = self._key_to_path(key)
+            row = rows.get(key)
+            if row is None or row.get("mtime") != self._mtime(path):
+                artifact = self._load_from_key(key)
+                if artifact is None:
+                    changed = changed or row is not None
+                    continue
+                row = self._manifest_row(key, artifact, path)
+                changed = True
+            self._index_put(key, row)
+        if changed or len(self._index) != len(rows):
+            self._write_index()
+
+    def _index_put(self, key: str, row: Dict[str, Any]) -> None:
+        self._index_remove(key)
+        self._index[key] = row
+        for token in set(row.get("tokens", ())):
+            self._by_token.setdefault(token, set()).add(key)
+
+    def _index_remove(self, key: str) -> bool:
+        row = self._index.pop(key, None)
+        if row is None:
+            return False
+        for token in set(row.get("tokens", ())):
+            keys = self._by_token.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_token[token]
+        return True
+
+    def _rank_candidates(self, query: str) -> List[tuple]:
+        """(score, key) for artifacts sharing a token with the query, best first."""
+        tokens = self._tokenize(query)
+        candidates = set()
+        for token in set(tokens):
+            candidates.update(self._by_token.get(token, ()))
+        scored = [
+            (self._token_similarity(tokens, self._index[key]["tokens"]), key)
+            for key in candidates
+        ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored
+
+    def _write_index(self) -> None:
+        """Atomically rewrite the manifest from memory (lock held)."""
+        tmp_path = self._index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": self.INDEX_VERSION, "artifacts": self._index}, f)
+            os.replace(tmp_path, self._index_path)
+        except OSError:
+            pass
+
     # ------------------------------------------------------------------
     # Lightweight similarity (reuses logic from research_coordinator)
     # ------------------------------------------------------------------
@@ -224,8 +355,10 @@ class ArtifactChainStore:
     @classmethod
     def _query_similarity(cls, a: str, b: str) -> float:
         """Jaccard + overlap similarity between two query strings."""
-        a_tokens = cls._tokenize(a)
-        b_tokens = cls._tokenize(b)
+        return cls._token_similarity(cls._tokenize(a), cls._tokenize(b))
+
+    @staticmethod
+    def _token_similarity(a_tokens: List[str], b_tokens: List[str]) -> float:
         if not a_tokens or not b_tokens:
             return 0.0
 
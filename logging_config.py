@@ -4,22 +4,109 @@ Centralized Logging Configuration for Jarvis
 This module provides a unified logging setup for the entire Jarvis system.
 All modules should use this configuration to ensure consistent logging behavior.
 
+Records are handed to a QueueHandler on the calling thread and formatted and
+written by a QueueListener thread, so a log call on the event loop costs a
+queue put rather than string formatting plus file I/O. The logger level is
+the lowest level any sink accepts, so ``logger.isEnabledFor(DEBUG)`` is False
+(and DEBUG call sites cost nothing) when no sink wants DEBUG.
+
+Structured fields passed with ``extra`` (e.g. tool, track, latency_ms) are
+written as JSON keys by the optional JSON-lines sink.
+
 Usage:
     from logging_config import setup_logging
-    setup_logging()
+    setup_logging(json_file="logs/jarvis.jsonl")
 
     # Then in any module:
     import logging
     logger = logging.getLogger(__name__)
     logger.info("Your message here")
+    logger.info("tool %s done", name, extra={"tool": name, "latency_ms": 12.5})
 """
 
+import atexit
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# LogRecord attributes that are not user-supplied structured fields
+_RECORD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message", "asctime", "taskName",
+}
 
+# Argument types a record can hold until the listener formats it: anything
+# else may be mutated by the caller before then, so it is formatted up front
+_IMMUTABLE_ARGS = (str, int, float, bool, bytes, type(None))
 
-def setup_logging(log_file="logs/jarvis.log", console_level=logging.INFO, file_level=logging.DEBUG):
+_listener = None
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that defers all formatting to the listener thread.
+
+    The stock handler merges msg % args on the calling thread (so records
+    can be pickled across processes); in-process that work can wait, unless
+    an argument is a mutable object (a dict, list, or anything else the
+    caller may change before the listener gets to it), in which case the
+    message is snapshotted here.
+    """
+
+    def prepare(self, record):
+        args = record.args
+        if args and (not isinstance(args, tuple)
+                     or not all(isinstance(arg, _IMMUTABLE_ARGS) for arg in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: ts, level, logger, msg, plus any extra fields"""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def _ensure_dir(path):
+    log_dir = os.path.dirname(path)
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+
+def parse_level(name, default=logging.INFO):
+    """Level number for a level name such as "debug"; default if it is not one"""
+    level = logging.getLevelName(str(name).strip().upper())
+    if isinstance(level, int):
+        return level
+    logging.getLogger("jarvis").warning(
+        "Unknown log level %r, using %s", name, logging.getLevelName(default))
+    return default
+
+
+def shutdown_logging():
+    """Stop the listener thread, writing out any queued records"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def setup_logging(log_file="logs/jarvis.log", console_level=logging.INFO, file_level=logging.DEBUG,
+                  json_file=None, json_level=logging.DEBUG, use_queue=True):
     """
     Configure logging for the entire Jarvis system.
 
@@ -27,20 +114,23 @@ def setup_logging(log_file="logs/jarvis.log", console_level=logging.INFO, file_l
         log_file: Path to the log file (default: logs/jarvis.log)
         console_level: Log level for console output (default: INFO)
         file_level: Log level for file output (default: DEBUG for full transparency)
+        json_file: Optional path for a JSON-lines log with structured fields
+        json_level: Log level for the JSON-lines sink
+        use_queue: Format and write on a background listener thread
 
     Returns:
         logging.Logger: The root logger instance
     """
     # Ensure logs directory exists
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    _ensure_dir(log_file)
 
-    # Create root logger
+    # Create root logger; its level is the lowest any sink accepts
     root_logger = logging.getLogger("jarvis")
-    root_logger.setLevel(logging.DEBUG)  # Capture everything at root level
+    levels = [console_level, file_level] + ([json_level] if json_file else [])
+    root_logger.setLevel(min(levels))
 
-    # Remove any existing handlers to avoid duplicates
+    # Remove any existing handlers (and listener) to avoid duplicates
+    shutdown_logging()
     root_logger.handlers.clear()
 
     # Define standard format with timestamp, module name, level, and message
@@ -58,13 +148,35 @@ def setup_logging(log_file="logs/jarvis.log", console_level=logging.INFO, file_l
     )
     file_handler.setLevel(file_level)
     file_handler.setFormatter(log_format)
-    root_logger.addHandler(file_handler)
 
     # Console Handler: INFO level (clean UI)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
     console_handler.setFormatter(log_format)
-    root_logger.addHandler(console_handler)
+    handlers = [file_handler, console_handler]
+
+    # JSON-lines Handler: machine-parseable records with structured fields
+    if json_file:
+        _ensure_dir(json_file)
+        json_handler = RotatingFileHandler(
+            json_file,
+            maxBytes=10 * 1024 * 1024,
+            backupCount=5,
+            encoding="utf-8"
+        )
+        json_handler.setLevel(json_level)
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    if use_queue:
+        global _listener
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(LazyQueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Log initialization message
     root_logger.info("=" * 80)
@@ -72,6 +184,8 @@ def setup_logging(log_file="logs/jarvis.log", console_level=logging.INFO, file_l
     root_logger.info(f"Log file: {os.path.abspath(log_file)}")
     root_logger.info(f"Console level: {logging.getLevelName(console_level)}")
     root_logger.info(f"File level: {logging.getLevelName(file_level)}")
+    if json_file:
+        root_logger.info(f"JSON log: {os.path.abspath(json_file)}")
     root_logger.info("=" * 80)
 
     return root_logger
@@ -91,3 +205,6 @@ def get_logger(name):
     if not name.startswith("jarvis."):
         name = f"jarvis.{name}"
     return logging.getLogger(name)
+
+
+atexit.register(shutdown_logging)
@@ -329,7 +329,8 @@ class MacroBuilder:
             return {"success": False, "message": f"Macro '{name}' not found"}
         
         import asyncio
-        
+        from ableton_controls.async_controller import call_controller
+
         results = []
         all_success = True
         
@@ -338,9 +339,11 @@ class MacroBuilder:
         for i, step in enumerate(macro.steps):
             # Get the function from the controller
             if hasattr(ableton_controller, step.function):
-                func = getattr(ableton_controller, step.function)
                 try:
-                    result = func(**step.args) if step.args else func()
+                    # Awaited on the asyncio OSC transport when available
+                    result = await call_controller(
+                        ableton_controller, step.function, **(step.args or {})
+                    )
                     results.append({
                         "step": i + 1,
                         "function": step.function,
@@ -18,6 +18,7 @@ from pipeline.schemas import (
     DeviceSpec,
     ParamSpec,
     PipelineResult,
+    MultiPipelineResult,
     DeviceResult,
     ParamResult,
     PipelinePhase,
@@ -30,6 +31,7 @@ __all__ = [
     "DeviceSpec",
     "ParamSpec",
     "PipelineResult",
+    "MultiPipelineResult",
     "DeviceResult",
     "ParamResult",
     "PipelinePhase",
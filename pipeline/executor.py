@@ -7,17 +7,27 @@ Executes a ChainPipelinePlan through four phases with ZERO LLM calls:
     VERIFY  -> Re-read parameters, compare against plan
     REPORT  -> Aggregate results
 
+execute_many() runs plans for several tracks at once: device loads (and
+clears) are serialized through one lock because the remote script handles
+one browser load at a time, while readiness polling, parameter writes and
+verification for other tracks proceed concurrently.
+
 Reuses existing infrastructure:
     - reliable_params.load_device_verified()    for device loading with polling
     - reliable_params.wait_for_device_ready()   for readiness check
     - reliable_params.set_parameter_by_name()   for param setting + normalization
+    - reliable_params.set_parameters_bundled()  for bundled param writes (one readback)
     - reliable_params.find_parameter_index()    for semantic name resolution
+    - reliable_params.lookup_parameter_index()  for dry-run checks against stored schemas
     - reliable_params.get_parameter_value_sync() for readback
     - smart_normalize_parameter()               for value conversion
 """
 
 import logging
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from pipeline.schemas import (
@@ -25,6 +35,7 @@ from pipeline.schemas import (
     DeviceSpec,
     ParamSpec,
     PipelineResult,
+    MultiPipelineResult,
     DeviceResult,
     ParamResult,
     PipelinePhase,
@@ -46,8 +57,11 @@ class ChainPipelineExecutor:
     # Timing constants
     DEVICE_LOAD_DELAY_S = 0.5       # min delay after device load
     DEVICE_READY_TIMEOUT_S = 8.0    # timeout for device readiness polling
-    PARAM_INTER_DELAY_S = 0.05      # delay between parameter sets
+    CLEAR_DELETE_DELAY_S = 0.1      # delay between deletes when clearing a track
+    PARAM_INTER_DELAY_S = 0.05      # delay between parameter sets (per-param path only)
+    BATCH_PARAM_WRITES = True       # send a device's params as OSC bundles when supported
     DEFAULT_TOLERANCE = 0.02        # normalized-space tolerance for idempotency
+    MAX_PARALLEL_TRACKS = 4         # worker threads for execute_many()
 
     def __init__(
         self,
@@ -73,6 +87,9 @@ class ChainPipelineExecutor:
         self.reliable = reliable
         self.guardrail = guardrail or LLMGuardrail()
         self.metrics = PipelineMetrics()
+        # The remote script loads one device at a time; device-count polling in
+        # load_device_verified also assumes no other load/delete interleaves
+        self._load_lock = threading.Lock()
 
     def execute(self, plan: ChainPipelinePlan) -> PipelineResult:
         """Execute a complete chain pipeline plan.
@@ -83,6 +100,98 @@ class ChainPipelineExecutor:
         Returns:
             PipelineResult with detailed per-device, per-param results
         """
+        return self._execute_plan(plan)
+
+    def execute_many(
+        self,
+        plans: List[ChainPipelinePlan],
+        max_workers: Optional[int] = None,
+    ) -> MultiPipelineResult:
+        """Execute plans for several tracks concurrently.
+
+        The single Gemini tool call that produced all plans counts as the
+        one LLM call. Plans for the same track run in order on one worker;
+        different tracks overlap, except that device loads and clears are
+        serialized through the executor's load lock.
+
+        Args:
+            plans: Validated ChainPipelinePlans (typically one per track)
+            max_workers: Concurrent tracks (default: MAX_PARALLEL_TRACKS)
+
+        Returns:
+            MultiPipelineResult with per-plan results, summed per-phase
+            timing and overall throughput
+        """
+        start = time.time()
+        multi = MultiPipelineResult(success=False, tracks_planned=len(plans))
+        if not plans:
+            multi.success = True
+            return multi
+
+        self.guardrail.record_call("plan")
+        track_list_result = self.controller.get_track_list()
+        if not track_list_result.get("success"):
+            multi.errors.append("Failed to get track list from Ableton")
+            multi.total_time_ms = (time.time() - start) * 1000
+            return multi
+        tracks = track_list_result.get("tracks", [])
+
+        # Same-track plans must not interleave (device indices would shift)
+        by_track: "OrderedDict[int, List[int]]" = OrderedDict()
+        for i, plan in enumerate(plans):
+            by_track.setdefault(plan.track_index, []).append(i)
+
+        results: List[Optional[PipelineResult]] = [None] * len(plans)
+
+        def run_track(indices: List[int]):
+            for i in indices:
+                results[i] = self._execute_plan(plans[i], tracks=tracks, record_plan_call=False)
+
+        workers = max(1, min(max_workers or self.MAX_PARALLEL_TRACKS, len(by_track)))
+        multi.max_workers = workers
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline") as pool:
+            for future in [pool.submit(run_track, indices) for indices in by_track.values()]:
+                future.result()
+
+        multi.results = results
+        multi.total_time_ms = (time.time() - start) * 1000
+        for res in results:
+            multi.total_devices_loaded += res.total_devices_loaded
+            multi.total_params_set += res.total_params_set
+            multi.load_wait_ms += sum(d.load_wait_ms for d in res.devices)
+            for phase, ms in res.phase_times_ms.items():
+                multi.phase_times_ms[phase] = multi.phase_times_ms.get(phase, 0.0) + ms
+            if res.success:
+                multi.tracks_succeeded += 1
+            multi.errors.extend(f"track {res.track_index}: {e}" for e in res.errors)
+        elapsed_s = max(multi.total_time_ms / 1000.0, 1e-9)
+        multi.devices_per_s = multi.total_devices_loaded / elapsed_s
+        multi.params_per_s = multi.total_params_set / elapsed_s
+        multi.success = multi.tracks_succeeded == len(plans)
+
+        logger.info(
+            "PIPELINE_MULTI tracks=%d/%d devices=%d params=%d workers=%d "
+            "time=%.0fms load_wait=%.0fms throughput=%.1f params/s",
+            multi.tracks_succeeded, len(plans), multi.total_devices_loaded,
+            multi.total_params_set, workers, multi.total_time_ms,
+            multi.load_wait_ms, multi.params_per_s,
+        )
+        return multi
+
+    def _execute_plan(
+        self,
+        plan: ChainPipelinePlan,
+        tracks: Optional[List[dict]] = None,
+        record_plan_call: bool = True,
+    ) -> PipelineResult:
+        """Run one plan through PLAN -> EXECUTE -> VERIFY -> REPORT.
+
+        Args:
+            plan: Validated ChainPipelinePlan
+            tracks: Track list already fetched by execute_many() (None = fetch)
+            record_plan_call: Count the plan's LLM call (False when the
+                caller already counted one call for a batch of plans)
+        """
         start = time.time()
         result = PipelineResult(
             success=False,
@@ -99,15 +208,17 @@ class ChainPipelineExecutor:
             # PLAN PHASE
             # ============================================================
             # The Gemini tool call that produced this plan counts as LLM call #1
-            self.guardrail.record_call("plan")
+            if record_plan_call:
+                self.guardrail.record_call("plan")
 
             # Validate track exists
-            track_list_result = self.controller.get_track_list()
-            if not track_list_result.get("success"):
-                result.errors.append("Failed to get track list from Ableton")
-                return self._finalize(result, start)
+            if tracks is None:
+                track_list_result = self.controller.get_track_list()
+                if not track_list_result.get("success"):
+                    result.errors.append("Failed to get track list from Ableton")
+                    return self._finalize(result, start)
+                tracks = track_list_result.get("tracks", [])
 
-            tracks = track_list_result.get("tracks", [])
             if plan.track_index >= len(tracks):
                 result.errors.append(
                     f"Track index {plan.track_index} out of range "
@@ -132,22 +243,23 @@ class ChainPipelineExecutor:
                         loaded=False,
                         is_fallback=rd["is_fallback"],
                         params=[
-                            ParamResult(
-                                name=p.name,
-                                requested_value=p.value,
-                                success=True,
-                                verified=False,
-                            )
+                            self._predict_param(rd["resolved_name"], p)
                             for p in rd["spec"].params
                         ],
                     )
                     for rd in resolved_devices
                 ]
+                for dev in result.devices:
+                    for pr in dev.params:
+                        if pr.error:
+                            result.warnings.append(f"{dev.name}.{pr.name}: {pr.error}")
+                self._end_phase(result, PipelinePhase.PLAN, start)
                 return self._finalize(result, start)
 
             # ============================================================
             # EXECUTE PHASE (no LLM calls)
             # ============================================================
+            phase_start = self._end_phase(result, PipelinePhase.PLAN, start)
             result.phase_reached = PipelinePhase.EXECUTE
 
             with self.guardrail.block_phase("execute"):
@@ -165,6 +277,7 @@ class ChainPipelineExecutor:
             # ============================================================
             # VERIFY PHASE (no LLM calls)
             # ============================================================
+            phase_start = self._end_phase(result, PipelinePhase.EXECUTE, phase_start)
             result.phase_reached = PipelinePhase.VERIFY
 
             with self.guardrail.block_phase("verify"):
@@ -175,6 +288,7 @@ class ChainPipelineExecutor:
             # ============================================================
             # REPORT PHASE
             # ============================================================
+            phase_start = self._end_phase(result, PipelinePhase.VERIFY, phase_start)
             result.phase_reached = PipelinePhase.REPORT
 
             for dev in result.devices:
@@ -205,12 +319,21 @@ class ChainPipelineExecutor:
                     result.errors.clear()
                     result.success = True
 
+            self._end_phase(result, PipelinePhase.REPORT, phase_start)
+
         except Exception as e:
             result.errors.append(f"Pipeline error: {str(e)}")
             logger.exception("Pipeline execution failed")
 
         return self._finalize(result, start)
 
+    @staticmethod
+    def _end_phase(result: PipelineResult, phase: PipelinePhase, phase_start: float) -> float:
+        """Record a phase's duration; returns the next phase's start time."""
+        now = time.time()
+        result.phase_times_ms[phase.value] = (now - phase_start) * 1000
+        return now
+
     def _finalize(self, result: PipelineResult, start: float) -> PipelineResult:
         """Set timing and record metrics."""
         result.total_time_ms = (time.time() - start) * 1000
@@ -239,6 +362,26 @@ class ChainPipelineExecutor:
                 logger.info("Device fallback: %s -> %s", spec.name, resolved_name)
         return resolved
 
+    def _predict_param(self, device_name: str, param_spec: ParamSpec) -> ParamResult:
+        """Dry-run result for one param, checked against known device layouts.
+
+        Uses only cached/persisted parameter schemas (no OSC). Devices never
+        met before are assumed to resolve.
+        """
+        pr = ParamResult(
+            name=param_spec.name,
+            requested_value=param_spec.value,
+            success=True,
+            verified=False,
+        )
+        lookup = getattr(type(self.reliable), "lookup_parameter_index", None)
+        if not callable(lookup) or not self.reliable.cache.find_device_name(device_name):
+            return pr
+        if self.reliable.lookup_parameter_index(device_name, param_spec.name) is None:
+            pr.success = False
+            pr.error = f"Parameter '{param_spec.name}' not found on {device_name}"
+        return pr
+
     # ------------------------------------------------------------------
     # EXECUTE helpers
     # ------------------------------------------------------------------
@@ -249,9 +392,11 @@ class ChainPipelineExecutor:
             num_result = self.controller.get_num_devices_sync(track_index)
             count = num_result.get("count", 0) if num_result.get("success") else 0
             # Delete from last to first to avoid index shifting
-            for i in range(count - 1, -1, -1):
-                self.controller.delete_device(track_index, i)
-                time.sleep(0.1)
+            with self._load_lock:
+                for i in range(count - 1, -1, -1):
+                    self.controller.delete_device(track_index, i)
+                    time.sleep(self.CLEAR_DELETE_DELAY_S)
+            self.reliable.cache.on_track_cleared(track_index)
             logger.info("Cleared %d devices from track %d", count, track_index)
         except Exception as e:
             logger.warning("Failed to clear devices: %s", e)
@@ -269,7 +414,64 @@ class ChainPipelineExecutor:
             is_fallback=rd["is_fallback"],
         )
 
-        # --- Load device ---
+        # --- Load device (serialized across tracks) ---
+        wait_start = time.time()
+        with self._load_lock:
+            dev_result.load_wait_ms = (time.time() - wait_start) * 1000
+            load_result = self._load_with_fallbacks(track_index, rd, dev_result)
+        dev_result.load_time_ms = (time.time() - dev_start) * 1000
+        if load_result is None:
+            return dev_result
+
+        dev_result.loaded = True
+        device_index = load_result.get("device_index")
+        dev_result.device_index = device_index
+
+        if device_index is None:
+            dev_result.error = "Device loaded but index unknown"
+            return dev_result
+
+        # --- Wait for device readiness ---
+        if not self.reliable.wait_for_device_ready(
+            track_index, device_index,
+            timeout=self.DEVICE_READY_TIMEOUT_S,
+        ):
+            dev_result.error = "Device loaded but not ready for parameters"
+            return dev_result
+
+        # --- Set parameters ---
+        param_start = time.time()
+        if self._bundled_writes_supported():
+            dev_result.params.extend(self._set_params_bundled(
+                track_index, device_index, dev_result.name, spec.params,
+            ))
+        else:
+            for param_spec in spec.params:
+                pr = self._set_param(
+                    track_index, device_index,
+                    dev_result.name, param_spec,
+                )
+                dev_result.params.append(pr)
+                time.sleep(self.PARAM_INTER_DELAY_S)
+
+        dev_result.param_time_ms = (time.time() - param_start) * 1000
+
+        # --- Handle enabled/bypass ---
+        if not spec.enabled:
+            self.controller.set_device_enabled(track_index, device_index, 0)
+
+        return dev_result
+
+    def _load_with_fallbacks(self, track_index: int, rd: dict,
+                             dev_result: DeviceResult) -> Optional[dict]:
+        """Load a resolved device, trying its fallbacks. Caller holds _load_lock.
+
+        Returns:
+            The successful load_device_verified() result, or None (with
+            dev_result.error set) if every candidate failed
+        """
+        spec: DeviceSpec = rd["spec"]
+        device_name = rd["resolved_name"]
         load_result = self.reliable.load_device_verified(
             track_index,
             device_name,
@@ -278,8 +480,6 @@ class ChainPipelineExecutor:
             min_delay=self.DEVICE_LOAD_DELAY_S,
         )
 
-        dev_result.load_time_ms = (time.time() - dev_start) * 1000
-
         if not load_result.get("success"):
             # Try explicit fallback
             if spec.fallback and device_name != spec.fallback:
@@ -295,7 +495,7 @@ class ChainPipelineExecutor:
                     dev_result.is_fallback = True
                 else:
                     dev_result.error = load_result.get("message", "Load failed")
-                    return dev_result
+                    return None
             else:
                 # Try fallback chain from fallback_map
                 fallbacks = get_fallback_chain(rd["original_name"])
@@ -317,41 +517,9 @@ class ChainPipelineExecutor:
                         break
                 if not loaded:
                     dev_result.error = load_result.get("message", "Load failed (all fallbacks exhausted)")
-                    return dev_result
-
-        dev_result.loaded = True
-        device_index = load_result.get("device_index")
-        dev_result.device_index = device_index
-
-        if device_index is None:
-            dev_result.error = "Device loaded but index unknown"
-            return dev_result
-
-        # --- Wait for device readiness ---
-        if not self.reliable.wait_for_device_ready(
-            track_index, device_index,
-            timeout=self.DEVICE_READY_TIMEOUT_S,
-        ):
-            dev_result.error = "Device loaded but not ready for parameters"
-            return dev_result
-
-        # --- Set parameters ---
-        param_start = time.time()
-        for param_spec in spec.params:
-            pr = self._set_param(
-                track_index, device_index,
-                dev_result.name, param_spec,
-            )
-            dev_result.params.append(pr)
-            time.sleep(self.PARAM_INTER_DELAY_S)
-
-        dev_result.param_time_ms = (time.time() - param_start) * 1000
-
-        # --- Handle enabled/bypass ---
-        if not spec.enabled:
-            self.controller.set_device_enabled(track_index, device_index, 0)
+                    return None
 
-        return dev_result
+        return load_result
 
     def _set_param(
         self,
@@ -422,6 +590,94 @@ class ChainPipelineExecutor:
 
         return pr
 
+    def _bundled_writes_supported(self) -> bool:
+        """True if the reliable controller implements set_parameters_bundled()."""
+        # Checked on the class so stand-ins that only define the per-param API
+        # (including MagicMock) keep using the one-write-at-a-time path
+        return self.BATCH_PARAM_WRITES and callable(
+            getattr(type(self.reliable), "set_parameters_bundled", None)
+        )
+
+    def _set_params_bundled(
+        self,
+        track_index: int,
+        device_index: int,
+        device_name: str,
+        param_specs: List[ParamSpec],
+    ) -> List[ParamResult]:
+        """Set all of a device's params with bundled writes.
+
+        Same steps as _set_param(), but the idempotency check reads every
+        value in one round trip and all remaining writes go out together via
+        reliable.set_parameters_bundled(), so time scales with the number of
+        OSC bundles instead of the number of parameters.
+        """
+        results: List[ParamResult] = []
+        pending = []  # (ParamResult, param_index)
+        writes = {}
+        current_values = self.reliable.get_all_parameter_values(track_index, device_index)
+
+        for param_spec in param_specs:
+            pr = ParamResult(
+                name=param_spec.name,
+                requested_value=param_spec.value,
+                success=False,
+            )
+            results.append(pr)
+            try:
+                param_index = self.reliable.find_parameter_index(
+                    track_index, device_index, param_spec.name
+                )
+                if param_index is None:
+                    pr.error = f"Parameter '{param_spec.name}' not found on {device_name}"
+                    continue
+
+                if current_values is not None and param_index < len(current_values):
+                    current_normalized = current_values[param_index]
+                else:
+                    current_normalized = self.reliable.get_parameter_value_sync(
+                        track_index, device_index, param_index
+                    )
+                if current_normalized is not None:
+                    target_normalized = self._compute_target_normalized(
+                        track_index, device_index, param_index,
+                        device_name, param_spec.name, param_spec.value,
+                    )
+                    tolerance = param_spec.tolerance or self.DEFAULT_TOLERANCE
+                    if (target_normalized is not None
+                            and abs(current_normalized - target_normalized) <= tolerance):
+                        pr.success = True
+                        pr.skipped_idempotent = True
+                        pr.actual_value = param_spec.value
+                        pr.verified = True
+                        continue
+
+                # Later specs for the same parameter win, as with sequential writes
+                writes[param_index] = param_spec.value
+                pending.append((pr, param_index))
+            except Exception as e:
+                pr.error = str(e)
+
+        if not writes:
+            return results
+
+        try:
+            outcome = self.reliable.set_parameters_bundled(track_index, device_index, writes)
+        except Exception as e:
+            for pr, _ in pending:
+                pr.error = str(e)
+            return results
+
+        for pr, param_index in pending:
+            set_result = outcome.get(param_index, {})
+            pr.success = set_result.get("success", False)
+            pr.verified = set_result.get("verified", False)
+            pr.actual_value = set_result.get("actual_value")
+            if not pr.success:
+                pr.error = set_result.get("message", "Unknown error")
+
+        return results
+
     def _compute_target_normalized(
         self,
         track_index: int,
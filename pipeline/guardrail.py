@@ -23,6 +23,7 @@ Usage:
 
 import threading
 from contextlib import contextmanager
+from typing import Dict
 
 
 _GLOBAL_PHASE = threading.local()
@@ -69,8 +70,18 @@ class LLMGuardrail:
         self._lock = threading.Lock()
         self._call_count = 0
         self._max_calls = max_calls
-        self._blocked_phases: set = set()
-        self._current_phase: str = "idle"
+        # phase -> nesting depth; several executor workers may block the same phase
+        self._blocked_phases: Dict[str, int] = {}
+        # Each executor worker enters and leaves its own phase
+        self._local = threading.local()
+
+    @property
+    def _current_phase(self) -> str:
+        return getattr(self._local, "phase", "idle")
+
+    @_current_phase.setter
+    def _current_phase(self, phase: str) -> None:
+        self._local.phase = phase
 
     def record_call(self, phase: str) -> int:
         """Record an LLM call. Raises LLMBudgetExceeded if over budget."""
@@ -97,7 +108,7 @@ class LLMGuardrail:
         """Context manager that blocks LLM calls for the given phase."""
         prev_global_phase = get_blocked_phase()
         with self._lock:
-            self._blocked_phases.add(phase)
+            self._blocked_phases[phase] = self._blocked_phases.get(phase, 0) + 1
             prev_phase = self._current_phase
             self._current_phase = phase
         _GLOBAL_PHASE.phase = phase
@@ -105,7 +116,11 @@ class LLMGuardrail:
             yield
         finally:
             with self._lock:
-                self._blocked_phases.discard(phase)
+                depth = self._blocked_phases.get(phase, 0) - 1
+                if depth > 0:
+                    self._blocked_phases[phase] = depth
+                else:
+                    self._blocked_phases.pop(phase, None)
                 self._current_phase = prev_phase
             _GLOBAL_PHASE.phase = prev_global_phase
 
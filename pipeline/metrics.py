@@ -10,6 +10,7 @@ Tracks:
 """
 
 import logging
+import threading
 import time
 from typing import List
 
@@ -24,6 +25,8 @@ class PipelineMetrics:
     def __init__(self, max_history: int = 100):
         self._history: List[dict] = []
         self._max_history = max_history
+        # execute_many() records from several worker threads
+        self._lock = threading.Lock()
 
     def record(self, result: PipelineResult):
         """Record a pipeline execution result with structured logging."""
@@ -44,9 +47,10 @@ class PipelineMetrics:
             "error_count": len(result.errors),
         }
 
-        self._history.append(entry)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
+        with self._lock:
+            self._history.append(entry)
+            if len(self._history) > self._max_history:
+                self._history = self._history[-self._max_history:]
 
         # Structured log output
         if result.success:
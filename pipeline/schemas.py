@@ -10,10 +10,11 @@ Output models (result returned to Gemini as FunctionResponse):
     - ParamResult: Result of setting a single parameter
     - DeviceResult: Result of loading and configuring a single device
     - PipelineResult: Complete result of the pipeline execution
+    - MultiPipelineResult: Several plans executed concurrently (one per track)
 """
 
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -159,6 +160,7 @@ class DeviceResult(BaseModel):
     params: List[ParamResult] = Field(default_factory=list)
     error: Optional[str] = None
     load_time_ms: float = 0.0
+    load_wait_ms: float = 0.0  # time spent waiting for other tracks' loads
     param_time_ms: float = 0.0
 
 
@@ -178,5 +180,26 @@ class PipelineResult(BaseModel):
     llm_calls_used: int = 0
     total_time_ms: float = 0.0
     dry_run: bool = False
+    phase_times_ms: Dict[str, float] = Field(default_factory=dict)
     errors: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
+
+
+class MultiPipelineResult(BaseModel):
+    """Result of executing several plans concurrently (one per track)."""
+    success: bool
+    results: List[PipelineResult] = Field(default_factory=list)
+    tracks_planned: int = 0
+    tracks_succeeded: int = 0
+    total_devices_loaded: int = 0
+    total_params_set: int = 0
+    total_time_ms: float = 0.0
+    phase_times_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-phase time summed over all plans (exceeds total_time_ms when overlapped)",
+    )
+    load_wait_ms: float = 0.0
+    devices_per_s: float = 0.0
+    params_per_s: float = 0.0
+    max_workers: int = 0
+    errors: List[str] = Field(default_factory=list)
@@ -3,12 +3,83 @@ Gemini FunctionDeclaration for the build_chain_pipeline tool.
 
 This defines the tool schema that Gemini uses to generate a complete
 chain execution plan in a single function_call. The schema mirrors
-pipeline.schemas.ChainPipelinePlan.
+pipeline.schemas.ChainPipelinePlan; ``plans`` carries one such plan per
+track for multi-track builds.
 """
 
 from google.genai import types
 
 
+_DEVICES_SCHEMA = types.Schema(
+    type="ARRAY",
+    description="Ordered list of devices to load (signal chain order)",
+    items=types.Schema(
+        type="OBJECT",
+        properties={
+            "name": types.Schema(
+                type="STRING",
+                description=(
+                    "Exact device name: 'EQ Eight', 'Compressor', "
+                    "'Glue Compressor', 'Reverb', 'Delay', 'Saturator', "
+                    "'Limiter', 'Utility', 'Multiband Dynamics', 'Gate', "
+                    "'Auto Filter', 'Echo', 'Pedal', 'Overdrive', "
+                    "'Chorus-Ensemble', 'Phaser-Flanger', 'Drum Buss'"
+                )
+            ),
+            "purpose": types.Schema(
+                type="STRING",
+                description=(
+                    "What this device does in the chain (e.g., "
+                    "'high_pass', 'dynamics', 'de_essing', 'warmth', "
+                    "'presence_boost', 'space', 'depth')"
+                )
+            ),
+            "params": types.Schema(
+                type="ARRAY",
+                description="Parameters to set (semantic names + human-readable values)",
+                items=types.Schema(
+                    type="OBJECT",
+                    properties={
+                        "name": types.Schema(
+                            type="STRING",
+                            description=(
+                                "Semantic param key: threshold_db, ratio, "
+                                "attack_ms, release_ms, band1_freq_hz, "
+                                "band1_gain_db, band1_q, band1_type, "
+                                "band2_freq_hz, band2_gain_db, band2_q, "
+                                "band2_type, band3_freq_hz, band3_gain_db, "
+                                "band3_q, band3_type, band4_freq_hz, "
+                                "band4_gain_db, band4_q, band4_type, "
+                                "dry_wet_pct, drive_db, output_db, "
+                                "decay_time_ms, predelay_ms, room_size, "
+                                "high_cut_hz, low_cut_hz, output_gain_db, "
+                                "knee_db, makeup_db, delay_time_ms, "
+                                "feedback_pct, filter_freq_hz, filter_on, "
+                                "gain_db, pan, width_pct, mute"
+                            )
+                        ),
+                        "value": types.Schema(
+                            type="NUMBER",
+                            description="Human-readable value (Hz, dB, ms, ratio, pct)"
+                        ),
+                    },
+                    required=["name", "value"]
+                )
+            ),
+            "enabled": types.Schema(
+                type="BOOLEAN",
+                description="True=active, False=bypassed. Default True."
+            ),
+            "fallback": types.Schema(
+                type="STRING",
+                description="Alternative device if primary unavailable"
+            ),
+        },
+        required=["name"]
+    )
+)
+
+
 BUILD_CHAIN_PIPELINE_TOOL = types.FunctionDeclaration(
     name="build_chain_pipeline",
     description=(
@@ -34,7 +105,10 @@ BUILD_CHAIN_PIPELINE_TOOL = types.FunctionDeclaration(
         "For Utility: gain_db, pan, width_pct, mute. "
         "Values are in human-readable units: Hz for frequency, dB for "
         "gain/threshold, ms for attack/release/decay, ratio for compression "
-        "ratio (e.g. 4.0 means 4:1), percentage 0-100 for dry/wet."
+        "ratio (e.g. 4.0 means 4:1), percentage 0-100 for dry/wet. "
+        "To build chains on SEVERAL tracks, pass them all in one call as "
+        "'plans' (one entry per track) instead of track_index/devices; "
+        "the tracks are then built concurrently."
     ),
     parameters=types.Schema(
         type="OBJECT",
@@ -43,74 +117,7 @@ BUILD_CHAIN_PIPELINE_TOOL = types.FunctionDeclaration(
                 type="INTEGER",
                 description="0-based track index (Track 1 = 0, Track 2 = 1)"
             ),
-            "devices": types.Schema(
-                type="ARRAY",
-                description="Ordered list of devices to load (signal chain order)",
-                items=types.Schema(
-                    type="OBJECT",
-                    properties={
-                        "name": types.Schema(
-                            type="STRING",
-                            description=(
-                                "Exact device name: 'EQ Eight', 'Compressor', "
-                                "'Glue Compressor', 'Reverb', 'Delay', 'Saturator', "
-                                "'Limiter', 'Utility', 'Multiband Dynamics', 'Gate', "
-                                "'Auto Filter', 'Echo', 'Pedal', 'Overdrive', "
-                                "'Chorus-Ensemble', 'Phaser-Flanger', 'Drum Buss'"
-                            )
-                        ),
-                        "purpose": types.Schema(
-                            type="STRING",
-                            description=(
-                                "What this device does in the chain (e.g., "
-                                "'high_pass', 'dynamics', 'de_essing', 'warmth', "
-                                "'presence_boost', 'space', 'depth')"
-                            )
-                        ),
-                        "params": types.Schema(
-                            type="ARRAY",
-                            description="Parameters to set (semantic names + human-readable values)",
-                            items=types.Schema(
-                                type="OBJECT",
-                                properties={
-                                    "name": types.Schema(
-                                        type="STRING",
-                                        description=(
-                                            "Semantic param key: threshold_db, ratio, "
-                                            "attack_ms, release_ms, band1_freq_hz, "
-                                            "band1_gain_db, band1_q, band1_type, "
-                                            "band2_freq_hz, band2_gain_db, band2_q, "
-                                            "band2_type, band3_freq_hz, band3_gain_db, "
-                                            "band3_q, band3_type, band4_freq_hz, "
-                                            "band4_gain_db, band4_q, band4_type, "
-                                            "dry_wet_pct, drive_db, output_db, "
-                                            "decay_time_ms, predelay_ms, room_size, "
-                                            "high_cut_hz, low_cut_hz, output_gain_db, "
-                                            "knee_db, makeup_db, delay_time_ms, "
-                                            "feedback_pct, filter_freq_hz, filter_on, "
-                                            "gain_db, pan, width_pct, mute"
-                                        )
-                                    ),
-                                    "value": types.Schema(
-                                        type="NUMBER",
-                                        description="Human-readable value (Hz, dB, ms, ratio, pct)"
-                                    ),
-                                },
-                                required=["name", "value"]
-                            )
-                        ),
-                        "enabled": types.Schema(
-                            type="BOOLEAN",
-                            description="True=active, False=bypassed. Default True."
-                        ),
-                        "fallback": types.Schema(
-                            type="STRING",
-                            description="Alternative device if primary unavailable"
-                        ),
-                    },
-                    required=["name"]
-                )
-            ),
+            "devices": _DEVICES_SCHEMA,
             "description": types.Schema(
                 type="STRING",
                 description="What this chain achieves (e.g., 'Kanye Donda vocal chain')"
@@ -123,7 +130,27 @@ BUILD_CHAIN_PIPELINE_TOOL = types.FunctionDeclaration(
                 type="BOOLEAN",
                 description="Validate without executing. Default false."
             ),
+            "plans": types.Schema(
+                type="ARRAY",
+                description=(
+                    "Chains for several tracks in one call, built concurrently. "
+                    "Use instead of track_index/devices."
+                ),
+                items=types.Schema(
+                    type="OBJECT",
+                    properties={
+                        "track_index": types.Schema(
+                            type="INTEGER",
+                            description="0-based track index"
+                        ),
+                        "devices": _DEVICES_SCHEMA,
+                        "description": types.Schema(type="STRING"),
+                        "clear_existing": types.Schema(type="BOOLEAN"),
+                    },
+                    required=["track_index", "devices"]
+                )
+            ),
         },
-        required=["track_index", "devices"]
+        required=[]
     )
 )
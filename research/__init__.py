@@ -44,6 +44,9 @@ from .research_coordinator import (
     DeviceSpec,
     ResearchPolicy
 )
+from .answer_cache import ResearchAnswerCache
+from .llm_response_cache import LLMResponseCache, get_llm_response_cache
+from .single_flight import SingleFlight, get_single_flight_stats
 
 __all__ = [
     # Legacy parser
@@ -78,6 +81,13 @@ __all__ = [
     'research_vocal_chain',
     'ChainSpec',
     'DeviceSpec',
-    'ResearchPolicy'
+    'ResearchPolicy',
+    # Answer / response caches
+    'ResearchAnswerCache',
+    'LLMResponseCache',
+    'get_llm_response_cache',
+    # Request coalescing
+    'SingleFlight',
+    'get_single_flight_stats'
 ]
 
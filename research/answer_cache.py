@@ -0,0 +1,382 @@
+"""
+Research Answer Cache
+
+Indexed store for synthesized research answers (research_cache.json).
+
+The cache is loaded once into memory: an exact-key dict plus a token
+inverted index, so a semantic lookup scores only entries that share a
+token with the query (entries sharing none have zero similarity anyway).
+
+Persistence is append-only. New and updated answers are appended to a
+JSON-lines journal next to the snapshot; hit counters are kept in memory
+and appended in batches. The journal is folded back into the snapshot
+(research_cache.json, same {"entries": [...]} format as before) once it
+grows past ``compact_every`` records. Lookups never write to disk.
+
+Several processes (or cache instances) may share one journal. Appends and
+compaction hold an exclusive lock on ``<journal>.lock``, and compaction
+rebuilds from the snapshot plus the whole journal under that lock, so
+records appended by other writers end up in the snapshot instead of being
+discarded with the journal.
+
+Usage:
+    cache = ResearchAnswerCache("research/research_cache.json", max_entries=500)
+    cache.put("travis scott vocal chain", "Travis Scott Vocal Chain", answer, route="single_shot")
+    hit = cache.lookup("travis scott vocals", threshold=0.84)
+    cache.close()
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query_key(query: str) -> str:
+    """Normalize a query string for simple semantic cache keys."""
+    return _SPACE_RE.sub(" ", (query or "").strip().lower())
+
+
+def tokenize_query(query: str) -> List[str]:
+    return _TOKEN_RE.findall(normalize_query_key(query))
+
+
+def token_similarity(a_tokens: List[str], b_tokens: List[str]) -> float:
+    """Lightweight semantic-ish similarity without external dependencies."""
+    if not a_tokens or not b_tokens:
+        return 0.0
+
+    a_set = set(a_tokens)
+    b_set = set(b_tokens)
+    jaccard = len(a_set & b_set) / max(1, len(a_set | b_set))
+
+    a_counts = Counter(a_tokens)
+    b_counts = Counter(b_tokens)
+    shared = sum(min(a_counts[t], b_counts[t]) for t in (a_set & b_set))
+    denom = max(1, min(len(a_tokens), len(b_tokens)))
+    overlap = shared / denom
+
+    return (0.7 * jaccard) + (0.3 * overlap)
+
+
+def _journal_path(snapshot_path: str) -> str:
+    return os.path.splitext(snapshot_path)[0] + ".log.jsonl"
+
+
+@contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+    """Exclusive lock shared with other processes (raises OSError if unavailable)"""
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # retries for ~10 s
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# Open caches, flushed at interpreter exit
+_open_caches: "weakref.WeakSet[ResearchAnswerCache]" = weakref.WeakSet()
+
+
+class ResearchAnswerCache:
+    """In-memory indexed answer cache over a snapshot + append-only journal"""
+
+    def __init__(self, path: str, max_entries: int = 500,
+                 hit_flush_every: int = 20, compact_every: int = 200):
+        self.path = path
+        self.journal_path = _journal_path(path)
+        self.lock_path = self.journal_path + ".lock"
+        self.max_entries = max_entries
+        self.hit_flush_every = hit_flush_every
+        self.compact_every = compact_every
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._tokens: Dict[str, List[str]] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+        self._pending_hits: Dict[str, Tuple[int, str]] = {}
+        self._journal_records = 0
+        self.stats = {"lookups": 0, "exact_hits": 0, "semantic_hits": 0, "misses": 0,
+                      "candidates_scored": 0, "journal_appends": 0, "compactions": 0}
+
+        self._load()
+        _open_caches.add(self)
+
+    # ==================== LOADING ====================
+
+    def _load(self) -> None:
+        """(Re)build the in-memory state from the snapshot plus the journal"""
+        self._entries, self._tokens, self._by_token = {}, {}, {}
+        self._journal_records = 0
+        for entry in self._read_snapshot():
+            self._index(entry)
+        if os.path.exists(self.journal_path):
+            try:
+                with open(self.journal_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # torn final line after a crash
+                        self._replay(record)
+                        self._journal_records += 1
+            except OSError:
+                pass
+        self._evict()
+
+    def _read_snapshot(self) -> List[Dict[str, Any]]:
+        """Load snapshot entries, supporting both legacy and structured formats."""
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return []
+        if isinstance(data, dict) and isinstance(data.get("entries"), list):
+            return [e for e in data["entries"] if isinstance(e, dict) and e.get("query_key")]
+        if isinstance(data, dict):
+            now = datetime.now().isoformat()
+            return [{
+                "query_key": str(k),
+                "original_query": str(k),
+                "answer": str(v),
+                "route": "",
+                "created_at": now,
+                "last_hit_at": now,
+                "hit_count": 0,
+            } for k, v in data.items()]
+        return []
+
+    def _replay(self, record: Dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "put" and isinstance(record.get("entry"), dict):
+            self._index(record["entry"])
+        elif op == "hits" and isinstance(record.get("hits"), dict):
+            for key, (count, last_hit_at) in record["hits"].items():
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry["hit_count"] = int(entry.get("hit_count", 0)) + int(count)
+                    entry["last_hit_at"] = last_hit_at
+
+    def _index(self, entry: Dict[str, Any]) -> None:
+        key = entry["query_key"]
+        self._unindex(key)
+        tokens = tokenize_query(entry.get("original_query") or key)
+        self._entries[key] = entry
+        self._tokens[key] = tokens
+        for token in set(tokens):
+            self._by_token.setdefault(token, set()).add(key)
+
+    def _unindex(self, key: str) -> None:
+        if self._entries.pop(key, None) is None:
+            return
+        for token in set(self._tokens.pop(key, ())):
+            keys = self._by_token.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_token[token]
+
+    @staticmethod
+    def _rank(entry: Dict[str, Any]) -> Tuple[str, int]:
+        return (str(entry.get("last_hit_at", "")), int(entry.get("hit_count", 0)))
+
+    def _evict(self) -> None:
+        overflow = len(self._entries) - self.max_entries
+        if overflow > 0:
+            for entry in sorted(self._entries.values(), key=self._rank)[:overflow]:
+                self._unindex(entry["query_key"])
+                self._pending_hits.pop(entry["query_key"], None)
+
+    # ==================== LOOKUP ====================
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, query: str) -> bool:
+        return normalize_query_key(query) in self._entries
+
+    def get_entry(self, query: str) -> Optional[Dict[str, Any]]:
+        """Copy of the entry stored under the query's normalized key"""
+        entry = self._entries.get(normalize_query_key(query))
+        return dict(entry) if entry is not None else None
+
+    def lookup(self, query: str, semantic: bool = True,
+               threshold: float = 0.84) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a query.
+
+        Returns:
+            {"answer", "cache_match_type": "exact"|"semantic",
+             "cache_similarity", "matched_query"} or None
+        """
+        with self._lock:
+            self.stats["lookups"] += 1
+            entry = self._entries.get(normalize_query_key(query))
+            score = 1.0
+            match_type = "exact"
+
+            if entry is None and semantic:
+                match_type = "semantic"
+                entry, score = self._best_semantic(tokenize_query(query))
+                if entry is not None and score < threshold:
+                    entry = None
+
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats[f"{match_type}_hits"] += 1
+            self._record_hit(entry)
+            return {
+                "answer": entry.get("answer", ""),
+                "cache_match_type": match_type,
+                "cache_similarity": 1.0 if match_type == "exact" else round(float(score), 4),
+                "matched_query": entry.get("original_query") or entry.get("query_key"),
+            }
+
+    def _best_semantic(self, query_tokens: List[str]) -> Tuple[Optional[Dict[str, Any]], float]:
+        candidates: Set[str] = set()
+        for token in set(query_tokens):
+            candidates.update(self._by_token.get(token, ()))
+        self.stats["candidates_scored"] += len(candidates)
+
+        best, best_key = None, None
+        for key in candidates:
+            score = token_similarity(query_tokens, self._tokens[key])
+            # Ties go to the most recently used entry
+            rank = (score, self._rank(self._entries[key]))
+            if best_key is None or rank > best_key:
+                best, best_key = self._entries[key], rank
+        return best, (best_key[0] if best_key else 0.0)
+
+    def _record_hit(self, entry: Dict[str, Any]) -> None:
+        now = datetime.now().isoformat()
+        key = entry["query_key"]
+        entry["hit_count"] = int(entry.get("hit_count", 0)) + 1
+        entry["last_hit_at"] = now
+        count, _ = self._pending_hits.get(key, (0, now))
+        self._pending_hits[key] = (count + 1, now)
+        if sum(c for c, _ in self._pending_hits.values()) >= self.hit_flush_every:
+            self.flush_hits()
+
+    # ==================== WRITES ====================
+
+    def put(self, query_key: str, original_query: str, answer: str, route: str = "") -> None:
+        """Store (or update) the answer for a normalized query key"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            existing = self._entries.get(query_key)
+            if existing is not None:
+                entry = dict(existing, original_query=original_query, answer=answer,
+                             route=route or existing.get("route", ""), last_hit_at=now)
+            else:
+                entry = {
+                    "query_key": query_key,
+                    "original_query": original_query,
+                    "answer": answer,
+                    "route": route,
+                    "created_at": now,
+                    "last_hit_at": now,
+                    "hit_count": 0,
+                }
+            self._index(entry)
+            self._evict()
+            self._append([{"op": "put", "entry": entry}])
+
+    def flush_hits(self) -> None:
+        """Append batched hit counters to the journal"""
+        with self._lock:
+            if not self._pending_hits:
+                return
+            hits = {key: list(value) for key, value in self._pending_hits.items()}
+            self._pending_hits.clear()
+            self._append([{"op": "hits", "hits": hits}])
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        try:
+            with _file_lock(self.lock_path):
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    for record in records:
+                        f.write(json.dumps(record) + "\n")
+        except OSError:
+            return
+        self._journal_records += len(records)
+        self.stats["journal_appends"] += len(records)
+        if self._journal_records >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Fold the journal into the snapshot and truncate it.
+
+        Every change this instance made is already journaled (pending hits
+        are flushed first), so the snapshot is rebuilt from disk under the
+        journal lock: other writers' records since our last load are kept,
+        and the in-memory state picks them up too.
+        """
+        with self._lock:
+            tmp_path = self.path + ".tmp"
+            try:
+                with _file_lock(self.lock_path):
+                    if self._pending_hits:
+                        hits = {key: list(value) for key, value in self._pending_hits.items()}
+                        with open(self.journal_path, "a", encoding="utf-8") as f:
+                            f.write(json.dumps({"op": "hits", "hits": hits}) + "\n")
+                        self._pending_hits.clear()
+                    self._load()
+                    entries = sorted(self._entries.values(), key=self._rank, reverse=True)
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        json.dump({"entries": entries}, f, indent=2)
+                    os.replace(tmp_path, self.path)
+                    if os.path.exists(self.journal_path):
+                        os.remove(self.journal_path)
+            except OSError:
+                return
+            self._journal_records = 0
+            self.stats["compactions"] += 1
+
+    def close(self) -> None:
+        """Flush pending hit counters"""
+        if os.path.isdir(os.path.dirname(self.journal_path) or "."):
+            self.flush_hits()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries),
+                        journal_records=self._journal_records,
+                        pending_hits=sum(c for c, _ in self._pending_hits.values()))
+
+
+def close_answer_caches() -> None:
+    """Flush every open cache (registered with atexit)"""
+    for cache in list(_open_caches):
+        cache.close()
+
+
+atexit.register(close_answer_caches)
@@ -7,14 +7,19 @@ Uses google-generativeai (stable) instead of google-genai (alpha).
 import os
 import asyncio
 import json
-import hashlib
 import requests
+import shlex
 import subprocess
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from dotenv import load_dotenv
 
+from .llm_response_cache import LLMResponseCache, build_cache_key, get_llm_response_cache
+from .single_flight import single_flight
+from utils.relay_worker import RelayError, RelayWorkerPool, openclaw_worker_command
+
 load_dotenv()
 
 @dataclass
@@ -34,7 +39,44 @@ class ExtractionResult:
     source: str = ""
     error: Optional[str] = None
 
+def _generate_flight_key(self, prompt: str, system_prompt: str = None, model_id: Optional[str] = None):
+    """Concurrent identical prompts to the same provider share one request"""
+    model = model_id or getattr(self, "default_model_id", "")
+    return (type(self).__name__, build_cache_key(prompt, system_prompt, model))
+
+
 class BaseLLMClient(ABC):
+    # Persistent response store; None means the shared get_llm_response_cache()
+    response_cache: Optional[LLMResponseCache] = None
+
+    def _build_cache_key(self, prompt: str, system_prompt: Optional[str], model_id: str) -> str:
+        return build_cache_key(prompt, system_prompt, model_id)
+
+    def _get_response_cache(self) -> Optional[LLMResponseCache]:
+        return self.response_cache if self.response_cache is not None else get_llm_response_cache()
+
+    # The cache is SQLite (and may be opened on first use): keep it off the event loop
+
+    def _read_cache(self, cache_key: str, model_id: str) -> Optional[Dict[str, Any]]:
+        cache = self._get_response_cache()
+        return cache.get_entry(cache_key, model_id) if cache is not None else None
+
+    def _write_cache(self, cache_key: str, response: LLMResponse) -> None:
+        cache = self._get_response_cache()
+        if cache is not None:
+            cache.put(cache_key, response.model, response.content, response.tokens_used)
+
+    async def _cached_response(self, cache_key: str, model_id: str) -> Optional[LLMResponse]:
+        entry = await asyncio.to_thread(self._read_cache, cache_key, model_id)
+        if entry is None:
+            return None
+        return LLMResponse(content=entry["content"], model=entry["model"],
+                           tokens_used=entry["tokens_used"], success=True)
+
+    async def _store_response(self, cache_key: str, response: LLMResponse) -> None:
+        if response.success:
+            await asyncio.to_thread(self._write_cache, cache_key, response)
+
     @abstractmethod
     async def generate(
         self,
@@ -65,7 +107,6 @@ class GeminiClient(BaseLLMClient):
         self._model = None
         self._models: Dict[str, Any] = {}
         self._initialized = False
-        self._response_cache: Dict[str, LLMResponse] = {}
         
         if not self.api_key:
             print("[GeminiClient] Warning: No API key found. Set GOOGLE_API_KEY env var.")
@@ -91,10 +132,7 @@ class GeminiClient(BaseLLMClient):
             print(f"[GeminiClient] Failed to initialize model {target_model_id}: {e}")
             return None
 
-    def _build_cache_key(self, prompt: str, system_prompt: Optional[str], model_id: str) -> str:
-        payload = f"{model_id}|{system_prompt or ''}|{prompt}"
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
+    @single_flight("llm_generate", key=_generate_flight_key, copy_results=True)
     async def generate(
         self,
         prompt: str,
@@ -104,7 +142,7 @@ class GeminiClient(BaseLLMClient):
         target_model_id = model_id or self.default_model_id
         cache_key = self._build_cache_key(prompt, system_prompt, target_model_id)
 
-        cached = self._response_cache.get(cache_key)
+        cached = await self._cached_response(cache_key, target_model_id)
         if cached:
             return cached
 
@@ -128,7 +166,7 @@ class GeminiClient(BaseLLMClient):
                     success=True
                 )
 
-                self._response_cache[cache_key] = llm_response
+                await self._store_response(cache_key, llm_response)
                 return llm_response
             except Exception as e:
                 err = str(e)
@@ -233,9 +271,31 @@ def _looks_like_rate_limit(text: str) -> bool:
     return any(h in lower for h in _RATE_LIMIT_HINTS)
 
 
+_openclaw_relay: Optional[RelayWorkerPool] = None
+
+
+def get_openclaw_relay() -> Optional[RelayWorkerPool]:
+    """Shared OpenClaw relay worker pool (started on first request), or None
+    when RESEARCH_OPENCLAW_PERSISTENT=0."""
+    global _openclaw_relay
+    if os.getenv("RESEARCH_OPENCLAW_PERSISTENT", "1").lower() in {"0", "false", "no", "off"}:
+        return None
+    if _openclaw_relay is None:
+        custom = os.getenv("RESEARCH_OPENCLAW_RELAY_CMD", "").strip()
+        command = shlex.split(custom) if custom else openclaw_worker_command(["openclaw"])
+        size = max(1, int(os.getenv("RESEARCH_OPENCLAW_RELAY_WORKERS", "1")))
+        _openclaw_relay = RelayWorkerPool(command, size=size, name="openclaw-relay")
+    return _openclaw_relay
+
+
 class OpenClawRelayClient(BaseLLMClient):
     """Relay client that forwards prompts through local OpenClaw auth session via CLI.
 
+    Prompts go to a warm relay worker (utils/openclaw_relay_worker.py) that
+    runs the CLI for each one, so this process never spawns per prompt;
+    RESEARCH_OPENCLAW_RELAY_CMD swaps in another worker and
+    RESEARCH_OPENCLAW_PERSISTENT=0 runs one CLI process per call instead.
+
     Includes exponential-backoff retry on rate-limit errors so that transient
     provider cooldowns don't immediately surface as hard failures.
     """
@@ -246,14 +306,28 @@ class OpenClawRelayClient(BaseLLMClient):
         self.timeout_s = int(os.getenv("RESEARCH_OPENCLAW_TIMEOUT_SEC", "45"))
         self.max_retries = max(1, int(os.getenv("RESEARCH_LLM_MAX_RETRIES", "3")))
         self.base_delay = float(os.getenv("RESEARCH_LLM_RETRY_BASE_DELAY_SEC", "2.0"))
-        self._response_cache: Dict[str, LLMResponse] = {}
-
-    def _build_cache_key(self, prompt: str, system_prompt: Optional[str], model_id: str) -> str:
-        payload = f"{model_id}|{system_prompt or ''}|{prompt}"
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        self.relay: Optional[RelayWorkerPool] = None  # None -> shared get_openclaw_relay()
 
     async def _call_once(self, full_prompt: str) -> tuple:
-        """Single subprocess call.  Returns (proc | None, error_str)."""
+        """Single relay call.  Returns (proc-like | None, error_str)."""
+        relay = self.relay or get_openclaw_relay()
+        if relay is not None:
+            try:
+                reply = await relay.request_async(
+                    {"op": "agent", "message": full_prompt, "agent": self.agent_id,
+                     "session_id": self.session_id, "timeout": self.timeout_s},
+                    timeout=self.timeout_s + 15,
+                )
+            except RelayError as e:
+                # Includes RelayTimeout: a worker that keeps timing out is killed
+                # and restarted by the pool, and this call goes to the CLI
+                print(f"[OpenClawRelay] Relay worker unavailable ({e}); using one-shot CLI")
+            else:
+                if "returncode" in reply:
+                    return SimpleNamespace(returncode=reply["returncode"], stdout=reply.get("stdout", ""),
+                                           stderr=reply.get("stderr", "")), ""
+                print(f"[OpenClawRelay] Relay worker error ({reply.get('error')}); using one-shot CLI")
+
         cmd = ["openclaw", "agent", "--json", "--timeout", str(self.timeout_s),
                "--message", full_prompt]
         if self.session_id:
@@ -271,12 +345,14 @@ class OpenClawRelayClient(BaseLLMClient):
         except Exception as e:
             return None, str(e)
 
+    @single_flight("llm_generate", key=_generate_flight_key, copy_results=True)
     async def generate(self, prompt: str, system_prompt: str = None, model_id: Optional[str] = None) -> LLMResponse:
         full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
         target = model_id or "openclaw-relay"
         cache_key = self._build_cache_key(full_prompt, None, target)
-        if cache_key in self._response_cache:
-            return self._response_cache[cache_key]
+        cached = await self._cached_response(cache_key, target)
+        if cached:
+            return cached
 
         last_error = ""
 
@@ -341,7 +417,7 @@ class OpenClawRelayClient(BaseLLMClient):
                 return LLMResponse(content="", success=False, error="OpenClaw relay returned empty response")
 
             resp = LLMResponse(content=content, model=target, success=True)
-            self._response_cache[cache_key] = resp
+            await self._store_response(cache_key, resp)
             return resp
 
         return LLMResponse(content="", success=False, error=last_error or "OpenClaw relay: all retries exhausted")
@@ -374,15 +450,11 @@ class OpenAIClient(BaseLLMClient):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.default_model_id = os.getenv("RESEARCH_OPENAI_MODEL", model_id)
         self.base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
-        self._response_cache: Dict[str, LLMResponse] = {}
 
         if not self.api_key:
             print("[OpenAIClient] Warning: No API key found. Set OPENAI_API_KEY env var.")
 
-    def _build_cache_key(self, prompt: str, system_prompt: Optional[str], model_id: str) -> str:
-        payload = f"{model_id}|{system_prompt or ''}|{prompt}"
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
+    @single_flight("llm_generate", key=_generate_flight_key, copy_results=True)
     async def generate(
         self,
         prompt: str,
@@ -391,7 +463,7 @@ class OpenAIClient(BaseLLMClient):
     ) -> LLMResponse:
         target_model_id = model_id or self.default_model_id
         cache_key = self._build_cache_key(prompt, system_prompt, target_model_id)
-        cached = self._response_cache.get(cache_key)
+        cached = await self._cached_response(cache_key, target_model_id)
         if cached:
             return cached
 
@@ -438,7 +510,7 @@ class OpenAIClient(BaseLLMClient):
                 data = response.json()
                 content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
                 llm_response = LLMResponse(content=content or "", model=target_model_id, success=True)
-                self._response_cache[cache_key] = llm_response
+                await self._store_response(cache_key, llm_response)
                 return llm_response
             except Exception as e:
                 if attempt >= max_attempts:
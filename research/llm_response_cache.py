@@ -0,0 +1,255 @@
+"""
+LLM Response Cache
+
+Persistent, content-addressed store for research LLM responses, shared by
+every research client (Gemini, OpenAI, OpenClaw relay) and every process
+that uses them (jarvis_engine, research_bot, single-shot research).
+
+Responses are keyed by a SHA-256 of (model, system prompt, prompt) and kept
+in a SQLite file, so re-running the same extraction prompt after a restart
+is a local read instead of an API call. Entries expire per model (TTL
+matched on the longest model-id prefix) and the store is bounded in size,
+evicting least-recently-used rows first. A hit only records its access time
+in memory; those are written back in batches (and before any eviction), so
+reads don't write to the file.
+
+Configuration (env):
+    RESEARCH_LLM_CACHE=0                    disable the persistent cache
+    RESEARCH_LLM_CACHE_PATH=...             SQLite file (default research/llm_response_cache.sqlite3)
+    RESEARCH_LLM_CACHE_MAX_MB=64            size bound for stored responses
+    RESEARCH_LLM_CACHE_TTL_SEC=2592000      default TTL (30 days)
+    RESEARCH_LLM_CACHE_TTLS=gpt-4o=86400,gemini-2.0=604800   per-model TTLs (0 = never cache)
+
+Usage:
+    cache = get_llm_response_cache()
+    key = build_cache_key(prompt, system_prompt, "gemini-2.0-flash")
+    content = cache.get(key, "gemini-2.0-flash")
+    if content is None:
+        content = call_model(...)
+        cache.put(key, "gemini-2.0-flash", content)
+    print(cache.get_stats())
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("jarvis.research.llm_response_cache")
+
+_DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "llm_response_cache.sqlite3")
+_DEFAULT_TTL_SEC = 30 * 24 * 3600
+_DEFAULT_MAX_MB = 64
+_TOUCH_BATCH = 64  # pending last_access updates written back at once
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    tokens_used INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access);
+"""
+
+
+def build_cache_key(prompt: str, system_prompt: Optional[str], model_id: str) -> str:
+    """Content address for one generation request"""
+    payload = f"{model_id}|{system_prompt or ''}|{prompt}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def parse_model_ttls(spec: str) -> Dict[str, float]:
+    """Parse "prefix=seconds,prefix=seconds" into a dict (bad items are skipped)"""
+    ttls = {}
+    for item in (spec or "").split(","):
+        prefix, sep, value = item.partition("=")
+        if not sep or not prefix.strip():
+            continue
+        try:
+            ttls[prefix.strip()] = float(value)
+        except ValueError:
+            continue
+    return ttls
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with per-model TTLs and LRU size bound"""
+
+    def __init__(self, path: str = _DEFAULT_PATH, max_bytes: int = _DEFAULT_MAX_MB * 1024 * 1024,
+                 default_ttl: float = _DEFAULT_TTL_SEC, model_ttls: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.model_ttls = dict(model_ttls or {})
+
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}  # key -> last_access not yet written
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        try:
+            # Several processes share the file; WAL lets readers run alongside a writer
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+        self._conn.executescript(_SCHEMA)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+    def ttl_for(self, model: str) -> float:
+        """TTL for a model id: the longest matching prefix in model_ttls, else the default"""
+        best = None
+        for prefix in self.model_ttls:
+            if (model or "").startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.model_ttls[best] if best is not None else self.default_ttl
+
+    # ==================== READ / WRITE ====================
+
+    def get(self, key: str, model: str = "") -> Optional[str]:
+        """Cached content for a key, or None (missing or expired)"""
+        return (self.get_entry(key, model) or {}).get("content")
+
+    def get_entry(self, key: str, model: str = "") -> Optional[Dict[str, Any]]:
+        """Cached {"content", "model", "tokens_used"} for a key, or None"""
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT model, content, tokens_used, size, created_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return None
+                stored_model, content, tokens_used, size, created_at = row
+                if now - created_at > self.ttl_for(model or stored_model):
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._touched.pop(key, None)
+                    self._total_bytes -= size
+                    self.stats["expired"] += 1
+                    self.stats["misses"] += 1
+                    return None
+            except sqlite3.Error:
+                self.stats["errors"] += 1
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touches()
+            self.stats["hits"] += 1
+            return {"content": content, "model": stored_model, "tokens_used": tokens_used}
+
+    def put(self, key: str, model: str, content: str, tokens_used: int = 0) -> None:
+        """Store a successful response (skipped when the model's TTL is 0)"""
+        if self.ttl_for(model) <= 0:
+            return
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._lock:
+            try:
+                old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, model, content, tokens_used, size, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, model, content, int(tokens_used or 0), size, now, now),
+                )
+            except sqlite3.Error:
+                self.stats["errors"] += 1
+                return
+            self._total_bytes += size - (old[0] if old else 0)
+            self.stats["writes"] += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _flush_touches(self) -> None:
+        """Write pending last_access times in one statement (lock held)"""
+        if not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        try:
+            self._conn.executemany("UPDATE responses SET last_access = ? WHERE key = ?",
+                                   [(when, key) for key, when in touched.items()])
+        except sqlite3.Error:
+            self.stats["errors"] += 1
+
+    def flush(self) -> None:
+        """Write back access times recorded by hits since the last batch"""
+        with self._lock:
+            self._flush_touches()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used rows until under 90% of max_bytes (lock held)"""
+        self._flush_touches()  # LRU order needs the recent hits
+        # Other processes write to the same file: start from the real total
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        target = int(self.max_bytes * 0.9)
+        if total > target:
+            doomed = []
+            for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+                if total <= target:
+                    break
+                doomed.append((key,))
+                total -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            self.stats["evictions"] += len(doomed)
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._touched = {}
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            stats = dict(self.stats, entries=entries, bytes=self._total_bytes)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+# ==================== SINGLETON ====================
+
+_cache: Optional[LLMResponseCache] = None
+_cache_failed = False  # opening failed once; don't retry (and re-log) per call
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """The shared response cache, or None when disabled (RESEARCH_LLM_CACHE=0)
+    or when it could not be opened (not retried)"""
+    global _cache, _cache_failed
+    if os.getenv("RESEARCH_LLM_CACHE", "1").lower() in {"0", "false", "no", "off"}:
+        return None
+    if _cache is None and not _cache_failed:
+        with _cache_lock:
+            if _cache is None and not _cache_failed:
+                try:
+                    _cache = LLMResponseCache(
+                        path=os.getenv("RESEARCH_LLM_CACHE_PATH", _DEFAULT_PATH),
+                        max_bytes=int(float(os.getenv("RESEARCH_LLM_CACHE_MAX_MB", str(_DEFAULT_MAX_MB))) * 1024 * 1024),
+                        default_ttl=float(os.getenv("RESEARCH_LLM_CACHE_TTL_SEC", str(_DEFAULT_TTL_SEC))),
+                        model_ttls=parse_model_ttls(os.getenv("RESEARCH_LLM_CACHE_TTLS", "")),
+                    )
+                    atexit.register(_cache.flush)
+                except (sqlite3.Error, OSError, ValueError) as e:
+                    _cache_failed = True
+                    logger.warning("LLM response cache disabled: %s", e)
+    return _cache
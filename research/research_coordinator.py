@@ -9,12 +9,13 @@ import asyncio
 import json
 import os
 import re
-from collections import Counter
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from pipeline.guardrail import assert_llm_allowed, LLMCallBlocked
+from .answer_cache import ResearchAnswerCache, normalize_query_key, tokenize_query, token_similarity
+from .single_flight import single_flight
 
 
 @dataclass
@@ -174,6 +175,12 @@ class ResearchPolicy:
     cache_max_age_days: int
 
 
+def _research_flight_key(coordinator: "ResearchCoordinator", query: str = "", *args, **kwargs):
+    """Concurrent perform_research calls for the same normalized query and options share one run."""
+    options = repr((args, sorted(kwargs.items())))
+    return (id(coordinator), coordinator._normalize_query_key(query), options)
+
+
 class ResearchCoordinator:
     """
     Coordinates research from multiple sources and aggregates results.
@@ -193,6 +200,7 @@ class ResearchCoordinator:
         self._audio_analyst = None
         self._artifact_store = None  # Lazy-loaded artifact chain store
         self._research_cache_path = os.path.join(os.path.dirname(__file__), "research_cache.json")
+        self._answer_cache: Optional[ResearchAnswerCache] = None  # Loaded on first lookup
         self._cheap_model_id = os.getenv("RESEARCH_CHEAP_MODEL", "gemini-2.0-flash-lite")
         self._expensive_model_id = os.getenv("RESEARCH_REASONING_MODEL", "gemini-2.0-flash")
         self._default_budget_mode = os.getenv("RESEARCH_BUDGET_MODE", "balanced").lower().strip()
@@ -455,30 +463,14 @@ class ResearchCoordinator:
 
     def _normalize_query_key(self, query: str) -> str:
         """Normalize a query string for simple semantic cache keys."""
-        return re.sub(r"\s+", " ", (query or "").strip().lower())
+        return normalize_query_key(query)
 
     def _tokenize_query(self, query: str) -> List[str]:
-        text = self._normalize_query_key(query)
-        return re.findall(r"[a-z0-9]+", text)
+        return tokenize_query(query)
 
     def _query_similarity(self, a: str, b: str) -> float:
         """Lightweight semantic-ish similarity without external dependencies."""
-        a_tokens = self._tokenize_query(a)
-        b_tokens = self._tokenize_query(b)
-        if not a_tokens or not b_tokens:
-            return 0.0
-
-        a_set = set(a_tokens)
-        b_set = set(b_tokens)
-        jaccard = len(a_set & b_set) / max(1, len(a_set | b_set))
-
-        a_counts = Counter(a_tokens)
-        b_counts = Counter(b_tokens)
-        shared = sum(min(a_counts[t], b_counts[t]) for t in (a_set & b_set))
-        denom = max(1, min(len(a_tokens), len(b_tokens)))
-        overlap = shared / denom
-
-        return (0.7 * jaccard) + (0.3 * overlap)
+        return token_similarity(tokenize_query(a), tokenize_query(b))
 
     def _is_direct_daw_command(self, query: str) -> bool:
         """Detect direct Ableton-control intents that should skip research."""
@@ -512,109 +504,26 @@ class ResearchCoordinator:
 
         return (has_command and has_target) or phrase_hits
 
-    def _load_research_cache(self) -> Dict[str, Any]:
-        """Load cache, supporting both legacy and structured semantic formats."""
-        if not os.path.exists(self._research_cache_path):
-            return {"entries": []}
-        try:
-            with open(self._research_cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and isinstance(data.get("entries"), list):
-                return data
-            if isinstance(data, dict):
-                now = datetime.now().isoformat()
-                entries = []
-                for k, v in data.items():
-                    entries.append({
-                        "query_key": str(k),
-                        "original_query": str(k),
-                        "answer": str(v),
-                        "route": "",
-                        "created_at": now,
-                        "last_hit_at": now,
-                        "hit_count": 0,
-                    })
-                return {"entries": entries}
-        except (OSError, json.JSONDecodeError):
-            pass
-        return {"entries": []}
-
-    def _save_research_cache(self, cache: Dict[str, Any]) -> None:
-        os.makedirs(os.path.dirname(self._research_cache_path), exist_ok=True)
-        with open(self._research_cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=2)
+    def _get_answer_cache(self) -> ResearchAnswerCache:
+        """The indexed answer cache for _research_cache_path (loaded once per path)."""
+        cache = self._answer_cache
+        if cache is None or cache.path != self._research_cache_path:
+            if cache is not None:
+                cache.close()
+            cache = ResearchAnswerCache(self._research_cache_path,
+                                        max_entries=self._semantic_cache_max_entries)
+            self._answer_cache = cache
+        return cache
 
     def _get_cached_synthesized_answer(self, query: str) -> Optional[Dict[str, Any]]:
-        cache = self._load_research_cache()
-        entries = cache.get("entries", [])
-        if not isinstance(entries, list):
-            return None
-
-        query_key = self._normalize_query_key(query)
-        for entry in entries:
-            if entry.get("query_key") == query_key:
-                entry["last_hit_at"] = datetime.now().isoformat()
-                entry["hit_count"] = int(entry.get("hit_count", 0)) + 1
-                self._save_research_cache(cache)
-                return {
-                    "answer": entry.get("answer", ""),
-                    "cache_match_type": "exact",
-                    "cache_similarity": 1.0,
-                    "matched_query": entry.get("original_query") or entry.get("query_key")
-                }
-
-        if not self._enable_semantic_cache:
-            return None
-
-        best = None
-        best_score = 0.0
-        for entry in entries:
-            candidate = entry.get("original_query") or entry.get("query_key") or ""
-            score = self._query_similarity(query, candidate)
-            if score > best_score:
-                best_score = score
-                best = entry
-
-        if best and best_score >= self._semantic_cache_threshold:
-            best["last_hit_at"] = datetime.now().isoformat()
-            best["hit_count"] = int(best.get("hit_count", 0)) + 1
-            self._save_research_cache(cache)
-            return {
-                "answer": best.get("answer", ""),
-                "cache_match_type": "semantic",
-                "cache_similarity": round(float(best_score), 4),
-                "matched_query": best.get("original_query") or best.get("query_key")
-            }
-
-        return None
+        return self._get_answer_cache().lookup(
+            query,
+            semantic=self._enable_semantic_cache,
+            threshold=self._semantic_cache_threshold,
+        )
 
     def _store_cached_synthesized_answer(self, query: str, answer: str, route: str = "") -> None:
-        cache = self._load_research_cache()
-        entries = cache.setdefault("entries", [])
-        query_key = self._normalize_query_key(query)
-        now = datetime.now().isoformat()
-
-        for entry in entries:
-            if entry.get("query_key") == query_key:
-                entry["original_query"] = query
-                entry["answer"] = answer
-                entry["route"] = route or entry.get("route", "")
-                entry["last_hit_at"] = now
-                break
-        else:
-            entries.append({
-                "query_key": query_key,
-                "original_query": query,
-                "answer": answer,
-                "route": route,
-                "created_at": now,
-                "last_hit_at": now,
-                "hit_count": 0,
-            })
-
-        entries.sort(key=lambda e: (str(e.get("last_hit_at", "")), int(e.get("hit_count", 0))), reverse=True)
-        cache["entries"] = entries[: self._semantic_cache_max_entries]
-        self._save_research_cache(cache)
+        self._get_answer_cache().put(self._normalize_query_key(query), query, answer, route)
 
     @staticmethod
     def _parse_json_object(text: str) -> Optional[Dict[str, Any]]:
@@ -804,6 +713,7 @@ Query: "{query}"
             sources=[f"file://{file_path}"]
         )
 
+    @single_flight("perform_research", key=_research_flight_key, copy_results=True)
     async def perform_research(
         self,
         query: str,
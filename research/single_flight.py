@@ -0,0 +1,153 @@
+"""
+Single-Flight Request Coalescing
+
+When several callers ask for the same thing at once (the voice session and
+the desktop UI researching the same artist, or two tool calls in one turn),
+only the first one does the work; the rest await its in-flight result.
+Nothing is cached: once the call finishes, the next request for the key
+starts a new one.
+
+The in-flight result is a thread-safe future, so duplicates are coalesced
+even when the callers run on different event loops. If the leading caller
+is cancelled, a waiting duplicate takes over instead of being cancelled.
+
+Usage:
+    class YouTubeResearcher:
+        @single_flight("fetch_transcript", key=lambda self, video_id: video_id)
+        async def fetch_transcript(self, video_id): ...
+
+    print(get_single_flight_stats())   # {"fetch_transcript": {"calls": 3, "coalesced": 2, ...}}
+"""
+
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _LeaderCancelled(Exception):
+    """The caller doing the work was cancelled; a waiter should retry"""
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution"""
+
+    def __init__(self, name: str, copy_results: bool = False):
+        self.name = name
+        self.copy_results = copy_results  # give each duplicate its own deep copy
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, concurrent.futures.Future] = {}
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() for key, or await the identical call already in flight"""
+        while True:
+            with self._lock:
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = concurrent.futures.Future()
+                    self._inflight[key] = future
+                    self.stats["executions"] += 1
+                else:
+                    self.stats["coalesced"] += 1
+                self.stats["calls"] += 1
+
+            if leader:
+                return await self._lead(key, future, fn)
+            try:
+                # shield: a cancelled waiter must not cancel the shared future
+                result = await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderCancelled:
+                with self._lock:
+                    self.stats["calls"] -= 1
+                    self.stats["coalesced"] -= 1
+                continue
+            return self._share(result)
+
+    async def _lead(self, key: Hashable, future: concurrent.futures.Future,
+                    fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._finish(key, future)
+            future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            self._finish(key, future)
+            with self._lock:
+                self.stats["errors"] += 1
+            future.set_exception(e)
+            raise
+        self._finish(key, future)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _share(self, result: Any) -> Any:
+        if not self.copy_results:
+            return result
+        try:
+            return copy.deepcopy(result)
+        except Exception:
+            return result
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, inflight=len(self._inflight))
+
+
+# ==================== REGISTRY ====================
+
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(name: str, copy_results: bool = False) -> SingleFlight:
+    """The process-wide SingleFlight for a name (created on first use)"""
+    with _flights_lock:
+        flight = _flights.get(name)
+        if flight is None:
+            flight = _flights[name] = SingleFlight(name, copy_results=copy_results)
+        elif copy_results:
+            flight.copy_results = True  # one user sharing mutable results is enough
+        return flight
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every named flight, including how many calls were coalesced"""
+    with _flights_lock:
+        flights = list(_flights.values())
+    return {flight.name: flight.get_stats() for flight in flights}
+
+
+def single_flight(name: str, key: Callable[..., Optional[Hashable]], copy_results: bool = False):
+    """
+    Decorate an async function so concurrent calls with the same key share one run.
+
+    ``key`` receives the function's arguments; returning None opts that call out.
+    """
+    flight = get_single_flight(name, copy_results=copy_results)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            flight_key = key(*args, **kwargs)
+            if flight_key is None:
+                return await fn(*args, **kwargs)
+            return await flight.do(flight_key, lambda: fn(*args, **kwargs))
+
+        wrapper.single_flight = flight
+        return wrapper
+
+    return decorator
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse
 from dotenv import load_dotenv
 
+from .single_flight import single_flight
+
 load_dotenv()
 
 # Get logger for this module
@@ -259,6 +261,7 @@ class WebResearcher:
         """Legacy site search - deprecated by main search function"""
         return []
     
+    @single_flight("scrape_article", key=lambda self, url: url or None, copy_results=True)
     async def scrape_article(self, url: str) -> ScrapedArticle:
         """
         Scrape the content of an article.
@@ -15,6 +15,8 @@ from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
+from .single_flight import single_flight
+
 load_dotenv()
 
 
@@ -300,6 +302,8 @@ class YouTubeResearcher:
         
         return max(0.0, score)
     
+    @single_flight("fetch_transcript", key=lambda self, video_id: video_id or None,
+                   copy_results=True)
     async def fetch_transcript(self, video_id: str) -> TranscriptResult:
         """
         Fetch the transcript for a YouTube video.
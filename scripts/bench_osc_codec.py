@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+OSC Codec Microbenchmark
+
+Measures messages/second for encoding and decoding typical Jarvis OSC
+traffic with the shared codec (ableton_controls/osc_codec.py) against the
+hand-rolled ``bytes +=`` implementation it replaced. No Ableton required.
+
+The gains are largest on numeric and long messages (parameter value and
+name lists). A short message with a string (device load) encodes at about
+the legacy rate and decodes only slightly faster, since the per-message
+header work dominates there. Single runs are noisy on a busy machine; use
+a longer --seconds to compare.
+
+Usage:
+    python scripts/bench_osc_codec.py
+    python scripts/bench_osc_codec.py --seconds 2.0
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+
+# Ensure repo root is on sys.path
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.osc_codec import decode_message, encode_bundle, encode_message
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation (copied from AbletonController before the codec)
+# ---------------------------------------------------------------------------
+
+def legacy_build(address, args):
+    addr_bytes = address.encode("utf-8") + b"\x00"
+    addr_padded = addr_bytes + b"\x00" * ((4 - len(addr_bytes) % 4) % 4)
+    type_tag = ","
+    arg_data = b""
+    for arg in args:
+        if isinstance(arg, bool):
+            type_tag += "i"
+            arg_data += struct.pack(">i", 1 if arg else 0)
+        elif isinstance(arg, int):
+            type_tag += "i"
+            arg_data += struct.pack(">i", arg)
+        elif isinstance(arg, float):
+            type_tag += "f"
+            arg_data += struct.pack(">f", arg)
+        else:
+            type_tag += "s"
+            s_bytes = str(arg).encode("utf-8") + b"\x00"
+            arg_data += s_bytes + b"\x00" * ((4 - len(s_bytes) % 4) % 4)
+    type_bytes = type_tag.encode("utf-8") + b"\x00"
+    type_padded = type_bytes + b"\x00" * ((4 - len(type_bytes) % 4) % 4)
+    return addr_padded + type_padded + arg_data
+
+
+def legacy_parse(data):
+    null_idx = data.index(b"\x00")
+    address = data[:null_idx].decode("utf-8")
+    addr_size = (null_idx + 4) & ~3
+    if len(data) <= addr_size:
+        return address, []
+    type_start = addr_size
+    if data[type_start:type_start + 1] != b",":
+        return address, []
+    type_null = data.index(b"\x00", type_start)
+    type_tag = data[type_start + 1:type_null].decode("utf-8")
+    type_size = ((type_null - type_start) + 4) & ~3
+    args = []
+    offset = type_start + type_size
+    for tag in type_tag:
+        if tag == "i":
+            args.append(struct.unpack(">i", data[offset:offset + 4])[0])
+            offset += 4
+        elif tag == "f":
+            args.append(struct.unpack(">f", data[offset:offset + 4])[0])
+            offset += 4
+        elif tag == "s":
+            s_null = data.index(b"\x00", offset)
+            args.append(data[offset:s_null].decode("utf-8"))
+            offset = ((s_null + 1) + 3) & ~3
+    return address, args
+
+
+# ---------------------------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------------------------
+
+PARAM_SET = ("/live/device/set/parameter/value", [0, 1, 5, 0.75])
+DEVICE_LOAD = ("/jarvis/device/load", [2, "FabFilter Pro-Q 3", -1])
+PARAM_NAMES = ("/live/device/get/parameters/name",
+               [0, 1] + ["Parameter %d Name" % i for i in range(64)])
+PARAM_VALUES = ("/live/device/get/parameters/value",
+                [0, 1] + [i * 0.01 for i in range(64)])
+
+WORKLOADS = [
+    ("param set (4 args)", PARAM_SET),
+    ("device load (3 args)", DEVICE_LOAD),
+    ("64 param names", PARAM_NAMES),
+    ("64 param values", PARAM_VALUES),
+]
+
+
+def _rate(fn, seconds, repeats=5):
+    """Best calls/second over several ~seconds/repeats runs (filters noise)."""
+    best = 0.0
+    batch = 200
+    for _ in range(repeats):
+        n = 0
+        start = time.perf_counter()
+        deadline = start + seconds / repeats
+        while True:
+            for _ in range(batch):
+                fn()
+            n += batch
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+        best = max(best, n / (now - start))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OSC codec microbenchmark")
+    parser.add_argument("--seconds", type=float, default=0.5,
+                        help="Time per measurement (default: 0.5)")
+    args = parser.parse_args()
+
+    print(f"{'workload':<24}{'op':<8}{'before msg/s':>14}{'after msg/s':>14}{'speedup':>9}")
+    print("-" * 69)
+    for label, (address, osc_args) in WORKLOADS:
+        data = legacy_build(address, osc_args)
+        assert data == encode_message(address, osc_args), label
+
+        for op, before, after in (
+            ("encode", lambda: legacy_build(address, osc_args),
+                       lambda: encode_message(address, osc_args)),
+            ("decode", lambda: legacy_parse(data),
+                       lambda: decode_message(data)),
+        ):
+            r_before = _rate(before, args.seconds)
+            r_after = _rate(after, args.seconds)
+            print(f"{label:<24}{op:<8}{r_before:>14,.0f}{r_after:>14,.0f}{r_after / r_before:>8.2f}x")
+
+    # Bundling: 32 parameter writes as separate datagrams vs one bundle
+    writes = [("/live/device/set/parameter/value", [0, 1, i, 0.5]) for i in range(32)]
+    r_before = _rate(lambda: [legacy_build(a, v) for a, v in writes], args.seconds)
+    r_after = _rate(lambda: encode_bundle(writes), args.seconds)
+    print(f"{'32 param sets':<24}{'bundle':<8}{r_before * 32:>14,.0f}{r_after * 32:>14,.0f}"
+          f"{r_after / r_before:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Shared pytest hooks.
+
+The live-Ableton scripts in this directory bind the JarvisDeviceLoader reply
+port (11003) themselves, so release the process-wide loader channel after
+each module that used it.
+
+Research clients open the persistent LLM response cache on construction;
+point it at a throwaway file so test runs never create or read the real
+research/llm_response_cache.sqlite3.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from ableton_controls.loader_channel import close_loader_channels
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _release_loader_port():
+    yield
+    close_loader_channels()
+
+
+_llm_cache_dir = None
+
+
+def pytest_configure(config):
+    global _llm_cache_dir
+    if "RESEARCH_LLM_CACHE_PATH" not in os.environ:
+        _llm_cache_dir = tempfile.mkdtemp(prefix="jarvis-llm-cache-")
+        os.environ["RESEARCH_LLM_CACHE_PATH"] = os.path.join(_llm_cache_dir, "llm_response_cache.sqlite3")
+
+
+def pytest_unconfigure(config):
+    if _llm_cache_dir is not None:
+        os.environ.pop("RESEARCH_LLM_CACHE_PATH", None)
+        shutil.rmtree(_llm_cache_dir, ignore_errors=True)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Fake OpenClaw relay worker for tests.
+
+Speaks the line-delimited JSON protocol of utils/relay_worker.py without
+calling OpenClaw. Each "agent" request is answered in its own thread
+with an OpenClaw-shaped JSON reply echoing the message and this process's pid.
+
+Messages that start with a directive change the behaviour:
+    "sleep 0.2 ..."   answer after 0.2 s (exercises pipelining / timeouts)
+    "rate_limit"      exit code 1 with a 429 error on stderr
+    "worker_error"    a worker-level error (no returncode: OpenClaw never ran)
+    "crash"           exit the worker without answering
+
+Usage:
+    RelayWorker([sys.executable, "tests/fake_openclaw_relay.py"])
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+_write_lock = threading.Lock()
+
+
+def _reply(message):
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def _answer(request):
+    message = str(request.get("message", ""))
+    if message.startswith("sleep "):
+        time.sleep(float(message.split()[1]))
+    if message == "worker_error":
+        _reply({"id": request.get("id"), "ok": False, "error": "Command not found: openclaw"})
+        return
+    if message == "rate_limit":
+        _reply({"id": request.get("id"), "ok": False, "returncode": 1,
+                "stdout": "", "stderr": "429 rate_limit: provider cooldown"})
+        return
+    payload = {"result": {"payloads": [{"text": f"echo: {message}"}]},
+               "pid": os.getpid(), "agent": request.get("agent"),
+               "session_id": request.get("session_id")}
+    _reply({"id": request.get("id"), "ok": True, "returncode": 0,
+            "stdout": json.dumps(payload), "stderr": ""})
+
+
+def main():
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if request.get("op") == "ping":
+            _reply({"id": request.get("id"), "ok": True, "pong": True})
+        elif request.get("message") == "crash":
+            os._exit(3)
+        else:
+            threading.Thread(target=_answer, args=(request,), daemon=True).start()
+
+
+if __name__ == "__main__":
+    main()
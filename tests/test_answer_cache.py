@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the indexed research answer cache (research/answer_cache.py):
+exact and token-indexed semantic lookups, read-only lookups with batched
+hit flushing, journal replay, compaction, eviction and the legacy format.
+
+Run with:
+    python -m pytest tests/test_answer_cache.py -v
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from research.answer_cache import ResearchAnswerCache, normalize_query_key
+
+
+class TestResearchAnswerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "research_cache.json")
+        self.journal = os.path.join(self.tmp, "research_cache.log.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _cache(self, **kwargs):
+        return ResearchAnswerCache(self.path, **kwargs)
+
+    def _put(self, cache, query, answer):
+        cache.put(normalize_query_key(query), query, answer, route="single_shot")
+
+    def _journal_lines(self):
+        if not os.path.exists(self.journal):
+            return []
+        with open(self.journal, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_exact_lookup_normalizes_the_query(self):
+        cache = self._cache()
+        self._put(cache, "How To Mix 808s", "Sidechain the kick.")
+
+        hit = cache.lookup("  how to   mix 808s ")
+
+        self.assertEqual(hit["answer"], "Sidechain the kick.")
+        self.assertEqual(hit["cache_match_type"], "exact")
+        self.assertEqual(hit["cache_similarity"], 1.0)
+        self.assertEqual(hit["matched_query"], "How To Mix 808s")
+
+    def test_semantic_lookup_only_scores_entries_sharing_a_token(self):
+        cache = self._cache()
+        self._put(cache, "travis scott vocal chain", "Autotune then saturation.")
+        for n in range(20):
+            self._put(cache, f"unrelated topic {n}", "x")
+
+        hit = cache.lookup("travis scott vocal chain settings", threshold=0.5)
+
+        self.assertEqual(hit["cache_match_type"], "semantic")
+        self.assertEqual(hit["answer"], "Autotune then saturation.")
+        self.assertEqual(cache.get_stats()["candidates_scored"], 1)
+        self.assertIsNone(cache.lookup("travis scott vocal chain settings", threshold=0.99))
+        self.assertIsNone(cache.lookup("travis scott vocal chain settings", semantic=False))
+
+    def test_lookup_does_not_write_until_hits_are_batched(self):
+        cache = self._cache(hit_flush_every=3)
+        self._put(cache, "how to mix 808s", "answer")
+        before = len(self._journal_lines())
+
+        cache.lookup("how to mix 808s")
+        cache.lookup("how to mix 808s")
+        self.assertEqual(len(self._journal_lines()), before)
+        self.assertFalse(os.path.exists(self.path))
+
+        cache.lookup("how to mix 808s")
+        records = self._journal_lines()
+        self.assertEqual(len(records), before + 1)
+        self.assertEqual(records[-1]["op"], "hits")
+        self.assertEqual(records[-1]["hits"]["how to mix 808s"][0], 3)
+
+    def test_journal_is_replayed_on_reopen(self):
+        cache = self._cache()
+        self._put(cache, "how to mix 808s", "old")
+        self._put(cache, "how to mix 808s", "new")
+        cache.lookup("how to mix 808s")
+        cache.close()
+
+        reopened = self._cache()
+
+        self.assertEqual(len(reopened), 1)
+        entry = reopened.get_entry("how to mix 808s")
+        self.assertEqual(entry["answer"], "new")
+        self.assertEqual(entry["hit_count"], 1)
+
+    def test_compaction_rewrites_snapshot_and_truncates_journal(self):
+        cache = self._cache(compact_every=3)
+        for n in range(3):
+            self._put(cache, f"query {n}", f"answer {n}")
+
+        self.assertFalse(os.path.exists(self.journal))
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(len(data["entries"]), 3)
+        self.assertEqual(cache.get_stats()["compactions"], 1)
+        self.assertEqual(self._cache().lookup("query 1")["answer"], "answer 1")
+
+    def test_compaction_keeps_records_from_other_writers(self):
+        first, second = self._cache(), self._cache()
+        self._put(first, "query a", "answer a")
+        self._put(second, "query b", "answer b")
+        second.lookup("query b")
+        second.flush_hits()
+
+        first.compact()
+
+        self.assertFalse(os.path.exists(self.journal))
+        self.assertEqual(first.lookup("query b")["answer"], "answer b")
+        reopened = self._cache()
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(reopened.get_entry("query b")["hit_count"], 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = self._cache(max_entries=2)
+        self._put(cache, "first query", "1")
+        self._put(cache, "second query", "2")
+        cache.lookup("first query")
+        self._put(cache, "third query", "3")
+
+        self.assertIn("first query", cache)
+        self.assertNotIn("second query", cache)
+        self.assertEqual(len(self._cache(max_entries=2)), 2)
+
+    def test_legacy_flat_snapshot_is_loaded(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"how to mix 808s": "legacy answer"}, f)
+
+        self.assertEqual(self._cache().lookup("How to mix 808s")["answer"], "legacy answer")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -127,6 +127,52 @@ class TestArtifactChainStore(unittest.TestCase):
     def test_delete_missing_returns_false(self):
         self.assertFalse(self.store.delete_artifact("nonexistent"))
 
+    # ── Manifest Index ────────────────────────────────────────────────
+    def test_manifest_is_maintained_on_save_and_delete(self):
+        self.store.save_artifact("query 1", _sample_artifact("query 1"))
+        self.store.save_artifact("query 2", _sample_artifact("query 2"))
+        self.store.delete_artifact("query 1")
+
+        with open(os.path.join(self._tmp, "_index.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.assertEqual(list(manifest["artifacts"]), ["query_2"])
+        row = manifest["artifacts"]["query_2"]
+        self.assertEqual(row["artist"], "Travis Scott")
+        self.assertEqual(row["tokens"], ["query", "2"])
+        self.assertEqual(row["path"], "query_2.json")
+
+    def test_fuzzy_lookup_and_listing_parse_only_the_winner(self):
+        self.store.save_artifact("Travis Scott Utopia vocal chain", _sample_artifact())
+        for n in range(10):
+            self.store.save_artifact(f"jazz piano {n}", _sample_artifact(f"jazz piano {n}"))
+
+        store = ArtifactChainStore(self._tmp)
+        store.list_artifacts()  # loads the manifest
+        opened = []
+        original = store._load_from_key
+
+        def counting_load(key):
+            opened.append(key)
+            return original(key)
+
+        store._load_from_key = counting_load
+        loaded = store.load_artifact("travis scott utopia vocal")
+        self.assertEqual(len(store.list_artifacts()), 11)
+
+        self.assertEqual(loaded["_cache_match"], "fuzzy")
+        self.assertEqual(opened, ["travis_scott_utopia_vocal", "travis_scott_utopia"])
+
+    def test_manifest_reconciles_files_changed_on_disk(self):
+        self.store.save_artifact("query 1", _sample_artifact("query 1"))
+        with open(os.path.join(self._tmp, "hand_made.json"), "w", encoding="utf-8") as f:
+            json.dump(dict(_sample_artifact("hand made preset"), query="hand made preset"), f)
+        os.remove(os.path.join(self._tmp, "query_1.json"))
+
+        store = ArtifactChainStore(self._tmp)
+
+        self.assertEqual([item["key"] for item in store.list_artifacts()], ["hand_made"])
+        self.assertEqual(store.load_artifact("hand made preset sound")["query"], "hand made preset")
+
 
 class TestQuerySimilarity(unittest.TestCase):
     def test_identical(self):
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the asyncio OSC transport (ableton_controls/async_controller.py)
+and the sync AbletonController facade that runs on top of it.
+
+Uses the local fake AbletonOSC UDP server from test_response_mux — no Ableton
+required.
+
+Run with:
+    python -m pytest tests/test_async_controller.py -v
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.async_controller import AsyncAbletonController, call_controller
+from ableton_controls.controller import AbletonController
+from tests.test_response_mux import EQ_NAMES, _FakeAbletonOSC, _device_responder, _free_port
+
+
+class _TrackStateResponder:
+    """Applies /live/track/set/* and answers /live/track/get/* as [track, value]."""
+
+    def __init__(self):
+        self.state = {}
+
+    def __call__(self, address, args):
+        if address.startswith("/live/track/set/"):
+            prop = address.rsplit("/", 1)[-1]
+            self.state[(prop, args[0])] = args[-1]
+            return None
+        if address.startswith("/live/track/get/"):
+            prop = address.rsplit("/", 1)[-1]
+            return [args[0], self.state.get((prop, args[0]), 0)]
+        return None
+
+
+class TestAsyncAbletonController(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _FakeAbletonOSC(batch_size=8)
+
+    def tearDown(self):
+        self.server.close()
+
+    def _run(self, coro_fn):
+        async def main():
+            actrl = AsyncAbletonController(port=self.server.port, response_port=_free_port())
+            await actrl.connect()
+            try:
+                return await coro_fn(actrl)
+            finally:
+                actrl.stop()
+        return asyncio.run(main())
+
+    def test_pipelined_queries_resolve_their_own_futures(self):
+        requests = [("/live/device/get/parameter/value", [0, 1, p], None) for p in range(8)]
+        results = self._run(lambda actrl: actrl.query_many(requests, timeout=2.0))
+
+        for p, resp in enumerate(results):
+            self.assertIsNotNone(resp)
+            self.assertEqual(resp[1][:3], [0, 1, p])
+            self.assertAlmostEqual(resp[1][3], p * 0.1, places=5)
+
+    def test_concurrent_tasks_do_not_cross(self):
+        async def scenario(actrl):
+            return await asyncio.gather(*[
+                actrl.get_device_parameter_value_sync(0, 1, p, timeout=2.0) for p in range(8)
+            ])
+
+        results = self._run(scenario)
+        for p, result in enumerate(results):
+            self.assertTrue(result["success"])
+            self.assertAlmostEqual(result["value"], p * 0.1, places=5)
+
+    def test_timeout_returns_none_and_clears_table(self):
+        # Only 3 of 8 queries go out, so the fake server never answers
+        async def scenario(actrl):
+            results = await actrl.query_many(
+                [("/live/device/get/parameter/value", [0, 1, p], None) for p in range(3)],
+                timeout=0.1,
+            )
+            return results, actrl.mux.in_flight(), actrl.mux.get_stats()["timeouts"]
+
+        results, in_flight, timeouts = self._run(scenario)
+        self.assertEqual(results, [None, None, None])
+        self.assertEqual(in_flight, 0)
+        self.assertEqual(timeouts, 3)
+
+    def test_verified_set_awaits_readback(self):
+        self.server.batch_size = 1
+        self.server.responder = _TrackStateResponder()
+
+        result = self._run(lambda actrl: actrl.mute_track(2, 1, verify=True))
+
+        self.assertTrue(result["verified"])
+        self.assertEqual(result["actual"], 1)
+
+    def test_get_track_mute_reads_value_not_track_id(self):
+        self.server.batch_size = 1
+        self.server.responder = _TrackStateResponder()
+
+        result = self._run(lambda actrl: actrl.get_track_mute(3))
+
+        # Reply is [3, 0]: track 3 is NOT muted
+        self.assertTrue(result["success"])
+        self.assertFalse(result["muted"])
+
+
+class TestSyncFacade(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _FakeAbletonOSC(batch_size=6, responder=_device_responder)
+        self.ctrl = AbletonController(port=self.server.port, response_port=_free_port())
+        if self.ctrl.async_controller is None:
+            self.skipTest("could not bind response listener")
+
+    def tearDown(self):
+        self.ctrl.shutdown()
+        self.server.close()
+
+    def test_async_snapshot_from_caller_loop_shares_transport(self):
+        snap = asyncio.run(call_controller(self.ctrl, "get_device_state_snapshot", 0, 1, timeout=2.0))
+
+        self.assertTrue(snap.success, snap.message)
+        self.assertEqual(snap.names, EQ_NAMES)
+        # Metadata cache is shared with the sync facade
+        self.assertIsNotNone(self.ctrl.device_metadata.get(0, 1))
+        self.assertIs(self.ctrl.async_controller.mux, self.ctrl._mux)
+
+    def test_sync_track_calls_run_on_the_transport(self):
+        self.server.batch_size = 1
+        self.server.responder = _TrackStateResponder()
+
+        result = self.ctrl.set_track_volume(1, 0.7, verify=True)
+
+        self.assertTrue(result["verified"])
+        self.assertAlmostEqual(result["volume"], 0.7, places=5)
+        self.assertAlmostEqual(self.ctrl.get_track_volume(1)["volume"], 0.7, places=5)
+        self.assertGreater(self.ctrl.async_controller.mux.get_stats()["matched"], 0)
+
+    def test_executor_verified_set_keeps_the_agent_loop_ticking(self):
+        from agents.executor_agent import ExecutorAgent
+
+        self.server.batch_size = 1
+        state = _TrackStateResponder()
+
+        def slow_readback(address, args):
+            if address.startswith("/live/track/get/"):
+                time.sleep(0.1)
+            return state(address, args)
+
+        self.server.responder = slow_readback
+        executor = ExecutorAgent(SimpleNamespace(ableton=self.ctrl))
+        content = {"extracted_action": "set_track_volume",
+                   "parameters": {"track_index": 1, "volume": 0.7, "verify": True}}
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticking = asyncio.ensure_future(ticker())
+            try:
+                result = await executor._execute_simple(content)
+            finally:
+                ticking.cancel()
+            return result, ticks
+
+        with patch.object(ExecutorAgent, "persistence", None):
+            result, ticks = asyncio.run(main())
+
+        self.assertTrue(result["verified"])
+        self.assertAlmostEqual(result["volume"], 0.7, places=5)
+        # previous-value readback + verify readback: ~200 ms of Ableton waits
+        self.assertGreater(ticks, 10)
+
+    def test_sync_call_from_the_loop_thread_is_refused(self):
+        actrl = self.ctrl.async_controller
+
+        async def from_loop():
+            return self.ctrl.get_track_mute(0)
+
+        future = asyncio.run_coroutine_threadsafe(from_loop(), actrl.loop)
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=2.0)
+
+    def test_stuck_call_times_out_instead_of_hanging(self):
+        async def never_returns(*args, **kwargs):
+            await asyncio.sleep(3600)
+
+        self.ctrl.FACADE_TIMEOUT = 0.1
+        with patch.object(self.ctrl.async_controller, "get_track_mute", never_returns):
+            with self.assertRaises(TimeoutError):
+                self.ctrl.get_track_mute(0)
+
+    def test_shutdown_stops_transport_thread(self):
+        thread = self.ctrl._resp_thread
+        self.ctrl.shutdown()
+        thread.join(timeout=2.0)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.ctrl.async_controller)
+
+
+class TestSyncFacadeWithoutListener(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _FakeAbletonOSC(batch_size=1, responder=_TrackStateResponder())
+        # Hold the reply port so the controller cannot bind its listener
+        self.blocker = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.blocker.bind(("127.0.0.1", 0))
+        self.ctrl = AbletonController(port=self.server.port,
+                                      response_port=self.blocker.getsockname()[1])
+
+    def tearDown(self):
+        self.ctrl.shutdown()
+        self.blocker.close()
+        self.server.close()
+
+    def test_calls_still_reach_ableton(self):
+        self.assertIsNone(self.ctrl.async_controller)
+
+        self.assertTrue(self.ctrl.mute_track(2, 1)["success"])
+        self.assertTrue(self.ctrl.get_track_mute(2)["muted"])
+
+    def test_calls_from_a_running_loop_do_not_nest_asyncio_run(self):
+        async def from_engine_loop():
+            return self.ctrl.mute_track(2, 1), self.ctrl.get_track_mute(2)
+
+        wrote, read = asyncio.run(from_engine_loop())
+
+        self.assertTrue(wrote["success"])
+        self.assertTrue(read["muted"])
+
+
+class TestCallController(unittest.TestCase):
+
+    def test_falls_back_to_thread_for_sync_controllers(self):
+        controller = MagicMock()
+        controller.get_track_volume.return_value = {"success": True, "volume": 0.5}
+
+        result = asyncio.run(call_controller(controller, "get_track_volume", 0))
+
+        self.assertEqual(result["volume"], 0.5)
+        controller.get_track_volume.assert_called_once_with(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
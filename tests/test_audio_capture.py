@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the mic capture pipeline (utils/audio_capture.py): the PCM
+ring buffer, frame coalescing from the reader thread, drop accounting and
+the energy gate.
+
+Run with:
+    python -m pytest tests/test_audio_capture.py -v
+"""
+
+import array
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from utils.audio_capture import EnergyGate, MicCapture, PcmRingBuffer, pcm_rms
+
+
+def _tone(samples, level):
+    """Square wave of the given amplitude as 16-bit PCM"""
+    return array.array("h", [level if i % 2 else -level for i in range(samples)]).tobytes()
+
+
+class FakeStream:
+    """Input stream that returns queued chunks, then blocks until closed"""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.closed = threading.Event()
+
+    def read(self, frames, exception_on_overflow=True):
+        if self.chunks:
+            return self.chunks.pop(0)
+        self.closed.wait(1.0)
+        raise OSError("stream closed")
+
+
+class TestPcmRingBuffer(unittest.TestCase):
+
+    def test_reads_exact_frames_across_wraparound(self):
+        ring = PcmRingBuffer(8)
+        ring.write(b"abcdef")
+        self.assertEqual(ring.read(4), b"abcd")
+        ring.write(b"ghijk")
+
+        self.assertEqual(ring.read(7), b"efghijk")
+        self.assertIsNone(ring.read(1))
+
+    def test_overflow_overwrites_oldest_and_reports_drops(self):
+        ring = PcmRingBuffer(4)
+        self.assertEqual(ring.write(b"abc"), 0)
+        self.assertEqual(ring.write(b"def"), 2)
+
+        self.assertEqual(ring.read(4), b"cdef")
+        self.assertEqual(ring.write(b"0123456"), 3)
+        self.assertEqual(ring.read(4), b"3456")
+
+
+class TestEnergyGate(unittest.TestCase):
+
+    def setUp(self):
+        self.quiet = _tone(160, 10)
+        self.loud = _tone(160, 3000)
+
+    def test_rms(self):
+        self.assertAlmostEqual(pcm_rms(self.loud), 3000.0)
+        self.assertEqual(pcm_rms(b""), 0.0)
+
+    def test_silence_is_skipped_and_speech_gets_preroll_and_hangover(self):
+        gate = EnergyGate(300, hangover_frames=2, preroll_frames=2)
+
+        self.assertEqual(gate.process(self.quiet), [])
+        self.assertEqual(gate.process(self.quiet), [])
+        self.assertEqual(gate.process(self.quiet), [])
+        self.assertEqual(gate.process(self.loud), [self.quiet, self.quiet, self.loud])
+        self.assertEqual(gate.process(self.quiet), [self.quiet])   # hangover
+        self.assertEqual(gate.process(self.quiet), [self.quiet])
+        self.assertEqual(gate.process(self.quiet), [])
+        self.assertFalse(gate.is_open)
+
+    def test_last_voice_at_is_the_last_loud_frame_not_the_gate_closing(self):
+        gate = EnergyGate(300, hangover_frames=2, preroll_frames=0)
+
+        for at, frame in enumerate([self.loud, self.loud, self.quiet, self.quiet, self.quiet]):
+            gate.process(frame, at=float(at))
+
+        self.assertFalse(gate.is_open)
+        self.assertEqual(gate.last_voice_at, 1.0)
+
+    def test_zero_threshold_disables_gating(self):
+        self.assertEqual(EnergyGate(0).process(self.quiet), [self.quiet])
+
+
+class TestMicCapture(unittest.TestCase):
+
+    def test_reader_thread_coalesces_chunks_into_frames(self):
+        # 16 kHz, 10 ms chunks (160 frames), 30 ms send frames
+        chunks = [bytes([n]) * 320 for n in range(7)]
+        stream = FakeStream(chunks)
+        mic = MicCapture(16000, chunk_frames=160, frame_ms=30)
+
+        async def main():
+            mic.start(stream)
+            frames = [await mic.read_frame(timeout=1.0) for _ in range(2)]
+            stream.closed.set()
+            tail = await mic.read_frame(timeout=1.0)
+            mic.stop()
+            return frames, tail
+
+        frames, tail = asyncio.run(main())
+
+        self.assertEqual(frames, [b"".join(chunks[0:3]), b"".join(chunks[3:6])])
+        self.assertIsNone(tail)  # 10 ms left over is not a full frame
+        stats = mic.get_stats()
+        self.assertEqual(stats["chunks_captured"], 7)
+        self.assertEqual(stats["frames_read"], 2)
+        self.assertEqual(stats["frame_ms"], 30)
+        self.assertIsInstance(mic.error, OSError)
+
+    def test_frame_time_accounts_for_audio_buffered_behind_it(self):
+        mic = MicCapture(16000, chunk_frames=160, frame_ms=100)
+        mic.ring.write(bytes(2 * mic.frame_bytes))
+
+        before = time.perf_counter()
+        asyncio.run(mic.read_frame(timeout=0.1))
+
+        # A whole 100 ms frame was captured after this one
+        self.assertAlmostEqual(before - mic.last_frame_at, 0.1, delta=0.05)
+
+    def test_slow_consumer_drops_oldest_audio_and_counts_it(self):
+        chunks = [bytes([n]) * 320 for n in range(10)]
+        stream = FakeStream(chunks)
+        mic = MicCapture(16000, chunk_frames=160, frame_ms=10, buffer_seconds=0.04)
+
+        async def main():
+            mic.start(stream)
+            while stream.chunks:
+                await asyncio.sleep(0.01)
+            stream.closed.set()
+            frame = await mic.read_frame(timeout=1.0)
+            mic.stop()
+            return frame
+
+        frame = asyncio.run(main())
+
+        self.assertEqual(frame, chunks[6])
+        self.assertEqual(mic.get_stats()["chunks_dropped"], 6)
+
+    def test_record_send_tracks_latency(self):
+        mic = MicCapture()
+        mic.record_send(3200, 0.002)
+        mic.record_send(3200, 0.004)
+
+        stats = mic.get_stats()
+        self.assertEqual(stats["frames_sent"], 2)
+        self.assertAlmostEqual(stats["send_ms_mean"], 3.0)
+        self.assertAlmostEqual(stats["send_ms_max"], 4.0)
+
+    def test_reader_and_sender_counters_have_separate_owners(self):
+        mic = MicCapture(16000, chunk_frames=160, frame_ms=10)
+        stream = FakeStream([bytes(320)] * 3)
+
+        async def main():
+            mic.start(stream)
+            for _ in range(3):
+                await mic.read_frame(timeout=1.0)
+            mic.record_send(320, 0.001)
+            stream.closed.set()
+            mic.stop()
+
+        asyncio.run(main())
+
+        # The reader thread only writes capture_stats, the event loop only stats
+        self.assertTrue(set(mic.capture_stats).isdisjoint(mic.stats))
+        self.assertEqual(mic.capture_stats["chunks_captured"], 3)
+        self.assertEqual(mic.stats["frames_sent"], 1)
+        self.assertEqual(mic.get_stats()["chunks_captured"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the playback jitter buffer (utils/audio_playback.py):
+pre-buffering, block writes from the writer thread, utterance-level
+start/end callbacks, underruns, flush on interruption and latency stats.
+
+Run with:
+    python -m pytest tests/test_audio_playback.py -v
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from utils.audio_playback import PlaybackEngine
+
+# 1 kHz keeps the byte counts small: 2 bytes per ms
+RATE = 1000
+
+
+class FakeOutputStream:
+    """Records writes; each write takes as long as the audio it carries"""
+
+    def __init__(self, realtime=False):
+        self.writes = []
+        self.realtime = realtime
+
+    def write(self, data):
+        self.writes.append(data)
+        if self.realtime:
+            time.sleep(len(data) / (2 * RATE))
+
+
+class TestPlaybackEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+        self.started = threading.Event()
+        self.ended = threading.Event()
+        self.stream = FakeOutputStream()
+        self.playback = PlaybackEngine(RATE, prebuffer_ms=20, block_ms=10, gap_ms=100, tail_ms=0)
+
+    def tearDown(self):
+        self.playback.stop()
+
+    def _start(self):
+        def on_start():
+            self.events.append("start")
+            self.started.set()
+
+        def on_end():
+            self.events.append("end")
+            self.ended.set()
+
+        self.playback.start(self.stream, on_start=on_start, on_end=on_end)
+
+    def test_utterance_plays_in_blocks_with_one_start_and_end(self):
+        self._start()
+        for n in range(3):
+            self.playback.feed(bytes([n]) * 30)
+        self.playback.end_of_turn()
+
+        self.assertTrue(self.ended.wait(2))
+        self.assertEqual(self.events, ["start", "end"])
+        self.assertEqual(b"".join(self.stream.writes), b"\x00" * 30 + b"\x01" * 30 + b"\x02" * 30)
+        self.assertTrue(all(len(block) <= 20 for block in self.stream.writes))
+        stats = self.playback.get_stats()
+        self.assertEqual(stats["utterances"], 1)
+        self.assertEqual(stats["bytes_played"], 90)
+        self.assertEqual(stats["underruns"], 0)
+        self.assertFalse(self.playback.active)
+
+    def test_waits_for_prebuffer_before_playing(self):
+        self._start()
+        self.playback.feed(b"\x00" * 10)  # below the 40-byte pre-buffer
+
+        self.assertFalse(self.started.wait(0.05))
+        self.playback.feed(b"\x00" * 30)
+        self.assertTrue(self.started.wait(1))
+
+    def test_gap_mid_utterance_is_an_underrun_not_a_new_utterance(self):
+        self._start()
+        self.playback.feed(b"\x00" * 40)
+        self.assertTrue(self.started.wait(1))
+        time.sleep(0.03)
+        self.playback.feed(b"\x01" * 40)
+        self.playback.end_of_turn()
+
+        self.assertTrue(self.ended.wait(2))
+        self.assertEqual(self.events, ["start", "end"])
+        self.assertGreaterEqual(self.playback.get_stats()["underruns"], 1)
+
+    def test_silence_longer_than_gap_ends_the_utterance(self):
+        self._start()
+        self.playback.feed(b"\x00" * 40)
+
+        self.assertTrue(self.ended.wait(2))
+        self.assertEqual(self.events, ["start", "end"])
+
+    def test_flush_drops_queued_audio(self):
+        self.stream.realtime = True
+        self._start()
+        self.playback.feed(b"\x00" * 2000)  # one second of audio
+        self.assertTrue(self.started.wait(1))
+
+        self.playback.flush()
+
+        self.assertTrue(self.ended.wait(1))
+        self.assertLess(self.playback.get_stats()["bytes_played"], 2000)
+        self.assertEqual(self.playback.get_stats()["flushes"], 1)
+
+    def test_speech_latency_is_measured_from_input_end(self):
+        self._start()
+        self.playback.mark_input_end(time.perf_counter() - 0.5)
+        self.playback.feed(b"\x00" * 40)
+        self.playback.end_of_turn()
+
+        self.assertTrue(self.ended.wait(2))
+        stats = self.playback.get_stats()
+        self.assertEqual(stats["speech_latency_count"], 1)
+        self.assertGreaterEqual(stats["speech_latency_ms_mean"], 500)
+
+    def test_end_of_turn_without_audio_is_ignored(self):
+        self._start()
+        self.playback.end_of_turn()
+        self.playback.feed(b"\x00" * 40)
+        time.sleep(0.05)
+
+        self.assertEqual(self.events, ["start"])  # waits out the gap, not ended early
+
+
+if __name__ == "__main__":
+    unittest.main()
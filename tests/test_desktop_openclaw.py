@@ -14,6 +14,7 @@ import os
 import sys
 import types
 import unittest
+from unittest.mock import patch
 
 _MOD_PATH = os.path.join(os.path.dirname(__file__), "..", "jarvis_desktop_openclaw.py")
 
@@ -37,6 +38,8 @@ _spec = importlib.util.spec_from_file_location("jarvis_desktop_openclaw", _MOD_P
 mod = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(mod)
 
+from utils.relay_worker import RelayTimeout  # importable once the module set up sys.path
+
 
 class TestExtractReply(unittest.TestCase):
     """Verify JSON reply extraction across formats."""
@@ -244,5 +247,69 @@ class TestLocalFirstSendMessage(unittest.TestCase):
         self.assertEqual(out, ["relay ok"])
 
 
+class TestPersistentRelay(unittest.TestCase):
+    """Relay calls go through a configured long-lived worker (fake relay stand-in)."""
+
+    def setUp(self):
+        fake = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_openclaw_relay.py")
+        self._orig_relay = mod._relay
+        mod._relay = mod.RelayWorkerPool([sys.executable, fake])
+
+    def tearDown(self):
+        if mod._relay is not None:
+            mod._relay.close()
+        mod._relay = self._orig_relay
+
+    def test_reply_comes_from_the_worker(self):
+        self.assertEqual(mod._call_openclaw_once("hello"), ("echo: hello", ""))
+        self.assertEqual(mod._call_openclaw_once("again"), ("echo: again", ""))
+        self.assertEqual(mod._relay.get_stats()["starts"], 1)
+
+    def test_worker_errors_keep_rate_limit_text(self):
+        reply, err = mod._call_openclaw_once("rate_limit")
+        self.assertIsNone(reply)
+        self.assertTrue(mod._is_rate_limit_error(err))
+
+    def test_warm_relay_pings_the_worker(self):
+        self.assertEqual(mod._warm_relay(), "persistent worker ready")
+
+    def test_worker_error_falls_back_to_the_cli_candidates(self):
+        cli_ok = [sys.executable, "-c", "import json; print(json.dumps({'reply': 'cli ok'}))"]
+        orig = mod._pick_candidates
+        mod._pick_candidates = lambda *a, **k: [["/nonexistent/openclaw"], cli_ok]
+        try:
+            self.assertEqual(mod._call_openclaw_once("worker_error"), ("cli ok", ""))
+        finally:
+            mod._pick_candidates = orig
+
+    def test_worker_timeout_falls_back_to_the_cli_candidates(self):
+        cli_ok = [sys.executable, "-c", "import json; print(json.dumps({'reply': 'cli ok'}))"]
+        with patch.object(mod, "_pick_candidates", lambda *a, **k: [cli_ok]), \
+                patch.object(mod._relay, "request", side_effect=RelayTimeout("no response")):
+            self.assertEqual(mod._call_openclaw_once("hello"), ("cli ok", ""))
+
+    def test_default_worker_is_the_bundled_one(self):
+        with patch.dict(os.environ, {"OPENCLAW_RELAY_WORKER_CMD": ""}), \
+                patch.object(mod, "_is_windows", lambda: False):
+            command = mod._relay_worker_command()
+        self.assertEqual(command[1], mod.OPENCLAW_WORKER_SCRIPT)
+        self.assertEqual(command[2:], [mod._NODE, mod._OPENCLAW_MJS])
+
+    def test_windows_runs_the_worker_inside_wsl(self):
+        with patch.dict(os.environ, {"OPENCLAW_RELAY_WORKER_CMD": ""}), \
+                patch.object(mod, "_is_windows", lambda: True), \
+                patch.object(mod.os.path, "isfile", lambda path: path == mod.WSL_EXE), \
+                patch.object(mod, "OPENCLAW_WORKER_SCRIPT", r"C:\Jarvis\utils\openclaw_relay_worker.py"):
+            command = mod._relay_worker_command()
+        self.assertEqual(command[:4], [mod.WSL_EXE, "-e", "python3", "/mnt/c/Jarvis/utils/openclaw_relay_worker.py"])
+
+    def test_no_worker_when_turned_off(self):
+        mod._relay.close()
+        mod._relay = None
+        with patch.object(mod, "OPENCLAW_RELAY_PERSISTENT", False):
+            self.assertEqual(mod._warm_relay(), "one CLI process per call")
+        self.assertIsNone(mod._relay)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Unit tests for event-driven device readiness: the JarvisDeviceLoader Remote
+Script's /jarvis/device/loaded notification, VSTDiscoveryService waiting for
+it, and ReliableParameterController skipping its polling when it arrives.
+
+The Remote Script runs against small stand-ins for Live's track and browser
+objects; the client side talks to a local fake loader over UDP — no Ableton
+required.
+
+Run with:
+    python -m pytest tests/test_device_load_events.py -v
+"""
+
+import importlib
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.device_metadata import DeviceMetadataCache
+from ableton_controls.osc_codec import decode_message, encode_message
+from ableton_controls.reliable_params import ReliableParameterController
+from discovery.vst_discovery import VSTDiscoveryService
+from tests.test_response_mux import _free_port
+
+
+def _import_remote_script():
+    """Import the Remote Script with a placeholder for Live's module."""
+    with patch.dict(sys.modules, {"Live": types.ModuleType("Live")}):
+        module = importlib.import_module("ableton_remote_script.JarvisDeviceLoader")
+    return module.JarvisDeviceLoader
+
+
+class _Device:
+
+    def __init__(self, name, class_name, num_parameters, ptr):
+        self.name = name
+        self.class_name = class_name
+        self.parameters = [object()] * num_parameters
+        self._live_ptr = ptr
+
+
+class _Track:
+
+    def __init__(self, devices=()):
+        self.name = "Vox"
+        self.devices = list(devices)
+        self.listeners = []
+
+    def add_devices_listener(self, callback):
+        self.listeners.append(callback)
+
+    def devices_has_listener(self, callback):
+        return callback in self.listeners
+
+    def remove_devices_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def insert(self, index, device):
+        self.devices.insert(index, device)
+        for callback in list(self.listeners):
+            callback()
+
+
+class TestRemoteScriptLoadNotifications(unittest.TestCase):
+
+    def setUp(self):
+        loader_cls = _import_remote_script()
+        with patch.object(loader_cls, "_start_osc_listener"):
+            self.loader = loader_cls(MagicMock())
+        self.track = _Track([_Device("Utility", "StereoGain", 5, 1)])
+        self.loader._get_song = lambda: MagicMock(tracks=[self.track])
+        self.loader._get_browser = lambda: MagicMock()
+        self.loader._find_device_uri = lambda browser, name: "query:eq8"
+        self.scheduled = []
+        self.loader.schedule_message = lambda ticks, fn: self.scheduled.append(fn)
+        self.sent = []
+        self.loader._send_response = lambda addr, address, args: self.sent.append((address, args))
+
+    def test_devices_listener_reports_inserted_device(self):
+        with patch("time.sleep") as sleep:
+            result = self.loader._load_device_on_track(0, "EQ Eight")
+        self.assertEqual(result[:2], [1, "loading"])
+        sleep.assert_not_called()
+        self.assertEqual(self.sent, [])
+
+        # Live inserts the device after the selected one, not at the end
+        self.track.insert(0, _Device("EQ Eight", "Eq8", 43, 2))
+
+        self.assertEqual(self.sent, [("/jarvis/device/loaded", [0, "EQ Eight", 0, "EQ Eight", "Eq8", 43])])
+        self.assertEqual(self.loader._pending_loads[0], [])
+
+    def test_loads_parked_together_each_get_their_own_device(self):
+        self.loader._load_device_on_track(0, "EQ Eight", -1, "load-1")
+        self.loader._load_device_on_track(0, "Compressor", -1, "load-2")
+
+        self.track.insert(1, _Device("EQ Eight", "Eq8", 43, 2))
+        self.assertEqual(self.sent, [("/jarvis/device/loaded", [0, "load-1", 1, "EQ Eight", "Eq8", 43])])
+        self.assertEqual(len(self.loader._pending_loads[0]), 1)
+
+        self.track.insert(2, _Device("Compressor", "Compressor2", 20, 3))
+        self.assertEqual(self.sent[1], ("/jarvis/device/loaded", [0, "load-2", 2, "Compressor", "Compressor2", 20]))
+        self.assertEqual(self.loader._pending_loads[0], [])
+
+    def test_devices_added_in_one_pass_resolve_one_load_each(self):
+        self.loader._load_device_on_track(0, "EQ Eight")
+        self.loader._load_device_on_track(0, "Compressor")
+
+        self.track.devices += [_Device("EQ Eight", "Eq8", 43, 2), _Device("Compressor", "Compressor2", 20, 3)]
+        self.track.listeners[0]()
+
+        self.assertEqual([args[2] for _, args in self.sent], [1, 2])
+        self.assertEqual(self.loader._pending_loads[0], [])
+
+    def test_unchanged_device_list_reports_failure_on_timeout(self):
+        self.loader._load_device_on_track(0, "EQ Eight")
+        for fn in self.scheduled:
+            fn()
+
+        self.assertEqual(self.sent[0][0], "/jarvis/device/load/failed")
+        self.assertEqual(self.sent[0][1][:3], [0, "EQ Eight", "EQ Eight"])
+
+        self.loader.disconnect()
+        self.assertEqual(self.track.listeners, [])
+
+
+# Replaced by the load id the client sent with the load
+LOAD_ID = object()
+
+
+class _FakeDeviceLoader:
+    """UDP stand-in for JarvisDeviceLoader: accepts a load, then notifies."""
+
+    def __init__(self, reply_port, events):
+        self.reply_port = reply_port
+        self.events = events
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.2)
+        self.port = self.sock.getsockname()[1]
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while self._running:
+            try:
+                data, _ = self.sock.recvfrom(65535)
+            except (socket.timeout, OSError):
+                continue
+            address, args = decode_message(data)
+            if address == "/jarvis/test":  # capability probe: no request ids
+                self.sock.sendto(encode_message("/jarvis/test/response", ["ok"]),
+                                 ("127.0.0.1", self.reply_port))
+                continue
+            if address != "/jarvis/device/load":
+                continue
+            self.sock.sendto(encode_message("/jarvis/device/load/response",
+                                            [1, "loading", "Loading device: %s" % args[1]]),
+                             ("127.0.0.1", self.reply_port))
+            for event_address, event_args in self.events:
+                event_args = [args[3] if arg is LOAD_ID else arg for arg in event_args]
+                self.sock.sendto(encode_message(event_address, event_args),
+                                 ("127.0.0.1", self.reply_port))
+
+    def close(self):
+        self._running = False
+        self._thread.join(timeout=1.0)
+        self.sock.close()
+
+
+class TestDiscoveryAwaitsNotification(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.reply_port = _free_port()
+
+    def tearDown(self):
+        self.server.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _service(self, events):
+        self.server = _FakeDeviceLoader(self.reply_port, events)
+        service = VSTDiscoveryService(osc_send_port=self.server.port,
+                                      osc_recv_port=self.reply_port,
+                                      cache_file=os.path.join(self.tmpdir, "vst_cache.json"))
+        service.load_event_timeout = 2.0
+        return service
+
+    def test_load_returns_slot_from_notification(self):
+        service = self._service([
+            ("/jarvis/device/loaded", [3, LOAD_ID, 0, "Other", "Other", 1]),  # another track
+            ("/jarvis/device/loaded", [1, LOAD_ID, 2, "EQ Eight", "Eq8", 43]),
+        ])
+
+        result = service.load_device_on_track(1, "EQ Eight")
+
+        self.assertTrue(result["success"], result["message"])
+        self.assertEqual((result["device_index"], result["class_name"], result["num_parameters"]),
+                         (2, "Eq8", 43))
+
+    def test_failure_notification_is_not_recoverable(self):
+        service = self._service([
+            ("/jarvis/device/load/failed", [1, LOAD_ID, "EQ Eight", "Device load may have failed"]),
+        ])
+
+        result = service.load_device_on_track(1, "EQ Eight")
+
+        self.assertFalse(result["success"])
+        self.assertNotIn("timeout", result["message"].lower())
+
+    def test_late_event_from_an_earlier_load_is_ignored(self):
+        service = self._service([
+            # An earlier load on the same track expiring after we sent ours
+            ("/jarvis/device/load/failed", [1, "0123abcd4567", "EQ Eight", "Device load may have failed"]),
+            ("/jarvis/device/loaded", [1, LOAD_ID, 2, "EQ Eight", "Eq8", 43]),
+        ])
+
+        result = service.load_device_on_track(1, "EQ Eight")
+
+        self.assertTrue(result["success"], result["message"])
+        self.assertEqual(result["device_index"], 2)
+
+
+class TestReliableUsesNotification(unittest.TestCase):
+
+    def test_notified_load_skips_settle_delay_and_polling(self):
+        ableton = MagicMock()
+        ableton.device_metadata = DeviceMetadataCache()
+        ableton.get_num_devices_sync.return_value = {"success": True, "count": 0}
+        ableton.load_device.return_value = {
+            "success": True, "status": "loaded", "device_index": 0,
+            "device_name": "EQ Eight", "class_name": "Eq8", "num_parameters": 43,
+        }
+        reliable = ReliableParameterController(ableton)
+
+        with patch("ableton_controls.reliable_params.time.sleep") as sleep:
+            loaded = reliable.load_device_verified(0, "EQ Eight", min_delay=0.5)
+            ready = reliable.wait_for_device_ready(0, 0)
+
+        self.assertTrue(loaded["success"])
+        self.assertEqual(loaded["device_index"], 0)
+        self.assertTrue(ready)
+        sleep.assert_not_called()
+        self.assertEqual(ableton.get_num_devices_sync.call_count, 1)
+        ableton.get_device_parameters_name_sync.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the identity-keyed device metadata cache
+(ableton_controls/device_metadata.py), its parameter-name index and the
+controller's probe re-binding.
+
+Uses the local fake AbletonOSC UDP server from test_response_mux — no Ableton
+required.
+
+Run with:
+    python -m pytest tests/test_device_metadata.py -v
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.controller import AbletonController
+from ableton_controls.device_metadata import (
+    CachedDeviceInfo, DeviceMetadataCache, ParamNameIndex, device_key,
+)
+from ableton_controls.reliable_params import ParameterCache, ReliableParameterController
+from tests.test_response_mux import EQ_NAMES, _FakeAbletonOSC, _device_responder, _free_port
+
+
+def _fill(cache, track, device, class_name="Eq8", name="EQ Eight", names=None):
+    names = names or ["Gain", "Freq", "Q"]
+    return cache.set(track, device, name, names, [0.0] * len(names), [1.0] * len(names),
+                     class_name=class_name)
+
+
+class TestDeviceMetadataCache(unittest.TestCase):
+
+    def test_same_device_type_shares_one_entry(self):
+        cache = DeviceMetadataCache()
+        _fill(cache, 0, 1)
+        _fill(cache, 3, 0)
+
+        self.assertIs(cache.get(0, 1), cache.get(3, 0))
+        stats = cache.stats()
+        self.assertEqual((stats["total_entries"], stats["bound_slots"]), (1, 2))
+
+    def test_identity_includes_parameter_signature(self):
+        self.assertNotEqual(device_key("PluginDevice", ["A", "B"]),
+                            device_key("PluginDevice", ["A", "C"]))
+
+    def test_lru_eviction_unbinds_slots(self):
+        cache = DeviceMetadataCache(max_entries=2)
+        _fill(cache, 0, 0, class_name="A")
+        _fill(cache, 0, 1, class_name="B")
+        cache.get(0, 0)  # A is now most recently used
+        _fill(cache, 0, 2, class_name="C")
+
+        self.assertIsNotNone(cache.get(0, 0))
+        self.assertIsNone(cache.get(0, 1))
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertIsNone(cache.bind_probe(5, 5, "B", "EQ Eight", 3))
+
+    def test_delete_and_load_unbind_shifted_slots_only(self):
+        cache = DeviceMetadataCache()
+        for d in range(3):
+            _fill(cache, 0, d)
+        _fill(cache, 1, 0)
+
+        cache.on_device_deleted(0, 1)
+        self.assertIsNotNone(cache.get(0, 0))
+        self.assertIsNone(cache.get(0, 1))
+        self.assertIsNone(cache.get(0, 2))
+        self.assertIsNotNone(cache.get(1, 0))
+
+        cache.on_device_loaded(1)  # unknown insert position -> whole track
+        self.assertIsNone(cache.get(1, 0))
+        # The device type itself survives; only the slot bindings were dropped
+        self.assertEqual(cache.stats()["total_entries"], 1)
+
+    def test_bind_probe_reuses_known_type(self):
+        cache = DeviceMetadataCache()
+        self.assertEqual(cache.known_device_types(), 0)
+        info = _fill(cache, 0, 0)
+
+        self.assertIs(cache.bind_probe(2, 4, "Eq8", "EQ Eight", 3), info)
+        self.assertIs(cache.get(2, 4), info)
+        self.assertIsNone(cache.bind_probe(2, 5, "Eq8", "EQ Eight", 8))
+        self.assertEqual(cache.stats()["probe_hits"], 1)
+
+    def test_inaccessible_entries_are_slot_private_and_expire(self):
+        cache = DeviceMetadataCache()
+        cache.set(0, 0, "Serum", [], [], [], accessible=False, is_vst=True)
+        cache.set(0, 1, "Serum", [], [], [], accessible=False, is_vst=True)
+
+        self.assertIsNot(cache.get(0, 0), cache.get(0, 1))
+        self.assertEqual(cache.known_device_types(), 0)
+        with patch("ableton_controls.device_metadata.time.time", return_value=1e12):
+            self.assertIsNone(cache.get(0, 0))
+
+    def test_parameter_cache_alias_keeps_old_api(self):
+        cache = ParameterCache()
+        _fill(cache, 0, 0)
+        _fill(cache, 0, 1, class_name="Compressor2")
+
+        self.assertTrue(cache.invalidate(0, 0))
+        self.assertEqual(cache.invalidate_track(0), 1)
+        self.assertEqual(cache.clear(), 2)
+        self.assertIn("hits", cache.stats())
+
+
+def _linear_param_index(names, name):
+    """The scan ParamNameIndex replaces, kept as the reference behaviour."""
+    query = name.lower()
+    for test in (lambda n: n == query, lambda n: query in n, lambda n: n in query):
+        for i, param_name in enumerate(names):
+            if test(param_name.lower()):
+                return i
+    return None
+
+
+EQ8_NAMES = ["Device On"] + ["%d %s A" % (band, field) for band in range(1, 9)
+                             for field in ("Frequency", "Gain", "Resonance",
+                                           "Filter Type", "Filter On")] + ["Output Gain", "Scale"]
+
+
+class TestParamNameIndex(unittest.TestCase):
+
+    def test_matches_linear_scan(self):
+        index = ParamNameIndex(EQ8_NAMES)
+        queries = ["device on", "3 GAIN A", "gain", "freq", "8 filter", "on", "a", "",
+                   "output gain db", "xyz", "Scale factor", "1 Frequency A extra", "Resonance"]
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(index.lookup(query), _linear_param_index(EQ8_NAMES, query))
+
+    def test_cached_info_uses_index(self):
+        info = CachedDeviceInfo("EQ Eight", list(EQ8_NAMES), [0.0] * 43, [1.0] * 43, 0.0)
+
+        self.assertEqual(info.get_param_index("4 gain a"), EQ8_NAMES.index("4 Gain A"))
+        self.assertIs(info.name_index, info.name_index)
+
+    def test_alias_expansion_and_memoized_resolution(self):
+        cache = DeviceMetadataCache()
+        cache.set(0, 0, "EQ Eight", list(EQ8_NAMES), [0.0] * 43, [1.0] * 43, class_name="Eq8")
+        ableton = MagicMock()
+        ableton.device_metadata = cache
+        reliable = ReliableParameterController(ableton)
+
+        # "air" is an adaptive_layer alias for band4_gain_db
+        self.assertEqual(reliable.find_parameter_index(0, 0, "air"), EQ8_NAMES.index("4 Gain A"))
+        self.assertEqual(cache.get(0, 0).name_index.resolved["air"], EQ8_NAMES.index("4 Gain A"))
+
+        with patch.object(reliable, "_semantic_parameter_index") as semantic:
+            reliable.find_parameter_index(0, 0, "air")
+        semantic.assert_not_called()
+
+
+class TestControllerRebinding(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+
+        def responder(address, args):
+            self.requests.append(address)
+            return _device_responder(address, args)
+
+        self.server = _FakeAbletonOSC(batch_size=1, responder=responder)
+        self.ctrl = AbletonController(port=self.server.port, response_port=_free_port())
+        if self.ctrl.async_controller is None:
+            self.skipTest("could not bind response listener")
+
+    def tearDown(self):
+        self.ctrl.shutdown()
+        self.server.close()
+
+    def test_second_slot_of_same_type_is_bound_by_probe(self):
+        first = self.ctrl.get_device_metadata(0, 1)
+        self.assertEqual(first.param_names, EQ_NAMES)
+        self.assertEqual(first.param_maxs, [1.0, 1.0, 15.0, 18.0])
+
+        self.requests.clear()
+        second = self.ctrl.get_device_metadata(2, 0)
+
+        self.assertIs(second, first)
+        self.assertNotIn("/live/device/get/parameters/name", self.requests)
+        self.assertIn("/live/device/get/num_parameters", self.requests)
+
+    def test_cold_cache_skips_probe(self):
+        self.ctrl.get_device_metadata(0, 1)
+
+        self.assertNotIn("/live/device/get/num_parameters", self.requests)
+
+    def test_minmax_served_from_cache_until_device_deleted(self):
+        self.ctrl.get_device_parameters_minmax_sync(0, 1)
+        self.requests.clear()
+
+        result = self.ctrl.get_device_parameters_minmax_sync(0, 1)
+        self.assertTrue(result["success"])
+        self.assertEqual(self.requests, [])
+
+        self.ctrl.device_metadata.on_device_deleted(0, 0)
+        self.ctrl.get_device_parameters_minmax_sync(0, 1)
+        self.assertIn("/live/device/get/num_parameters", self.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent device parameter schema store
+(device_parameter_cache.DeviceParameterCache) and its use by the metadata
+cache, AbletonController, ReliableParameterController and the pipeline.
+
+Run with:
+    python -m pytest tests/test_device_schema_store.py -v
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.controller import AbletonController
+from ableton_controls.device_metadata import DeviceMetadataCache
+from ableton_controls.reliable_params import ReliableParameterController
+from device_parameter_cache import DEVICE_SCHEMA_VERSION, DeviceParameterCache
+from pipeline.executor import ChainPipelineExecutor
+from pipeline.schemas import ChainPipelinePlan, DeviceSpec, ParamSpec
+from tests.test_response_mux import EQ_NAMES, _FakeAbletonOSC, _device_responder, _free_port
+
+EQ8_NAMES = ["Device On"] + ["%d %s A" % (band, field) for band in range(1, 9)
+                             for field in ("Frequency", "Gain", "Resonance",
+                                           "Filter Type", "Filter On")]
+
+
+def _record_eq8(store, names=EQ8_NAMES):
+    return store.record_schema("Eq8", "EQ Eight", names,
+                               [0.0] * len(names), [1.0] * len(names))
+
+
+class _StoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "device_schemas.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+class TestSchemaStore(_StoreTestCase):
+
+    def test_schema_survives_restart_and_replaces_stock_map(self):
+        self.assertTrue(_record_eq8(DeviceParameterCache(store_path=self.path)))
+
+        store = DeviceParameterCache(store_path=self.path)
+        self.assertEqual(store.get_param_index("Eq8", "8 Filter On A"), 40)
+        self.assertIsNone(store.get_param_index("Eq8", "Band 1 On"))  # stock seed replaced
+        self.assertEqual(store.find_schema_by_device_name("eq eight").class_name, "Eq8")
+        # Stock maps for classes never met stay available
+        self.assertEqual(store.get_param_index("Compressor", "Threshold"), 1)
+
+    def test_unchanged_layout_is_not_rewritten(self):
+        store = DeviceParameterCache(store_path=self.path)
+        _record_eq8(store)
+        mtime = os.path.getmtime(self.path)
+        os.utime(self.path, (mtime - 100, mtime - 100))
+
+        self.assertFalse(_record_eq8(store))
+        self.assertEqual(os.path.getmtime(self.path), mtime - 100)
+
+    def test_plugins_are_keyed_by_class_and_name(self):
+        store = DeviceParameterCache(store_path=self.path)
+        store.record_schema("PluginDevice", "Pro-Q 3", ["Gain"], [0.0], [1.0])
+        store.record_schema("PluginDevice", "Serum", ["Macro 1", "Macro 2"], [0, 0], [1, 1])
+
+        self.assertEqual(store.get_schema("PluginDevice", "Serum").names, ["Macro 1", "Macro 2"])
+        self.assertEqual(len(store.list_schemas()), 2)
+
+    def test_other_versions_and_corrupt_files_are_ignored(self):
+        with open(self.path, "w") as f:
+            json.dump({"version": DEVICE_SCHEMA_VERSION + 1, "devices": {}}, f)
+        self.assertEqual(DeviceParameterCache(store_path=self.path).list_schemas(), [])
+
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        self.assertEqual(DeviceParameterCache(store_path=self.path).list_schemas(), [])
+
+    def test_quantization_is_kept_when_ranges_are_rerecorded(self):
+        store = DeviceParameterCache(store_path=self.path)
+        store.record_schema("Eq8", "EQ Eight", ["On", "Freq"], [0, 0], [1, 1], quantized=[True, False])
+        store.record_schema("Eq8", "EQ Eight", ["On", "Freq"], [0, 10], [1, 22000])
+
+        reloaded = DeviceParameterCache(store_path=self.path).get_schema("Eq8")
+        self.assertEqual(reloaded.quantized, [True, False])
+        self.assertEqual(reloaded.maxs, [1.0, 22000.0])
+
+
+class TestSeededMetadata(_StoreTestCase):
+
+    def test_cold_start_resolves_known_device_without_osc(self):
+        _record_eq8(DeviceParameterCache(store_path=self.path))
+        ableton = MagicMock()
+        ableton.device_metadata = DeviceMetadataCache(
+            schema_store=DeviceParameterCache(store_path=self.path))
+        ableton.get_num_devices_sync.side_effect = [{"success": True, "count": 0},
+                                                    {"success": True, "count": 1}]
+        ableton.load_device.return_value = {"success": True}
+        reliable = ReliableParameterController(ableton)
+
+        with patch("ableton_controls.reliable_params.time.sleep"):
+            loaded = reliable.load_device_verified(0, "EQ Eight", min_delay=0)
+        index = reliable.find_parameter_index(0, 0, "band8_gain_db")
+
+        self.assertTrue(loaded["success"])
+        self.assertEqual(index, EQ8_NAMES.index("8 Gain A"))
+        ableton.get_device_state_snapshot.assert_not_called()
+        ableton.bind_device_metadata.assert_not_called()
+
+    def test_new_layouts_are_recorded(self):
+        store = DeviceParameterCache(store_path=self.path)
+        cache = DeviceMetadataCache(schema_store=store)
+        cache.set(0, 0, "Utility", ["Gain", "Mute"], [0.0, 0.0], [1.0, 1.0], class_name="StereoGain")
+
+        self.assertEqual(DeviceParameterCache(store_path=self.path).get_schema("StereoGain").names,
+                         ["Gain", "Mute"])
+        self.assertFalse(cache.needs_quantization("Eq8", "EQ Eight"))
+        self.assertTrue(cache.needs_quantization("StereoGain", "Utility"))
+
+
+class TestControllerQuantization(_StoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        def responder(address, args):
+            if address == "/live/device/get/parameters/is_quantized":
+                return [args[0], args[1], 1, 0, 0, 0]
+            return _device_responder(address, args)
+
+        self.server = _FakeAbletonOSC(batch_size=1, responder=responder)
+        self.store = DeviceParameterCache(store_path=self.path)
+        self.ctrl = AbletonController(port=self.server.port, response_port=_free_port(),
+                                      schema_store=self.store)
+        if self.ctrl.async_controller is None:
+            self.skipTest("could not bind response listener")
+
+    def tearDown(self):
+        self.ctrl.shutdown()
+        self.server.close()
+        super().tearDown()
+
+    def test_first_snapshot_records_full_schema_with_quantization(self):
+        self.ctrl.get_device_state_snapshot(0, 1)
+
+        schema = DeviceParameterCache(store_path=self.path).get_schema("Eq8")
+        self.assertEqual(schema.names, EQ_NAMES)
+        self.assertEqual(schema.quantized, [True, False, False, False])
+        self.assertEqual(self.ctrl.device_metadata.get(0, 1).param_quantized,
+                         [True, False, False, False])
+
+
+class TestPipelineDryRun(_StoreTestCase):
+
+    def test_dry_run_flags_params_missing_from_known_layout(self):
+        _record_eq8(DeviceParameterCache(store_path=self.path))
+        ableton = MagicMock()
+        ableton.device_metadata = DeviceMetadataCache(
+            schema_store=DeviceParameterCache(store_path=self.path))
+        ableton.get_track_list.return_value = {"success": True, "tracks": [{"name": "Vox"}]}
+        executor = ChainPipelineExecutor(controller=ableton,
+                                         reliable=ReliableParameterController(ableton))
+        plan = ChainPipelinePlan(track_index=0, dry_run=True, devices=[
+            DeviceSpec(name="EQ Eight", params=[ParamSpec(name="band1_freq_hz", value=200.0),
+                                                ParamSpec(name="band9_gain", value=1.0)]),
+        ])
+
+        result = executor.execute(plan)
+
+        self.assertTrue(result.success)
+        self.assertEqual([p.success for p in result.devices[0].params], [True, False])
+        self.assertEqual(len(result.warnings), 1)
+        ableton.get_device_state_snapshot.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
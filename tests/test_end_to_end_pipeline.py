@@ -627,8 +627,8 @@ class TestPluginAvailabilityFallback(unittest.TestCase):
         mock_ab = MagicMock()
         mock_ab.load_device.return_value = {"success": True, "message": "ok"}
         ex = self._make_executor(mock_ab)
-        result = ex._dispatch_command(mock_ab, "add_device",
-                                      {"device": "CLA-76"}, 0, None)
+        result = run_async(ex._dispatch_command(mock_ab, "add_device",
+                                                {"device": "CLA-76"}, 0, None))
         self.assertTrue(result["success"])
         self.assertEqual(result["loaded_device"], "CLA-76")
         self.assertFalse(result["is_fallback"])
@@ -645,8 +645,8 @@ class TestPluginAvailabilityFallback(unittest.TestCase):
             {"success": True, "message": "ok"},           # Compressor (stock)
         ]
         ex = self._make_executor(mock_ab)
-        result = ex._dispatch_command(mock_ab, "add_device",
-                                      {"device": "CLA-76"}, 0, None)
+        result = run_async(ex._dispatch_command(mock_ab, "add_device",
+                                                {"device": "CLA-76"}, 0, None))
         self.assertTrue(result["success"])
         self.assertEqual(result["loaded_device"], "Compressor")
         self.assertTrue(result["is_fallback"])
@@ -657,8 +657,8 @@ class TestPluginAvailabilityFallback(unittest.TestCase):
         mock_ab = MagicMock()
         mock_ab.load_device.return_value = {"success": False, "message": "nope"}
         ex = self._make_executor(mock_ab)
-        result = ex._dispatch_command(mock_ab, "add_device",
-                                      {"device": "CLA-76"}, 0, None)
+        result = run_async(ex._dispatch_command(mock_ab, "add_device",
+                                                {"device": "CLA-76"}, 0, None))
         self.assertFalse(result["success"])
         self.assertTrue(result["is_fallback"])
         self.assertIsNone(result["loaded_device"])
@@ -671,9 +671,9 @@ class TestPluginAvailabilityFallback(unittest.TestCase):
             {"success": True, "message": "ok"},
         ]
         ex = self._make_executor(mock_ab)
-        result = ex._dispatch_command(mock_ab, "add_device",
-                                      {"device": "MyPlugin", "fallbacks": ["Reverb"]},
-                                      0, None)
+        result = run_async(ex._dispatch_command(mock_ab, "add_device",
+                                                {"device": "MyPlugin", "fallbacks": ["Reverb"]},
+                                                0, None))
         self.assertTrue(result["success"])
         self.assertEqual(result["loaded_device"], "Reverb")
 
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the fuzzy plugin-name index (discovery/fuzzy_index.py) and
+its use in PluginNameResolver and VSTDiscoveryService.find_plugins:
+candidate pruning, agreement with a full scan, the resolve LRU and
+rebuilding on reload/refresh.
+
+Run with:
+    python -m pytest tests/test_fuzzy_index.py -v
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from discovery import vst_discovery
+from discovery.fuzzy_index import FuzzyNameIndex, tokenize
+from discovery.plugin_name_resolver import PluginNameResolver
+from discovery.vst_discovery import VSTDiscoveryService
+
+_NAMES = ["EQ Eight", "EQ Three", "Compressor", "Glue Compressor", "Reverb",
+          "FabFilter Pro-Q 3", "FabFilter Pro-C 2", "Soothe2", "CLA-76", "Utility"]
+# Padding so pruning has something to prune
+_NAMES += [f"Vendor{n} Synth{n}" for n in range(200)]
+
+
+def _write_cache(path, names, **extra):
+    with open(path, "w") as f:
+        json.dump({"plugins": [dict({"name": n, "type": "plugin", "category": "unknown"}, **extra)
+                               for n in names]}, f)
+
+
+class TestFuzzyNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = FuzzyNameIndex([[n.lower()] for n in _NAMES])
+
+    def test_tokenize_splits_separators_and_digits(self):
+        self.assertEqual(tokenize("FabFilter Pro-Q3"), ["fabfilter", "pro", "q", "3"])
+        self.assertEqual(tokenize("soothe_2"), ["soothe", "2"])
+
+    def test_candidates_include_substring_and_token_matches_only(self):
+        found = {_NAMES[i] for i in self.index.candidates("pro-q")}
+
+        self.assertIn("FabFilter Pro-Q 3", found)
+        self.assertIn("FabFilter Pro-C 2", found)  # shares the "pro" token
+        self.assertNotIn("Vendor7 Synth7", found)
+        self.assertLess(len(found), 10)
+
+    def test_short_queries_and_keys_are_never_pruned(self):
+        index = FuzzyNameIndex([["eq"], ["reverb"], ["delay", "dl"]])
+
+        self.assertEqual(index.candidates("q"), [0, 1, 2])
+        self.assertEqual(index.candidates("reverb"), [0, 1, 2])
+
+    def test_aliases_are_indexed_with_their_entry(self):
+        index = FuzzyNameIndex([["eq eight", "eq8"], ["compressor"]])
+
+        self.assertEqual(index.candidates("eq8 please"), [0])
+        self.assertEqual(index.keys[0], ("eq eight", "eq8"))
+        self.assertEqual(index.sorted_tokens[0], "eight eq")
+
+
+class TestResolverIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = os.path.join(self.tmp, "vst_cache.json")
+        _write_cache(self.cache, _NAMES)
+        self.resolver = PluginNameResolver(os.path.join(self.tmp, "none.json"), self.cache)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _full_scan(self, query, threshold):
+        scored = [(self.resolver._calculate_similarity(query.lower(), n.lower()), n)
+                  for n in _NAMES]
+        scored = sorted([s for s in scored if s[0] >= threshold], key=lambda s: s[0], reverse=True)
+        return (scored[0][1], scored[0][0], [n for _, n in scored[1:4]]) if scored else (None, 0.0, [])
+
+    def test_fuzzy_match_agrees_with_full_scan(self):
+        for query in ["pro q 3", "fabfilter proq", "glue comp", "compresor", "eq 8",
+                      "cla 76", "soothe", "utilty", "reverbb", "vendor12 synth"]:
+            for threshold in (0.55, 0.7, 0.85):
+                with self.subTest(query=query, threshold=threshold):
+                    self.assertEqual(self.resolver._fuzzy_match(query, threshold),
+                                     self._full_scan(query, threshold))
+
+    def test_fuzzy_match_scores_only_pruned_candidates(self):
+        with patch.object(self.resolver, "_score", wraps=self.resolver._score) as score:
+            self.resolver._fuzzy_match("fabfilter pro-q", 0.7)
+
+        self.assertLess(score.call_count, 20)
+
+    def test_resolve_is_memoized_per_case_insensitive_query(self):
+        first = self.resolver.resolve("Pro Q 3")
+        with patch.object(self.resolver, "_fuzzy_match") as fuzzy:
+            second = self.resolver.resolve("pro q 3 ")
+        fuzzy.assert_not_called()
+
+        self.assertEqual(second.resolved_name, first.resolved_name)
+        self.assertEqual(second.original_query, "pro q 3")
+        second.alternatives.append("mutated")
+        self.assertNotIn("mutated", self.resolver.resolve("Pro Q 3").alternatives)
+
+    def test_resolve_cache_is_bounded(self):
+        self.resolver.resolve_cache_size = 3
+        for query in ["a1", "b2", "c3", "d4"]:
+            self.resolver.resolve(query)
+
+        self.assertEqual(len(self.resolver._resolve_cache), 3)
+        self.assertNotIn(("a1", False), self.resolver._resolve_cache)
+
+    def test_concurrent_resolves_keep_the_cache_bounded(self):
+        self.resolver.resolve_cache_size = 8
+        queries = [f"synth{n}" for n in range(40)]
+        errors = []
+
+        def worker(offset):
+            try:
+                for query in queries[offset:] + queries[:offset]:
+                    self.resolver.resolve(query)
+            except Exception as e:  # e.g. "OrderedDict mutated during iteration"
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n * 5,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.resolver._resolve_cache), 8)
+
+    def test_reload_rebuilds_index_and_drops_cached_results(self):
+        self.assertEqual(self.resolver.resolve("ozone 11").resolution_tier, "not_found")
+        _write_cache(self.cache, _NAMES + ["Ozone 11 Equalizer"])
+
+        self.resolver.reload()
+
+        result = self.resolver.resolve("ozone 11")
+        self.assertEqual(result.resolved_name, "Ozone 11 Equalizer")
+
+
+class TestFindPluginsIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = os.path.join(self.tmp, "vst_cache.json")
+        _write_cache(self.cache, _NAMES, category="eq")
+        self.vst = VSTDiscoveryService(cache_file=self.cache)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_find_plugins_matches_full_matches_query_scan(self):
+        for query in ["Pro-Q", "fabfilter eq", "compressor", "glue"]:
+            with self.subTest(query=query):
+                scored = sorted(((p.matches_query(query), p) for p in self.vst._plugins
+                                 if p.matches_query(query) >= 0.5),
+                                key=lambda s: s[0], reverse=True)
+                self.assertEqual([p.name for p in self.vst.find_plugins(query, min_score=0.5)],
+                                 [p.name for _, p in scored[:5]])
+
+    def test_find_plugins_filters_category_and_uses_aliases(self):
+        self.vst._plugins[0].aliases = ["EQ8"]
+        self.vst._plugins[0].category = "filter"
+        self.vst._build_category_index()
+
+        self.assertEqual(self.vst.find_plugins("eq8", category="filter")[0].name, "EQ Eight")
+        self.assertEqual(self.vst.find_plugins("eq8", category="eq", min_score=0.8), [])
+
+    def test_refresh_reloads_the_resolver_reading_the_same_cache(self):
+        resolver = PluginNameResolver(os.path.join(self.tmp, "none.json"), self.cache)
+        with patch.object(vst_discovery, "_resolver", resolver), \
+                patch.object(resolver, "reload") as reload:
+            self.vst._install_plugins([], [{"name": "New Plugin"}], "", {})
+        reload.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
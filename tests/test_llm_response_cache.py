@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent LLM response cache (research/llm_response_cache.py)
+and its use by the research clients: hits across restarts, per-model TTLs,
+LRU size bound, hit/miss counters and zero API calls on a cached prompt.
+
+Run with:
+    python -m pytest tests/test_llm_response_cache.py -v
+"""
+
+import asyncio
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from research import llm_response_cache
+from research.llm_client import GeminiClient, ResearchLLMClient
+from research.llm_response_cache import (
+    LLMResponseCache, build_cache_key, get_llm_response_cache, parse_model_ttls,
+)
+
+
+class TestLLMResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "llm.sqlite3")
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            cache.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _cache(self, **kwargs):
+        cache = LLMResponseCache(self.path, **kwargs)
+        self.caches.append(cache)
+        return cache
+
+    def test_responses_survive_a_restart(self):
+        key = build_cache_key("extract settings", "system", "gemini-2.0-flash")
+        self._cache().put(key, "gemini-2.0-flash", "EQ Eight", tokens_used=12)
+
+        reopened = self._cache()
+
+        self.assertEqual(reopened.get_entry(key),
+                         {"content": "EQ Eight", "model": "gemini-2.0-flash", "tokens_used": 12})
+        self.assertEqual(reopened.get_stats()["hits"], 1)
+
+    def test_key_is_content_addressed(self):
+        self.assertEqual(build_cache_key("p", "s", "m"), build_cache_key("p", "s", "m"))
+        self.assertNotEqual(build_cache_key("p", "s", "m"), build_cache_key("p", "s", "m2"))
+        self.assertNotEqual(build_cache_key("p", None, "m"), build_cache_key("p", "s", "m"))
+
+    def test_per_model_ttl_uses_longest_prefix(self):
+        cache = self._cache(default_ttl=100, model_ttls=parse_model_ttls("gpt=10,gpt-4o=20,bad,x=y"))
+
+        self.assertEqual(cache.ttl_for("gpt-4o-mini"), 20)
+        self.assertEqual(cache.ttl_for("gpt-3.5"), 10)
+        self.assertEqual(cache.ttl_for("gemini-2.0-flash"), 100)
+
+    def test_expired_entries_are_misses(self):
+        cache = self._cache(model_ttls={"fast": 60})
+        cache.put("k", "fast-model", "old answer")
+
+        with patch("research.llm_response_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.get("k"))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["expired"], stats["misses"], stats["entries"]), (1, 1, 0))
+
+    def test_zero_ttl_models_are_not_stored(self):
+        cache = self._cache(model_ttls={"live": 0})
+        cache.put("k", "live-model", "answer")
+        self.assertIsNone(cache.get("k"))
+
+    def test_size_bound_evicts_least_recently_used(self):
+        cache = self._cache(max_bytes=250)
+        cache.put("a", "m", "a" * 100)
+        cache.put("b", "m", "b" * 100)
+        time.sleep(0.01)
+        cache.get("a")
+        cache.put("c", "m", "c" * 100)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertLessEqual(cache.get_stats()["bytes"], 250)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_hits_write_access_times_back_in_batches(self):
+        cache = self._cache()
+        cache.put("k", "m", "answer")
+        written = lambda: sqlite3.connect(self.path).execute(
+            "SELECT last_access FROM responses WHERE key = 'k'").fetchone()[0]
+        stored = written()
+
+        with patch("research.llm_response_cache.time.time", return_value=stored + 60):
+            cache.get("k")
+        self.assertEqual(written(), stored)  # the hit did not write
+
+        cache.flush()
+        self.assertEqual(written(), stored + 60)
+
+    def test_hit_only_pending_in_memory_still_protects_from_eviction(self):
+        cache = self._cache(max_bytes=250)
+        cache.put("a", "m", "a" * 100)
+        cache.put("b", "m", "b" * 100)
+        with patch("research.llm_response_cache.time.time", return_value=time.time() + 60):
+            cache.get("a")
+        cache.put("c", "m", "c" * 100)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+
+class TestSharedCache(unittest.TestCase):
+
+    def test_open_failure_is_logged_once_and_not_retried(self):
+        error = sqlite3.OperationalError("unable to open database file")
+        with patch.object(llm_response_cache, "_cache", None), \
+                patch.object(llm_response_cache, "_cache_failed", False), \
+                patch.dict(os.environ, {"RESEARCH_LLM_CACHE": "1"}), \
+                patch.object(llm_response_cache, "LLMResponseCache", side_effect=error) as opener:
+            with self.assertLogs("jarvis.research.llm_response_cache", "WARNING") as logs:
+                self.assertIsNone(get_llm_response_cache())
+            self.assertIsNone(get_llm_response_cache())
+
+        self.assertEqual(opener.call_count, 1)
+        self.assertEqual(len(logs.records), 1)
+
+
+class _FakeResponse:
+    text = "cached reply"
+
+
+class TestClientsUseTheCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = LLMResponseCache(os.path.join(self.tmp, "llm.sqlite3"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _client(self, model):
+        client = GeminiClient(api_key="test-key")
+        client.response_cache = self.cache
+        client._models["gemini-2.0-flash"] = model
+        return client
+
+    def test_repeat_prompt_after_restart_makes_no_api_call(self):
+        model = AsyncMock()
+        model.generate_content_async.return_value = _FakeResponse()
+
+        first = asyncio.run(ResearchLLMClient(self._client(model))._generate_with_fallback("extract", "sys"))
+        second = asyncio.run(ResearchLLMClient(self._client(model))._generate_with_fallback("extract", "sys"))
+
+        self.assertEqual(model.generate_content_async.await_count, 1)
+        self.assertEqual((first.content, second.content), ("cached reply", "cached reply"))
+        self.assertEqual(second.model, "gemini-2.0-flash")
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+
+    def test_cache_is_read_and_written_off_the_event_loop(self):
+        model = AsyncMock()
+        model.generate_content_async.return_value = _FakeResponse()
+        client = self._client(model)
+        threads = []
+        for name in ("get_entry", "put"):
+            original = getattr(self.cache, name)
+
+            def record(*args, _original=original, **kwargs):
+                threads.append(threading.current_thread())
+                return _original(*args, **kwargs)
+            setattr(self.cache, name, record)
+
+        asyncio.run(client.generate("extract"))
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_failed_responses_are_not_cached(self):
+        model = AsyncMock()
+        model.generate_content_async.side_effect = [RuntimeError("boom"), _FakeResponse()]
+        client = self._client(model)
+
+        self.assertFalse(asyncio.run(client.generate("extract")).success)
+        self.assertTrue(asyncio.run(client.generate("extract")).success)
+        self.assertEqual(model.generate_content_async.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
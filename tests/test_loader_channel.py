@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared JarvisDeviceLoader request channel
+(ableton_controls/loader_channel.py): one bound reply port for concurrent
+callers, request-id matching, the plain-message fallback for older Remote
+Scripts and the in-flight limit.
+
+Uses a local fake loader over UDP — no Ableton required.
+
+Run with:
+    python -m pytest tests/test_loader_channel.py -v
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.loader_channel import LoaderChannel
+from ableton_controls.osc_codec import decode_message, encode_message
+from tests.test_response_mux import _free_port
+
+
+class _FakeLoader:
+    """
+    Echoes ``/x [n]`` as ``/x/response [n]`` after ``delays[n]`` seconds, in
+    its own thread, so replies come back out of order. With
+    ``answer_test=False`` the capability probe goes unanswered.
+    """
+
+    def __init__(self, reply_port, ids=True, delays=None, answer_test=True):
+        self.reply_port = reply_port
+        self.ids = ids
+        self.answer_test = answer_test
+        self.delays = delays or {}
+        self.received = []
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.2)
+        self.port = self.sock.getsockname()[1]
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _reply(self, address, args, delay):
+        time.sleep(delay)
+        try:
+            self.sock.sendto(encode_message(address, args), ("127.0.0.1", self.reply_port))
+        except OSError:
+            pass  # closed while the reply was delayed
+
+    def _serve(self):
+        while self._running:
+            try:
+                data, _ = self.sock.recvfrom(65535)
+            except (socket.timeout, OSError):
+                continue
+            address, args = decode_message(data)
+            self.received.append(address)
+            if address == "/jarvis/test":
+                if not self.answer_test:
+                    continue
+                caps = ["ok", "req"] if self.ids else ["ok"]
+                self._reply("/jarvis/test/response", caps, 0)
+                continue
+            if address == "/jarvis/req" and self.ids:
+                request_id, address, args = args[0], args[1], args[2:]
+                reply = ("/jarvis/reply", [request_id, address + "/response"] + args)
+            else:
+                reply = (address + "/response", args)
+            delay = self.delays.get(args[0] if args else None, 0)
+            threading.Thread(target=self._reply, args=reply + (delay,), daemon=True).start()
+
+    def close(self):
+        self._running = False
+        self._thread.join(timeout=1.0)
+        self.sock.close()
+
+
+class TestLoaderChannel(unittest.TestCase):
+
+    def setUp(self):
+        self.reply_port = _free_port()
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.close()
+
+    def _channel(self, max_in_flight=4, **server_kwargs):
+        self.server = _FakeLoader(self.reply_port, **server_kwargs)
+        self.channel = LoaderChannel("127.0.0.1", self.server.port, self.reply_port, max_in_flight)
+        return self.channel
+
+    def _concurrent(self, channel, values, timeout=2.0):
+        results = {}
+
+        def call(n):
+            results[n] = channel.request("/jarvis/echo", [n], timeout=timeout)
+
+        threads = [threading.Thread(target=call, args=(n,)) for n in values]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_concurrent_requests_share_one_port_and_match_by_id(self):
+        channel = self._channel(delays={1: 0.3, 2: 0.1})
+
+        results = self._concurrent(channel, [1, 2, 3])
+
+        for n in (1, 2, 3):
+            self.assertEqual(results[n], ("/jarvis/echo/response", [n]))
+        self.assertTrue(channel.get_stats()["ids_supported"])
+        self.assertEqual(self.server.received.count("/jarvis/req"), 3)
+        self.assertEqual(self.server.received.count("/jarvis/test"), 1)  # one probe, shared
+
+    def test_late_reply_is_not_handed_to_the_next_caller(self):
+        channel = self._channel(delays={1: 0.4})
+
+        self.assertIsNone(channel.request("/jarvis/echo", [1], timeout=0.1))
+        time.sleep(0.05)
+        reply = channel.request("/jarvis/echo", [2], timeout=1.0)
+        time.sleep(0.4)  # the reply to the abandoned request arrives now
+
+        self.assertEqual(reply, ("/jarvis/echo/response", [2]))
+        self.assertEqual(channel.get_stats()["timeouts"], 1)
+
+    def test_plain_messages_for_scripts_without_ids(self):
+        channel = self._channel(ids=False)
+
+        results = self._concurrent(channel, [1, 2])
+
+        self.assertEqual(sorted(r[1] for r in results.values()), [[1], [2]])
+        self.assertFalse(channel.get_stats()["ids_supported"])
+        self.assertNotIn("/jarvis/req", self.server.received)
+
+    def test_unanswered_probe_is_not_repeated_for_every_request(self):
+        channel = self._channel(answer_test=False)
+
+        first = channel.request("/jarvis/echo", [1], timeout=2.0)
+        second = channel.request("/jarvis/echo", [2], timeout=2.0)
+
+        self.assertEqual((first[1], second[1]), ([1], [2]))
+        self.assertEqual(self.server.received.count("/jarvis/test"), 1)
+        self.assertIsNone(channel.get_stats()["ids_supported"])
+
+    def test_probe_and_reply_share_one_deadline(self):
+        channel = self._channel(answer_test=False, delays={1: 1.0})
+
+        started = time.monotonic()
+        self.assertIsNone(channel.request("/jarvis/echo", [1], timeout=0.3))
+
+        self.assertLess(time.monotonic() - started, 0.45)
+
+    def test_in_flight_limit(self):
+        channel = self._channel(max_in_flight=1, delays={1: 0.5})
+        channel.request("/jarvis/test", [])  # negotiate up front
+
+        slow = threading.Thread(target=channel.request, args=("/jarvis/echo", [1], 2.0))
+        slow.start()
+        time.sleep(0.1)
+
+        self.assertIsNone(channel.request("/jarvis/echo", [2], timeout=0.1))
+        slow.join()
+        self.assertEqual(channel.get_stats()["saturated"], 1)
+        self.assertEqual(channel.request("/jarvis/echo", [3], timeout=1.0)[1], [3])
+
+    def test_expect_receives_notifications_for_its_prefix(self):
+        channel = self._channel()
+        events = channel.expect(["/jarvis/device/loaded"], [1])
+
+        channel.request("/jarvis/echo", [0])
+        channel._sock.sendto(encode_message("/jarvis/device/loaded", [3, 0, "Other"]),
+                             ("127.0.0.1", self.reply_port))
+        channel._sock.sendto(encode_message("/jarvis/device/loaded", [1, 2, "EQ Eight"]),
+                             ("127.0.0.1", self.reply_port))
+
+        self.assertEqual(channel.wait(events, 1.0), ("/jarvis/device/loaded", [1, 2, "EQ Eight"]))
+
+    def test_second_channel_on_the_same_port_is_refused(self):
+        self._channel().start()
+
+        with self.assertRaises(OSError):
+            LoaderChannel("127.0.0.1", self.server.port, self.reply_port).start()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the queued logging backend (logging_config.py) and the
+engine's log() helper: deferred formatting, level gating, the JSON-lines
+sink with structured fields, and flushing on shutdown.
+
+Run with:
+    python -m pytest tests/test_logging_backend.py -v
+"""
+
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+import logging_config
+from logging_config import LazyQueueHandler, setup_logging, shutdown_logging
+
+
+class _Expensive:
+    """Counts how often it is formatted"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "expensive"
+
+
+class TestLoggingBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root = logging.getLogger("jarvis")
+        self.saved = (list(self.root.handlers), self.root.level, logging_config._listener)
+        logging_config._listener = None  # leave the session's listener running
+
+    def tearDown(self):
+        shutdown_logging()
+        handlers, level, listener = self.saved
+        self.root.handlers[:] = handlers
+        self.root.setLevel(level)
+        logging_config._listener = listener
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _setup(self, **kwargs):
+        kwargs.setdefault("log_file", os.path.join(self.tmp, "jarvis.log"))
+        kwargs.setdefault("console_level", logging.CRITICAL)
+        setup_logging(**kwargs)
+
+    def _read(self, name):
+        with open(os.path.join(self.tmp, name), encoding="utf-8") as f:
+            return f.read()
+
+    def test_records_are_queued_and_written_by_the_listener(self):
+        self._setup()
+
+        self.assertEqual([type(h) for h in self.root.handlers], [LazyQueueHandler])
+        logging.getLogger("jarvis.test").info("hello %s", "queue")
+        shutdown_logging()
+
+        self.assertIn("jarvis.test - INFO - hello queue", self._read("jarvis.log"))
+
+    def test_formatting_is_deferred_to_the_listener(self):
+        self._setup()
+        handler = self.root.handlers[0]
+
+        record = logging.LogRecord("jarvis.test", logging.INFO, "", 0, "x=%s n=%d", ("a", 3), None)
+        prepared = handler.prepare(record)
+
+        self.assertIs(prepared, record)
+        self.assertEqual((record.msg, record.args), ("x=%s n=%d", ("a", 3)))
+
+    def test_mutable_args_are_snapshotted_on_the_calling_thread(self):
+        self._setup()
+        value, params = _Expensive(), {"gain": 1.0}
+        handler = self.root.handlers[0]
+
+        record = logging.LogRecord("jarvis.test", logging.INFO, "", 0, "%s %s", (value, params), None)
+        handler.prepare(record)
+        params["gain"] = 2.0
+
+        self.assertEqual(value.formatted, 1)
+        self.assertEqual(record.getMessage(), "expensive {'gain': 1.0}")
+
+    def test_unknown_level_names_fall_back_to_info(self):
+        self.assertEqual(logging_config.parse_level("debug"), logging.DEBUG)
+        with self.assertLogs("jarvis", logging.WARNING):
+            self.assertEqual(logging_config.parse_level("verbose"), logging.INFO)
+
+    def test_logger_level_is_the_lowest_sink_level(self):
+        self._setup(console_level=logging.WARNING, file_level=logging.INFO)
+        self.assertFalse(self.root.isEnabledFor(logging.DEBUG))
+
+        self._setup(console_level=logging.WARNING, file_level=logging.INFO,
+                    json_file=os.path.join(self.tmp, "jarvis.jsonl"), json_level=logging.DEBUG)
+        self.assertTrue(self.root.isEnabledFor(logging.DEBUG))
+
+    def test_json_lines_sink_writes_structured_fields(self):
+        self._setup(json_file=os.path.join(self.tmp, "jarvis.jsonl"))
+
+        logging.getLogger("jarvis.engine").info(
+            "[OK] %s", "mute_track", extra={"tool": "mute_track", "track": 2, "latency_ms": 4.5})
+        shutdown_logging()
+
+        entries = [json.loads(line) for line in self._read("jarvis.jsonl").splitlines()]
+        entry = entries[-1]
+        self.assertEqual(entry["msg"], "[OK] mute_track")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["logger"], "jarvis.engine")
+        self.assertEqual((entry["tool"], entry["track"], entry["latency_ms"]), ("mute_track", 2, 4.5))
+
+    def test_synchronous_mode_attaches_handlers_directly(self):
+        self._setup(use_queue=False)
+
+        self.assertNotIn(LazyQueueHandler, [type(h) for h in self.root.handlers])
+        self.assertIsNone(logging_config._listener)
+
+
+class TestEngineLog(unittest.TestCase):
+
+    def setUp(self):
+        import jarvis_engine
+        self.engine = jarvis_engine
+        self.logger = jarvis_engine._engine_logger
+        self.saved_level = self.logger.level
+
+    def tearDown(self):
+        self.logger.setLevel(self.saved_level)
+
+    def test_disabled_levels_skip_formatting(self):
+        self.logger.setLevel(logging.INFO)
+        value = _Expensive()
+
+        with patch.object(self.logger, "log") as emit:
+            self.engine.log("    Result: %s", "DEBUG", value, tool="x")
+
+        emit.assert_not_called()
+        self.assertEqual(value.formatted, 0)
+        self.assertFalse(self.engine.log_enabled("DEBUG"))
+
+    def test_prefixes_args_and_fields(self):
+        self.logger.setLevel(logging.DEBUG)
+
+        with self.assertLogs("jarvis.engine", level="DEBUG") as logs:
+            self.engine.log("tool %s", "WARN", "mute_track", tool="mute_track", latency_ms=3.0)
+
+        record = logs.records[0]
+        self.assertEqual(record.getMessage(), "[WARN] tool mute_track")
+        self.assertEqual(record.levelno, logging.WARNING)
+        self.assertEqual((record.tool, record.latency_ms), ("mute_track", 3.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared OSC codec (ableton_controls/osc_codec.py).
+
+Covers round trips for every supported type, byte-for-byte compatibility
+with the hand-rolled encoder it replaced, bundles (including interop with
+python-osc) and the vendored copy shipped with the remote script.
+
+Run with:
+    python -m pytest tests/test_osc_codec.py -v
+"""
+
+import math
+import os
+import struct
+import sys
+import unittest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.osc_codec import (
+    Bundle, Double, Int64, OSCCodecError, OSCEncoder,
+    decode_bundle, decode_message, decode_packet, encode_bundle, encode_message, is_bundle,
+)
+from scripts.bench_osc_codec import legacy_build, legacy_parse
+
+try:
+    from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY as PY_IMMEDIATELY
+    from pythonosc.osc_message import OscMessage
+    from pythonosc.osc_message_builder import OscMessageBuilder
+    from pythonosc.osc_packet import OscPacket
+    HAS_PYTHONOSC = True
+except ImportError:
+    HAS_PYTHONOSC = False
+
+
+class TestMessages(unittest.TestCase):
+
+    def test_round_trip_all_types(self):
+        args = [7, -3, 0.5, Double(1.0 / 3), 2 ** 40, "Pro-Q 3", b"\x01\x02\x03",
+                True, False, None]
+        address, decoded = decode_message(encode_message("/x/all", args))
+
+        self.assertEqual(address, "/x/all")
+        self.assertEqual(decoded[:3], [7, -3, 0.5])
+        self.assertEqual(decoded[3], 1.0 / 3)  # float64, no precision loss
+        self.assertEqual(decoded[4], 2 ** 40)
+        self.assertEqual(decoded[5], "Pro-Q 3")
+        self.assertEqual(decoded[6], b"\x01\x02\x03")
+        # bool is sent as int (AbletonOSC convention), None as N
+        self.assertEqual(decoded[7:], [1, 0, None])
+
+    def test_matches_legacy_encoder_bytes(self):
+        cases = [
+            ("/live/device/set/parameter/value", [0, 1, 5, 0.75]),
+            ("/jarvis/device/load", [2, "FabFilter Pro-Q 3", -1]),
+            ("/live/song/get/num_tracks", []),
+            ("/abc", ["", "xyz", True, 1.5]),
+            ("/live/track/get/name", [3]),
+        ]
+        for address, args in cases:
+            with self.subTest(address=address, args=args):
+                data = encode_message(address, args)
+                self.assertEqual(data, legacy_build(address, args))
+                self.assertEqual(decode_message(data), legacy_parse(data))
+
+    def test_int64_promotion_and_explicit_types(self):
+        data = encode_message("/big", [2 ** 31, Int64(5)])
+        self.assertIn(b",hh\x00", data)
+        self.assertEqual(decode_message(data)[1], [2 ** 31, 5])
+
+    def test_blob_is_padded_to_four_bytes(self):
+        data = encode_message("/b", [b"\xff" * 5])
+        self.assertEqual(len(data) % 4, 0)
+        self.assertEqual(decode_message(data)[1], [b"\xff" * 5])
+
+    def test_memoryview_input(self):
+        data = encode_message("/live/track/get/volume", [0, 0.85])
+        address, args = decode_message(memoryview(bytearray(data)))
+        self.assertEqual(address, "/live/track/get/volume")
+        self.assertAlmostEqual(args[1], 0.85, places=5)
+
+    def test_truncated_input_raises_codec_error(self):
+        data = encode_message("/live/device/get/parameters/value", [0, 1, 0.1, 0.2])
+        with self.assertRaises(OSCCodecError):
+            decode_message(data[:-3])
+        with self.assertRaises(OSCCodecError):
+            decode_message(b"/no/terminator")
+        # Still a ValueError for callers that already catch that
+        self.assertTrue(issubclass(OSCCodecError, ValueError))
+
+    def test_trailing_string_runs_keep_empty_and_non_ascii_names(self):
+        names = ["Gain", "", "Freq 1", "abc", "", "Q\u00e9", "abcd", "x" * 7]
+        for tail in (names, [n for n in names if n.isascii()]):
+            data = encode_message("/live/device/get/parameters/name", [0, 1] + tail)
+            self.assertEqual(decode_message(data)[1], [0, 1] + tail)
+            self.assertEqual(decode_message(bytearray(data))[1], [0, 1] + tail)
+            with self.assertRaises(OSCCodecError):
+                decode_message(data[:-4])
+
+    def test_string_runs_inside_a_bundle_stop_at_their_element(self):
+        bundle = encode_bundle([("/names", ["a", "bb", "ccc", "dddd"]),
+                                ("/load", [2, "Pro-Q 3", -1])])
+        self.assertEqual(decode_packet(bundle), [("/names", ["a", "bb", "ccc", "dddd"]),
+                                                 ("/load", [2, "Pro-Q 3", -1])])
+
+    def test_special_floats_survive(self):
+        _, args = decode_message(encode_message("/f", [float("inf"), -0.0]))
+        self.assertTrue(math.isinf(args[0]))
+        self.assertEqual(struct.pack(">f", args[1]), struct.pack(">f", -0.0))
+
+
+class TestBundles(unittest.TestCase):
+
+    WRITES = [("/live/device/set/parameter/value", [0, 1, i, i / 10.0]) for i in range(4)]
+
+    def test_bundle_round_trip(self):
+        data = encode_bundle(self.WRITES)
+        self.assertTrue(is_bundle(data))
+
+        timetag, messages = decode_bundle(data)
+        self.assertEqual(timetag, 1)
+        self.assertEqual([m[1][2] for m in messages], [0, 1, 2, 3])
+        self.assertEqual(decode_packet(data), messages)
+
+    def test_nested_bundle_and_preencoded_elements_flatten(self):
+        pre = encode_message("/pre", [9])
+        data = encode_bundle([self.WRITES[0], Bundle(self.WRITES[1:3]), pre])
+
+        addresses = [address for address, _ in decode_packet(data)]
+        self.assertEqual(addresses, ["/live/device/set/parameter/value"] * 3 + ["/pre"])
+
+    def test_encoder_grows_while_a_view_is_held(self):
+        encoder = OSCEncoder(capacity=32)
+        held = encoder.encode_view("/a", [1])
+        # Growing must not raise BufferError because of the exported view
+        big = encoder.encode_bundle([("/long/address/%d" % i, ["x" * 50]) for i in range(20)])
+
+        self.assertEqual(len(held), 12)
+        self.assertEqual(len(decode_packet(big)), 20)
+
+    def test_bad_element_size_raises(self):
+        data = bytearray(encode_bundle(self.WRITES[:1]))
+        struct.pack_into(">i", data, 16, 4096)
+        with self.assertRaises(OSCCodecError):
+            decode_packet(bytes(data))
+
+    def test_single_message_packet(self):
+        data = encode_message("/x", [1])
+        self.assertFalse(is_bundle(data))
+        self.assertEqual(decode_packet(data), [("/x", [1])])
+
+
+@unittest.skipUnless(HAS_PYTHONOSC, "python-osc not installed")
+class TestPythonOscInterop(unittest.TestCase):
+
+    def test_python_osc_decodes_our_message(self):
+        msg = OscMessage(encode_message("/t", [1, 0.5, "s", Double(0.25), 2 ** 40]))
+        self.assertEqual(msg.address, "/t")
+        self.assertEqual(msg.params, [1, 0.5, "s", 0.25, 2 ** 40])
+
+    def test_we_decode_python_osc_bundle(self):
+        builder = OscBundleBuilder(PY_IMMEDIATELY)
+        for i in range(3):
+            m = OscMessageBuilder(address="/live/device/set/parameter/value")
+            for arg in (0, 1, i, 0.5):
+                m.add_arg(arg)
+            builder.add_content(m.build())
+
+        messages = decode_packet(builder.build().dgram)
+        self.assertEqual([args[2] for _, args in messages], [0, 1, 2])
+
+    def test_python_osc_decodes_our_bundle(self):
+        packet = OscPacket(encode_bundle(TestBundles.WRITES))
+        self.assertEqual([m.message.params[2] for m in packet.messages], [0, 1, 2, 3])
+
+
+class TestSharedUsers(unittest.TestCase):
+
+    def test_remote_script_copy_is_identical(self):
+        shared = os.path.join(_REPO_ROOT, "ableton_controls", "osc_codec.py")
+        vendored = os.path.join(_REPO_ROOT, "ableton_remote_script", "JarvisDeviceLoader",
+                                "osc_codec.py")
+        with open(shared, "rb") as a, open(vendored, "rb") as b:
+            self.assertEqual(a.read(), b.read(),
+                             "re-copy ableton_controls/osc_codec.py into the remote script")
+
+    def test_vst_discovery_uses_codec(self):
+        from discovery.vst_discovery import VSTDiscoveryService
+        service = VSTDiscoveryService.__new__(VSTDiscoveryService)
+        data = service._build_osc_message("/jarvis/plugins/get", [0, "x"])
+
+        self.assertEqual(data, encode_message("/jarvis/plugins/get", [0, "x"]))
+        self.assertEqual(service._parse_osc_response(data), ("/jarvis/plugins/get", [0, "x"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Unit tests for bundled parameter writes (ableton_controls/param_batch.py),
+AbletonController.write_device_parameters_bundled / set_device_parameters_batch,
+ReliableParameterController.set_parameters_bundled and the pipeline's
+bundled write path.
+
+Uses the local fake AbletonOSC UDP server from test_response_mux — no Ableton
+required.
+
+Run with:
+    python -m pytest tests/test_param_batch.py -v
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.controller import AbletonController
+from ableton_controls.osc_codec import decode_packet
+from ableton_controls.param_batch import (
+    ParamWriteFlowControl,
+    find_dropped_writes,
+    param_write_bundles,
+)
+from ableton_controls.reliable_params import ReliableParameterController
+from pipeline.executor import ChainPipelineExecutor
+from pipeline.schemas import ChainPipelinePlan, DeviceSpec, ParamSpec
+from tests.test_response_mux import _FakeAbletonOSC, _free_port
+
+
+class _ParamDevice:
+    """Fake device: applies parameter writes, answers metadata/value reads.
+
+    Writes for indices in ``drop_once`` are silently lost the first time,
+    like UDP datagrams the bridge did not absorb.
+    """
+
+    def __init__(self, count=32, drop_once=()):
+        self.values = [0.0] * count
+        self.drop_once = set(drop_once)
+        self.writes = 0
+
+    def __call__(self, address, args):
+        t, d = args[0], args[1]
+        if address == "/live/device/set/parameter/value":
+            self.writes += 1
+            index, value = args[2], args[3]
+            if index in self.drop_once:
+                self.drop_once.discard(index)
+            else:
+                self.values[index] = value
+            return None
+        if address == "/live/device/get/parameters/value":
+            return [t, d] + list(self.values)
+        if address == "/live/device/get/name":
+            return [t, d, "Fake"]
+        if address == "/live/device/get/class_name":
+            return [t, d, "FakeDevice"]
+        if address == "/live/device/get/num_parameters":
+            return [t, d, len(self.values)]
+        if address == "/live/device/get/parameters/name":
+            return [t, d] + ["P%d" % i for i in range(len(self.values))]
+        if address == "/live/device/get/parameters/min":
+            return [t, d] + [0.0] * len(self.values)
+        if address == "/live/device/get/parameters/max":
+            return [t, d] + [1.0] * len(self.values)
+        return None
+
+
+class TestFlowControl(unittest.TestCase):
+
+    def test_backs_off_only_on_drops_and_recovers(self):
+        flow = ParamWriteFlowControl(bundle_size=32, increase=8)
+
+        flow.record(sent=32, dropped=0)
+        self.assertEqual(flow.plan(), (40, 0.0))
+
+        flow.record(sent=40, dropped=3)
+        size, gap = flow.plan()
+        self.assertEqual(size, 20)
+        self.assertGreater(gap, 0.0)
+
+        for _ in range(10):
+            flow.record(sent=20, dropped=0)
+        self.assertEqual(flow.plan(), (64, 0.0))
+        self.assertEqual(flow.get_stats()["backoffs"], 1)
+
+    def test_bundles_split_by_size(self):
+        packets = param_write_bundles(0, 1, {i: i / 10.0 for i in range(10)}, bundle_size=4)
+
+        self.assertEqual(len(packets), 3)
+        messages = [m for p in packets for m in decode_packet(p)]
+        self.assertEqual([args[2] for _, args in messages], list(range(10)))
+
+    def test_find_dropped_writes(self):
+        readback = [0.5, 0.0, 100.0, 0.0]
+        expected = {0: 0.5, 1: 0.25, 2: 100.5, 3: 0.9}
+
+        self.assertEqual(find_dropped_writes(expected, readback, skip=[3]), [1])
+
+
+class TestControllerBundledWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.device = _ParamDevice(count=30)
+        self.server = _FakeAbletonOSC(batch_size=1, responder=self.device)
+        self.ctrl = AbletonController(port=self.server.port, response_port=_free_port())
+        if self.ctrl.async_controller is None:
+            self.skipTest("could not bind response listener")
+
+    def tearDown(self):
+        self.ctrl.shutdown()
+        self.server.close()
+
+    def test_thirty_params_in_one_bundle(self):
+        values = {i: round(i / 30.0, 3) for i in range(30)}
+
+        result = self.ctrl.write_device_parameters_bundled(0, 1, values)
+
+        self.assertTrue(result["success"], result["message"])
+        self.assertTrue(result["verified"])
+        self.assertEqual((result["bundles"], result["rounds"]), (1, 1))
+        self.assertAlmostEqual(self.device.values[29], values[29], places=5)
+
+    def test_dropped_writes_are_resent_and_flow_backs_off(self):
+        self.device.drop_once = {3, 17}
+        values = {i: 0.5 for i in range(30)}
+
+        result = self.ctrl.write_device_parameters_bundled(0, 1, values)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["rounds"], 2)
+        self.assertEqual(self.device.writes, 32)
+        stats = self.ctrl.get_param_write_stats()
+        self.assertEqual((stats["backoffs"], stats["dropped"]), (1, 2))
+
+    def test_batch_clamps_and_reports_caller_values(self):
+        result = self.ctrl.set_device_parameters_batch(0, 1, {0: 50.0, 1: 0.25, 99: 0.5})
+
+        self.assertFalse(result["success"])  # index 99 is out of range
+        applied = {e["param_index"]: e for e in result["applied"]}
+        self.assertEqual(applied[0]["value"], 50.0)
+        self.assertAlmostEqual(applied[0]["sent_value"], 0.5)
+        self.assertTrue(applied[0]["clamped"])
+        self.assertEqual([e["param_index"] for e in result["failed"]], [99])
+
+    def test_async_transport_shares_flow_control(self):
+        self.device.drop_once = {0}
+        actrl = self.ctrl.async_controller
+
+        async def scenario():
+            return await actrl.write_device_parameters_bundled(0, 1, {0: 0.7, 1: 0.2})
+
+        result = asyncio.run(scenario())
+
+        self.assertTrue(result["success"])
+        self.assertIs(actrl.param_flow, self.ctrl._param_flow)
+        self.assertEqual(self.ctrl.get_param_write_stats()["backoffs"], 1)
+
+
+class TestReliableBundledWrites(unittest.TestCase):
+
+    def test_unconfirmed_params_fall_back_to_verified_path(self):
+        ableton = MagicMock()
+        ableton.write_device_parameters_bundled.return_value = {
+            "success": False, "verified": True, "rounds": 3,
+            "applied": [{"param_index": 0, "value": 0.5}],
+            "failed": [{"param_index": 1, "value": 0.3}],
+            "readback": {0: 0.5, 1: 0.0},
+            "message": "Set 1/2",
+        }
+        reliable = ReliableParameterController(ableton)
+
+        with patch.object(reliable, "_prepare_parameter_write",
+                          side_effect=lambda t, d, i, v, tol: {
+                              "min": 0.0, "max": 1.0, "param_name": "P", "device_name": "D",
+                              "clamped_value": v, "clamped": False, "normalized_value": v,
+                              "conversion_method": "passthrough", "effective_tolerance": 0.01,
+                              "negative_only": False}), \
+                patch.object(reliable, "set_parameter_verified",
+                             return_value={"success": True, "verified": True}) as verified:
+            results = reliable.set_parameters_bundled(0, 1, {0: 0.5, 1: 0.3})
+
+        self.assertTrue(results[0]["verified"])
+        self.assertEqual(results[0]["actual_value"], 0.5)
+        verified.assert_called_once_with(0, 1, 1, 0.3)
+        self.assertTrue(results[1]["success"])
+
+
+class _BundledReliable:
+    """Reliable-controller stand-in that supports bundled writes."""
+
+    def __init__(self):
+        self.load_device_verified = MagicMock(return_value={"success": True, "device_index": 0})
+        self.wait_for_device_ready = MagicMock(return_value=True)
+        self.find_parameter_index = MagicMock(side_effect=lambda t, d, name: int(name[1:]))
+        self.get_all_parameter_values = MagicMock(return_value=[0.0] * 8)
+        self.get_parameter_value_sync = MagicMock(return_value=None)
+        self.get_device_info = MagicMock(return_value=None)
+        self.set_parameter_by_name = MagicMock()
+        self.bundled_calls = []
+
+    def set_parameters_bundled(self, track_index, device_index, params):
+        self.bundled_calls.append(dict(params))
+        return {i: {"success": True, "verified": True, "actual_value": v} for i, v in params.items()}
+
+
+class TestPipelineBundledWrites(unittest.TestCase):
+
+    def test_device_params_go_out_in_one_bundled_call(self):
+        ctrl = MagicMock()
+        ctrl.get_track_list.return_value = {"success": True, "tracks": [{"name": "Vox"}]}
+        reliable = _BundledReliable()
+        executor = ChainPipelineExecutor(controller=ctrl, reliable=reliable)
+        plan = ChainPipelinePlan(track_index=0, devices=[
+            DeviceSpec(name="EQ Eight", params=[ParamSpec(name="p%d" % i, value=i / 10.0)
+                                                for i in range(1, 6)]),
+        ])
+
+        with patch("pipeline.executor.time.sleep") as sleep:
+            result = executor.execute(plan)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.total_params_set, 5)
+        self.assertEqual(reliable.bundled_calls, [{i: i / 10.0 for i in range(1, 6)}])
+        reliable.set_parameter_by_name.assert_not_called()
+        self.assertNotIn(((ChainPipelineExecutor.PARAM_INTER_DELAY_S,),), sleep.call_args_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,10 +9,12 @@ Verifies that:
 - Dry-run mode makes zero controller calls
 - Guardrail blocks LLM calls during execute/verify
 - Result aggregation is correct
+- Multi-track plans overlap while device loads stay serialized
 """
 
 import os
 import sys
+import threading
 import time
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
@@ -453,5 +455,98 @@ class TestExecutorBypass:
         ctrl.set_device_enabled.assert_called_once_with(0, 0, 0)
 
 
+class TestExecutorMultiTrack:
+    @staticmethod
+    def _slow_reliable(load_s=0.05, param_s=0.1):
+        """Mock reliable whose loads and param writes take real time."""
+        reliable = make_mock_reliable()
+        state = {"loading": 0, "max_loading": 0}
+        lock = threading.Lock()
+
+        def load(track_index, device_name, **kwargs):
+            with lock:
+                state["loading"] += 1
+                state["max_loading"] = max(state["max_loading"], state["loading"])
+            time.sleep(load_s)
+            with lock:
+                state["loading"] -= 1
+            return {"success": True, "device_index": 0, "message": "Loaded"}
+
+        def set_param(*args, **kwargs):
+            time.sleep(param_s)
+            return {"success": True, "verified": True, "actual_value": None, "message": "Set OK"}
+
+        reliable.load_device_verified.side_effect = load
+        reliable.set_parameter_by_name.side_effect = set_param
+        return reliable, state
+
+    @staticmethod
+    def _plans(tracks=3, params=2):
+        return [
+            ChainPipelinePlan(track_index=t, devices=[
+                DeviceSpec(name="Compressor",
+                           params=[ParamSpec(name="p%d" % i, value=0.5) for i in range(params)]),
+            ])
+            for t in range(tracks)
+        ]
+
+    def test_tracks_overlap_but_loads_are_serialized(self):
+        reliable, state = self._slow_reliable()
+        guardrail = LLMGuardrail(max_calls=1)
+        executor = ChainPipelineExecutor(
+            controller=make_mock_controller(), reliable=reliable, guardrail=guardrail
+        )
+        executor.PARAM_INTER_DELAY_S = 0.0
+
+        start = time.time()
+        multi = executor.execute_many(self._plans())
+        elapsed = time.time() - start
+
+        assert multi.success
+        assert multi.tracks_succeeded == 3
+        assert [r.track_index for r in multi.results] == [0, 1, 2]
+        assert state["max_loading"] == 1
+        # Sequential would be 3 * (0.05 + 2 * 0.1) = 0.75 s
+        assert elapsed < 0.6
+        assert guardrail.call_count == 1
+        assert multi.total_params_set == 6
+        assert multi.params_per_s > 0
+        assert set(multi.phase_times_ms) == {"plan", "execute", "verify", "report"}
+        # The track list is fetched once for the whole batch
+        assert executor.controller.get_track_list.call_count == 1
+
+    def test_same_track_plans_run_in_order(self):
+        reliable, _ = self._slow_reliable(load_s=0.0, param_s=0.0)
+        order = []
+        reliable.load_device_verified.side_effect = (
+            lambda track_index, device_name, **kw: order.append((track_index, device_name))
+            or {"success": True, "device_index": 0, "message": "Loaded"}
+        )
+        executor = ChainPipelineExecutor(controller=make_mock_controller(), reliable=reliable)
+        plans = [
+            ChainPipelinePlan(track_index=1, devices=[DeviceSpec(name="EQ Eight")]),
+            ChainPipelinePlan(track_index=1, devices=[DeviceSpec(name="Compressor")]),
+        ]
+
+        multi = executor.execute_many(plans)
+
+        assert multi.success
+        assert order == [(1, "EQ Eight"), (1, "Compressor")]
+        assert multi.max_workers == 1
+
+    def test_invalid_track_fails_only_that_plan(self):
+        reliable, _ = self._slow_reliable(load_s=0.0, param_s=0.0)
+        executor = ChainPipelineExecutor(controller=make_mock_controller(), reliable=reliable)
+        plans = self._plans(tracks=1) + [
+            ChainPipelinePlan(track_index=9, devices=[DeviceSpec(name="EQ Eight")]),
+        ]
+
+        multi = executor.execute_many(plans)
+
+        assert not multi.success
+        assert multi.tracks_succeeded == 1
+        assert any(e.startswith("track 9:") for e in multi.errors)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
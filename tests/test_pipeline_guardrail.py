@@ -121,6 +121,31 @@ class TestLLMGuardrail:
         assert g.call_count == 100
         assert len(errors) == 0
 
+    def test_blocked_phase_is_per_thread(self):
+        """A worker's execute phase does not block or leak into other threads."""
+        g = LLMGuardrail(max_calls=1)
+        entered, release = threading.Event(), threading.Event()
+        blocked_in_worker = []
+
+        def worker():
+            with g.block_phase("execute"):
+                entered.set()
+                release.wait(2)
+                try:
+                    g.assert_no_llm()
+                except LLMCallBlocked:
+                    blocked_in_worker.append(True)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        entered.wait(2)
+        g.assert_no_llm()  # this thread is not in a blocked phase
+        release.set()
+        thread.join()
+
+        assert blocked_in_worker == [True]
+        assert g._current_phase == "idle"
+
     def test_thread_safety_over_budget(self):
         """Concurrent calls over budget should raise, not corrupt."""
         g = LLMGuardrail(max_calls=5)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the plugin inventory: the JarvisDeviceLoader Remote Script's
+paginated, hashed /jarvis/plugins/get listing and VSTDiscoveryService's
+delta refresh against it.
+
+The Remote Script runs on stand-in browser items and serves the client over
+local UDP ports — no Ableton required.
+
+Run with:
+    python -m pytest tests/test_plugin_inventory.py -v
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from discovery.vst_discovery import VSTDiscoveryService
+from tests.test_device_load_events import _import_remote_script
+from tests.test_remote_browser_index import _Item, _browser
+from tests.test_response_mux import _free_port
+
+
+def _loader(browser):
+    loader_cls = _import_remote_script()
+    with patch.object(loader_cls, "_start_osc_listener"):
+        loader = loader_cls(MagicMock())
+    loader._get_browser = lambda: browser
+    return loader
+
+
+class TestRemoteInventory(unittest.TestCase):
+
+    def setUp(self):
+        self.browser = _browser()
+        self.loader = _loader(self.browser)
+        self.sent = []
+        self.loader._send_response = lambda addr, address, args: self.sent.append((address, args))
+
+    def test_inventory_lists_devices_with_type_category_and_uri(self):
+        self.loader._start_browser_index()
+
+        plugins = {p["name"]: p for p in self.loader._get_available_plugins()}
+
+        self.assertEqual(sorted(plugins), ["Compressor", "EQ Eight", "Pro-Q 3"])
+        self.assertEqual((plugins["Pro-Q 3"]["type"], plugins["Pro-Q 3"]["category"]),
+                         ("plugin", "eq"))
+        self.assertEqual(plugins["Pro-Q 3"]["path"], "Plug-Ins/FabFilter/Pro-Q 3")
+        self.assertEqual(plugins["Compressor"]["category"], "compressor")
+        self.assertEqual(plugins["EQ Eight"]["uri"], "query:EQEight")
+        self.assertEqual([p["name"] for p in self.loader._get_available_plugins("eq")],
+                         ["EQ Eight", "Pro-Q 3"])
+
+    def test_pages_carry_listing_hash_and_wait_for_the_walk(self):
+        self.loader.schedule_message = lambda ticks, fn: self.scheduled.append(fn)
+        self.scheduled = []
+
+        self.loader._handle_get_plugins(["", 0, 2], None)
+        self.assertEqual(self.sent, [])  # parked until the walk finishes
+        while self.scheduled:
+            self.scheduled.pop(0)()
+
+        address, args = self.sent[0]
+        self.assertEqual(address, "/jarvis/plugins/get/response")
+        self.assertEqual(args[:5], [1, "success", 3, 0, 2])
+        self.assertEqual(len(json.loads(args[5])), 2)
+        self.assertEqual(args[6], self.loader._inventory_hash)
+
+        self.loader._handle_plugins_hash([], None)
+        _, hash_args = self.sent[1]
+        self.assertEqual(sorted(json.loads(hash_args[4])), ["audio_effect", "plugin"])
+
+
+class TestDiscoveryDeltaRefresh(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.browser = _browser()
+        self.loader = _loader(self.browser)
+        self.loader._start_browser_index()
+        self.loader._osc_port = _free_port()
+        self.loader._response_port = _free_port()
+        self.loader._start_osc_listener()
+        for _ in range(100):  # until the listener thread has bound its port
+            try:
+                if self.loader._socket.getsockname()[1] == self.loader._osc_port:
+                    break
+            except (AttributeError, OSError):
+                pass
+            time.sleep(0.01)
+        self.requests = []
+        handle = self.loader._handle_get_plugins
+        self.loader._handle_get_plugins = lambda args, addr: (self.requests.append(args[0]),
+                                                              handle(args, addr))
+        self.service = VSTDiscoveryService(osc_send_port=self.loader._osc_port,
+                                           osc_recv_port=self.loader._response_port,
+                                           cache_file=os.path.join(self.tmpdir, "vst_cache.json"))
+
+    def tearDown(self):
+        self.loader.disconnect()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_unchanged_inventory_is_not_downloaded_and_changes_fetch_one_type(self):
+        self.assertTrue(self.service.refresh_plugins())
+        self.assertEqual(sorted(self.requests), ["audio_effect", "plugin"])
+        self.assertEqual(len(self.service.get_all_plugins()), 3)
+
+        self.requests.clear()
+        self.assertTrue(self.service.refresh_plugins())
+        self.assertEqual(self.requests, [])
+
+        self.browser.plugins.children[0].children.append(_Item("Pro-C 2", is_device=True))
+        self.loader._start_browser_index()
+        self.requests.clear()
+        self.assertTrue(self.service.refresh_plugins())
+
+        self.assertEqual(self.requests, ["plugin"])
+        names = sorted(p.name for p in self.service.get_all_plugins())
+        self.assertEqual(names, ["Compressor", "EQ Eight", "Pro-C 2", "Pro-Q 3"])
+
+        # The hashes persist with the cache, so a restart skips the download too
+        restarted = VSTDiscoveryService(osc_send_port=self.loader._osc_port,
+                                        osc_recv_port=self.loader._response_port,
+                                        cache_file=self.service.cache_file)
+        self.requests.clear()
+        self.assertTrue(restarted.refresh_plugins())
+        self.assertEqual(self.requests, [])
+        uris = {p.name: p.uri for p in restarted.get_all_plugins()}
+        self.assertEqual(uris["Pro-C 2"], "query:Pro-C2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent relay worker (utils/relay_worker.py) against
+the fake relay (tests/fake_openclaw_relay.py): one long-lived process,
+pipelined out-of-order responses, timeouts, restart after a crash, the
+worker pool, the bundled OpenClaw worker and the research relay client.
+
+Run with:
+    python -m pytest tests/test_relay_worker.py -v
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from research import llm_client
+from research.llm_response_cache import LLMResponseCache
+from utils.relay_worker import (RelayError, RelayTimeout, RelayWorker, RelayWorkerPool,
+                                openclaw_worker_command)
+
+FAKE_RELAY = [sys.executable, os.path.join(_REPO_ROOT, "tests", "fake_openclaw_relay.py")]
+
+
+def _pid(response):
+    return json.loads(response["stdout"])["pid"]
+
+
+def _text(response):
+    return json.loads(response["stdout"])["result"]["payloads"][0]["text"]
+
+
+class _CancelledWhileResolving(concurrent.futures.Future):
+    """Cancelled by its awaiter just as the reader thread goes to resolve it"""
+
+    def done(self):
+        was_done = super().done()
+        self.cancel()
+        return was_done
+
+    def set_running_or_notify_cancel(self):
+        self.cancel()
+        return super().set_running_or_notify_cancel()
+
+
+class TestRelayWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.worker = RelayWorker(FAKE_RELAY)
+
+    def tearDown(self):
+        self.worker.close()
+
+    def test_requests_reuse_one_process(self):
+        responses = [self.worker.request({"op": "agent", "message": f"m{n}"}, timeout=5) for n in range(20)]
+
+        self.assertEqual([_text(r) for r in responses], [f"echo: m{n}" for n in range(20)])
+        self.assertEqual(len({_pid(r) for r in responses}), 1)
+        stats = self.worker.get_stats()
+        self.assertEqual((stats["starts"], stats["completed"]), (1, 20))
+        self.assertLess(stats["latency_ms_mean"], 500)
+
+    def test_pipelined_responses_are_matched_by_id(self):
+        done = []
+
+        def slow():
+            done.append(_text(self.worker.request({"message": "sleep 0.3 slow"}, timeout=5)))
+
+        thread = threading.Thread(target=slow)
+        thread.start()
+        self.worker.start()
+        done.append(_text(self.worker.request({"message": "fast"}, timeout=5)))
+        thread.join(5)
+
+        self.assertEqual(done, ["echo: fast", "echo: sleep 0.3 slow"])
+
+    def test_timeout_kills_the_stuck_worker_and_the_next_request_restarts_it(self):
+        first_pid = _pid(self.worker.request({"message": "hello"}, timeout=5))
+        stuck = self.worker._proc
+
+        with self.assertRaises(RelayTimeout):
+            self.worker.request({"message": "sleep 5"}, timeout=0.1)
+
+        self.assertIsNotNone(stuck.wait(5))
+        self.assertNotEqual(_pid(self.worker.request({"message": "after"}, timeout=5)), first_pid)
+        stats = self.worker.get_stats()
+        self.assertEqual((stats["timeouts"], stats["restarts"], stats["starts"]), (1, 1, 2))
+
+    def test_worker_survives_timeouts_below_the_limit(self):
+        worker = RelayWorker(FAKE_RELAY, max_timeouts=2)
+        try:
+            for _ in range(2):
+                with self.assertRaises(RelayTimeout):
+                    worker.request({"message": "sleep 1"}, timeout=0.1)
+                # a completed request resets the count
+                self.assertEqual(_text(worker.request({"message": "after"}, timeout=5)), "echo: after")
+            self.assertEqual(worker.get_stats()["starts"], 1)
+
+            async def stuck():
+                for _ in range(2):
+                    with self.assertRaises(RelayTimeout):
+                        await worker.request_async({"message": "sleep 5"}, timeout=0.1)
+
+            asyncio.run(stuck())
+            self.assertEqual(worker.get_stats()["restarts"], 1)
+            self.assertFalse(worker.alive)
+        finally:
+            worker.close()
+
+    def test_killing_a_stuck_worker_fails_its_other_requests(self):
+        other = []
+        thread = threading.Thread(target=lambda: other.append(
+            self._request_or_error({"message": "sleep 5 other"}, timeout=5)))
+        thread.start()
+        time.sleep(0.1)
+
+        with self.assertRaises(RelayTimeout):
+            self.worker.request({"message": "sleep 5"}, timeout=0.1)
+        thread.join(5)
+
+        self.assertIsInstance(other[0], RelayError)
+        self.assertNotIsInstance(other[0], RelayTimeout)
+
+    def _request_or_error(self, payload, timeout):
+        try:
+            return self.worker.request(payload, timeout)
+        except RelayError as e:
+            return e
+
+    def test_crash_fails_in_flight_requests_and_restarts(self):
+        first_pid = _pid(self.worker.request({"message": "hello"}, timeout=5))
+
+        with self.assertRaises(RelayError):
+            self.worker.request({"message": "crash"}, timeout=5)
+
+        second_pid = _pid(self.worker.request({"message": "hello"}, timeout=5))
+        self.assertNotEqual(first_pid, second_pid)
+        self.assertEqual(self.worker.get_stats()["starts"], 2)
+
+    def test_async_requests_are_pipelined(self):
+        async def main():
+            return await asyncio.gather(*(self.worker.request_async({"message": f"sleep 0.2 {n}"}, timeout=5)
+                                          for n in range(5)))
+
+        responses = asyncio.run(main())
+
+        self.assertEqual([_text(r) for r in responses], [f"echo: sleep 0.2 {n}" for n in range(5)])
+        self.assertLess(self.worker.get_stats()["latency_ms_max"], 900)  # not 5 x 200 ms
+
+    def test_cancelled_async_request_leaves_the_worker_usable(self):
+        async def main():
+            task = asyncio.ensure_future(self.worker.request_async({"message": "sleep 0.2 dropped"}, timeout=5))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0.3)  # the dropped reply arrives
+            return await self.worker.request_async({"message": "next"}, timeout=5)
+
+        self.assertEqual(_text(asyncio.run(main())), "echo: next")
+        self.assertEqual(self.worker.get_stats()["starts"], 1)
+
+    def test_cancel_racing_the_reply_does_not_kill_the_reader(self):
+        request_id, _ = self.worker.submit({"message": "sleep 0.1 raced"})
+        racing = _CancelledWhileResolving()
+        with self.worker._lock:
+            self.worker._pending[request_id] = racing
+
+        # answered after the raced reply, so the reader has to survive it
+        self.assertEqual(_text(self.worker.request({"message": "sleep 0.3 next"}, timeout=5)), "echo: sleep 0.3 next")
+        self.assertTrue(racing.cancelled())
+        self.assertEqual(self.worker.get_stats()["starts"], 1)
+
+    def test_unstartable_worker_raises_relay_error(self):
+        worker = RelayWorker(["/nonexistent/relay-worker"])
+        with self.assertRaises(RelayError):
+            worker.request({"message": "hi"}, timeout=1)
+
+
+class TestRelayWorkerPool(unittest.TestCase):
+
+    def test_concurrent_requests_spread_across_workers(self):
+        pool = RelayWorkerPool(FAKE_RELAY, size=2)
+        try:
+            async def main():
+                return await asyncio.gather(*(pool.request_async({"message": "sleep 0.2 x"}, timeout=5)
+                                              for _ in range(2)))
+
+            responses = asyncio.run(main())
+            self.assertEqual(len({_pid(r) for r in responses}), 2)
+            self.assertEqual(pool.get_stats()["completed"], 2)
+        finally:
+            pool.close()
+
+
+class TestBundledOpenClawWorker(unittest.TestCase):
+
+    def test_worker_runs_the_cli_with_agent_arguments(self):
+        fake_cli = [sys.executable, "-c",
+                    "import json, sys; print(json.dumps({'reply': ' '.join(sys.argv[1:])}))"]
+        worker = RelayWorker(openclaw_worker_command(fake_cli))
+        try:
+            self.assertTrue(worker.request({"op": "ping"}, timeout=10)["pong"])
+            response = worker.request({"op": "agent", "message": "hi", "agent": "jarvis", "timeout": 5},
+                                      timeout=10)
+        finally:
+            worker.close()
+
+        self.assertEqual(response["returncode"], 0)
+        self.assertEqual(json.loads(response["stdout"])["reply"],
+                         "agent --json --timeout 5 --message hi --agent jarvis")
+
+    def test_missing_cli_is_reported_per_request(self):
+        worker = RelayWorker(openclaw_worker_command(["/nonexistent/openclaw"]))
+        try:
+            response = worker.request({"op": "agent", "message": "hi"}, timeout=10)
+        finally:
+            worker.close()
+
+        self.assertFalse(response["ok"])
+        self.assertIn("Command not found", response["error"])
+
+
+class TestOpenClawRelayClient(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.pool = RelayWorkerPool(FAKE_RELAY)
+        self.client = llm_client.OpenClawRelayClient()
+        self.client.relay = self.pool
+        self.client.base_delay = 0.0
+        self.client.response_cache = LLMResponseCache(os.path.join(self.tmp, "llm.sqlite3"))
+
+    def tearDown(self):
+        self.pool.close()
+        self.client.response_cache.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_generate_goes_through_the_worker(self):
+        response = asyncio.run(self.client.generate("extract settings", system_prompt="be brief"))
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.content, "echo: be brief\n\nextract settings")
+        self.assertEqual(self.pool.get_stats()["starts"], 1)
+
+    def test_rate_limits_are_retried_then_reported(self):
+        response = asyncio.run(self.client.generate("rate_limit"))
+
+        self.assertFalse(response.success)
+        self.assertIn("rate_limit", response.error)
+        self.assertEqual(self.pool.get_stats()["completed"], self.client.max_retries)
+
+    def test_worker_error_falls_back_to_the_cli(self):
+        cli = SimpleNamespace(returncode=0, stdout=json.dumps({"reply": "from cli"}), stderr="")
+        with patch.object(llm_client.subprocess, "run", return_value=cli) as run:
+            response = asyncio.run(self.client.generate("worker_error"))
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.content, "from cli")
+        self.assertEqual(run.call_args.args[0][:2], ["openclaw", "agent"])
+
+    def test_worker_timeout_falls_back_to_the_cli(self):
+        cli = SimpleNamespace(returncode=0, stdout=json.dumps({"reply": "from cli"}), stderr="")
+        with patch.object(self.pool, "request_async", side_effect=RelayTimeout("no response")), \
+                patch.object(llm_client.subprocess, "run", return_value=cli) as run:
+            response = asyncio.run(self.client.generate("slow prompt"))
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.content, "from cli")
+        run.assert_called_once()
+
+    def test_shared_relay_runs_the_bundled_worker_unless_turned_off(self):
+        with patch.dict(os.environ, {"RESEARCH_OPENCLAW_RELAY_CMD": ""}), \
+                patch.object(llm_client, "_openclaw_relay", None):
+            relay = llm_client.get_openclaw_relay()
+            self.assertEqual(relay.workers[0].command, openclaw_worker_command(["openclaw"]))
+
+            with patch.dict(os.environ, {"RESEARCH_OPENCLAW_PERSISTENT": "0"}):
+                self.assertIsNone(llm_client.get_openclaw_relay())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JarvisDeviceLoader Remote Script's browser index: the
+time-sliced build, name lookups for /jarvis/device/load and URI lookups for
+/jarvis/device/load_by_uri.
+
+Runs the Remote Script against stand-ins for Live's browser items — no
+Ableton required.
+
+Run with:
+    python -m pytest tests/test_remote_browser_index.py -v
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from tests.test_device_load_events import _Track, _import_remote_script
+
+
+class _Item:
+    """Stand-in for Live's BrowserItem."""
+
+    def __init__(self, name, children=(), is_device=False, uri=None):
+        self.name = name
+        self.children = list(children)
+        self.is_device = is_device
+        self.is_loadable = is_device or not children
+        self.uri = uri or "query:%s" % name.replace(" ", "")
+
+    @property
+    def iter_children(self):
+        return iter(self.children)
+
+
+def _browser():
+    presets = [_Item("Warm Vocal"), _Item("Air Boost")]
+    browser = MagicMock()
+    browser.audio_effects = _Item("Audio Effects", [
+        _Item("EQ & Filters", [_Item("EQ Eight", presets, is_device=True)]),
+        _Item("Dynamics", [_Item("Compressor", [_Item("Gentle")], is_device=True)]),
+    ])
+    browser.midi_effects = _Item("MIDI Effects")
+    browser.instruments = _Item("Instruments")
+    browser.plugins = _Item("Plug-Ins", [
+        _Item("FabFilter", [_Item("Pro-Q 3", is_device=True, uri="query:Plugins#VST3:FabFilter:Pro-Q%203")]),
+    ])
+    browser.drums = _Item("Drums", [_Item("Compressor")])  # a sample, not the device
+    browser.max_for_live = _Item("Max for Live")
+    return browser
+
+
+class TestBrowserIndex(unittest.TestCase):
+
+    def setUp(self):
+        loader_cls = _import_remote_script()
+        with patch.object(loader_cls, "_start_osc_listener"):
+            self.loader = loader_cls(MagicMock())
+        self.browser = _browser()
+        self.loader._get_browser = lambda: self.browser
+        self.scheduled = []
+        self.loader.schedule_message = lambda ticks, fn: self.scheduled.append(fn)
+
+    def _build(self):
+        self.assertTrue(self.loader._start_browser_index())
+        while self.scheduled:
+            self.scheduled.pop(0)()
+
+    def test_build_is_time_sliced(self):
+        self.loader._index_slice_seconds = 0.0  # one node per slice
+
+        self.loader._start_browser_index()
+        self.assertEqual(self.loader._index_state, "building")
+        self.assertEqual(len(self.scheduled), 1)
+
+        self._build()
+        self.assertEqual(self.loader._index_state, "ready")
+
+    def test_lookups_come_from_the_index(self):
+        self._build()
+
+        with patch.object(self.loader, "_deep_search") as crawl:
+            item = self.loader._find_device_uri(self.browser, "pro-q 3")
+            missing = self.loader._find_device_uri(self.browser, "Warm Vocal")  # a preset
+            compressor = self.loader._find_device_uri(self.browser, "Compressor")
+        crawl.assert_not_called()
+
+        self.assertEqual(item.name, "Pro-Q 3")
+        self.assertIsNone(missing)
+        self.assertTrue(compressor.is_device)
+        self.assertIs(self.loader._find_browser_item_by_uri(
+            self.browser, "query:Plugins#VST3:FabFilter:Pro-Q%203"), item)
+
+    def test_load_by_uri_uses_index(self):
+        self._build()
+        track = _Track()
+        self.loader._get_song = lambda: MagicMock(tracks=[track])
+
+        result = self.loader._load_device_by_uri(0, "query:EQEight")
+
+        self.assertEqual(result[:2], [1, "loading"])
+        self.browser.load_item.assert_called_once()
+        self.assertEqual(self.browser.load_item.call_args[0][0].name, "EQ Eight")
+
+    def test_refresh_invalidates_and_rebuilds(self):
+        self._build()
+        self.loader._send_response = MagicMock()
+
+        self.loader._handle_browser_index_status([1], None)
+
+        # The socket thread only marks the index stale; the main thread drops it
+        self.assertEqual(self.loader._index_state, "building")
+        self.assertEqual(self.scheduled, [self.loader._invalidate_browser_index])
+        self.scheduled.pop(0)()
+        self.assertEqual(self.loader._index_by_name, {})
+        while self.scheduled:
+            self.scheduled.pop(0)()
+        self.assertEqual(self.loader._index_state, "ready")
+        self.assertIn("pro-q3", self.loader._index_by_name)
+
+    def test_walk_superseded_by_a_refresh_does_not_publish(self):
+        self.loader._index_slice_seconds = 0.0
+        self.loader._send_response = MagicMock()
+        self.loader._start_browser_index()
+
+        self.loader._handle_browser_index_status([1], None)
+        while self.scheduled:
+            step = self.scheduled.pop(0)
+            if step == self.loader._invalidate_browser_index:
+                break
+            step()
+
+        self.assertEqual(self.loader._index_state, "building")
+        self.assertEqual(self.loader._inventory, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
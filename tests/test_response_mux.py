@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the OSC response multiplexer (ableton_controls/response_mux.py)
+and the correlated _send_and_wait / _send_many_and_wait on AbletonController.
+
+Uses a local fake AbletonOSC UDP server — no Ableton required.
+
+Run with:
+    python -m pytest tests/test_response_mux.py -v
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from ableton_controls.controller import AbletonController
+from ableton_controls.osc_codec import decode_packet
+from ableton_controls.response_mux import OSCResponseMux
+
+
+def _free_port():
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def _param_value_responder(address, args):
+    """Answer /live/device/get/parameter/value with value = param * 0.1."""
+    return list(args) + [args[2] * 0.1]
+
+
+EQ_NAMES = ["Device On", "1 Frequency A", "1 Gain A", "1 Resonance A"]
+
+
+def _device_responder(address, args):
+    """Answer device-level queries for a 4-parameter device."""
+    t, d = args[0], args[1]
+    if address == "/live/device/get/name":
+        return [t, d, "EQ Eight"]
+    if address == "/live/device/get/class_name":
+        return [t, d, "Eq8"]
+    if address == "/live/device/get/num_parameters":
+        return [t, d, len(EQ_NAMES)]
+    if address == "/live/device/get/parameters/name":
+        return [t, d] + EQ_NAMES
+    if address == "/live/device/get/parameters/min":
+        return [t, d, 0.0, 0.0, -15.0, 0.1]
+    if address == "/live/device/get/parameters/max":
+        return [t, d, 1.0, 1.0, 15.0, 18.0]
+    if address == "/live/device/get/parameters/value":
+        return [t, d, 1.0, 0.5, 0.0, 0.7]
+    return None
+
+
+class _FakeAbletonOSC:
+    """Minimal AbletonOSC stand-in driven by a responder(address, args).
+
+    Collects requests into batches and replies in REVERSE order, so a
+    controller that matched by address alone would mix the answers up.
+    """
+
+    def __init__(self, batch_size, responder=_param_value_responder):
+        self.batch_size = batch_size
+        self.responder = responder
+        self.requests = []
+        self.port = _free_port()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", self.port))
+        self.sock.settimeout(0.2)
+        self.running = True
+        self.codec = AbletonController.__new__(AbletonController)
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        batch = []
+        while self.running:
+            try:
+                data, addr = self.sock.recvfrom(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            for address, args in decode_packet(data):
+                self.requests.append(address)
+                batch.append((address, args, addr))
+            if len(batch) >= self.batch_size:
+                for address, args, addr in reversed(batch):
+                    reply = self.responder(address, args)
+                    if reply is not None:
+                        self.sock.sendto(self.codec._build_osc_message(address, reply), addr)
+                batch = []
+
+    def close(self):
+        self.running = False
+        self.sock.close()
+
+
+class TestOSCResponseMux(unittest.TestCase):
+
+    def test_reply_routed_by_echoed_prefix(self):
+        mux = OSCResponseMux()
+        addr = "/live/device/get/parameter/value"
+        a = mux.register([addr], [0, 1, 3])
+        b = mux.register([addr], [0, 1, 7])
+
+        # Replies arrive in the opposite order
+        self.assertTrue(mux.dispatch(addr, [0, 1, 7, 0.7]))
+        self.assertTrue(mux.dispatch(addr, [0, 1, 3, 0.3]))
+
+        self.assertEqual(mux.wait(a, 0.1), (addr, [0, 1, 3, 0.3]))
+        self.assertEqual(mux.wait(b, 0.1), (addr, [0, 1, 7, 0.7]))
+        self.assertEqual(mux.in_flight(), 0)
+
+    def test_reply_without_prefix_goes_to_oldest_waiter(self):
+        mux = OSCResponseMux()
+        addr = "/live/track/get/num_devices"
+        first = mux.register([addr], [2])
+        second = mux.register([addr], [5])
+
+        mux.dispatch(addr, [4])
+
+        self.assertEqual(mux.wait(first, 0.1), (addr, [4]))
+        self.assertFalse(second.event.is_set())
+        self.assertEqual(mux.get_stats()["fallback_matched"], 1)
+
+    def test_stale_reply_for_other_track_is_not_delivered(self):
+        mux = OSCResponseMux()
+        addr = "/live/track/get/volume"
+        pending = mux.register([addr], [0])
+
+        self.assertFalse(mux.dispatch(addr, [3, 0.5]))
+        self.assertIsNone(mux.wait(pending, 0.05))
+        self.assertIn(addr, mux.unmatched)
+        self.assertEqual(mux.get_stats()["timeouts"], 1)
+
+    def test_reply_being_delivered_is_not_counted_as_timeout(self):
+        mux = OSCResponseMux()
+        addr = "/live/track/get/volume"
+        pending = mux.register([addr], [0])
+        setting, release = threading.Event(), threading.Event()
+
+        class _SlowEvent(threading.Event):
+            def set(self):
+                setting.set()
+                release.wait(1.0)
+                super().set()
+
+        pending.event = _SlowEvent()
+        dispatcher = threading.Thread(target=mux.dispatch, args=(addr, [0, 0.5]))
+        dispatcher.start()
+        setting.wait(1.0)
+
+        # The waiter's deadline passes while the listener is mid-delivery
+        expired = []
+        expirer = threading.Thread(target=lambda: expired.append(mux.expire(pending)))
+        expirer.start()
+        time.sleep(0.05)
+        release.set()
+        dispatcher.join(1.0)
+        expirer.join(1.0)
+
+        self.assertEqual(expired, [False])
+        self.assertEqual(pending.response, (addr, [0, 0.5]))
+        self.assertEqual(mux.get_stats()["timeouts"], 0)
+
+    def test_alternate_accept_address(self):
+        mux = OSCResponseMux()
+        pending = mux.register(["/live/song/get/tempo", "/live/song/get/tempo/response"], [])
+        mux.dispatch("/live/song/get/tempo/response", [120.0])
+        self.assertEqual(mux.wait(pending, 0.1), ("/live/song/get/tempo/response", [120.0]))
+        self.assertEqual(mux.in_flight(), 0)
+
+
+class TestControllerConcurrentQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _FakeAbletonOSC(batch_size=8)
+        self.ctrl = AbletonController(port=self.server.port, response_port=_free_port())
+        if self.ctrl._resp_sock is None:
+            self.skipTest("could not bind response listener")
+
+    def tearDown(self):
+        self.ctrl.shutdown()
+        self.server.close()
+
+    def test_pipelined_queries_get_their_own_answers(self):
+        requests = [("/live/device/get/parameter/value", [0, 1, p], None) for p in range(8)]
+        results = self.ctrl._send_many_and_wait(requests, timeout=2.0)
+
+        for p, resp in enumerate(results):
+            self.assertIsNotNone(resp)
+            _addr, args = resp
+            self.assertEqual(args[:3], [0, 1, p])
+            self.assertAlmostEqual(args[3], p * 0.1, places=5)
+
+    def test_threaded_send_and_wait_do_not_cross(self):
+        results = {}
+
+        def query(p):
+            results[p] = self.ctrl.get_device_parameter_value_sync(0, 1, p, timeout=2.0)
+
+        threads = [threading.Thread(target=query, args=(p,)) for p in range(8)]
+        start = time.time()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertLess(time.time() - start, 2.0)
+        for p in range(8):
+            self.assertTrue(results[p]["success"])
+            self.assertAlmostEqual(results[p]["value"], p * 0.1, places=5)
+
+
+class TestDeviceStateSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        # 6 queries per snapshot: only answered once ALL are in flight
+        self.server = _FakeAbletonOSC(batch_size=6, responder=_device_responder)
+        self.ctrl = AbletonController(port=self.server.port, response_port=_free_port())
+        if self.ctrl._resp_sock is None:
+            self.skipTest("could not bind response listener")
+
+    def tearDown(self):
+        self.ctrl.shutdown()
+        self.server.close()
+
+    def test_snapshot_reads_everything_in_one_round_trip(self):
+        snap = self.ctrl.get_device_state_snapshot(0, 1, timeout=2.0)
+
+        self.assertTrue(snap.success, snap.message)
+        self.assertEqual(snap.device_name, "EQ Eight")
+        self.assertEqual(snap.names, EQ_NAMES)
+        for got, want in zip(snap.mins, [0.0, 0.0, -15.0, 0.1]):
+            self.assertAlmostEqual(got, want, places=5)
+        self.assertEqual(list(snap.maxs[:3]), [1.0, 1.0, 15.0])
+        self.assertAlmostEqual(snap.values[3], 0.7, places=5)
+        self.assertEqual(snap.maxs.typecode, "d")
+        self.assertEqual(snap.param_count, 4)
+        # Names and ranges are cached for safe_set_device_parameter
+        self.assertEqual(snap.class_name, "Eq8")
+        self.assertEqual(self.ctrl.device_metadata.get(0, 1).param_names, EQ_NAMES)
+
+    def test_reliable_fetch_uses_snapshot(self):
+        from ableton_controls.reliable_params import ReliableParameterController
+
+        # Without values only 5 queries go out
+        self.server.batch_size = 5
+        reliable = ReliableParameterController(self.ctrl)
+        info = reliable.get_device_info(0, 1)
+
+        self.assertTrue(info.accessible)
+        self.assertEqual(info.device_name, "EQ Eight")
+        self.assertEqual(info.get_param_index("1 Gain A"), 2)
+        self.assertNotIn("/live/track/get/devices/name", self.server.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
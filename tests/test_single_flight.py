@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Unit tests for single-flight request coalescing (research/single_flight.py):
+concurrent duplicates share one execution, errors and leader cancellation,
+cross-event-loop callers, and the decorated research entry points.
+
+Run with:
+    python -m pytest tests/test_single_flight.py -v
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import AsyncMock
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from research.llm_client import GeminiClient, OpenAIClient, OpenClawRelayClient
+from research.llm_response_cache import LLMResponseCache
+from research.research_coordinator import ResearchCoordinator, _research_flight_key
+from research.single_flight import SingleFlight, get_single_flight_stats
+from research.web_research import WebResearcher
+from research.youtube_research import YouTubeResearcher
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        self.flight = SingleFlight("test")
+        self.runs = 0
+
+    async def _work(self, result="done", delay=0.05):
+        self.runs += 1
+        await asyncio.sleep(delay)
+        return result
+
+    def test_concurrent_duplicates_share_one_execution(self):
+        async def main():
+            return await asyncio.gather(
+                *(self.flight.do("travis scott", self._work) for _ in range(3)),
+                self.flight.do("kanye", lambda: self._work("other")),
+            )
+
+        results = asyncio.run(main())
+
+        self.assertEqual(results, ["done", "done", "done", "other"])
+        self.assertEqual(self.runs, 2)
+        stats = self.flight.get_stats()
+        self.assertEqual((stats["calls"], stats["executions"], stats["coalesced"]), (4, 2, 2))
+        self.assertEqual(stats["inflight"], 0)
+
+    def test_sequential_calls_are_not_cached(self):
+        async def main():
+            await self.flight.do("k", self._work)
+            await self.flight.do("k", self._work)
+
+        asyncio.run(main())
+        self.assertEqual(self.runs, 2)
+
+    def test_errors_reach_every_waiter(self):
+        async def fail():
+            await asyncio.sleep(0.02)
+            raise ValueError("quota")
+
+        async def main():
+            return await asyncio.gather(self.flight.do("k", fail), self.flight.do("k", fail),
+                                        return_exceptions=True)
+
+        results = asyncio.run(main())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(self.flight.get_stats()["errors"], 1)
+
+    def test_waiter_takes_over_when_leader_is_cancelled(self):
+        async def main():
+            leader = asyncio.create_task(self.flight.do("k", lambda: self._work(delay=1)))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(self.flight.do("k", self._work))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await waiter
+
+        self.assertEqual(asyncio.run(main()), "done")
+        self.assertEqual(self.runs, 2)
+
+    def test_callers_on_different_event_loops_are_coalesced(self):
+        started = threading.Event()
+        results = []
+
+        async def slow():
+            started.set()
+            return await self._work(delay=0.2)
+
+        def other_loop():
+            started.wait(1)
+            results.append(asyncio.run(self.flight.do("k", self._work)))
+
+        thread = threading.Thread(target=other_loop)
+        thread.start()
+        results.append(asyncio.run(self.flight.do("k", slow)))
+        thread.join(2)
+
+        self.assertEqual(results, ["done", "done"])
+        self.assertEqual(self.runs, 1)
+
+    def test_copy_results_gives_duplicates_their_own_copy(self):
+        flight = SingleFlight("copies", copy_results=True)
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return {"meta": {}}
+
+        async def main():
+            return await asyncio.gather(flight.do("k", work), flight.do("k", work))
+
+        first, second = asyncio.run(main())
+        self.assertEqual(first, second)
+        self.assertIsNot(first["meta"], second["meta"])
+
+
+class _SlowResponse:
+    text = "chain"
+
+
+class TestDecoratedEntryPoints(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = LLMResponseCache(os.path.join(self.tmp, "llm.sqlite3"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_concurrent_identical_generate_calls_make_one_request(self):
+        async def slow_generate(prompt):
+            await asyncio.sleep(0.05)
+            return _SlowResponse()
+
+        model = AsyncMock()
+        model.generate_content_async.side_effect = slow_generate
+        client = GeminiClient(api_key="test-key")
+        client.response_cache = self.cache
+        client._models["gemini-2.0-flash"] = model
+        before = get_single_flight_stats().get("llm_generate", {}).get("coalesced", 0)
+
+        async def main():
+            return await asyncio.gather(*(client.generate("same prompt") for _ in range(3)))
+
+        responses = asyncio.run(main())
+
+        self.assertEqual([r.content for r in responses], ["chain"] * 3)
+        self.assertEqual(model.generate_content_async.await_count, 1)
+        self.assertEqual(get_single_flight_stats()["llm_generate"]["coalesced"] - before, 2)
+        self.assertIsNot(responses[0], responses[1])  # callers may mutate their copy
+
+    def test_perform_research_is_keyed_on_the_normalized_query_and_options(self):
+        coordinator = ResearchCoordinator()
+
+        self.assertEqual(_research_flight_key(coordinator, "Travis Scott Vocal", deep_research=False),
+                         _research_flight_key(coordinator, "  travis scott   vocal ", deep_research=False))
+        self.assertNotEqual(_research_flight_key(coordinator, "travis scott vocal"),
+                            _research_flight_key(coordinator, "travis scott vocal", deep_research=True))
+        self.assertTrue(ResearchCoordinator.perform_research.single_flight.copy_results)
+
+    def test_coalesced_entry_points_hand_out_copies(self):
+        for method in (GeminiClient.generate, OpenClawRelayClient.generate, OpenAIClient.generate,
+                       WebResearcher.scrape_article, YouTubeResearcher.fetch_transcript):
+            self.assertTrue(method.single_flight.copy_results, method.__qualname__)
+
+
+if __name__ == "__main__":
+    unittest.main()
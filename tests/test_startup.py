@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for staged startup (utils/startup.py) and its use in
+jarvis_engine: lazy subsystems, background warm-up and the startup profile.
+
+Run with:
+    python -m pytest tests/test_startup.py -v
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from utils.startup import LazySubsystem, StartupProfiler, warm_up
+
+
+class TestLazySubsystem(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = StartupProfiler()
+        self.builds = 0
+
+    def _factory(self):
+        self.builds += 1
+        time.sleep(0.05)
+        return MagicMock(name="subsystem")
+
+    def test_built_on_first_attribute_access_only(self):
+        lazy = LazySubsystem("kb", self._factory, self.profiler)
+        self.assertFalse(lazy.ready)
+
+        lazy.get_chain("x")
+        lazy.get_chain("y")
+
+        self.assertTrue(lazy.ready)
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(lazy.get().get_chain.call_count, 2)
+
+    def test_concurrent_first_uses_share_one_build(self):
+        lazy = LazySubsystem("kb", self._factory, self.profiler)
+
+        threads = [threading.Thread(target=lazy.get) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(self.builds, 1)
+
+    def test_failed_build_is_reported_and_retried_on_use(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("no config")
+            return "ok"
+
+        lazy = LazySubsystem("flaky", flaky, self.profiler)
+        errors = []
+        warm_up([lazy], on_error=lambda name, e: errors.append((name, str(e))))
+
+        self.assertEqual(errors, [("flaky", "no config")])
+        self.assertFalse(lazy.ready)
+        self.assertEqual(lazy.get(), "ok")
+
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def test_nested_steps_and_milestones_are_reported_in_order(self):
+        profiler = StartupProfiler()
+        with profiler.measure("agents", "init"):
+            with profiler.measure("config", "init"):
+                pass
+        profiler.mark("session connected")
+
+        lines = profiler.report().splitlines()
+
+        self.assertIn("init   agents", lines[2])
+        self.assertIn("init     config", lines[3])
+        self.assertIn("== session connected ==", lines[4])
+
+    def test_subsystem_init_is_recorded(self):
+        profiler = StartupProfiler()
+        LazySubsystem("kb", lambda: 1, profiler).get()
+
+        self.assertEqual([(r.name, r.phase) for r in profiler.records], [("kb", "init")])
+
+
+class TestEngineStaging(unittest.TestCase):
+
+    def test_heavy_subsystems_are_lazy_stand_ins(self):
+        import jarvis_engine
+
+        for subsystem in jarvis_engine.BACKGROUND_SUBSYSTEMS:
+            self.assertIsInstance(subsystem, LazySubsystem)
+        self.assertNotIn("agent_system", jarvis_engine.__dict__)
+
+    def test_patched_subsystem_is_used_by_call_sites(self):
+        import jarvis_engine
+
+        with patch("jarvis_engine.device_intelligence", MagicMock()) as intel:
+            intel.get_param_info.return_value = {"name": "Threshold"}
+            result = jarvis_engine.get_parameter_info("Compressor", 1)
+
+        intel.get_param_info.assert_called_once_with("Compressor", 1)
+        self.assertTrue(result["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
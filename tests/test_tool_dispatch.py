@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the tool dispatch registry (tool_dispatch.py) and its use by
+jarvis_engine and ableton_bridge: argument coercion, track_index
+validation, per-tool stats, the shared controller tools and per-resource
+ordering of concurrent tool calls.
+
+Run with:
+    python -m pytest tests/test_tool_dispatch.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from tool_dispatch import (
+    ALL_ARGS, TRACK, ResourceScheduler, ToolRegistry, ToolStats,
+    register_controller_tools, to_int,
+)
+
+
+class TestToolRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.controller = MagicMock()
+        self.reliable = MagicMock()
+        self.registry = register_controller_tools(
+            ToolRegistry(), lambda: self.controller, lambda: self.reliable)
+
+    def test_to_int_coerces_numeric_strings_only(self):
+        self.assertEqual(to_int("2.0"), 2)
+        self.assertEqual(to_int(3.7), 3)
+        self.assertEqual(to_int("vocals"), "vocals")
+        self.assertIsNone(to_int(None))
+
+    def test_call_coerces_args_and_applies_defaults(self):
+        self.registry.call("mute_track", {"track_index": "1", "muted": 1.0})
+        self.controller.mute_track.assert_called_once_with(1, 1, verify=False)
+
+        self.registry.call("create_audio_track", {})
+        self.controller.create_audio_track.assert_called_once_with(-1)
+
+    def test_set_device_parameter_goes_through_reliable_params(self):
+        self.registry.call("set_device_parameter",
+                           {"track_index": 0, "device_index": "2", "param_index": "5", "value": 0.5})
+        self.reliable.set_parameter_verified.assert_called_once_with(0, 2, 5, 0.5)
+
+    def test_missing_track_index(self):
+        self.assertTrue(self.registry.missing_track_index("mute_track", {}))
+        self.assertFalse(self.registry.missing_track_index("mute_track", {"track_index": "0"}))
+        self.assertFalse(self.registry.missing_track_index("play", {}))
+        self.assertFalse(self.registry.missing_track_index("no_such_tool", {}))
+
+    def test_all_args_passes_the_whole_dict(self):
+        handler = MagicMock(return_value={"success": True})
+        self.registry.register("pipeline", handler, ALL_ARGS, TRACK)
+        args = {"track_index": "3", "devices": []}
+
+        self.registry.call("pipeline", args)
+
+        handler.assert_called_once_with(args, 3)
+
+    def test_unknown_tool_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.registry.call("no_such_tool", {})
+
+    def test_stats_count_calls_failures_and_exceptions(self):
+        self.controller.play.return_value = {"success": True}
+        self.controller.stop.return_value = {"success": False}
+        self.controller.continue_playback.side_effect = RuntimeError("boom")
+
+        self.registry.call("play", {})
+        self.registry.call("play", {})
+        self.registry.call("stop", {})
+        with self.assertRaises(RuntimeError):
+            self.registry.call("continue_playback", {})
+
+        stats = self.registry.stats.get_stats()
+        self.assertEqual(stats["play"]["calls"], 2)
+        self.assertEqual(stats["play"]["failures"], 0)
+        self.assertEqual(stats["stop"]["failures"], 1)
+        self.assertEqual(stats["continue_playback"]["failures"], 1)
+        self.assertEqual(sum(stats["play"]["histogram"].values()), 2)
+        self.assertIn("play", self.registry.stats.report())
+
+    def test_call_async_uses_the_registered_arg_spec(self):
+        async def handler(track, muted, verify):
+            return {"success": True, "args": (track, muted, verify)}
+
+        result = asyncio.run(self.registry.call_async(
+            "mute_track", {"track_index": "2", "muted": "1"}, handler))
+
+        self.assertEqual(result["args"], (2, 1, False))
+        self.assertEqual(self.registry.stats.get_stats()["mute_track"]["calls"], 1)
+
+
+class TestToolStats(unittest.TestCase):
+
+    def test_histogram_buckets_and_ordering(self):
+        stats = ToolStats(buckets_ms=(1, 10))
+        stats.record("fast", 0.0005)
+        stats.record("slow", 0.005)
+        stats.record("slow", 0.5)
+
+        result = stats.get_stats()
+
+        self.assertEqual(list(result), ["slow", "fast"])
+        self.assertEqual(result["fast"]["histogram"], {"<=1ms": 1})
+        self.assertEqual(result["slow"]["histogram"], {"<=10ms": 1, ">10ms": 1})
+        self.assertAlmostEqual(result["slow"]["mean_ms"], 252.5)
+
+        stats.reset()
+        self.assertEqual(stats.get_stats(), {})
+
+
+class TestResourceScheduler(unittest.TestCase):
+
+    def _run(self, calls):
+        """Run (label, keys, seconds) calls concurrently; return (start, end) order"""
+        scheduler = ResourceScheduler()
+        events = []
+
+        async def work(label, seconds):
+            events.append(("start", label))
+            await asyncio.sleep(seconds)
+            events.append(("end", label))
+
+        async def main():
+            await asyncio.gather(*(scheduler.run(keys, lambda l=label, s=seconds: work(l, s))
+                                   for label, keys, seconds in calls))
+
+        asyncio.run(main())
+        return events, scheduler
+
+    def test_resource_keys(self):
+        registry = register_controller_tools(ToolRegistry(), MagicMock, MagicMock)
+
+        self.assertEqual(registry.resource_keys("mute_track", {"track_index": "2"}), ("track:2",))
+        self.assertEqual(registry.resource_keys("get_track_list", {}), ())
+        self.assertEqual(registry.resource_keys("set_tempo", {"bpm": 120}), ("song",))
+        self.assertIsNone(registry.resource_keys("delete_track", {"track_index": 1}))
+        plans = [{"track_index": 3, "devices": []}, {"track_index": "1", "devices": []}]
+        self.assertEqual(registry.resource_keys("build_chain_pipeline", {"plans": plans}),
+                         ("track:1", "track:3"))
+        self.assertIsNone(registry.resource_keys("build_chain_pipeline", {"plans": [{"devices": []}]}))
+
+    def test_same_track_calls_are_serialized_in_order(self):
+        events, scheduler = self._run([("a", ("track:1",), 0.03), ("b", ("track:1",), 0.0)])
+
+        self.assertEqual(events, [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")])
+        self.assertEqual(scheduler.get_stats()["waited"], 1)
+
+    def test_independent_calls_overlap(self):
+        events, _ = self._run([("a", ("track:1",), 0.03), ("b", ("track:2",), 0.0),
+                               ("r1", (), 0.03), ("r2", (), 0.0)])
+
+        self.assertLess(events.index(("end", "b")), events.index(("end", "a")))
+        self.assertLess(events.index(("end", "r2")), events.index(("end", "r1")))
+
+    def test_trackless_read_sees_earlier_writes(self):
+        registry = register_controller_tools(ToolRegistry(), MagicMock, MagicMock)
+        arm = registry.resource_keys("arm_track", {"track_index": 1, "armed": 1})
+        read = registry.resource_keys("get_armed_tracks", {})
+
+        events, _ = self._run([("arm", arm, 0.03), ("get_armed_tracks", read, 0.0),
+                               ("mute", ("track:2",), 0.0)])
+
+        self.assertGreater(events.index(("start", "get_armed_tracks")), events.index(("end", "arm")))
+        self.assertGreater(events.index(("start", "mute")), events.index(("end", "get_armed_tracks")))
+
+    def test_barrier_waits_for_earlier_and_blocks_later_calls(self):
+        events, _ = self._run([("a", ("track:1",), 0.02), ("read", (), 0.04),
+                               ("delete", None, 0.0), ("b", ("track:2",), 0.0)])
+
+        delete_start = events.index(("start", "delete"))
+        self.assertGreater(delete_start, events.index(("end", "a")))
+        self.assertGreater(delete_start, events.index(("end", "read")))
+        self.assertGreater(events.index(("start", "b")), events.index(("end", "delete")))
+
+    def test_failed_call_releases_its_resources(self):
+        scheduler = ResourceScheduler()
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def ok():
+            return "ok"
+
+        async def main():
+            return await asyncio.gather(scheduler.run(("song",), boom), scheduler.run(("song",), ok),
+                                        return_exceptions=True)
+
+        first, second = asyncio.run(main())
+        self.assertIsInstance(first, RuntimeError)
+        self.assertEqual(second, "ok")
+
+
+class TestEngineAndBridgeRegistries(unittest.TestCase):
+
+    def test_engine_and_bridge_share_the_controller_tools(self):
+        import ableton_bridge
+        import jarvis_engine
+
+        shared = set(ableton_bridge.TOOLS) - {"describe_functions", "diag_osc"}
+        self.assertTrue(shared <= set(jarvis_engine.TOOLS))
+        self.assertIn("build_chain_pipeline", jarvis_engine.TOOLS)
+        self.assertEqual(ableton_bridge.TRACK_OPERATIONS & jarvis_engine.TRACK_OPERATIONS,
+                         ableton_bridge.TRACK_OPERATIONS)
+
+    def test_engine_dispatch_requires_track_index(self):
+        import jarvis_engine
+
+        result = jarvis_engine.execute_ableton_function("mute_track", {"muted": 1})
+
+        self.assertFalse(result["success"])
+        self.assertIn("Track index required", result["message"])
+
+    def test_engine_dispatch_reads_module_globals_per_call(self):
+        import jarvis_engine
+
+        controller = MagicMock()
+        controller.set_tempo.return_value = {"success": True}
+        with patch.object(jarvis_engine, "ableton", controller):
+            result = jarvis_engine.execute_ableton_function("set_tempo", {"bpm": 120})
+
+        self.assertTrue(result["success"])
+        controller.set_tempo.assert_called_once_with(120)
+        self.assertEqual(jarvis_engine.execute_ableton_function("nope", {})["message"],
+                         "Unknown function: nope")
+
+    def test_chain_pipeline_plans_run_through_execute_many(self):
+        import jarvis_engine
+        from pipeline.executor import ChainPipelineExecutor
+        from pipeline.schemas import MultiPipelineResult
+
+        multi = MultiPipelineResult(success=True, tracks_planned=2, tracks_succeeded=2)
+        args = {"plans": [{"track_index": 0, "devices": [{"name": "EQ Eight"}]},
+                          {"track_index": 2, "devices": [{"name": "Compressor"}]}],
+                "dry_run": True}
+        with patch.object(jarvis_engine, "ableton", MagicMock()), \
+                patch.object(ChainPipelineExecutor, "execute_many", return_value=multi) as execute_many, \
+                patch.object(ChainPipelineExecutor, "execute") as execute:
+            result = jarvis_engine.execute_ableton_function("build_chain_pipeline", args)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["tracks_succeeded"], 2)
+        execute.assert_not_called()
+        plans = execute_many.call_args[0][0]
+        self.assertEqual([p.track_index for p in plans], [0, 2])
+        self.assertTrue(all(p.dry_run for p in plans))
+
+    def test_async_track_writes_forward_verify(self):
+        import jarvis_engine
+
+        controller = MagicMock()
+        controller.set_track_volume.return_value = {"success": True}
+        with patch.object(jarvis_engine, "ableton", controller):
+            result = asyncio.run(jarvis_engine.execute_ableton_function_async(
+                "set_track_volume", {"track_index": 0, "volume": 0.5, "verify": True}))
+
+        self.assertTrue(result["success"])
+        controller.set_track_volume.assert_called_once_with(0, 0.5, verify=True)
+
+
+class TestEngineToolCalls(unittest.TestCase):
+
+    def setUp(self):
+        import jarvis_engine
+        self.engine = jarvis_engine
+        patcher = patch.object(jarvis_engine, "RETRY_DELAY", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        jarvis_engine.session_connected.set()
+        self.session = SimpleNamespace(send_tool_response=AsyncMock())
+        session_patcher = patch.object(jarvis_engine, "_active_session", self.session)
+        session_patcher.start()
+        self.addCleanup(session_patcher.stop)
+
+    def _call(self, name, call_id, **args):
+        return SimpleNamespace(name=name, id=call_id, args=args)
+
+    def test_turn_tool_calls_run_concurrently_and_reply_once(self):
+        def slow_tool(name, args):
+            time.sleep(0.2)
+            return {"success": True, "message": name}
+
+        session = self.session
+        calls = [self._call("get_track_mute", "1", track_index=0),
+                 self._call("get_track_solo", "2", track_index=1),
+                 self._call("get_track_list", "3")]
+
+        with patch.object(self.engine, "_ASYNC_TOOL_HANDLERS", {}), \
+                patch.object(self.engine, "execute_ableton_function", side_effect=slow_tool):
+            started = time.perf_counter()
+            results = asyncio.run(self.engine.handle_tool_calls(session, calls))
+            elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual([r["message"] for r in results],
+                         ["get_track_mute", "get_track_solo", "get_track_list"])
+        session.send_tool_response.assert_awaited_once()
+        responses = session.send_tool_response.await_args.kwargs["function_responses"]
+        self.assertEqual([r.id for r in responses], ["1", "2", "3"])
+
+    def test_failed_tool_is_retried_and_reported(self):
+        execute = MagicMock(return_value={"success": False, "message": "no reply"})
+        session = self.session
+
+        with patch.object(self.engine, "_ASYNC_TOOL_HANDLERS", {}), \
+                patch.object(self.engine, "execute_ableton_function", execute):
+            results = asyncio.run(self.engine.handle_tool_calls(
+                session, [self._call("set_tempo", "1", bpm=120)]))
+
+        self.assertEqual(execute.call_count, self.engine.MAX_RETRIES + 1)
+        self.assertFalse(results[0]["success"])
+
+    def test_arm_then_get_armed_tracks_reads_after_the_write(self):
+        events = []
+
+        def tool(name, args):
+            events.append(("start", name))
+            time.sleep(0.05 if name == "arm_track" else 0)
+            events.append(("end", name))
+            return {"success": True, "message": name}
+
+        calls = [self._call("arm_track", "1", track_index=1, armed=1),
+                 self._call("get_armed_tracks", "2")]
+        with patch.object(self.engine, "_ASYNC_TOOL_HANDLERS", {}), \
+                patch.object(self.engine, "execute_ableton_function", side_effect=tool):
+            asyncio.run(self.engine.handle_tool_calls(self.session, calls))
+
+        self.assertEqual(events, [("start", "arm_track"), ("end", "arm_track"),
+                                  ("start", "get_armed_tracks"), ("end", "get_armed_tracks")])
+
+    def test_stale_session_reply_is_dropped(self):
+        stale = SimpleNamespace(send_tool_response=AsyncMock())
+        execute = MagicMock(return_value={"success": True, "message": "ok"})
+
+        async def main():
+            task = self.engine.spawn_tool_calls(stale, [self._call("set_tempo", "1", bpm=120)])
+            return await task
+
+        with patch.object(self.engine, "_ASYNC_TOOL_HANDLERS", {}), \
+                patch.object(self.engine, "execute_ableton_function", execute):
+            self.assertIsNone(asyncio.run(main()))
+
+        stale.send_tool_response.assert_not_awaited()
+        execute.assert_not_called()
+        self.assertTrue(self.engine.session_connected.is_set())
+
+    def test_session_teardown_cancels_pending_tool_calls(self):
+        async def hang(name, args):
+            await asyncio.sleep(10)
+
+        async def main():
+            task = self.engine.spawn_tool_calls(self.session, [self._call("set_tempo", "1", bpm=120)])
+            await asyncio.sleep(0.01)
+            self.engine._active_session = None
+            await self.engine.cancel_tool_calls(self.session)
+            return task
+
+        with patch.object(self.engine, "_execute_with_retries", side_effect=hang):
+            started = time.perf_counter()
+            task = asyncio.run(main())
+
+        self.assertTrue(task.cancelled())
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertEqual(self.engine._tool_call_tasks, {})
+        self.session.send_tool_response.assert_not_awaited()
+
+    def test_failed_outcomes_become_error_responses(self):
+        self.assertEqual(self.engine._as_tool_result(RuntimeError("boom")),
+                         {"success": False, "message": "Error: boom"})
+        self.assertEqual(self.engine._as_tool_result({"success": True}), {"success": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,443 @@
+"""
+Tool Dispatch Registry
+
+One table, built once per process, mapping tool names (the Gemini function
+declarations and the ableton_bridge CLI commands) to handlers, with a
+declarative spec of how each argument is read and coerced and whether the
+tool needs a track_index.
+
+The controller-level tools shared by jarvis_engine and ableton_bridge are
+registered by ``register_controller_tools``; each front end adds its own
+tools on top. Every dispatch is counted and timed per tool.
+
+Usage:
+    registry = ToolRegistry()
+    register_controller_tools(registry, lambda: ableton, lambda: reliable_params)
+    registry.register("get_track_status", get_track_status_combined, TRACK, track=True)
+
+    if registry.missing_track_index("mute_track", args):
+        ...
+    result = registry.call("mute_track", {"track_index": "0", "muted": 1})
+    print(registry.stats.report())
+
+    # Concurrent calls: same-track calls keep their order, reads run in parallel
+    scheduler = ResourceScheduler()
+    await scheduler.run(registry.resource_keys(name, args), lambda: run_tool(name, args))
+
+Deliberately free of ableton_controls / Gemini imports so the bridge CLI can
+list and validate tools without the OSC runtime installed.
+"""
+
+import asyncio
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+def to_int(value):
+    """Coerce a value to int where possible (numeric strings included)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        # Handle string numbers
+        try:
+            return int(float(value))
+        except ValueError:
+            return value
+    if isinstance(value, (int, float)):
+        return int(value)
+    return value
+
+
+class Arg(NamedTuple):
+    """How one tool argument is read from the call's args dict ("*" = the whole dict)"""
+    name: str
+    coerce: Optional[Callable[[Any], Any]] = None
+    default: Any = None
+
+
+# Shared argument specs
+TRACK = Arg("track_index", to_int)
+DEVICE = Arg("device_index", to_int)
+PARAM = Arg("param_index", to_int)
+VERIFY = Arg("verify", bool, False)
+ALL_ARGS = Arg("*")
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A registered tool: handler(*coerced args), in spec order"""
+    name: str
+    handler: Callable[..., Any]
+    args: Tuple[Arg, ...]
+    requires_track: bool = False
+
+    def bind(self, args: Dict[str, Any]) -> List[Any]:
+        """Read and coerce this tool's arguments from an args dict"""
+        values = []
+        for arg in self.args:
+            if arg.name == "*":
+                values.append(args)
+                continue
+            value = args.get(arg.name, arg.default)
+            if arg.coerce is not None and value is not None:
+                value = arg.coerce(value)
+            values.append(value)
+        return values
+
+
+# Tools that only read state; without a track_index they touch no resource
+READ_PREFIXES = ("get_", "find_", "list_", "search_", "lookup_", "explain_",
+                 "consult_", "suggest_", "describe_")
+
+# Tools that renumber tracks or replay several actions: they wait for every
+# earlier call and every later call waits for them
+BARRIER_TOOLS = frozenset({
+    "create_audio_track", "create_midi_track", "create_return_track",
+    "delete_track", "delete_return_track", "duplicate_track",
+    "execute_macro", "undo_last_action",
+})
+
+# Latency histogram bucket upper bounds, in milliseconds
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class ToolStats:
+    """Thread-safe per-tool call counts and latency histograms"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self._tools: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, name: str, seconds: float, failed: bool = False) -> None:
+        """Record one call of a tool"""
+        ms = seconds * 1000.0
+        slot = bisect.bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            entry = self._tools.get(name)
+            if entry is None:
+                entry = {"calls": 0, "failures": 0, "total_ms": 0.0, "max_ms": 0.0,
+                         "histogram": [0] * (len(self.buckets_ms) + 1)}
+                self._tools[name] = entry
+            entry["calls"] += 1
+            entry["failures"] += int(failed)
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["histogram"][slot] += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-tool stats, busiest (by total time) first:
+        {name: {"calls", "failures", "total_ms", "mean_ms", "max_ms",
+                "histogram": {"<=1ms": n, ..., ">10000ms": n}}}
+        """
+        labels = [f"<={b:g}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]:g}ms"]
+        with self._lock:
+            items = [(name, dict(entry, histogram=list(entry["histogram"])))
+                     for name, entry in self._tools.items()]
+        items.sort(key=lambda item: item[1]["total_ms"], reverse=True)
+        stats = {}
+        for name, entry in items:
+            entry["mean_ms"] = entry["total_ms"] / entry["calls"]
+            entry["histogram"] = {label: n for label, n in zip(labels, entry["histogram"]) if n}
+            stats[name] = entry
+        return stats
+
+    def report(self, limit: int = 15) -> str:
+        """Text table of the tools that took the most time"""
+        stats = self.get_stats()
+        if not stats:
+            return "No tool calls recorded"
+        lines = [f"{'tool':<32} {'calls':>6} {'fail':>5} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        for name, s in list(stats.items())[:limit]:
+            lines.append(f"{name:<32} {s['calls']:>6} {s['failures']:>5} {s['total_ms']:>10.1f} "
+                         f"{s['mean_ms']:>9.1f} {s['max_ms']:>9.1f}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+
+
+def _failed(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("success") is False
+
+
+class ToolRegistry:
+    """Name -> ToolSpec table with timed dispatch"""
+
+    def __init__(self):
+        self._tools: Dict[str, ToolSpec] = {}
+        self.stats = ToolStats()
+
+    def register(self, name: str, handler: Callable[..., Any], *args: Arg,
+                 track: bool = False) -> None:
+        """
+        Register (or replace) a tool.
+
+        Args:
+            name: Tool name
+            handler: Called with the coerced values of ``args``, in order
+            *args: Argument specs
+            track: True if the tool cannot run without a track_index
+        """
+        self._tools[name] = ToolSpec(name, handler, tuple(args), track)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tools
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tools)
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        return self._tools.get(name)
+
+    def names(self) -> List[str]:
+        """Sorted tool names"""
+        return sorted(self._tools)
+
+    def track_operations(self) -> frozenset:
+        """Names of the tools that require a track_index"""
+        return frozenset(name for name, spec in self._tools.items() if spec.requires_track)
+
+    def missing_track_index(self, name: str, args: Dict[str, Any]) -> bool:
+        """True if the tool needs a track_index and args has none"""
+        spec = self._tools.get(name)
+        return spec is not None and spec.requires_track and to_int(args.get("track_index")) is None
+
+    def resource_keys(self, name: str, args: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+        """
+        What a call touches, for ResourceScheduler.
+
+        Returns:
+            None for barrier tools; ("track:N",) for calls on a track (one
+            key per track for multi-track plans);
+            () for track-less reads (ordered after every earlier write);
+            ("song",) for other track-less calls
+        """
+        if name in BARRIER_TOOLS:
+            return None
+        plans = args.get("plans")
+        if plans:
+            # Multi-track call (build_chain_pipeline): hold every plan's track
+            tracks = [to_int(plan.get("track_index")) for plan in plans]
+            if args.get("devices"):
+                tracks.append(to_int(args.get("track_index")))
+            if not all(isinstance(t, int) for t in tracks):
+                return None
+            return tuple(f"track:{t}" for t in sorted(set(tracks)))
+        track_index = to_int(args.get("track_index"))
+        if isinstance(track_index, int):
+            return (f"track:{track_index}",)
+        if name.startswith(READ_PREFIXES):
+            return ()
+        return ("song",)
+
+    def call(self, name: str, args: Dict[str, Any]) -> Any:
+        """
+        Run a tool with an args dict (timed and counted).
+
+        Raises:
+            KeyError: Unknown tool name
+            Exception: Whatever the handler raises (recorded as a failure)
+        """
+        spec = self._tools[name]
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = spec.handler(*spec.bind(args))
+            failed = _failed(result)
+            return result
+        finally:
+            self.stats.record(name, time.perf_counter() - start, failed)
+
+    async def call_async(self, name: str, args: Dict[str, Any],
+                         handler: Callable[..., Any]) -> Any:
+        """Await an async ``handler`` with this tool's coerced args (timed and counted)"""
+        spec = self._tools[name]
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = await handler(*spec.bind(args))
+            failed = _failed(result)
+            return result
+        finally:
+            self.stats.record(name, time.perf_counter() - start, failed)
+
+
+class ResourceScheduler:
+    """
+    Orders concurrent async calls by the resources they touch.
+
+    A call starts once every earlier call sharing one of its keys has
+    finished, so calls on the same track run in submission order while
+    calls with disjoint keys overlap. A call with keys=() is a track-less
+    read (e.g. get_armed_tracks): it waits for every earlier keyed call and
+    later keyed calls wait for it, but reads overlap each other. A call with
+    keys=None is a barrier: it waits for all earlier calls, and all later
+    calls wait for it. Must be used from a single event loop.
+    """
+
+    def __init__(self):
+        self._tails: Dict[str, asyncio.Future] = {}
+        self._reads: set = set()
+        self._inflight: set = set()
+        self._barrier: Optional[asyncio.Future] = None
+        self.stats = {"calls": 0, "waited": 0, "barriers": 0}
+
+    async def run(self, keys: Optional[Tuple[str, ...]], start: Callable[[], Any]) -> Any:
+        """
+        Await ``start()`` once the call's resources are free.
+
+        Args:
+            keys: Resource keys from ToolRegistry.resource_keys
+                (() = track-less read, None = barrier)
+            start: Returns the awaitable to run
+        """
+        done = asyncio.get_running_loop().create_future()
+        waits = [self._barrier] if self._barrier is not None else []
+        if keys is None:
+            waits.extend(self._inflight)
+            self._tails.clear()
+            self._reads.clear()
+            self._barrier = done
+            self.stats["barriers"] += 1
+        elif not keys:
+            waits.extend(self._tails.values())
+            self._reads.add(done)
+        else:
+            waits.extend(self._tails[key] for key in keys if key in self._tails)
+            waits.extend(self._reads)
+            for key in keys:
+                self._tails[key] = done
+        self._inflight.add(done)
+
+        self.stats["calls"] += 1
+        pending = [w for w in waits if not w.done()]
+        try:
+            if pending:
+                self.stats["waited"] += 1
+                await asyncio.wait(pending)
+            return await start()
+        finally:
+            done.set_result(None)
+            self._inflight.discard(done)
+            self._reads.discard(done)
+            for key in keys or ():
+                if self._tails.get(key) is done:
+                    del self._tails[key]
+            if self._barrier is done:
+                self._barrier = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+
+def register_controller_tools(registry: ToolRegistry,
+                              controller: Callable[[], Any],
+                              reliable: Callable[[], Any]) -> ToolRegistry:
+    """
+    Register the AbletonController / ReliableParameterController tools
+    shared by jarvis_engine and ableton_bridge.
+
+    Args:
+        registry: Registry to add to
+        controller: Returns the AbletonController (looked up per call)
+        reliable: Returns the ReliableParameterController (looked up per call)
+    """
+    c = controller
+    r = reliable
+    reg = registry.register
+
+    # Playback
+    reg("play", lambda: c().play())
+    reg("stop", lambda: c().stop())
+    reg("continue_playback", lambda: c().continue_playback())
+    reg("start_recording", lambda: c().start_recording())
+    reg("stop_recording", lambda: c().stop_recording())
+    reg("toggle_metronome", lambda state: c().toggle_metronome(state), Arg("state", to_int))
+
+    # Transport
+    reg("set_tempo", lambda bpm: c().set_tempo(bpm), Arg("bpm"))
+    reg("set_position", lambda beat: c().set_position(beat), Arg("beat"))
+    reg("set_loop", lambda enabled: c().set_loop(enabled), Arg("enabled", to_int))
+    reg("set_loop_start", lambda beat: c().set_loop_start(beat), Arg("beat"))
+    reg("set_loop_length", lambda beats: c().set_loop_length(beats), Arg("beats"))
+
+    # Track controls
+    reg("mute_track", lambda t, muted, verify: c().mute_track(t, muted, verify=verify),
+        TRACK, Arg("muted", to_int), VERIFY, track=True)
+    reg("solo_track", lambda t, soloed, verify: c().solo_track(t, soloed, verify=verify),
+        TRACK, Arg("soloed", to_int), VERIFY, track=True)
+    reg("arm_track", lambda t, armed, verify: c().arm_track(t, armed, verify=verify),
+        TRACK, Arg("armed", to_int), VERIFY, track=True)
+    reg("set_track_volume", lambda t, volume, verify: c().set_track_volume(t, volume, verify=verify),
+        TRACK, Arg("volume"), VERIFY, track=True)
+    reg("set_track_pan", lambda t, pan, verify: c().set_track_pan(t, pan, verify=verify),
+        TRACK, Arg("pan"), VERIFY, track=True)
+    reg("set_track_send",
+        lambda t, send, level, verify: c().set_track_send(t, send, level, verify=verify),
+        TRACK, Arg("send_index", to_int), Arg("level"), VERIFY, track=True)
+
+    # Scene / clip
+    reg("fire_scene", lambda scene: c().fire_scene(scene), Arg("scene_index", to_int))
+    reg("fire_clip", lambda t, clip: c().fire_clip(t, clip), TRACK, Arg("clip_index", to_int), track=True)
+    reg("stop_clip", lambda t: c().stop_clip(t), TRACK, track=True)
+
+    # Track management
+    reg("create_audio_track", lambda index: c().create_audio_track(index), Arg("index", to_int, -1))
+    reg("create_midi_track", lambda index: c().create_midi_track(index), Arg("index", to_int, -1))
+    reg("create_return_track", lambda: c().create_return_track())
+    reg("delete_track", lambda t: c().delete_track(t), TRACK, track=True)
+    reg("delete_return_track", lambda t: c().delete_return_track(t), TRACK, track=True)
+    reg("duplicate_track", lambda t: c().duplicate_track(t), TRACK, track=True)
+    reg("set_track_name", lambda t, name: c().set_track_name(t, name), TRACK, Arg("name"), track=True)
+    reg("set_track_color", lambda t, color: c().set_track_color(t, color),
+        TRACK, Arg("color_index", to_int), track=True)
+
+    # Track queries
+    reg("get_track_list", lambda: c().get_track_list())
+    reg("get_track_mute", lambda t: c().get_track_mute(t), TRACK, track=True)
+    reg("get_track_solo", lambda t: c().get_track_solo(t), TRACK, track=True)
+    reg("get_track_arm", lambda t: c().get_track_arm(t), TRACK, track=True)
+    reg("get_track_volume", lambda t: c().get_track_volume(t), TRACK, track=True)
+    reg("get_track_pan", lambda t: c().get_track_pan(t), TRACK, track=True)
+    reg("get_track_send", lambda t, send: c().get_track_send(t, send),
+        TRACK, Arg("send_index", to_int), track=True)
+
+    # Device queries
+    reg("get_num_devices", lambda t: c().get_num_devices_sync(t), TRACK, track=True)
+    reg("get_track_devices", lambda t: c().get_track_devices_sync(t), TRACK, track=True)
+    reg("get_device_name", lambda t, d: c().get_device_name(t, d), TRACK, DEVICE, track=True)
+    reg("get_device_class_name", lambda t, d: c().get_device_class_name(t, d), TRACK, DEVICE, track=True)
+    reg("get_device_parameters", lambda t, d: c().get_device_parameters_name_sync(t, d),
+        TRACK, DEVICE, track=True)
+    reg("get_device_parameter_value", lambda t, d, p: c().get_device_parameter_value_sync(t, d, p),
+        TRACK, DEVICE, PARAM, track=True)
+
+    # Device control (parameter sets go through the verified controller)
+    reg("set_device_parameter", lambda t, d, p, value: r().set_parameter_verified(t, d, p, value),
+        TRACK, DEVICE, PARAM, Arg("value"), track=True)
+    reg("set_device_parameter_by_name",
+        lambda t, d, name, value: r().set_parameter_by_name(t, d, name, value),
+        TRACK, DEVICE, Arg("param_name"), Arg("value"), track=True)
+    reg("set_device_parameters_by_name", lambda t, d, params: r().set_parameters_by_name(t, d, params),
+        TRACK, DEVICE, Arg("params", None, {}), track=True)
+    reg("set_device_enabled", lambda t, d, enabled: c().set_device_enabled(t, d, enabled),
+        TRACK, DEVICE, Arg("enabled", to_int), track=True)
+
+    # Plugin management
+    reg("add_plugin_to_track", lambda t, name, pos: c().load_device(t, name, pos),
+        TRACK, Arg("plugin_name"), Arg("position", to_int, -1), track=True)
+    reg("get_available_plugins", lambda category: c().get_available_plugins(category), Arg("category"))
+    reg("find_plugin", lambda query, category: c().find_plugin(query, category),
+        Arg("query"), Arg("category"))
+    reg("refresh_plugin_list", lambda: c().refresh_plugin_list())
+
+    return registry
@@ -1,3 +1,9 @@
 from .storage_manager import StorageManager
+from .startup import LazySubsystem, StartupProfiler, startup_profiler, warm_up
+from .audio_capture import EnergyGate, MicCapture, PcmRingBuffer
+from .audio_playback import PlaybackEngine
+from .relay_worker import RelayError, RelayTimeout, RelayWorker, RelayWorkerPool
 
-__all__ = ["StorageManager"]
+__all__ = ["StorageManager", "LazySubsystem", "StartupProfiler", "startup_profiler", "warm_up",
+           "EnergyGate", "MicCapture", "PcmRingBuffer", "PlaybackEngine",
+           "RelayError", "RelayTimeout", "RelayWorker", "RelayWorkerPool"]
@@ -0,0 +1,300 @@
+"""
+Microphone Capture Pipeline
+
+Moves mic audio from PyAudio to the Gemini Live session with as little
+per-chunk work on the event loop as possible:
+
+- A dedicated reader thread blocks on ``stream.read`` and appends raw PCM
+  into a fixed-size ring buffer (no per-chunk thread hop, dict or queue
+  item). When the consumer falls behind, the oldest audio is overwritten
+  and counted as dropped instead of being silently discarded.
+- The sender coalesces the buffer into fixed-duration frames (e.g. 100 ms)
+  so each ``send_realtime_input`` call carries more audio.
+- An energy gate skips frames of silence. A short pre-roll is kept so
+  speech onsets are not clipped, and a hangover keeps sending for a while
+  after speech so the server-side VAD still sees the end of the utterance.
+
+Usage:
+    mic = MicCapture(sample_rate=16000, chunk_frames=1024, frame_ms=100)
+    mic.start(stream)                    # reader thread
+    frame = await mic.read_frame(timeout=1.0)
+    for out in gate.process(frame):
+        await session.send_realtime_input(media={"data": out, ...})
+        mic.record_send(len(out), elapsed)
+    print(mic.get_stats())
+"""
+
+import array
+import asyncio
+import math
+import operator
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+
+def pcm_rms(data: bytes) -> float:
+    """RMS level of little-endian 16-bit mono PCM (0..32768)"""
+    samples = array.array("h")
+    samples.frombytes(data[:len(data) - len(data) % SAMPLE_WIDTH])
+    if sys.byteorder != "little":
+        samples.byteswap()
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(map(operator.mul, samples, samples)) / len(samples))
+
+
+class PcmRingBuffer:
+    """
+    Fixed-capacity byte ring shared by one writer and one reader thread.
+
+    Writes never block: when full, the oldest bytes are overwritten and
+    reported as dropped.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buf = bytearray(capacity)
+        self._start = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> int:
+        return self._size
+
+    def write(self, data: bytes) -> int:
+        """Append data; returns the number of old bytes overwritten"""
+        view = memoryview(data)
+        if len(view) > self.capacity:
+            view = view[len(view) - self.capacity:]
+        with self._lock:
+            dropped = max(0, self._size + len(view) - self.capacity)
+            if dropped:
+                self._start = (self._start + dropped) % self.capacity
+                self._size -= dropped
+            end = (self._start + self._size) % self.capacity
+            first = min(len(view), self.capacity - end)
+            self._buf[end:end + first] = view[:first]
+            self._buf[:len(view) - first] = view[first:]
+            self._size += len(view)
+        return dropped + len(data) - len(view)
+
+    def read(self, size: int) -> Optional[bytes]:
+        """Remove and return exactly size bytes, or None if fewer are buffered"""
+        with self._lock:
+            if self._size < size:
+                return None
+            end = self._start + size
+            if end <= self.capacity:
+                data = bytes(self._buf[self._start:end])
+            else:
+                data = bytes(self._buf[self._start:]) + bytes(self._buf[:end - self.capacity])
+            self._start = end % self.capacity
+            self._size -= size
+            return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._start = 0
+            self._size = 0
+
+
+class EnergyGate:
+    """
+    Decides which frames are worth sending.
+
+    ``process(frame)`` returns the frames to send now: nothing while silent,
+    the buffered pre-roll plus the frame when speech starts, and every frame
+    until ``hangover_frames`` quiet frames have passed after speech.
+    A threshold of 0 disables gating.
+
+    ``last_voice_at`` is the capture time (``at``) of the last frame above
+    the threshold: where the user actually stopped talking, a hangover
+    earlier than the gate closing.
+    """
+
+    def __init__(self, threshold: float, hangover_frames: int = 10, preroll_frames: int = 3):
+        self.threshold = threshold
+        self.hangover_frames = hangover_frames
+        self._preroll: deque = deque(maxlen=max(preroll_frames, 1))
+        self._preroll_frames = preroll_frames
+        self._quiet = hangover_frames + 1  # start closed
+        self.is_open = False
+        self.last_voice_at: Optional[float] = None
+
+    def process(self, frame: bytes, at: Optional[float] = None) -> List[bytes]:
+        if self.threshold <= 0:
+            return [frame]
+        if pcm_rms(frame) >= self.threshold:
+            self._quiet = 0
+            self.last_voice_at = at if at is not None else time.perf_counter()
+        else:
+            self._quiet += 1
+
+        if self._quiet <= self.hangover_frames:
+            out = list(self._preroll) + [frame] if not self.is_open else [frame]
+            self._preroll.clear()
+            self.is_open = True
+            return out
+
+        self.is_open = False
+        if self._preroll_frames > 0:
+            self._preroll.append(frame)
+        return []
+
+    def reset(self) -> None:
+        """Close the gate and forget the pre-roll (e.g. while Jarvis speaks)"""
+        self._preroll.clear()
+        self._quiet = self.hangover_frames + 1
+        self.is_open = False
+
+
+class MicCapture:
+    """
+    Reader thread + ring buffer + frame coalescing for one mic stream.
+
+    One instance lives for the whole process; ``start``/``stop`` attach and
+    detach a PyAudio input stream per session.
+    """
+
+    def __init__(self, sample_rate: int = 16000, chunk_frames: int = 1024,
+                 frame_ms: int = 100, buffer_seconds: float = 2.0):
+        self.sample_rate = sample_rate
+        self.chunk_frames = chunk_frames
+        self.bytes_per_ms = sample_rate * SAMPLE_WIDTH / 1000.0
+        self.frame_bytes = int(self.bytes_per_ms * frame_ms) // SAMPLE_WIDTH * SAMPLE_WIDTH
+        self.ring = PcmRingBuffer(max(int(self.bytes_per_ms * buffer_seconds * 1000),
+                                      2 * self.frame_bytes))
+        self._stream = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Event] = None
+        self.error: Optional[Exception] = None
+        # perf_counter() time the last sample of the last read frame was captured
+        self.last_frame_at: Optional[float] = None
+        # Each counter has one writer: capture_stats belongs to the reader
+        # thread, stats to the event loop (read_frame, record_send and the
+        # sender's own counts). get_stats() merges them.
+        self.capture_stats = {
+            "chunks_captured": 0,
+            "bytes_captured": 0,
+            "bytes_dropped": 0,
+        }
+        self.stats = {
+            "frames_read": 0,
+            "frames_sent": 0,
+            "frames_gated": 0,     # silence skipped by the energy gate
+            "frames_muted": 0,     # discarded while Jarvis was speaking
+            "bytes_sent": 0,
+            "send_ms_total": 0.0,
+            "send_ms_max": 0.0,
+            "max_backlog_ms": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._running.is_set()
+
+    def start(self, stream, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Start the reader thread on an open input stream (call from the event loop)"""
+        self.stop()
+        self._stream = stream
+        self._loop = loop or asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self.error = None
+        self.ring.clear()
+        self._running.set()
+        self._thread = threading.Thread(target=self._reader, daemon=True, name="jarvis-mic")
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the reader thread (the stream is left for the caller to close)"""
+        self._running.clear()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._stream = None
+
+    def clear(self) -> None:
+        """Discard buffered audio"""
+        self.ring.clear()
+
+    def _reader(self) -> None:
+        stream = self._stream
+        while self._running.is_set():
+            try:
+                data = stream.read(self.chunk_frames, exception_on_overflow=False)
+            except Exception as e:
+                if self._running.is_set():
+                    self.error = e
+                break
+            capture = self.capture_stats
+            capture["chunks_captured"] += 1
+            capture["bytes_captured"] += len(data)
+            capture["bytes_dropped"] += self.ring.write(data)
+            if self.ring.available >= self.frame_bytes:
+                self._notify()
+        self._running.clear()
+        self._notify()
+
+    def _notify(self) -> None:
+        loop, ready = self._loop, self._ready
+        if loop is not None and ready is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                pass  # loop shutting down
+
+    async def read_frame(self, timeout: float = 1.0) -> Optional[bytes]:
+        """
+        Next coalesced frame, or None on timeout / when the reader stopped
+        with too little audio for a frame.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            backlog = self.ring.available
+            frame = self.ring.read(self.frame_bytes)
+            if frame is not None:
+                self.stats["frames_read"] += 1
+                # Audio still buffered behind this frame was captured after it
+                behind_ms = (backlog - len(frame)) / self.bytes_per_ms
+                self.last_frame_at = time.perf_counter() - behind_ms / 1000.0
+                backlog_ms = backlog / self.bytes_per_ms
+                if backlog_ms > self.stats["max_backlog_ms"]:
+                    self.stats["max_backlog_ms"] = backlog_ms
+                return frame
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._ready is None or not self.running:
+                return None
+            self._ready.clear()
+            if self.ring.available >= self.frame_bytes:
+                continue
+            try:
+                await asyncio.wait_for(self._ready.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def record_send(self, nbytes: int, seconds: float) -> None:
+        """Count one send_realtime_input call and its duration"""
+        ms = seconds * 1000.0
+        self.stats["frames_sent"] += 1
+        self.stats["bytes_sent"] += nbytes
+        self.stats["send_ms_total"] += ms
+        if ms > self.stats["send_ms_max"]:
+            self.stats["send_ms_max"] = ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.capture_stats)
+        stats.update(self.stats)
+        stats["send_ms_mean"] = (stats["send_ms_total"] / stats["frames_sent"]
+                                 if stats["frames_sent"] else 0.0)
+        chunk_bytes = self.chunk_frames * SAMPLE_WIDTH
+        stats["chunks_dropped"] = stats["bytes_dropped"] // chunk_bytes if chunk_bytes else 0
+        stats["frame_ms"] = self.frame_bytes / self.bytes_per_ms
+        return stats
@@ -0,0 +1,269 @@
+"""
+Speaker Playback Engine
+
+Plays Gemini's streamed speech through one writer thread fed from a
+jitter buffer, instead of one thread hop and mute/unmute per chunk:
+
+- Chunks are appended to a byte FIFO from the event loop (``feed``).
+- The writer thread waits for a short pre-buffer at the start of each
+  utterance, then writes fixed-size blocks to the output stream. If the
+  FIFO runs dry mid-utterance it counts an underrun and waits (up to
+  ``gap_ms``) for more audio, re-buffering before it resumes.
+- An utterance ends when the model's turn is over (``end_of_turn``), the
+  gap timeout expires, or playback is flushed on interruption. The
+  ``on_start``/``on_end`` callbacks fire once per utterance, so the mic echo
+  gate flips twice per reply rather than twice per chunk.
+
+Usage:
+    playback = PlaybackEngine(24000, prebuffer_ms=120)
+    playback.start(stream, on_start=mute_mic, on_end=unmute_mic)
+    playback.feed(chunk)          # from the receive loop
+    playback.end_of_turn()        # model turn complete
+    playback.flush()              # user interrupted
+    print(playback.get_stats())
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+
+class PlaybackEngine:
+    """Jitter buffer + writer thread for one mono 16-bit output stream"""
+
+    def __init__(self, sample_rate: int = 24000, prebuffer_ms: int = 120,
+                 block_ms: int = 40, gap_ms: int = 600, tail_ms: int = 150):
+        self.sample_rate = sample_rate
+        self.bytes_per_ms = sample_rate * SAMPLE_WIDTH / 1000.0
+        self.prebuffer_bytes = self._ms_to_bytes(prebuffer_ms)
+        self.block_bytes = max(self._ms_to_bytes(block_ms), SAMPLE_WIDTH)
+        self.gap_seconds = gap_ms / 1000.0
+        self.tail_seconds = tail_ms / 1000.0
+
+        self._chunks: deque = deque()
+        self._offset = 0            # bytes already consumed from _chunks[0]
+        self._buffered = 0
+        self._cond = threading.Condition()
+        self._end_of_turn = False
+        self._flushed = False
+        self._active = False        # inside an utterance
+        self._first_fed: Optional[float] = None
+        self._input_end: Optional[float] = None
+
+        self._stream = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._on_start: Optional[Callable[[], None]] = None
+        self._on_end: Optional[Callable[[], None]] = None
+        self.error: Optional[Exception] = None
+
+        self.stats = {
+            "utterances": 0,
+            "chunks_received": 0,
+            "bytes_played": 0,
+            "underruns": 0,
+            "flushes": 0,
+            "buffer_delay_ms_total": 0.0,
+            "buffer_delay_ms_max": 0.0,
+            "speech_latency_count": 0,
+            "speech_latency_ms_total": 0.0,
+            "speech_latency_ms_max": 0.0,
+        }
+
+    def _ms_to_bytes(self, ms: float) -> int:
+        return int(self.bytes_per_ms * ms) // SAMPLE_WIDTH * SAMPLE_WIDTH
+
+    # ==================== PRODUCER SIDE ====================
+
+    @property
+    def active(self) -> bool:
+        """True while an utterance is playing (or pre-buffering)"""
+        return self._active or self._buffered > 0
+
+    @property
+    def running(self) -> bool:
+        """True while the writer thread is attached to a stream"""
+        return self._thread is not None
+
+    @property
+    def buffered_ms(self) -> float:
+        return self._buffered / self.bytes_per_ms
+
+    def feed(self, data: bytes) -> None:
+        """Queue a chunk of PCM for playback"""
+        if not data:
+            return
+        with self._cond:
+            if self._first_fed is None and not self._active:
+                self._first_fed = time.perf_counter()
+            self._chunks.append(data)
+            self._buffered += len(data)
+            self.stats["chunks_received"] += 1
+            self._cond.notify()
+
+    def end_of_turn(self) -> None:
+        """No more audio for this reply: finish the utterance once drained"""
+        with self._cond:
+            if self._active or self._buffered:
+                self._end_of_turn = True
+                self._cond.notify()
+
+    def flush(self) -> None:
+        """Drop queued audio and end the current utterance (barge-in)"""
+        with self._cond:
+            self._clear_locked()
+            if self._active:
+                self._flushed = True
+                self.stats["flushes"] += 1
+            self._cond.notify()
+
+    def mark_input_end(self, at: Optional[float] = None) -> None:
+        """The user stopped speaking; the next utterance start measures speech latency"""
+        self._input_end = at if at is not None else time.perf_counter()
+
+    def _clear_locked(self) -> None:
+        self._chunks.clear()
+        self._offset = 0
+        self._buffered = 0
+        self._first_fed = None
+
+    # ==================== WRITER THREAD ====================
+
+    def start(self, stream, on_start: Optional[Callable[[], None]] = None,
+              on_end: Optional[Callable[[], None]] = None) -> None:
+        """Start the writer thread on an open output stream"""
+        self.stop()
+        self._stream = stream
+        self._on_start = on_start
+        self._on_end = on_end
+        self.error = None
+        with self._cond:
+            self._clear_locked()
+            self._end_of_turn = self._flushed = False
+            self._running = True
+        self._thread = threading.Thread(target=self._writer, daemon=True, name="jarvis-playback")
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the writer thread (the stream is left for the caller to close)"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._stream = None
+
+    def _take(self, size: int) -> bytes:
+        """Remove up to size bytes from the FIFO (lock held)"""
+        parts = []
+        while size > 0 and self._chunks:
+            head = self._chunks[0]
+            part = head[self._offset:self._offset + size]
+            parts.append(part)
+            size -= len(part)
+            self._offset += len(part)
+            if self._offset >= len(head):
+                self._chunks.popleft()
+                self._offset = 0
+        data = b"".join(parts)
+        self._buffered -= len(data)
+        return data
+
+    def _wait_for(self, nbytes: int, timeout: float) -> None:
+        """Wait until nbytes are buffered, the turn ends, a flush, or timeout (lock held)"""
+        deadline = time.monotonic() + timeout
+        while (self._running and self._buffered < nbytes
+               and not self._end_of_turn and not self._flushed):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._cond.wait(remaining)
+
+    def _writer(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while self._running and not self._buffered:
+                        self._end_of_turn = self._flushed = False
+                        self._cond.wait(0.5)
+                    if not self._running:
+                        return
+                    self._wait_for(self.prebuffer_bytes, self.gap_seconds)
+                    if not self._buffered:
+                        continue  # flushed while pre-buffering
+                    self._active = True
+                    self._begin_utterance_locked()
+                self._call(self._on_start)
+                self._play_utterance()
+                time.sleep(self.tail_seconds)  # let the speaker tail die out
+                with self._cond:
+                    self._active = bool(self._buffered)
+                    self._end_of_turn = self._flushed = False
+                    if self._active:
+                        continue  # more speech arrived during the tail
+                self._call(self._on_end)
+        except Exception as e:
+            self.error = e
+        finally:
+            with self._cond:
+                was_active, self._active = self._active, False
+            if was_active:
+                self._call(self._on_end)
+
+    def _begin_utterance_locked(self) -> None:
+        now = time.perf_counter()
+        self.stats["utterances"] += 1
+        if self._first_fed is not None:
+            delay = (now - self._first_fed) * 1000.0
+            self.stats["buffer_delay_ms_total"] += delay
+            self.stats["buffer_delay_ms_max"] = max(self.stats["buffer_delay_ms_max"], delay)
+            self._first_fed = None
+        if self._input_end is not None:
+            latency = (now - self._input_end) * 1000.0
+            self._input_end = None
+            self.stats["speech_latency_count"] += 1
+            self.stats["speech_latency_ms_total"] += latency
+            self.stats["speech_latency_ms_max"] = max(self.stats["speech_latency_ms_max"], latency)
+
+    def _play_utterance(self) -> None:
+        while True:
+            with self._cond:
+                if not self._running or self._flushed:
+                    return
+                block = self._take(self.block_bytes)
+                if not block:
+                    if self._end_of_turn:
+                        return
+                    # Ran dry mid-utterance: wait for the stream to catch up
+                    self.stats["underruns"] += 1
+                    self._wait_for(1, self.gap_seconds)
+                    if not self._buffered:
+                        return
+                    self._wait_for(self.prebuffer_bytes, self.gap_seconds)
+                    continue
+            self._stream.write(block)
+            self.stats["bytes_played"] += len(block)
+
+    @staticmethod
+    def _call(callback: Optional[Callable[[], None]]) -> None:
+        if callback is not None:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        utterances = stats["utterances"]
+        stats["buffer_delay_ms_mean"] = (stats["buffer_delay_ms_total"] / utterances
+                                         if utterances else 0.0)
+        count = stats["speech_latency_count"]
+        stats["speech_latency_ms_mean"] = stats["speech_latency_ms_total"] / count if count else 0.0
+        stats["buffered_ms"] = self.buffered_ms
+        return stats
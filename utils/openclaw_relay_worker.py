@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Relay Worker
+
+Long-lived process that serves relay requests over stdin/stdout using the
+line-delimited JSON protocol described in utils/relay_worker.py. Requests
+are handled concurrently (responses may arrive out of order, matched by
+id).
+
+The OpenClaw CLI has no persistent or stdin session mode, so each "agent"
+request still runs `openclaw agent` once. It runs from this already-warm
+process, though: the caller never spawns a process per prompt, and on
+Windows the worker itself runs inside WSL, so the wsl.exe hop is paid once
+per worker instead of once per call.
+
+The worker exits when stdin is closed.
+
+Usage:
+    python utils/openclaw_relay_worker.py                      # runs `openclaw`
+    python utils/openclaw_relay_worker.py node /path/openclaw.mjs
+
+Env:
+    OPENCLAW_RELAY_CONCURRENCY=4    requests run at once
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+DEFAULT_TIMEOUT_SEC = 45
+
+_write_lock = threading.Lock()
+
+
+def _reply(message: Dict[str, Any]) -> None:
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def build_agent_command(openclaw_cmd: List[str], request: Dict[str, Any]) -> List[str]:
+    timeout = int(request.get("timeout") or DEFAULT_TIMEOUT_SEC)
+    cmd = [*openclaw_cmd, "agent", "--json", "--timeout", str(timeout),
+           "--message", str(request.get("message", ""))]
+    if request.get("session_id"):
+        cmd.extend(["--session-id", str(request["session_id"])])
+    else:
+        cmd.extend(["--agent", str(request.get("agent") or "main")])
+    return cmd
+
+
+def handle_agent(openclaw_cmd: List[str], request: Dict[str, Any]) -> Dict[str, Any]:
+    timeout = int(request.get("timeout") or DEFAULT_TIMEOUT_SEC)
+    try:
+        proc = subprocess.run(
+            build_agent_command(openclaw_cmd, request),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=timeout + 10,
+        )
+    except FileNotFoundError:
+        return {"ok": False, "error": f"Command not found: {openclaw_cmd[0]}"}
+    except subprocess.TimeoutExpired:
+        return {"ok": False, "error": f"Timed out ({timeout + 10}s)"}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {
+        "ok": proc.returncode == 0,
+        "returncode": proc.returncode,
+        "stdout": proc.stdout or "",
+        "stderr": proc.stderr or "",
+    }
+
+
+def serve(openclaw_cmd: List[str], concurrency: int = 4) -> None:
+    def run(request: Dict[str, Any]) -> None:
+        response = handle_agent(openclaw_cmd, request)
+        response["id"] = request.get("id")
+        _reply(response)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                _reply({"id": None, "ok": False, "error": "Malformed request"})
+                continue
+            op = request.get("op", "agent")
+            if op == "ping":
+                _reply({"id": request.get("id"), "ok": True, "pong": True})
+            elif op == "agent":
+                pool.submit(run, request)
+            else:
+                _reply({"id": request.get("id"), "ok": False, "error": f"Unknown op: {op}"})
+
+
+def main(argv: List[str]) -> int:
+    openclaw_cmd = argv[1:] or ["openclaw"]
+    serve(openclaw_cmd, int(os.getenv("OPENCLAW_RELAY_CONCURRENCY", "4")))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
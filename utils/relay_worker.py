@@ -0,0 +1,306 @@
+"""
+Persistent Relay Worker
+
+Keeps a long-lived worker process (or a small pool of them) running and
+talks to it over stdin/stdout with line-delimited JSON, instead of starting
+a new process for every LLM relay call. Process startup and session setup
+are paid once per worker rather than per prompt.
+
+Protocol (one JSON object per line):
+    request:  {"id": 7, "op": "agent", "message": "...", "agent": "main",
+               "session_id": "", "timeout": 45}
+              {"id": 8, "op": "ping"}
+    response: {"id": 7, "ok": true, "returncode": 0, "stdout": "...", "stderr": ""}
+              {"id": 7, "ok": false, "error": "Command not found: openclaw"}
+              {"id": 8, "ok": true, "pong": true}
+
+Requests are pipelined: many can be in flight on one worker and responses
+may come back in any order; they are matched by id. A request that does not
+complete within its timeout raises RelayTimeout (its late response is
+dropped); after ``max_timeouts`` timeouts in a row the worker is taken to be
+stuck and is killed. If the worker exits or is killed, in-flight requests
+fail with RelayError and the next request starts a fresh worker.
+
+The bundled worker (utils/openclaw_relay_worker.py) serves the protocol by
+running the OpenClaw CLI from inside its own warm process. Any process that
+speaks the same protocol can be used instead (RESEARCH_OPENCLAW_RELAY_CMD for
+the research client, OPENCLAW_RELAY_WORKER_CMD for the desktop app; see
+tests/fake_openclaw_relay.py).
+
+Usage:
+    relay = RelayWorkerPool(openclaw_worker_command(["openclaw"]), size=2)
+    reply = relay.request({"op": "agent", "message": "hi"}, timeout=60)
+    reply = await relay.request_async({"op": "agent", "message": "hi"}, timeout=60)
+    print(relay.get_stats())
+    relay.close()
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+# The bundled OpenClaw worker script
+OPENCLAW_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "openclaw_relay_worker.py")
+
+
+class RelayError(RuntimeError):
+    """The worker could not be started, or exited with the request in flight"""
+
+
+class RelayTimeout(RelayError, TimeoutError):
+    """No response for a request within its timeout"""
+
+
+def openclaw_worker_command(openclaw_cmd: Sequence[str] = ("openclaw",)) -> List[str]:
+    """Command that runs the bundled worker with this interpreter"""
+    return [sys.executable, OPENCLAW_WORKER_SCRIPT, *openclaw_cmd]
+
+
+class RelayWorker:
+    """One long-lived worker process with pipelined JSON-lines requests"""
+
+    def __init__(self, command: Sequence[str], name: str = "relay-worker",
+                 env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None,
+                 max_timeouts: int = 1):
+        self.command = list(command)
+        self.name = name
+        self.env = env
+        self.cwd = cwd
+        self.max_timeouts = max(1, max_timeouts)  # in a row, before the worker is killed
+
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._pending: Dict[int, concurrent.futures.Future] = {}
+        self._ids = itertools.count(1)
+        self._timeouts_in_row = 0
+
+        self.stats = {
+            "starts": 0,
+            "restarts": 0,     # killed after max_timeouts timeouts in a row
+            "requests": 0,
+            "completed": 0,
+            "timeouts": 0,
+            "failures": 0,
+            "latency_ms_total": 0.0,
+            "latency_ms_max": 0.0,
+        }
+
+    # ==================== PROCESS ====================
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._proc.pid if self._proc is not None else None
+
+    def start(self) -> None:
+        """Start the worker if it is not already running"""
+        with self._lock:
+            self._ensure_started()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """(lock held)"""
+        if self.alive:
+            return self._proc
+        try:
+            proc = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                env=self.env,
+                cwd=self.cwd,
+            )
+        except OSError as e:
+            raise RelayError(f"Could not start {self.name}: {e}") from e
+        self._proc = proc
+        self._timeouts_in_row = 0
+        self.stats["starts"] += 1
+        threading.Thread(target=self._read_loop, args=(proc,), daemon=True,
+                         name=f"{self.name}-reader").start()
+        return proc
+
+    def _read_loop(self, proc: subprocess.Popen) -> None:
+        for line in proc.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # stray output from the worker
+            if not isinstance(message, dict):
+                continue
+            with self._lock:
+                future = self._pending.pop(message.get("id"), None)
+            # Claim the future first: an awaiting task that times out or is
+            # cancelled calls future.cancel() from its loop thread, and a
+            # cancel landing between a done() check and set_result() would
+            # raise here and kill the reader.
+            if future is not None and future.set_running_or_notify_cancel():
+                future.set_result(message)
+        code = proc.wait()
+        self._fail_pending(proc, RelayError(f"{self.name} exited (code {code})"))
+
+    def _fail_pending(self, proc: subprocess.Popen, error: Exception) -> None:
+        with self._lock:
+            if self._proc is not proc:
+                return  # already replaced; its requests were failed then
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Close stdin (the worker exits on EOF), then kill it if it lingers"""
+        with self._lock:
+            proc = self._proc
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        self._fail_pending(proc, RelayError(f"{self.name} closed"))
+        with self._lock:
+            if self._proc is proc:
+                self._proc = None
+
+    # ==================== REQUESTS ====================
+
+    def submit(self, payload: Dict[str, Any]) -> "tuple[int, concurrent.futures.Future]":
+        """Send a request without waiting; returns (id, future of the response)"""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            proc = self._ensure_started()
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            self.stats["requests"] += 1
+            try:
+                proc.stdin.write(json.dumps(dict(payload, id=request_id)) + "\n")
+                proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                self._pending.pop(request_id, None)
+                self.stats["failures"] += 1
+                raise RelayError(f"{self.name} is not accepting requests: {e}") from e
+        return request_id, future
+
+    def _abandon(self, request_id: int) -> None:
+        """Drop a timed-out request; kill the worker if it keeps timing out"""
+        with self._lock:
+            self.stats["timeouts"] += 1
+            if self._pending.pop(request_id, None) is None:
+                return  # answered at the deadline, or the worker already went
+            self._timeouts_in_row += 1
+            if self._timeouts_in_row < self.max_timeouts:
+                return
+            # The next request starts a fresh worker; this one's requests fail here
+            proc, self._proc = self._proc, None
+            pending, self._pending = self._pending, {}
+            self.stats["restarts"] += 1
+        if proc is not None:
+            try:
+                proc.kill()
+                proc.stdin.close()
+            except OSError:
+                pass
+        error = RelayError(f"{self.name} killed after {self.max_timeouts} timeout(s) in a row")
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def _record(self, started: float) -> None:
+        latency = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self._timeouts_in_row = 0
+            self.stats["completed"] += 1
+            self.stats["latency_ms_total"] += latency
+            self.stats["latency_ms_max"] = max(self.stats["latency_ms_max"], latency)
+
+    def request(self, payload: Dict[str, Any], timeout: float = 60.0) -> Dict[str, Any]:
+        """Send a request and block for its response"""
+        started = time.perf_counter()
+        request_id, future = self.submit(payload)
+        try:
+            response = future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            self._abandon(request_id)
+            raise RelayTimeout(f"{self.name}: no response in {timeout:.0f}s") from None
+        except RelayError:
+            self.stats["failures"] += 1
+            raise
+        self._record(started)
+        return response
+
+    async def request_async(self, payload: Dict[str, Any], timeout: float = 60.0) -> Dict[str, Any]:
+        """Send a request and await its response"""
+        started = time.perf_counter()
+        request_id, future = self.submit(payload)
+        try:
+            response = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self._abandon(request_id)
+            raise RelayTimeout(f"{self.name}: no response in {timeout:.0f}s") from None
+        except RelayError:
+            self.stats["failures"] += 1
+            raise
+        self._record(started)
+        return response
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats, pending=len(self._pending), alive=self.alive)
+        completed = stats["completed"]
+        stats["latency_ms_mean"] = stats["latency_ms_total"] / completed if completed else 0.0
+        return stats
+
+
+class RelayWorkerPool:
+    """A few RelayWorkers; each request goes to the least busy one"""
+
+    def __init__(self, command: Sequence[str], size: int = 1, name: str = "relay-worker", **kwargs):
+        self.workers = [RelayWorker(command, name=f"{name}-{i}", **kwargs) for i in range(max(1, size))]
+
+    def _pick(self) -> RelayWorker:
+        return min(self.workers, key=lambda worker: (worker.pending, not worker.alive))
+
+    def start(self) -> None:
+        for worker in self.workers:
+            worker.start()
+
+    def request(self, payload: Dict[str, Any], timeout: float = 60.0) -> Dict[str, Any]:
+        return self._pick().request(payload, timeout)
+
+    async def request_async(self, payload: Dict[str, Any], timeout: float = 60.0) -> Dict[str, Any]:
+        return await self._pick().request_async(payload, timeout)
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        per_worker = [worker.get_stats() for worker in self.workers]
+        totals = {key: sum(s[key] for s in per_worker)
+                  for key in ("starts", "restarts", "requests", "completed", "timeouts", "failures",
+                              "latency_ms_total", "pending")}
+        totals["latency_ms_max"] = max(s["latency_ms_max"] for s in per_worker)
+        totals["latency_ms_mean"] = (totals["latency_ms_total"] / totals["completed"]
+                                     if totals["completed"] else 0.0)
+        totals["workers"] = per_worker
+        return totals
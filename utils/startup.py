@@ -0,0 +1,161 @@
+"""
+Staged Startup
+
+Jarvis only needs the OSC transport and the Gemini session to take its first
+command; agents, knowledge bases and device intelligence can come up later.
+This module provides the pieces for that:
+
+- LazySubsystem: a module-level stand-in that builds its subsystem on first
+  attribute access (or when warmed up in the background), so call sites keep
+  using a plain global.
+- StartupProfiler: nested wall-clock timings of imports and initializations,
+  printed by ``jarvis_engine.py --profile-startup``.
+
+Usage:
+    reliable_params = LazySubsystem("reliable params", _build_reliable_params)
+    reliable_params.set_parameter_verified(...)   # built here if not yet
+
+    threading.Thread(target=warm_up, args=([reliable_params],), daemon=True).start()
+    print(startup_profiler.report())
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+
+@dataclass
+class StartupRecord:
+    """One timed startup step"""
+    name: str
+    phase: str          # "import", "init", "ready"
+    started: float      # seconds since the profiler's origin
+    seconds: float
+    depth: int          # nesting level within its thread
+    new_modules: int    # modules added to sys.modules during the step
+    thread: str
+
+
+class StartupProfiler:
+    """
+    Records how long each import and initialization step takes.
+
+    Steps may nest (an init that performs imports); the report indents them
+    so a parent's time includes its children.
+    """
+
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.records: List[StartupRecord] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def measure(self, name: str, phase: str = "init"):
+        """Time the enclosed block as one step"""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        modules_before = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.depth = depth
+            record = StartupRecord(name, phase, start - self.origin, elapsed, depth,
+                                   len(sys.modules) - modules_before,
+                                   threading.current_thread().name)
+            with self._lock:
+                self.records.append(record)
+
+    def mark(self, name: str) -> float:
+        """Record a milestone (e.g. "session connected"); returns seconds since origin"""
+        at = time.perf_counter() - self.origin
+        with self._lock:
+            self.records.append(StartupRecord(name, "ready", at, 0.0, 0, 0,
+                                              threading.current_thread().name))
+        return at
+
+    def report(self) -> str:
+        """Chronological startup report, one line per step"""
+        with self._lock:
+            records = sorted(self.records, key=lambda r: r.started)
+        lines = ["--- Startup Profile (ms since engine import) ---",
+                 f"{'at':>8} {'took':>8}  {'phase':<6} step"]
+        for r in records:
+            if r.phase == "ready":
+                lines.append(f"{r.started * 1000:8.0f} {'':>8}  {'ready':<6} == {r.name} ==")
+                continue
+            modules = f" (+{r.new_modules} modules)" if r.new_modules else ""
+            thread = "" if r.thread == "MainThread" else f" [{r.thread}]"
+            lines.append(f"{r.started * 1000:8.0f} {r.seconds * 1000:8.1f}  {r.phase:<6} "
+                         f"{'  ' * r.depth}{r.name}{modules}{thread}")
+        return "\n".join(lines)
+
+
+# Process-wide profiler; its origin is the first import of this module
+startup_profiler = StartupProfiler()
+
+
+class LazySubsystem:
+    """
+    Stand-in for a subsystem that is built on first use.
+
+    Attribute access is forwarded to the built object, so existing call
+    sites like ``device_intelligence.get_param_info(...)`` work unchanged.
+    Building is thread-safe: concurrent first uses wait for one build.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any],
+                 profiler: StartupProfiler = startup_profiler):
+        self._name = name
+        self._factory = factory
+        self._profiler = profiler
+        self._instance = None
+        self._built = False
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """True once the subsystem has been built"""
+        return self._built
+
+    def get(self) -> Any:
+        """The subsystem, building it now if needed"""
+        if self._built:
+            return self._instance
+        with self._lock:
+            if not self._built:
+                with self._profiler.measure(self._name, "init"):
+                    self._instance = self._factory()
+                self._built = True
+        return self._instance
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not found on the stand-in itself
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.get(), attr)
+
+    def __repr__(self) -> str:
+        state = "ready" if self._built else "not built"
+        return f"<LazySubsystem {self._name} ({state})>"
+
+
+def warm_up(subsystems: Iterable[LazySubsystem],
+            on_error: Optional[Callable[[str, Exception], None]] = None) -> None:
+    """
+    Build subsystems in order (meant for a background thread).
+
+    A failing subsystem is reported through ``on_error`` and retried on its
+    first real use.
+    """
+    for subsystem in subsystems:
+        try:
+            subsystem.get()
+        except Exception as e:
+            if on_error is not None:
+                on_error(subsystem._name, e)